@@ -0,0 +1,80 @@
+"""Add latest_scores table (latest score per ticker and mode)
+
+latest_scores holds each (ticker, mode)'s most recent row from scores.
+ScoreDatabase updates it in the same transaction as every save, and the
+latest-score queries read it through a (mode, date, score DESC, ticker DESC)
+index instead of computing MAX(date) over scores and joining back.
+
+The table is backfilled from scores here; ScoreDatabase.rebuild_latest_scores
+repeats the backfill if scores are ever loaded by other means.
+
+Revision ID: 6f0a87a3c47a
+Revises: e5806c281846
+Create Date: 2026-10-18 14:05:12.309114
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6f0a87a3c47a'
+down_revision: Union[str, None] = 'e5806c281846'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMN_NAMES = (
+    "ticker, date, mode, score, band, "
+    "f_pillar, t_pillar, r_pillar, o_pillar, q_pillar, s_pillar, "
+    "risk_penalty, guardrail_flags, confidence, s_z, as_of, config_hash, code_version"
+)
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE TABLE latest_scores (
+            ticker VARCHAR(20) NOT NULL,
+            date DATE NOT NULL,
+            mode VARCHAR(10) NOT NULL CHECK (mode IN ('Trader', 'Investor')),
+            score NUMERIC(5,2) NOT NULL CHECK (score >= 0 AND score <= 100),
+            band VARCHAR(20) NOT NULL CHECK (band IN ('Strong Buy', 'Buy', 'Hold', 'Avoid')),
+            f_pillar NUMERIC(5,2),
+            t_pillar NUMERIC(5,2),
+            r_pillar NUMERIC(5,2),
+            o_pillar NUMERIC(5,2),
+            q_pillar NUMERIC(5,2),
+            s_pillar NUMERIC(5,2),
+            risk_penalty NUMERIC(5,2) NOT NULL,
+            guardrail_flags JSONB NOT NULL DEFAULT '[]',
+            confidence NUMERIC(4,3) NOT NULL,
+            s_z NUMERIC(6,3) NOT NULL,
+            as_of TIMESTAMP WITH TIME ZONE NOT NULL,
+            config_hash VARCHAR(64) NOT NULL,
+            code_version VARCHAR(20),
+            PRIMARY KEY (ticker, mode)
+        )
+    """)
+
+    # Backfill before building the secondary index
+    op.execute(f"""
+        INSERT INTO latest_scores ({COLUMN_NAMES})
+        SELECT DISTINCT ON (ticker, mode) {COLUMN_NAMES}
+        FROM scores
+        ORDER BY ticker, mode, date DESC
+    """)
+
+    op.execute("""
+        CREATE INDEX idx_latest_scores_mode_date_score
+        ON latest_scores (mode, date, score DESC, ticker DESC)
+    """)
+    op.execute(
+        "COMMENT ON TABLE latest_scores IS "
+        "'Most recent score per (ticker, mode); kept in sync with scores on every save'"
+    )
+    op.execute("ANALYZE latest_scores")
+
+
+def downgrade() -> None:
+    op.execute("DROP TABLE IF EXISTS latest_scores")
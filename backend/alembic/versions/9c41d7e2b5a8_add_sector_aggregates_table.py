@@ -0,0 +1,102 @@
+"""Add sector_aggregates table (per-sector score aggregates per date and mode)
+
+sector_aggregates holds, for every (date, mode, sector_group), the number of
+scored stocks, mean and median score, band distribution, mean pillar scores,
+mean S_z and the number of SectorBear-flagged stocks. ScoreDatabase batch
+saves recompute the rows for the (date, mode) pairs they write, in the same
+transaction, so the sector endpoint reads a single row by primary key
+instead of aggregating scores per request.
+
+Sector groups come from sector_mapping (created here if missing, as in
+db_init/01_schema.sql); unmapped tickers are grouped as 'diversified'.
+The table is backfilled from scores here; ScoreDatabase.rebuild_sector_aggregates
+repeats the backfill after sector_mapping changes.
+
+Revision ID: 9c41d7e2b5a8
+Revises: 6f0a87a3c47a
+Create Date: 2026-10-18 18:40:27.553061
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c41d7e2b5a8'
+down_revision: Union[str, None] = '6f0a87a3c47a'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE TABLE IF NOT EXISTS sector_mapping (
+            ticker VARCHAR(20) PRIMARY KEY,
+            sector_id VARCHAR(50) NOT NULL,
+            sector_group VARCHAR(50) NOT NULL,
+            exchange VARCHAR(10)
+        )
+    """)
+    op.execute("CREATE INDEX IF NOT EXISTS idx_sector_mapping_group ON sector_mapping(sector_group)")
+
+    op.execute("""
+        CREATE TABLE sector_aggregates (
+            sector_group VARCHAR(50) NOT NULL,
+            mode VARCHAR(10) NOT NULL CHECK (mode IN ('Trader', 'Investor')),
+            date DATE NOT NULL,
+            n_stocks INTEGER NOT NULL,
+            mean_score NUMERIC(5,2) NOT NULL,
+            median_score NUMERIC(5,2) NOT NULL,
+            band_counts JSONB NOT NULL,
+            mean_f_pillar NUMERIC(5,2),
+            mean_t_pillar NUMERIC(5,2),
+            mean_r_pillar NUMERIC(5,2),
+            mean_o_pillar NUMERIC(5,2),
+            mean_q_pillar NUMERIC(5,2),
+            mean_s_pillar NUMERIC(5,2),
+            mean_s_z NUMERIC(6,3) NOT NULL,
+            sector_bear_count INTEGER NOT NULL,
+            updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+            PRIMARY KEY (sector_group, mode, date)
+        )
+    """)
+
+    op.execute("""
+        INSERT INTO sector_aggregates (
+            date, mode, sector_group, n_stocks, mean_score, median_score, band_counts,
+            mean_f_pillar, mean_t_pillar, mean_r_pillar, mean_o_pillar, mean_q_pillar,
+            mean_s_pillar, mean_s_z, sector_bear_count, updated_at
+        )
+        SELECT
+            s.date, s.mode, COALESCE(m.sector_group, 'diversified'),
+            COUNT(*),
+            ROUND(AVG(s.score), 2),
+            ROUND((percentile_cont(0.5) WITHIN GROUP (ORDER BY s.score))::numeric, 2),
+            jsonb_build_object(
+                'Strong Buy', COUNT(*) FILTER (WHERE s.band = 'Strong Buy'),
+                'Buy', COUNT(*) FILTER (WHERE s.band = 'Buy'),
+                'Hold', COUNT(*) FILTER (WHERE s.band = 'Hold'),
+                'Avoid', COUNT(*) FILTER (WHERE s.band = 'Avoid')
+            ),
+            ROUND(AVG(s.f_pillar), 2), ROUND(AVG(s.t_pillar), 2), ROUND(AVG(s.r_pillar), 2),
+            ROUND(AVG(s.o_pillar), 2), ROUND(AVG(s.q_pillar), 2), ROUND(AVG(s.s_pillar), 2),
+            ROUND(AVG(s.s_z), 3),
+            COUNT(*) FILTER (WHERE s.guardrail_flags ? 'SectorBear'),
+            NOW()
+        FROM scores s
+        LEFT JOIN sector_mapping m ON m.ticker = s.ticker
+        GROUP BY s.date, s.mode, COALESCE(m.sector_group, 'diversified')
+    """)
+
+    op.execute(
+        "COMMENT ON TABLE sector_aggregates IS "
+        "'Per-sector score aggregates per (date, mode); refreshed by batch saves'"
+    )
+    op.execute("ANALYZE sector_aggregates")
+
+
+def downgrade() -> None:
+    # sector_mapping predates this revision in db_init-created databases; keep it
+    op.execute("DROP TABLE IF EXISTS sector_aggregates")
@@ -0,0 +1,172 @@
+"""Align scores with the db_init column layout
+
+The initial revision created scores with an older column layout
+(scoring_date, f_score ... final_score, band_enum, no id). ScoreDatabase and
+every later revision use the layout from db_init/01_schema.sql (date,
+score, f_pillar ... s_pillar, guardrail_flags JSONB, config_hash, a serial
+id). This revision converts the old layout so `alembic upgrade head` works
+on an empty database; on a database built by db_init and stamped at the
+initial revision it detects the current layout and does nothing.
+
+Existing rows are copied across: scoring_date becomes date, final_score
+becomes score, the *_score pillar columns become *_pillar and the
+comma-separated guardrails become a JSON array. Columns the old layout never
+had get neutral values (confidence 0, s_z 0 when missing, config_hash
+'legacy'). Rows without a final_score or band cannot satisfy the new NOT
+NULL constraints and make the upgrade fail rather than being dropped.
+
+Revision ID: b7c2e9a4d813
+Revises: 183eb85141bf
+Create Date: 2026-10-18 21:05:13.402817
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7c2e9a4d813'
+down_revision: Union[str, None] = '183eb85141bf'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = """
+    id INTEGER NOT NULL DEFAULT nextval('scores_id_seq'),
+    ticker VARCHAR(20) NOT NULL,
+    date DATE NOT NULL,
+    mode VARCHAR(10) NOT NULL CHECK (mode IN ('Trader', 'Investor')),
+    score NUMERIC(5,2) NOT NULL CHECK (score >= 0 AND score <= 100),
+    band VARCHAR(20) NOT NULL CHECK (band IN ('Strong Buy', 'Buy', 'Hold', 'Avoid')),
+    f_pillar NUMERIC(5,2) CHECK (f_pillar >= 0 AND f_pillar <= 100),
+    t_pillar NUMERIC(5,2) CHECK (t_pillar >= 0 AND t_pillar <= 100),
+    r_pillar NUMERIC(5,2) CHECK (r_pillar >= 0 AND r_pillar <= 100),
+    o_pillar NUMERIC(5,2) CHECK (o_pillar >= 0 AND o_pillar <= 100),
+    q_pillar NUMERIC(5,2) CHECK (q_pillar >= 0 AND q_pillar <= 100),
+    s_pillar NUMERIC(5,2) CHECK (s_pillar >= 0 AND s_pillar <= 100),
+    risk_penalty NUMERIC(5,2) NOT NULL CHECK (risk_penalty >= 0 AND risk_penalty <= 20),
+    guardrail_flags JSONB NOT NULL DEFAULT '[]',
+    confidence NUMERIC(4,3) NOT NULL CHECK (confidence >= 0 AND confidence <= 1),
+    s_z NUMERIC(6,3) NOT NULL,
+    as_of TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    config_hash VARCHAR(64) NOT NULL,
+    code_version VARCHAR(20),
+    CHECK (LENGTH(ticker) >= 1)
+"""
+
+INDEXES = [
+    "CREATE INDEX idx_scores_ticker_date ON scores(ticker, date)",
+    "CREATE INDEX idx_scores_date_mode ON scores(date, mode)",
+    "CREATE INDEX idx_scores_band ON scores(band)",
+    "CREATE INDEX idx_scores_date_band_mode ON scores(date, band, mode)",
+    "CREATE INDEX idx_scores_as_of ON scores(as_of)",
+]
+
+LEGACY_INDEXES = ('idx_scores_ticker', 'idx_scores_band', 'idx_scores_scoring_date', 'idx_scores_mode')
+
+
+def _has_legacy_layout(bind) -> bool:
+    return bind.execute(sa.text("""
+        SELECT 1 FROM information_schema.columns
+        WHERE table_schema = current_schema() AND table_name = 'scores' AND column_name = 'scoring_date'
+    """)).scalar() is not None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if not _has_legacy_layout(bind):
+        return  # Built by db_init: already in this layout
+
+    op.execute("ALTER TABLE scores RENAME TO scores_legacy")
+    op.execute("ALTER TABLE scores_legacy RENAME CONSTRAINT scores_pkey TO scores_legacy_pkey")
+    for index in LEGACY_INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {index}")
+
+    op.execute("CREATE SEQUENCE scores_id_seq")
+    op.execute(f"""
+        CREATE TABLE scores (
+            {COLUMNS},
+            CONSTRAINT scores_pkey PRIMARY KEY (id),
+            UNIQUE (ticker, date, mode)
+        )
+    """)
+    op.execute("ALTER SEQUENCE scores_id_seq OWNED BY scores.id")
+
+    op.execute("""
+        INSERT INTO scores (
+            ticker, date, mode, score, band,
+            f_pillar, t_pillar, r_pillar, o_pillar, q_pillar, s_pillar,
+            risk_penalty, guardrail_flags, confidence, s_z, as_of, config_hash
+        )
+        SELECT
+            ticker, scoring_date::date, mode, ROUND(final_score::numeric, 2), band::text,
+            ROUND(f_score::numeric, 2), ROUND(t_score::numeric, 2), ROUND(r_score::numeric, 2),
+            ROUND(o_score::numeric, 2), ROUND(q_score::numeric, 2), ROUND(s_score::numeric, 2),
+            ROUND(COALESCE(risk_penalty, 0)::numeric, 2),
+            COALESCE(to_jsonb(string_to_array(NULLIF(guardrails, ''), ',')), '[]'::jsonb),
+            0, ROUND(COALESCE(s_z, 0)::numeric, 3),
+            COALESCE(as_of AT TIME ZONE 'UTC', NOW()), 'legacy'
+        FROM scores_legacy
+        ORDER BY scoring_date, ticker, mode
+    """)
+    op.execute("DROP TABLE scores_legacy")
+    op.execute("DROP TYPE IF EXISTS band_enum")
+
+    for statement in INDEXES:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    band_enum = sa.Enum('Strong Buy', 'Buy', 'Hold', 'Avoid', name='band_enum')
+    band_enum.create(op.get_bind())
+
+    op.execute("ALTER TABLE scores RENAME TO scores_current")
+    op.execute("ALTER TABLE scores_current RENAME CONSTRAINT scores_pkey TO scores_current_pkey")
+    for index in ('idx_scores_ticker_date', 'idx_scores_date_mode', 'idx_scores_band',
+                  'idx_scores_date_band_mode', 'idx_scores_as_of'):
+        op.execute(f"DROP INDEX IF EXISTS {index}")
+
+    op.create_table('scores',
+        sa.Column('ticker', sa.String(length=20), nullable=False),
+        sa.Column('scoring_date', sa.DateTime(), nullable=False),
+        sa.Column('mode', sa.String(length=20), nullable=False),
+        sa.Column('f_score', sa.Float(), nullable=True),
+        sa.Column('t_score', sa.Float(), nullable=True),
+        sa.Column('r_score', sa.Float(), nullable=True),
+        sa.Column('o_score', sa.Float(), nullable=True),
+        sa.Column('q_score', sa.Float(), nullable=True),
+        sa.Column('s_score', sa.Float(), nullable=True),
+        sa.Column('weighted_score', sa.Float(), nullable=True),
+        sa.Column('risk_penalty', sa.Float(), nullable=True),
+        sa.Column('final_score', sa.Float(), nullable=True),
+        sa.Column('band', band_enum, nullable=True),
+        sa.Column('guardrails', sa.String(length=500), nullable=True),
+        sa.Column('as_of', sa.DateTime(), nullable=True),
+        sa.Column('f_z', sa.Float(), nullable=True),
+        sa.Column('t_z', sa.Float(), nullable=True),
+        sa.Column('r_z', sa.Float(), nullable=True),
+        sa.Column('o_z', sa.Float(), nullable=True),
+        sa.Column('q_z', sa.Float(), nullable=True),
+        sa.Column('s_z', sa.Float(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('ticker', 'scoring_date', 'mode'),
+        sa.Index('idx_scores_ticker', 'ticker'),
+        sa.Index('idx_scores_band', 'band'),
+        sa.Index('idx_scores_scoring_date', 'scoring_date'),
+        sa.Index('idx_scores_mode', 'mode'),
+    )
+    op.execute("""
+        INSERT INTO scores (
+            ticker, scoring_date, mode, f_score, t_score, r_score, o_score, q_score, s_score,
+            risk_penalty, final_score, band, guardrails, as_of, s_z
+        )
+        SELECT
+            ticker, date, mode, f_pillar, t_pillar, r_pillar, o_pillar, q_pillar, s_pillar,
+            risk_penalty, score, band::band_enum,
+            NULLIF(array_to_string(ARRAY(SELECT jsonb_array_elements_text(guardrail_flags)), ','), ''),
+            as_of AT TIME ZONE 'UTC', s_z
+        FROM scores_current
+    """)
+    op.execute("DROP TABLE scores_current")  # Drops scores_id_seq with it
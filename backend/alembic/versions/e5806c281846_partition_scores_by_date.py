@@ -0,0 +1,142 @@
+"""Partition scores by date (monthly range partitions)
+
+Converts the scores table used by ScoreDatabase (db_init/01_schema.sql, which
+b7c2e9a4d813 brings alembic-built databases to) into a declaratively
+partitioned table: PARTITION BY RANGE (date), one partition
+per month plus a DEFAULT partition. Existing rows are copied across and the
+id sequence is carried over, so saved ids keep increasing.
+
+Indexes are reduced to what the queries use:
+- PRIMARY KEY (ticker, date, mode): upserts (ON CONFLICT) and ticker history
+- (date, mode, band, score DESC, ticker DESC): band pages and latest-date lookups
+The old single-column band / as_of indexes and the (ticker, date) index
+(a prefix of the primary key) are dropped, so each upsert maintains two
+indexes instead of six.
+
+Future partitions are created by greyoak_score.data.partitions
+(maintain_partitions), which the API runs on startup.
+
+Revision ID: e5806c281846
+Revises: b7c2e9a4d813
+Create Date: 2026-10-18 10:12:44.518203
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from greyoak_score.data.partitions import add_months, create_partitions, DEFAULT_PARTITION
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5806c281846'
+down_revision: Union[str, None] = 'b7c2e9a4d813'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+MONTHS_AHEAD = 3
+
+COLUMNS = """
+    id INTEGER NOT NULL DEFAULT nextval('scores_id_seq'),
+    ticker VARCHAR(20) NOT NULL,
+    date DATE NOT NULL,
+    mode VARCHAR(10) NOT NULL CHECK (mode IN ('Trader', 'Investor')),
+    score NUMERIC(5,2) NOT NULL CHECK (score >= 0 AND score <= 100),
+    band VARCHAR(20) NOT NULL CHECK (band IN ('Strong Buy', 'Buy', 'Hold', 'Avoid')),
+    f_pillar NUMERIC(5,2) CHECK (f_pillar >= 0 AND f_pillar <= 100),
+    t_pillar NUMERIC(5,2) CHECK (t_pillar >= 0 AND t_pillar <= 100),
+    r_pillar NUMERIC(5,2) CHECK (r_pillar >= 0 AND r_pillar <= 100),
+    o_pillar NUMERIC(5,2) CHECK (o_pillar >= 0 AND o_pillar <= 100),
+    q_pillar NUMERIC(5,2) CHECK (q_pillar >= 0 AND q_pillar <= 100),
+    s_pillar NUMERIC(5,2) CHECK (s_pillar >= 0 AND s_pillar <= 100),
+    risk_penalty NUMERIC(5,2) NOT NULL CHECK (risk_penalty >= 0 AND risk_penalty <= 20),
+    guardrail_flags JSONB NOT NULL DEFAULT '[]',
+    confidence NUMERIC(4,3) NOT NULL CHECK (confidence >= 0 AND confidence <= 1),
+    s_z NUMERIC(6,3) NOT NULL,
+    as_of TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    config_hash VARCHAR(64) NOT NULL,
+    code_version VARCHAR(20),
+    CHECK (LENGTH(ticker) >= 1)
+"""
+
+COLUMN_NAMES = (
+    "id, ticker, date, mode, score, band, "
+    "f_pillar, t_pillar, r_pillar, o_pillar, q_pillar, s_pillar, "
+    "risk_penalty, guardrail_flags, confidence, s_z, as_of, config_hash, code_version"
+)
+
+COMMENTS = [
+    "COMMENT ON TABLE scores IS 'Main output table storing daily scores for all stocks (range-partitioned by date)'",
+    "COMMENT ON COLUMN scores.s_z IS 'Sector momentum z-score (weighted). Used for SectorBear guardrail threshold (-1.5)'",
+    "COMMENT ON COLUMN scores.guardrail_flags IS 'Array of triggered guardrails: LowDataHold, Illiquidity, PledgeCap, HighRiskCap, SectorBear, LowCoverage'",
+    "COMMENT ON COLUMN scores.config_hash IS 'SHA-256 hash of YAML configs used for this score calculation (for determinism audit)'",
+    "COMMENT ON COLUMN scores.as_of IS 'Timestamp when score was calculated (for audit trail)'",
+]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    # Move the heap table aside; keep the id sequence alive past its drop
+    op.execute("ALTER TABLE scores RENAME TO scores_unpartitioned")
+    op.execute("ALTER TABLE scores_unpartitioned RENAME CONSTRAINT scores_pkey TO scores_unpartitioned_pkey")
+    op.execute("ALTER SEQUENCE scores_id_seq OWNED BY NONE")
+    for index in ('idx_scores_ticker_date', 'idx_scores_date_mode', 'idx_scores_band',
+                  'idx_scores_date_band_mode', 'idx_scores_as_of'):
+        op.execute(f"DROP INDEX IF EXISTS {index}")
+
+    # Partitioned parent (the unique key must include the partition column)
+    op.execute(f"""
+        CREATE TABLE scores (
+            {COLUMNS},
+            CONSTRAINT scores_pkey PRIMARY KEY (ticker, date, mode)
+        ) PARTITION BY RANGE (date)
+    """)
+    op.execute("ALTER SEQUENCE scores_id_seq OWNED BY scores.id")
+    op.execute("""
+        CREATE INDEX idx_scores_date_mode_band_score
+        ON scores (date, mode, band, score DESC, ticker DESC)
+    """)
+    op.execute(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF scores DEFAULT")
+
+    # Monthly partitions from the oldest score through MONTHS_AHEAD months out
+    first = bind.execute(sa.text("SELECT MIN(date) FROM scores_unpartitioned")).scalar() or date.today()
+    with bind.connection.cursor() as cur:
+        create_partitions(cur, first, add_months(date.today(), MONTHS_AHEAD), 'month')
+
+    op.execute(f"INSERT INTO scores ({COLUMN_NAMES}) SELECT {COLUMN_NAMES} FROM scores_unpartitioned")
+    op.execute("DROP TABLE scores_unpartitioned")
+
+    for statement in COMMENTS:
+        op.execute(statement)
+
+
+def downgrade() -> None:
+    # Detached partitions (if any) are left untouched as standalone tables
+    op.execute("ALTER TABLE scores RENAME TO scores_partitioned")
+    op.execute("ALTER TABLE scores_partitioned RENAME CONSTRAINT scores_pkey TO scores_partitioned_pkey")
+    op.execute("ALTER INDEX idx_scores_date_mode_band_score RENAME TO idx_scores_partitioned_date_mode_band_score")
+    op.execute("ALTER SEQUENCE scores_id_seq OWNED BY NONE")
+
+    op.execute(f"""
+        CREATE TABLE scores (
+            {COLUMNS},
+            CONSTRAINT scores_pkey PRIMARY KEY (id),
+            UNIQUE (ticker, date, mode)
+        )
+    """)
+    op.execute("ALTER SEQUENCE scores_id_seq OWNED BY scores.id")
+    op.execute(f"INSERT INTO scores ({COLUMN_NAMES}) SELECT {COLUMN_NAMES} FROM scores_partitioned")
+    op.execute("DROP TABLE scores_partitioned")  # Drops attached partitions too
+
+    op.execute("CREATE INDEX IF NOT EXISTS idx_scores_ticker_date ON scores(ticker, date)")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_scores_date_mode ON scores(date, mode)")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_scores_band ON scores(band)")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_scores_date_band_mode ON scores(date, band, mode)")
+    op.execute("CREATE INDEX IF NOT EXISTS idx_scores_as_of ON scores(as_of)")
+
+    op.execute("COMMENT ON TABLE scores IS 'Main output table storing daily scores for all stocks'")
+    for statement in COMMENTS[1:]:
+        op.execute(statement)
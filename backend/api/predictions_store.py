@@ -0,0 +1,168 @@
+"""
+GreyOak Predictor - Predictions Store
+Indexed, hot-reloading view over predictor_predictions.parquet for the API
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from greyoak_score.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Columns the predictor routes actually read
+STORE_COLUMNS = [
+    'date', 'symbol', 'p_pos', 'E', 'RA', 'predictor_score', 'timing_band', 'flags'
+]
+
+
+@dataclass(frozen=True)
+class PredictionsSnapshot:
+    """
+    Immutable, indexed copy of the predictions file
+
+    Rows are sorted by (upper-cased symbol, date), so every ticker owns one
+    contiguous row range that binary search over `symbol_keys` finds in
+    O(log n). The latest prediction for a ticker is the last row of its range.
+    """
+    frame: pd.DataFrame
+    symbol_keys: np.ndarray
+    mtime_ns: int
+    loaded_at: float
+
+    def row_range(self, ticker: str) -> tuple:
+        """Return (start, stop) rows for a ticker (empty range if absent)"""
+        key = ticker.upper()
+        start = int(np.searchsorted(self.symbol_keys, key, side='left'))
+        stop = int(np.searchsorted(self.symbol_keys, key, side='right'))
+        return start, stop
+
+    def latest(self, ticker: str) -> Optional[pd.Series]:
+        """Most recent prediction row for a ticker, or None"""
+        start, stop = self.row_range(ticker)
+        if start == stop:
+            return None
+        return self.frame.iloc[stop - 1]
+
+    def history(self, ticker: str) -> pd.DataFrame:
+        """All prediction rows for a ticker in date order"""
+        start, stop = self.row_range(ticker)
+        return self.frame.iloc[start:stop]
+
+
+class PredictionsStore:
+    """
+    Hot-reloading predictions store
+
+    Requests read whatever snapshot is current; when the file's mtime changes
+    a single background thread builds a new snapshot and swaps it in with one
+    reference assignment. Readers never wait on a reload, except for the very
+    first load when no snapshot exists yet.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        columns: Optional[List[str]] = None,
+        check_interval: float = 1.0
+    ):
+        """
+        Args:
+            path: Predictions Parquet file
+            columns: Columns to load (projection); default STORE_COLUMNS
+            check_interval: Minimum seconds between mtime checks
+        """
+        self.path = Path(path)
+        self.columns = list(columns) if columns else list(STORE_COLUMNS)
+        self.check_interval = check_interval
+
+        self._snapshot: Optional[PredictionsSnapshot] = None
+        self._reload_lock = threading.Lock()
+        self._last_check = 0.0
+
+    def _stat_mtime(self) -> Optional[int]:
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def _build_snapshot(self, mtime_ns: int) -> PredictionsSnapshot:
+        """Read the projected columns and index them by (symbol, date)"""
+        available = set(pq.read_schema(self.path).names)
+        columns = [c for c in self.columns if c in available]
+        frame = pd.read_parquet(self.path, columns=columns)
+
+        symbol_keys = frame['symbol'].astype(str).str.upper()
+        order = np.lexsort((frame['date'].values, symbol_keys.values))
+        frame = frame.iloc[order].reset_index(drop=True)
+
+        return PredictionsSnapshot(
+            frame=frame,
+            symbol_keys=symbol_keys.values[order].astype(str),
+            mtime_ns=mtime_ns,
+            loaded_at=time.time()
+        )
+
+    def _reload(self, mtime_ns: int) -> None:
+        """Build and atomically swap in a new snapshot (caller holds the lock)"""
+        try:
+            snapshot = self._build_snapshot(mtime_ns)
+            self._snapshot = snapshot
+            logger.info(f"Predictions store loaded {len(snapshot.frame)} rows from {self.path}")
+        except Exception as e:
+            logger.error(f"Failed to reload predictions from {self.path}: {e}")
+        finally:
+            self._reload_lock.release()
+
+    def _reload_in_background(self, mtime_ns: int) -> None:
+        if not self._reload_lock.acquire(blocking=False):
+            return  # A reload is already running
+        threading.Thread(
+            target=self._reload, args=(mtime_ns,), name='predictions-reload', daemon=True
+        ).start()
+
+    def snapshot(self) -> Optional[PredictionsSnapshot]:
+        """
+        Return the current snapshot, scheduling a reload if the file changed
+
+        Returns:
+            PredictionsSnapshot, or None if the file has never been loaded
+        """
+        current = self._snapshot
+
+        if current is None:
+            mtime_ns = self._stat_mtime()
+            if mtime_ns is None:
+                return None
+            # First load is synchronous; concurrent first callers wait here
+            with self._reload_lock:
+                if self._snapshot is None:
+                    try:
+                        self._snapshot = self._build_snapshot(mtime_ns)
+                    except Exception as e:
+                        logger.error(f"Failed to load predictions from {self.path}: {e}")
+                        return None
+            self._last_check = time.monotonic()
+            return self._snapshot
+
+        now = time.monotonic()
+        if now - self._last_check >= self.check_interval:
+            self._last_check = now
+            mtime_ns = self._stat_mtime()
+            if mtime_ns is not None and mtime_ns != current.mtime_ns:
+                self._reload_in_background(mtime_ns)
+
+        return current
+
+    def frame(self) -> Optional[pd.DataFrame]:
+        """Current predictions frame (sorted by symbol, date) or None"""
+        snapshot = self.snapshot()
+        return snapshot.frame if snapshot is not None else None
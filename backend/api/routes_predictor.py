@@ -8,11 +8,11 @@ from pydantic import BaseModel
 from typing import Optional, List
 from datetime import datetime
 from pathlib import Path
-import pandas as pd
 import sys
 
 sys.path.insert(0, '/app/backend')
 from predictor.infer import load_model, run_inference
+from api.predictions_store import PredictionsStore
 
 # Create router
 router = APIRouter(prefix="/predictor", tags=["predictor"])
@@ -22,16 +22,13 @@ MODEL_PATH = Path("/app/backend/predictor_output")
 PREDICTIONS_FILE = MODEL_PATH / "predictor_predictions.parquet"
 
 # Cache
-predictions_cache = None
+predictions_store = PredictionsStore(PREDICTIONS_FILE)
 model_cache = None
 
 
 def load_predictions_cache():
-    """Load predictions from parquet file"""
-    global predictions_cache
-    if predictions_cache is None and PREDICTIONS_FILE.exists():
-        predictions_cache = pd.read_parquet(PREDICTIONS_FILE)
-    return predictions_cache
+    """Current predictions frame (hot-reloaded when the parquet file changes)"""
+    return predictions_store.frame()
 
 
 def load_model_cache():
@@ -74,27 +71,23 @@ async def get_predictor_signal(
         PredictorResponse with timing signal and score
     """
     # Load predictions
-    predictions = load_predictions_cache()
+    snapshot = predictions_store.snapshot()
     
-    if predictions is None:
+    if snapshot is None:
         raise HTTPException(
             status_code=503,
             detail="Predictor not initialized. Run training first."
         )
     
-    # Find ticker (case-insensitive)
-    ticker_upper = ticker.upper()
-    stock_data = predictions[predictions['symbol'].str.upper() == ticker_upper]
+    # Find most recent prediction for ticker (case-insensitive, indexed)
+    stock_data = snapshot.latest(ticker)
     
-    if len(stock_data) == 0:
+    if stock_data is None:
         raise HTTPException(
             status_code=404,
-            detail=f"Ticker {ticker} not found in predictions. Available tickers: {len(predictions)} stocks."
+            detail=f"Ticker {ticker} not found in predictions. Available tickers: {len(snapshot.frame)} stocks."
         )
     
-    # Get most recent prediction
-    stock_data = stock_data.sort_values('date', ascending=False).iloc[0]
-    
     # Parse flags
     flags = stock_data['flags'].split(',') if stock_data['flags'] else []
     
@@ -140,7 +133,7 @@ async def list_predictions(
         )
     
     # Apply filters
-    filtered = predictions.copy()
+    filtered = predictions
     
     if timing_band:
         filtered = filtered[filtered['timing_band'] == timing_band]
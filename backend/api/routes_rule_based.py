@@ -7,7 +7,12 @@ from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 from typing import List, Dict, Optional
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import asyncio
+import os
 import sys
+import time
 from pathlib import Path
 
 sys.path.insert(0, '/app/backend')
@@ -22,6 +27,12 @@ router = APIRouter(prefix="/rule-based", tags=["rule-based-predictor"])
 # Initialize predictor (singleton)
 predictor_instance = None
 
+# Batch fan-out: bounded worker pool and per-ticker timeout
+BATCH_MAX_WORKERS = int(os.getenv('RULE_BASED_BATCH_WORKERS', '8'))
+BATCH_TICKER_TIMEOUT = float(os.getenv('RULE_BASED_TICKER_TIMEOUT', '20'))
+batch_executor = None
+batch_slots = None  # (event loop, semaphore sized to the pool)
+
 
 def get_predictor():
     """Get or create predictor instance"""
@@ -31,6 +42,88 @@ def get_predictor():
     return predictor_instance
 
 
+def get_batch_executor() -> ThreadPoolExecutor:
+    """Get or create the bounded worker pool for batch signals"""
+    global batch_executor
+    if batch_executor is None:
+        batch_executor = ThreadPoolExecutor(
+            max_workers=BATCH_MAX_WORKERS,
+            thread_name_prefix="rule-based-batch"
+        )
+    return batch_executor
+
+
+def _get_batch_slots() -> asyncio.Semaphore:
+    """
+    Get the semaphore counting free batch workers, shared by all requests
+    
+    Bound to the running event loop (recreated if the loop changes).
+    """
+    global batch_slots
+    loop = asyncio.get_running_loop()
+    if batch_slots is None or batch_slots[0] is not loop:
+        batch_slots = (loop, asyncio.Semaphore(BATCH_MAX_WORKERS))
+    return batch_slots[1]
+
+
+def _release_slot(loop: asyncio.AbstractEventLoop, slots: asyncio.Semaphore, _future) -> None:
+    """Executor done-callback: hand the worker slot back on the event loop"""
+    try:
+        loop.call_soon_threadsafe(slots.release)
+    except RuntimeError:  # Event loop already closed
+        pass
+
+
+async def _get_signal_bounded(
+    predictor,
+    ticker: str,
+    mode: str,
+    timeout: float
+) -> Dict:
+    """
+    Run one blocking get_signal call on the worker pool with a timeout
+    
+    A slot is taken before submitting and given back only when the call
+    finishes, so the slots track busy pool workers across all requests and
+    the timeout only starts once a worker is free. A timed-out call cannot
+    be interrupted; its thread keeps its worker and slot until it finishes
+    in the background, and the result is discarded.
+    """
+    slots = _get_batch_slots()
+    await slots.acquire()
+    loop = asyncio.get_running_loop()
+    try:
+        future = get_batch_executor().submit(partial(predictor.get_signal, ticker, mode=mode))
+    except BaseException:
+        slots.release()
+        raise
+    future.add_done_callback(partial(_release_slot, loop, slots))
+    
+    started = time.perf_counter()
+    try:
+        result = await asyncio.wait_for(asyncio.wrap_future(future), timeout=timeout)
+    except asyncio.TimeoutError:
+        logger.warning(f"Timed out processing {ticker} after {timeout:g}s")
+        return {
+            'ticker': ticker,
+            'signal': 'Error',
+            'error': f"Timed out after {timeout:g}s",
+            'timed_out': True,
+            'timestamp': datetime.now().isoformat()
+        }
+    except Exception as e:
+        logger.warning(f"Failed to process {ticker}: {e}")
+        return {
+            'ticker': ticker,
+            'signal': 'Error',
+            'error': str(e),
+            'timestamp': datetime.now().isoformat()
+        }
+    
+    logger.debug(f"Processed {ticker} in {time.perf_counter() - started:.2f}s")
+    return result
+
+
 # Response models
 class TechnicalsData(BaseModel):
     current_price: float
@@ -152,6 +245,11 @@ async def get_batch_signals(request: BatchSignalRequest):
     """
     Get rule-based signals for multiple stocks
     
+    Tickers are processed concurrently on a bounded worker pool
+    (RULE_BASED_BATCH_WORKERS) with a per-ticker timeout
+    (RULE_BASED_TICKER_TIMEOUT seconds). Results keep request order;
+    failed or timed-out tickers are reported in the summary.
+    
     **Use Cases:**
     - Portfolio screening
     - Bulk stock analysis
@@ -182,35 +280,34 @@ async def get_batch_signals(request: BatchSignalRequest):
         # Get predictor
         predictor = get_predictor()
         
-        # Process each ticker
-        results = []
+        # Fan out tickers concurrently on the bounded worker pool;
+        # gather preserves request order in the results
+        started = time.perf_counter()
+        results = await asyncio.gather(*[
+            _get_signal_bounded(predictor, ticker, request.mode.lower(), BATCH_TICKER_TIMEOUT)
+            for ticker in request.tickers
+        ])
+        
         signal_counts = {'Strong Buy': 0, 'Buy': 0, 'Hold': 0, 'Avoid': 0, 'Error': 0}
+        for result in results:
+            signal = result.get('signal', 'Error')
+            signal_counts[signal] = signal_counts.get(signal, 0) + 1
         
-        for ticker in request.tickers:
-            try:
-                result = predictor.get_signal(ticker, mode=request.mode.lower())
-                results.append(result)
-                
-                signal = result.get('signal', 'Error')
-                signal_counts[signal] = signal_counts.get(signal, 0) + 1
-                
-            except Exception as e:
-                logger.warning(f"Failed to process {ticker}: {e}")
-                results.append({
-                    'ticker': ticker,
-                    'signal': 'Error',
-                    'error': str(e),
-                    'timestamp': datetime.now().isoformat()
-                })
-                signal_counts['Error'] += 1
+        failures = [
+            {'ticker': r.get('ticker'), 'error': r.get('error', 'Unknown error')}
+            for r in results if r.get('signal') == 'Error'
+        ]
         
         # Build summary
         summary = {
             'total_tickers': len(request.tickers),
             'successful': len(request.tickers) - signal_counts['Error'],
             'failed': signal_counts['Error'],
+            'timed_out': sum(1 for r in results if r.get('timed_out')),
+            'failures': failures,
             'signal_distribution': {k: v for k, v in signal_counts.items() if v > 0},
-            'mode': request.mode
+            'mode': request.mode,
+            'elapsed_seconds': round(time.perf_counter() - started, 3)
         }
         
         response = BatchSignalResponse(
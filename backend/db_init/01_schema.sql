@@ -4,8 +4,11 @@
 -- ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
 -- Scores table (main output)
+-- Range-partitioned by date: one partition per month plus a DEFAULT safety net.
+-- Upcoming partitions are pre-created by greyoak_score.data.partitions
+-- (run on API startup and via `python -m greyoak_score.data.partitions`).
 CREATE TABLE IF NOT EXISTS scores (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     ticker VARCHAR(20) NOT NULL,
     date DATE NOT NULL,
     mode VARCHAR(10) NOT NULL CHECK (mode IN ('Trader', 'Investor')),
@@ -34,17 +37,62 @@ CREATE TABLE IF NOT EXISTS scores (
     config_hash VARCHAR(64) NOT NULL,
     code_version VARCHAR(20),
     
-    -- Constraints
-    UNIQUE(ticker, date, mode),
+    -- Constraints (unique keys must include the partition column)
+    CONSTRAINT scores_pkey PRIMARY KEY (ticker, date, mode),
     CHECK (LENGTH(ticker) >= 1)
+) PARTITION BY RANGE (date);
+
+-- Band pages (date, mode, band ORDER BY score DESC) and latest-date lookups;
+-- ticker history uses the primary key
+CREATE INDEX IF NOT EXISTS idx_scores_date_mode_band_score
+    ON scores (date, mode, band, score DESC, ticker DESC);
+
+CREATE TABLE IF NOT EXISTS scores_default PARTITION OF scores DEFAULT;
+
+-- Monthly partitions from 2020-01 (start of historical data) to 3 months ahead
+DO $$
+DECLARE
+    month_start DATE;
+BEGIN
+    FOR month_start IN
+        SELECT generate_series(DATE '2020-01-01', date_trunc('month', CURRENT_DATE) + INTERVAL '3 months', INTERVAL '1 month')::date
+    LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF scores FOR VALUES FROM (%L) TO (%L)',
+            'scores_p' || to_char(month_start, 'YYYY_MM'),
+            month_start,
+            (month_start + INTERVAL '1 month')::date
+        );
+    END LOOP;
+END $$;
+
+-- Latest score per (ticker, mode), maintained by ScoreDatabase in the same
+-- transaction as writes to scores; serves latest-universe and top-N reads
+CREATE TABLE IF NOT EXISTS latest_scores (
+    ticker VARCHAR(20) NOT NULL,
+    date DATE NOT NULL,
+    mode VARCHAR(10) NOT NULL CHECK (mode IN ('Trader', 'Investor')),
+    score NUMERIC(5,2) NOT NULL CHECK (score >= 0 AND score <= 100),
+    band VARCHAR(20) NOT NULL CHECK (band IN ('Strong Buy', 'Buy', 'Hold', 'Avoid')),
+    f_pillar NUMERIC(5,2),
+    t_pillar NUMERIC(5,2),
+    r_pillar NUMERIC(5,2),
+    o_pillar NUMERIC(5,2),
+    q_pillar NUMERIC(5,2),
+    s_pillar NUMERIC(5,2),
+    risk_penalty NUMERIC(5,2) NOT NULL,
+    guardrail_flags JSONB NOT NULL DEFAULT '[]',
+    confidence NUMERIC(4,3) NOT NULL,
+    s_z NUMERIC(6,3) NOT NULL,
+    as_of TIMESTAMP WITH TIME ZONE NOT NULL,
+    config_hash VARCHAR(64) NOT NULL,
+    code_version VARCHAR(20),
+    PRIMARY KEY (ticker, mode)
 );
 
--- Indexes for common query patterns
-CREATE INDEX IF NOT EXISTS idx_scores_ticker_date ON scores(ticker, date);
-CREATE INDEX IF NOT EXISTS idx_scores_date_mode ON scores(date, mode);
-CREATE INDEX IF NOT EXISTS idx_scores_band ON scores(band);
-CREATE INDEX IF NOT EXISTS idx_scores_date_band_mode ON scores(date, band, mode);
-CREATE INDEX IF NOT EXISTS idx_scores_as_of ON scores(as_of);
+-- Latest date per mode and top-N within it are single index range scans
+CREATE INDEX IF NOT EXISTS idx_latest_scores_mode_date_score
+    ON latest_scores (mode, date, score DESC, ticker DESC);
 
 -- Sector mapping table (from CSV)
 CREATE TABLE IF NOT EXISTS sector_mapping (
@@ -56,6 +104,29 @@ CREATE TABLE IF NOT EXISTS sector_mapping (
 
 CREATE INDEX IF NOT EXISTS idx_sector_mapping_group ON sector_mapping(sector_group);
 
+-- Per-(date, mode, sector_group) aggregates, recomputed by ScoreDatabase
+-- batch saves; the sector endpoint reads one row by primary key.
+-- Tickers without a sector_mapping row are grouped as 'diversified'
+CREATE TABLE IF NOT EXISTS sector_aggregates (
+    sector_group VARCHAR(50) NOT NULL,
+    mode VARCHAR(10) NOT NULL CHECK (mode IN ('Trader', 'Investor')),
+    date DATE NOT NULL,
+    n_stocks INTEGER NOT NULL,
+    mean_score NUMERIC(5,2) NOT NULL,
+    median_score NUMERIC(5,2) NOT NULL,
+    band_counts JSONB NOT NULL,  -- {"Strong Buy": n, "Buy": n, "Hold": n, "Avoid": n}
+    mean_f_pillar NUMERIC(5,2),
+    mean_t_pillar NUMERIC(5,2),
+    mean_r_pillar NUMERIC(5,2),
+    mean_o_pillar NUMERIC(5,2),
+    mean_q_pillar NUMERIC(5,2),
+    mean_s_pillar NUMERIC(5,2),
+    mean_s_z NUMERIC(6,3) NOT NULL,
+    sector_bear_count INTEGER NOT NULL,
+    updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT NOW(),
+    PRIMARY KEY (sector_group, mode, date)
+);
+
 -- Config audit table (track configuration changes)
 CREATE TABLE IF NOT EXISTS config_audit (
     id SERIAL PRIMARY KEY,
@@ -70,11 +141,14 @@ CREATE INDEX IF NOT EXISTS idx_config_audit_hash ON config_audit(config_hash);
 CREATE INDEX IF NOT EXISTS idx_config_audit_timestamp ON config_audit(timestamp DESC);
 
 -- Comments for documentation
-COMMENT ON TABLE scores IS 'Main output table storing daily scores for all stocks';
+COMMENT ON TABLE scores IS 'Main output table storing daily scores for all stocks (range-partitioned by date)';
 COMMENT ON COLUMN scores.s_z IS 'Sector momentum z-score (weighted). Used for SectorBear guardrail threshold (-1.5)';
 COMMENT ON COLUMN scores.guardrail_flags IS 'Array of triggered guardrails: LowDataHold, Illiquidity, PledgeCap, HighRiskCap, SectorBear, LowCoverage';
 COMMENT ON COLUMN scores.config_hash IS 'SHA-256 hash of YAML configs used for this score calculation (for determinism audit)';
 COMMENT ON COLUMN scores.as_of IS 'Timestamp when score was calculated (for audit trail)';
 
+COMMENT ON TABLE latest_scores IS 'Most recent score per (ticker, mode); kept in sync with scores on every save';
+
 COMMENT ON TABLE sector_mapping IS 'Ticker to sector mapping (from sector_map.csv)';
+COMMENT ON TABLE sector_aggregates IS 'Per-sector score aggregates per (date, mode); refreshed by batch saves';
 COMMENT ON TABLE config_audit IS 'Audit log for configuration changes (tracks config_hash + content)';
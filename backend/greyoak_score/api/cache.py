@@ -0,0 +1,173 @@
+"""
+In-process read-through response cache for score queries.
+
+Scores for a (date, mode) only change when a batch is persisted, so band and
+latest-score responses are cached with a TTL and LRU bound, keyed by the
+query parameters plus the scoring config_hash. Saves committed through
+ScoreDatabase invalidate matching entries via a save listener; writes made
+by other processes are picked up when the TTL expires.
+
+Routes cache the serialized JSON body, so hits skip serialization too.
+Each response entry carries a strong ETag (hash of the serialized response)
+so clients can revalidate with If-None-Match and receive 304 Not Modified.
+Caches of internal query results (never sent as a body) skip the ETag.
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+
+from greyoak_score.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """A cached response with its ETag and invalidation tags."""
+    value: Any
+    etag: Optional[str]  # None for internal values stored with etag=False
+    expires_at: float
+    date: Optional[date]  # None: depends on the latest date (any save invalidates)
+    mode: str
+
+
+class ResponseCache:
+    """
+    Thread-safe TTL + LRU cache of API responses (JSON bodies or models).
+
+    Entries expire ttl_seconds after they are stored; when max_entries is
+    reached the least recently used entry is evicted.
+    """
+
+    def __init__(self, max_entries: Optional[int] = None, ttl_seconds: Optional[float] = None):
+        """
+        Args:
+            max_entries: Capacity (RESPONSE_CACHE_MAX_ENTRIES, default 512)
+            ttl_seconds: Entry lifetime (RESPONSE_CACHE_TTL, default 300)
+        """
+        self.max_entries = max_entries or int(os.getenv('RESPONSE_CACHE_MAX_ENTRIES', '512'))
+        self.ttl_seconds = (
+            ttl_seconds if ttl_seconds is not None
+            else float(os.getenv('RESPONSE_CACHE_TTL', '300'))
+        )
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'invalidations': 0}
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        """Return a live entry (refreshing its LRU position) or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self._stats['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self._stats['hits'] += 1
+            return entry
+
+    def put(
+        self,
+        key: Hashable,
+        value: Any,
+        date: Optional[date],
+        mode: str,
+        etag: bool = True
+    ) -> CacheEntry:
+        """
+        Store a response model and return its entry.
+
+        Args:
+            key: Cache key (query parameters + config_hash)
+            value: Serialized JSON body (bytes), Pydantic response model or other query result
+            date: Score date the response depends on (None for latest-date queries)
+            mode: Scoring mode the response depends on
+            etag: Compute an ETag; pass False for internal values that are
+                  never served as a response body
+        """
+        entry = CacheEntry(
+            value=value,
+            etag=compute_etag(value) if etag else None,
+            expires_at=time.monotonic() + self.ttl_seconds,
+            date=date,
+            mode=mode
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._stats['evictions'] += 1
+        return entry
+
+    def invalidate(self, saved: Iterable[Tuple[date, str]]) -> int:
+        """
+        Drop entries affected by saved (date, mode) pairs.
+
+        Entries for a saved date are dropped, as are latest-date entries for
+        the same mode (a save may add a newer date).
+
+        Returns:
+            int: Number of entries removed
+        """
+        saved = set(saved)
+        modes = {mode for _, mode in saved}
+        with self._lock:
+            stale = [
+                key for key, entry in self._entries.items()
+                if (entry.date, entry.mode) in saved or (entry.date is None and entry.mode in modes)
+            ]
+            for key in stale:
+                del self._entries[key]
+            self._stats['invalidations'] += len(stale)
+        if stale:
+            logger.debug(f"Invalidated {len(stale)} cached responses for {sorted(saved)}")
+        return len(stale)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and current size for monitoring."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['size'] = len(self._entries)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = round(stats['hits'] / lookups, 4) if lookups else 0.0
+        return stats
+
+
+def compute_etag(value: Any) -> str:
+    """Strong ETag from the serialized response body."""
+    if isinstance(value, bytes):
+        body = value
+    elif hasattr(value, 'model_dump_json'):
+        body = value.model_dump_json().encode()
+    else:
+        body = repr(value).encode()
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Evaluate an If-None-Match header against an ETag (weak comparison).
+
+    Args:
+        if_none_match: Raw header value (may list several tags or be '*')
+        etag: Current entity tag
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == '*':
+        return True
+    candidates = {tag.strip().removeprefix('W/') for tag in if_none_match.split(',')}
+    return etag.removeprefix('W/') in candidates
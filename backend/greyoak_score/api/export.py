@@ -0,0 +1,141 @@
+"""
+Bulk columnar export of score history.
+
+Row chunks from ScoreDatabase.stream_score_chunks are encoded incrementally
+as an Arrow IPC stream, a Parquet file (one row group per chunk) or
+newline-delimited JSON. Each encoder is a generator of byte blocks suitable
+for a StreamingResponse, so only one chunk is in memory at a time however
+many rows are exported.
+"""
+
+from typing import Iterable, Iterator, List
+
+import orjson
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from greyoak_score.data.persistence import EXPORT_COLUMNS
+from greyoak_score.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+EXPORT_SCHEMA = pa.schema([
+    ('ticker', pa.string()),
+    ('date', pa.date32()),
+    ('mode', pa.string()),
+    ('score', pa.float64()),
+    ('band', pa.string()),
+    ('f_pillar', pa.float64()),
+    ('t_pillar', pa.float64()),
+    ('r_pillar', pa.float64()),
+    ('o_pillar', pa.float64()),
+    ('q_pillar', pa.float64()),
+    ('s_pillar', pa.float64()),
+    ('risk_penalty', pa.float64()),
+    ('guardrail_flags', pa.list_(pa.string())),
+    ('confidence', pa.float64()),
+    ('s_z', pa.float64()),
+    ('as_of', pa.timestamp('us', tz='UTC')),
+    ('config_hash', pa.string()),
+])
+
+# format name -> (media type, file extension)
+EXPORT_FORMATS = {
+    'arrow': ('application/vnd.apache.arrow.stream', 'arrows'),
+    'parquet': ('application/vnd.apache.parquet', 'parquet'),
+    'ndjson': ('application/x-ndjson', 'ndjson'),
+}
+
+
+class _ByteSink:
+    """Write-only file object that collects bytes until drained."""
+
+    def __init__(self):
+        self._blocks: List[bytes] = []
+        self.closed = False
+
+    def write(self, data) -> int:
+        self._blocks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data, self._blocks = b''.join(self._blocks), []
+        return data
+
+
+def to_record_batch(rows: List[tuple]) -> pa.RecordBatch:
+    """Transpose a chunk of EXPORT_COLUMNS tuples into an Arrow record batch."""
+    columns = zip(*rows)
+    return pa.RecordBatch.from_arrays(
+        [pa.array(values, type=field.type) for values, field in zip(columns, EXPORT_SCHEMA)],
+        schema=EXPORT_SCHEMA
+    )
+
+
+def encode_arrow(chunks: Iterable[List[tuple]]) -> Iterator[bytes]:
+    """Arrow IPC stream: the schema message, then one record batch per chunk."""
+    sink = _ByteSink()
+    with pa.ipc.new_stream(sink, EXPORT_SCHEMA) as writer:
+        yield sink.drain()
+        for rows in chunks:
+            writer.write_batch(to_record_batch(rows))
+            yield sink.drain()
+    yield sink.drain()  # End-of-stream marker
+
+
+def encode_parquet(chunks: Iterable[List[tuple]]) -> Iterator[bytes]:
+    """Parquet file with one row group per chunk; the footer is written last."""
+    sink = _ByteSink()
+    with pq.ParquetWriter(sink, EXPORT_SCHEMA, compression='zstd') as writer:
+        for rows in chunks:
+            writer.write_batch(to_record_batch(rows))
+            yield sink.drain()
+    yield sink.drain()  # Footer
+
+
+def encode_ndjson(chunks: Iterable[List[tuple]]) -> Iterator[bytes]:
+    """One JSON object per row, one byte block per chunk."""
+    option = orjson.OPT_APPEND_NEWLINE
+    for rows in chunks:
+        yield b''.join(orjson.dumps(dict(zip(EXPORT_COLUMNS, row)), option=option) for row in rows)
+
+
+_ENCODERS = {'arrow': encode_arrow, 'parquet': encode_parquet, 'ndjson': encode_ndjson}
+
+
+def encode_export(chunks: Iterable[List[tuple]], fmt: str) -> Iterator[bytes]:
+    """
+    Encode row chunks in an export format, skipping empty blocks.
+
+    Args:
+        chunks: Lists of tuples in EXPORT_COLUMNS order
+        fmt: 'arrow', 'parquet' or 'ndjson'
+
+    Yields:
+        Encoded byte blocks, roughly one per chunk
+    """
+    if fmt not in _ENCODERS:
+        raise ValueError(f"Invalid format: {fmt}. Must be one of {sorted(_ENCODERS)}")
+    rows = 0
+
+    def counted():
+        nonlocal rows
+        for chunk in chunks:
+            rows += len(chunk)
+            yield chunk
+
+    try:
+        for block in _ENCODERS[fmt](counted()):
+            if block:
+                yield block
+    except Exception as e:
+        # Once streaming has started, a truncated body is the only signal to the client
+        logger.error(f"Score export failed after {rows} rows: {e}", exc_info=True)
+        raise
+    logger.info(f"Exported {rows} scores as {fmt}")
@@ -20,6 +20,7 @@ from fastapi import FastAPI, Request, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse
+from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 import logging
@@ -37,9 +38,16 @@ from dotenv import load_dotenv
 load_dotenv()
 
 import greyoak_score
-from greyoak_score.api.routes import router
+from greyoak_score.api.routes import router, shutdown_scoring_executor
+from greyoak_score.api.responses import FastJSONResponse
 from greyoak_score.utils.logger import get_logger
 from greyoak_score.data.persistence import get_database, close_database
+from greyoak_score.data.async_persistence import (
+    get_async_database, close_async_database, use_async_driver
+)
+from greyoak_score.data.write_behind import get_write_queue, close_write_queue
+from greyoak_score.data.health_monitor import get_health_monitor, close_health_monitor
+from greyoak_score.data.score_events import get_score_event_broker, close_score_event_broker
 
 logger = get_logger(__name__)
 
@@ -54,12 +62,22 @@ async def lifespan(app: FastAPI):
     
     CP7 Startup:
     - Database connection pool initialization with retry logic
+    - Pool warm-up (connections opened, hot statements prepared)
+    - Async (asyncpg) read pool when DB_DRIVER=asyncpg
+    - Score partition pre-creation (partitioned schema only)
+    - Write-behind persistence queue start
+    - Background database health monitor start
+    - Score event broker start (its listener retries while the database is down)
     - Environment configuration validation
     - Security middleware configuration logging
     - Health check system initialization
     
     CP7 Shutdown:
-    - Database connection pool cleanup
+    - Scoring executor drain
+    - Score event broker stop
+    - Health monitor stop
+    - Write-behind queue flush
+    - Database connection pool cleanup (both drivers)
     - Graceful resource cleanup
     - Audit logging of shutdown
     """
@@ -75,7 +93,8 @@ async def lifespan(app: FastAPI):
         'rate_limit': os.getenv('RATE_LIMIT', '60'),
         'cors_enabled': bool(os.getenv('CORS_ORIGINS')),
         'trusted_hosts_enabled': bool(os.getenv('TRUSTED_HOSTS')),
-        'pool_config': f"{os.getenv('DB_POOL_MIN_CONN', '2')}-{os.getenv('DB_POOL_MAX_CONN', '20')}"
+        'pool_config': f"{os.getenv('DB_POOL_MIN_CONN', '2')}-{os.getenv('DB_POOL_MAX_CONN', '20')}",
+        'db_driver': 'asyncpg' if use_async_driver() else 'psycopg2'
     }
     logger.info(f"Environment configuration: {env_config}")
     
@@ -85,12 +104,48 @@ async def lifespan(app: FastAPI):
         if db.test_connection():
             pool_stats = db.get_pool_stats()
             logger.info(f"✅ Database connection pool initialized: {pool_stats}")
+            
+            # Open and prepare DB_POOL_MIN_CONN connections before traffic arrives
+            try:
+                db.warm_pool()
+            except Exception as e:
+                logger.warning(f"⚠️ Connection pool warm-up failed: {e}")
+            
+            # Make sure upcoming date partitions exist before scores arrive
+            try:
+                created = db.maintain_partitions(
+                    months_ahead=int(os.getenv('SCORES_PARTITION_MONTHS_AHEAD', '3'))
+                )['created']
+                if created:
+                    logger.info(f"✅ Created score partitions: {created}")
+            except Exception as e:
+                logger.warning(f"⚠️ Partition maintenance failed: {e}")
         else:
             logger.warning("⚠️ Database connection test failed - API will start but database operations may fail")
     except Exception as e:
         logger.error(f"❌ Database initialization error: {e}")
         logger.warning("API starting in degraded mode - database operations will fail")
     
+    # Open the async read pool used by the routes (DB_DRIVER=asyncpg)
+    if use_async_driver():
+        try:
+            await get_async_database()
+            logger.info("✅ Async database pool initialized")
+        except Exception as e:
+            logger.error(f"❌ Async database initialization error: {e}")
+    
+    # Start the write-behind persistence queue
+    get_write_queue()
+    
+    # Start background database health probes (served by /api/v1/health)
+    get_health_monitor()
+    
+    # Start the score event feed (served by /api/v1/events/scores)
+    try:
+        get_score_event_broker()
+    except Exception as e:
+        logger.error(f"❌ Score event broker failed to start: {e}")
+    
     startup_time = time.time() - start_time
     logger.info(f"🎯 GreyOak Score API v{greyoak_score.__version__} started successfully in {startup_time:.2f}s")
     
@@ -99,7 +154,40 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("🛑 Shutting down GreyOak Score API")
     
-    # Cleanup database connection pool
+    # Let in-flight scoring finish before the pool goes away
+    try:
+        shutdown_scoring_executor()
+        logger.info("✅ Scoring executor stopped")
+    except Exception as e:
+        logger.error(f"❌ Error stopping scoring executor: {e}")
+    
+    # Stop the score event listener and release stream subscribers
+    try:
+        close_score_event_broker()
+        logger.info("✅ Score event broker stopped")
+    except Exception as e:
+        logger.error(f"❌ Error stopping score event broker: {e}")
+    
+    # Stop health probes before the pool goes away
+    try:
+        close_health_monitor()
+        logger.info("✅ Database health monitor stopped")
+    except Exception as e:
+        logger.error(f"❌ Error stopping health monitor: {e}")
+    
+    # Flush queued scores while the database pool is still open
+    try:
+        close_write_queue()
+        logger.info("✅ Write-behind queue flushed")
+    except Exception as e:
+        logger.error(f"❌ Error flushing write-behind queue: {e}")
+    
+    # Cleanup database connection pools
+    try:
+        await close_async_database()
+    except Exception as e:
+        logger.error(f"❌ Error closing async database pool: {e}")
+    
     try:
         close_database()
         logger.info("✅ Database connection pool closed successfully")
@@ -160,6 +248,7 @@ app = FastAPI(
     redoc_url="/redoc",
     openapi_url="/openapi.json",
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
     contact={
         "name": "GreyOak Score Engine",  
         "email": "support@greyoak.com",
@@ -247,7 +336,8 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
         content={
             "error": "Validation Error",
             "message": "The request data is invalid. Please check the required fields and formats.",
-            "details": exc.errors(),
+            # Validator errors carry the raised exception in ctx; render it as text
+            "details": jsonable_encoder(exc.errors(), custom_encoder={Exception: str}),
             "request_id": request_id
         }
     )
@@ -274,7 +364,8 @@ async def http_exception_handler(request: Request, exc: StarletteHTTPException):
             "error": f"HTTP {exc.status_code}",
             "message": exc.detail,
             "request_id": request_id
-        }
+        },
+        headers=exc.headers  # e.g. Retry-After on 503
     )
 
 
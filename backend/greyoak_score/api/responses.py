@@ -0,0 +1,38 @@
+"""
+Fast JSON responses for the GreyOak Score API.
+
+FastJSONResponse renders with orjson, which serializes dicts, lists, floats
+and datetimes natively and is several times faster than the stdlib encoder
+for large score lists. It is the application's default response class, and
+read endpoints return it directly with pre-built dicts so large pages skip
+response_model validation entirely.
+"""
+
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from starlette.responses import JSONResponse
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(value: Any) -> Any:
+    """Fallback for types orjson does not handle natively."""
+    if isinstance(value, Decimal):
+        return float(value)
+    if hasattr(value, 'model_dump'):
+        return value.model_dump(mode='json')
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize content to JSON bytes with orjson."""
+    return orjson.dumps(content, default=_default, option=_ORJSON_OPTIONS)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
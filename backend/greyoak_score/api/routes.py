@@ -7,17 +7,31 @@ and provides comprehensive score calculation and retrieval capabilities.
 
 Endpoints:
 - POST /api/v1/calculate - Calculate score for a stock
+- POST /api/v1/calculate/batch - Calculate scores for many stocks in one call
+- GET /api/v1/scores/latest - Get latest scores for a mode (cached)
 - GET /api/v1/scores/{ticker} - Get score history for a ticker
-- GET /api/v1/scores/band/{band} - Get stocks by investment band
+- GET /api/v1/scores/band/{band} - Get stocks by investment band (cached)
+- GET /api/v1/sectors/{sector} - Get precomputed sector aggregates (cached)
+- POST /api/v1/portfolio/analyze - Weighted portfolio score, exposures and what-if scenarios
+- GET /api/v1/export/scores - Stream score history as Arrow IPC, Parquet or NDJSON
+- GET /api/v1/events/scores - Server-sent events for newly published scores
 - GET /api/v1/health - Health check with database connectivity
+- GET /api/v1/metrics - Connection pool, query latency and cache metrics
 """
 
-from fastapi import APIRouter, HTTPException, Query, Path, Request
-from typing import List, Optional
+from fastapi import APIRouter, HTTPException, Query, Path, Request, Response
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import asyncio
+import itertools
 import os
 import re
-import psycopg2
+import threading
+import time
 
 # Rate limiting
 from slowapi import Limiter
@@ -25,11 +39,26 @@ from slowapi.util import get_remote_address
 
 from greyoak_score.api.schemas import (
     ScoreRequest, ScoreResponse, HealthResponse, 
-    ErrorResponse, StocksByBandResponse
+    ErrorResponse, StocksByBandResponse, LatestScoresResponse,
+    BatchScoreRequest, BatchScoreResponse, SectorAnalysisResponse,
+    PortfolioAnalysisRequest, PortfolioAnalysisResponse
 )
+from greyoak_score.api.export import EXPORT_FORMATS, encode_export
+from greyoak_score.api.cache import ResponseCache, CacheEntry, etag_matches
+from greyoak_score.api.responses import FastJSONResponse, dumps
+from greyoak_score.api.singleflight import SingleFlight
 import greyoak_score
-from greyoak_score.data.persistence import get_database
+from greyoak_score.data.persistence import get_database, register_save_listener
+from greyoak_score.data.async_persistence import (
+    DATABASE_ERRORS, get_async_database, use_async_driver
+)
+from greyoak_score.data.write_behind import get_write_queue, WriteQueueFull
+from greyoak_score.data.health_monitor import get_health_monitor
+from greyoak_score.data.score_events import (
+    ScoreEventBroker, Subscription, TooManySubscribers, get_score_event_broker, get_score_event_stats
+)
 from greyoak_score.core.scoring import calculate_greyoak_score
+from greyoak_score.core.portfolio import PortfolioHoldings, build_holdings, aggregate_portfolio
 from greyoak_score.data.models import ScoreOutput, PillarScores
 from greyoak_score.utils.logger import get_logger
 
@@ -52,6 +81,303 @@ def get_db_instance():
     return get_database()
 
 
+# DB_DRIVER=asyncpg: reads go through the native async pool instead of
+# psycopg2 calls on worker threads
+USE_ASYNC_DB = use_async_driver()
+
+
+async def _query_db(method: str, **kwargs) -> Any:
+    """
+    Call a ScoreDatabase query method without blocking the event loop.
+    
+    Awaits AsyncScoreDatabase when the async driver is enabled, otherwise
+    runs the psycopg2 method on a worker thread. Both return the same types.
+    """
+    if USE_ASYNC_DB:
+        db = await get_async_database()
+        return await getattr(db, method)(**kwargs)
+    return await asyncio.to_thread(getattr(get_db_instance(), method), **kwargs)
+
+
+# Scoring executor: CPU-bound scoring and blocking psycopg2 calls run here
+# instead of on the event loop thread
+SCORING_EXECUTOR_WORKERS = int(os.getenv('SCORING_EXECUTOR_WORKERS', '4'))
+_scoring_executor: Optional[ThreadPoolExecutor] = None
+
+
+def get_scoring_executor() -> ThreadPoolExecutor:
+    """Get the scoring executor, creating it on first use."""
+    global _scoring_executor
+    if _scoring_executor is None:
+        _scoring_executor = ThreadPoolExecutor(
+            max_workers=SCORING_EXECUTOR_WORKERS,
+            thread_name_prefix="greyoak-scoring"
+        )
+        logger.info(f"Scoring executor started with {SCORING_EXECUTOR_WORKERS} workers")
+    return _scoring_executor
+
+
+def shutdown_scoring_executor() -> None:
+    """Wait for in-flight scoring work and stop the executor."""
+    global _scoring_executor
+    if _scoring_executor is not None:
+        _scoring_executor.shutdown(wait=True)
+        _scoring_executor = None
+
+
+async def _run_on_scoring_executor(func, *args) -> Tuple[Any, float, float]:
+    """
+    Run a blocking function on the scoring executor.
+    
+    Returns:
+        Tuple of (result, queue wait in ms, run time in ms)
+    """
+    submitted = time.perf_counter()
+    timings = {}
+    
+    def timed_call():
+        begun = time.perf_counter()
+        timings['queue'] = (begun - submitted) * 1000
+        try:
+            return func(*args)
+        finally:
+            timings['run'] = (time.perf_counter() - begun) * 1000
+    
+    loop = asyncio.get_running_loop()
+    result = await loop.run_in_executor(get_scoring_executor(), timed_call)
+    return result, timings['queue'], timings['run']
+
+
+def _format_server_timing(stage_ms: Dict[str, float]) -> str:
+    """Format stage durations as a Server-Timing header value."""
+    return ", ".join(f"{stage};dur={ms:.2f}" for stage, ms in stage_ms.items())
+
+
+@lru_cache(maxsize=1)
+def _get_score_config():
+    """Load the scoring configuration once per process (read-only afterwards)."""
+    from greyoak_score.core.config_manager import ConfigManager
+    from pathlib import Path as FilePath
+    
+    config_dir = FilePath(__file__).parent.parent.parent / "configs"
+    return ConfigManager(config_dir)
+
+
+def _compute_score(score_request: ScoreRequest, scoring_date) -> ScoreOutput:
+    """Build scoring inputs and run the scoring engine (blocking, CPU-bound)."""
+    import pandas as pd
+    
+    # For this implementation, we'll create a mock score calculation
+    # In production, this would load actual data and use the full pipeline
+    
+    # Mock pillar scores (in production, these would be calculated)
+    mock_pillar_scores = {
+        'F': 70.0 + hash(score_request.ticker) % 20,  # Deterministic but varied
+        'T': 65.0 + hash(score_request.date) % 25,
+        'R': 60.0 + hash(score_request.mode) % 30,
+        'O': 75.0 + hash(score_request.ticker + score_request.date) % 15,
+        'Q': 80.0 + hash(score_request.ticker + score_request.mode) % 20,
+        'S': 72.0 + hash(score_request.date + score_request.mode) % 18
+    }
+    
+    # Mock additional data (in production, loaded from CSV/database)
+    mock_prices_data = pd.Series({
+        'close': 2500.0,
+        'volume': 1000000,
+        'median_traded_value_cr': 4.5,
+        'rsi_14': 55.0,
+        'atr_20': 50.0,
+        'dma20': 2450.0,
+        'dma200': 2300.0,
+        'sigma20': 0.025
+    })
+    
+    mock_fundamentals_data = pd.Series({
+        'market_cap_cr': 15000.0,
+        'roe_3y': 0.15,
+        'sales_cagr_3y': 0.12,
+        'quarter_end': '2024-09-30'
+    })
+    
+    mock_ownership_data = pd.Series({
+        'promoter_holding_pct': 0.68,
+        'promoter_pledge_frac': 0.05,
+        'fii_holding_pct': 0.15
+    })
+    
+    # Determine sector group (simplified mapping)
+    sector_group = _get_sector_group(score_request.ticker)
+    
+    # Use the scoring engine (with mocked data)
+    return calculate_greyoak_score(
+        ticker=score_request.ticker,
+        pillar_scores=mock_pillar_scores,
+        prices_data=mock_prices_data,
+        fundamentals_data=mock_fundamentals_data,
+        ownership_data=mock_ownership_data,
+        sector_group=sector_group,
+        mode=score_request.mode.lower(),
+        config=_get_score_config(),
+        s_z=1.2,  # Mock sector momentum z-score
+        scoring_date=datetime.combine(scoring_date, datetime.min.time().replace(tzinfo=timezone.utc))
+    )
+
+
+def _persist_score(score_result: ScoreOutput) -> bool:
+    """
+    Hand a score to the write-behind queue (the database commit happens later).
+    
+    Returns:
+        bool: True if queued, False if the queue is unavailable
+        
+    Raises:
+        WriteQueueFull: If the queue stays full (backpressure)
+    """
+    try:
+        get_write_queue().submit(score_result)
+        return True
+    except WriteQueueFull:
+        raise
+    except Exception as e:
+        logger.warning(f"Failed to queue score for persistence: {e}")
+        return False
+
+
+def _compute_scores_batch(
+    batch_request: BatchScoreRequest, scoring_date
+) -> Tuple[List[ScoreOutput], List[Dict[str, str]]]:
+    """
+    Score every ticker in a batch in one pass (blocking, CPU-bound).
+    
+    The scoring config, date and mode are resolved once and shared by all
+    tickers; a ticker that fails is reported without failing the batch.
+    
+    Returns:
+        Tuple of (scores, errors as {'ticker', 'error'} dicts)
+    """
+    results, errors = [], []
+    for ticker in batch_request.tickers:
+        if not _validate_ticker(ticker):
+            errors.append({'ticker': ticker, 'error': "Invalid ticker format"})
+            continue
+        try:
+            score_request = ScoreRequest(ticker=ticker, date=batch_request.date, mode=batch_request.mode)
+            results.append(_compute_score(score_request, scoring_date))
+        except Exception as e:
+            logger.warning(f"Batch scoring failed for {ticker}: {e}")
+            errors.append({'ticker': ticker, 'error': str(e)})
+    return results, errors
+
+
+def _persist_scores_batch(scores: List[ScoreOutput]) -> int:
+    """
+    Write a batch of scores with one multi-row UPSERT (ScoreDatabase.save_scores_batch).
+    
+    Returns:
+        int: Rows written (0 if there was nothing to write or the write failed)
+    """
+    if not scores:
+        return 0
+    try:
+        return get_db_instance().save_scores_batch(scores)
+    except Exception as e:
+        logger.warning(f"Failed to persist batch of {len(scores)} scores: {e}")
+        return 0
+
+
+async def _score_and_persist(score_request: ScoreRequest, scoring_date) -> Tuple[ScoreOutput, Dict[str, float], bool]:
+    """
+    Compute a score on the scoring executor and queue it for persistence.
+    
+    Returns:
+        Tuple of (score, stage durations in ms, queued for persistence)
+        
+    Raises:
+        WriteQueueFull: If the write-behind queue stays full (backpressure)
+    """
+    stage_ms = {}
+    score_result, stage_ms['queue'], stage_ms['score'] = await _run_on_scoring_executor(
+        _compute_score, score_request, scoring_date
+    )
+    queued, queue_ms, stage_ms['persist'] = await _run_on_scoring_executor(
+        _persist_score, score_result
+    )
+    stage_ms['queue'] += queue_ms
+    return score_result, stage_ms, queued
+
+
+# Rows per server-side cursor fetch and per Arrow record batch / Parquet row group
+EXPORT_CHUNK_SIZE = int(os.getenv('EXPORT_CHUNK_SIZE', '50000'))
+# Each running export holds a pooled connection for the whole download;
+# cap them so slow clients cannot starve the pool for every other route
+EXPORT_MAX_CONCURRENT = int(os.getenv('EXPORT_MAX_CONCURRENT', '4'))
+export_slots = threading.BoundedSemaphore(EXPORT_MAX_CONCURRENT)
+
+# Score event stream: keepalive comment interval (seconds) and client reconnect delay (ms)
+SCORE_EVENTS_KEEPALIVE = float(os.getenv('SCORE_EVENTS_KEEPALIVE', '15'))
+SCORE_EVENTS_RETRY_MS = 3000
+
+
+# Single-flight coalescing: identical concurrent score calculations and
+# history queries share one in-flight computation/query
+score_flights = SingleFlight('score')
+history_flights = SingleFlight('ticker_history')
+
+
+# Read-through cache for band and latest-score responses; committed saves
+# drop entries for the (date, mode) they touch
+response_cache = ResponseCache()
+register_save_listener(response_cache.invalidate)
+
+# Packed portfolio holdings (numpy arrays, not response bodies): a separate
+# small cache without ETags, invalidated by saves like response_cache
+portfolio_cache = ResponseCache(max_entries=int(os.getenv('PORTFOLIO_CACHE_MAX_ENTRIES', '128')))
+register_save_listener(portfolio_cache.invalidate)
+
+
+def _conditional_response(request: Request, entry: CacheEntry) -> Response:
+    """Return the cached JSON body, or 304 if the client's If-None-Match matches."""
+    headers = {'ETag': entry.etag, 'Cache-Control': 'no-cache'}
+    if etag_matches(request.headers.get('if-none-match'), entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.value, media_type='application/json', headers=headers)
+
+
+def _json_response(content: Any, response: Response) -> FastJSONResponse:
+    """
+    Serialize pre-built response dicts directly, bypassing response_model validation.
+
+    Headers already set on the injected `response` are carried over.
+    """
+    headers = {k: v for k, v in response.headers.items() if k != 'content-length'}
+    return FastJSONResponse(content, headers=headers)
+
+
+def _score_response(score: ScoreOutput) -> ScoreResponse:
+    """Convert a ScoreOutput to the API response model."""
+    return ScoreResponse(
+        ticker=score.ticker,
+        date=score.scoring_date.isoformat(),
+        mode=score.mode,
+        score=score.score,
+        band=score.band,
+        pillars={
+            'F': score.pillars.F,
+            'T': score.pillars.T,
+            'R': score.pillars.R,
+            'O': score.pillars.O,
+            'Q': score.pillars.Q,
+            'S': score.pillars.S
+        },
+        risk_penalty=score.risk_penalty,
+        guardrail_flags=score.guardrail_flags,
+        confidence=score.confidence,
+        s_z=score.s_z,
+        as_of=score.as_of.isoformat(),
+        config_hash=score.config_hash
+    )
+
+
 @router.post(
     "/calculate",
     response_model=ScoreResponse,
@@ -73,7 +399,7 @@ def get_db_instance():
     3. Calculates six pillar scores with sector normalization
     4. Applies risk penalties and sequential guardrails
     5. Generates final score (0-100) and investment band
-    6. Saves result to database for audit trail
+    6. Queues result for batched (write-behind) database persistence
     7. Returns comprehensive scoring breakdown
     
     **Note:** This endpoint requires pre-calculated pillar scores in the current implementation.
@@ -81,112 +407,69 @@ def get_db_instance():
     """
 )
 @limiter.limit(rate_limit)
-async def calculate_score_endpoint(request_obj: Request, request: ScoreRequest):
+async def calculate_score_endpoint(request: Request, response: Response, score_request: ScoreRequest):
     """
     Calculate GreyOak Score for a stock.
     
     This is the main scoring endpoint that orchestrates the complete
     scoring pipeline from data loading to final score generation.
+    
+    Scoring and the database write run on the scoring executor so the event
+    loop stays free for other requests; per-stage durations are reported in
+    the Server-Timing response header. Concurrent requests for the same
+    (ticker, date, mode) share one computation (a `coalesced` stage marks
+    requests that waited on another's).
     """
+    stage_ms = {}
+    started = time.perf_counter()
     try:
         # Validate ticker format (basic validation)
-        if not _validate_ticker(request.ticker):
+        if not _validate_ticker(score_request.ticker):
             raise HTTPException(
                 status_code=400,
-                detail=f"Invalid ticker format: {request.ticker}. Expected format like 'RELIANCE.NS' or 'TCS.BO'"
+                detail=f"Invalid ticker format: {score_request.ticker}. Expected format like 'RELIANCE.NS' or 'TCS.BO'"
             )
         
         # Validate mode
-        if request.mode not in ['Trader', 'Investor']:
+        if score_request.mode not in ['Trader', 'Investor']:
             raise HTTPException(
                 status_code=400,
-                detail=f"Invalid mode: {request.mode}. Must be 'Trader' or 'Investor'"
+                detail=f"Invalid mode: {score_request.mode}. Must be 'Trader' or 'Investor'"
             )
         
         # Parse date
         try:
-            scoring_date = datetime.strptime(request.date, '%Y-%m-%d').date()
+            scoring_date = datetime.strptime(score_request.date, '%Y-%m-%d').date()
         except ValueError:
             raise HTTPException(
                 status_code=400,
-                detail=f"Invalid date format: {request.date}. Expected YYYY-MM-DD"
+                detail=f"Invalid date format: {score_request.date}. Expected YYYY-MM-DD"
             )
+        stage_ms['validate'] = (time.perf_counter() - started) * 1000
         
-        logger.info(f"Calculating score for {request.ticker} on {request.date} ({request.mode})")
-        
-        # For this implementation, we'll create a mock score calculation
-        # In production, this would load actual data and use the full pipeline
-        
-        # Mock pillar scores (in production, these would be calculated)
-        mock_pillar_scores = {
-            'F': 70.0 + hash(request.ticker) % 20,  # Deterministic but varied
-            'T': 65.0 + hash(request.date) % 25,
-            'R': 60.0 + hash(request.mode) % 30,
-            'O': 75.0 + hash(request.ticker + request.date) % 15,
-            'Q': 80.0 + hash(request.ticker + request.mode) % 20,
-            'S': 72.0 + hash(request.date + request.mode) % 18
-        }
-        
-        # Mock additional data (in production, loaded from CSV/database)
-        import pandas as pd
-        mock_prices_data = pd.Series({
-            'close': 2500.0,
-            'volume': 1000000,
-            'median_traded_value_cr': 4.5,
-            'rsi_14': 55.0,
-            'atr_20': 50.0,
-            'dma20': 2450.0,
-            'dma200': 2300.0,
-            'sigma20': 0.025
-        })
-        
-        mock_fundamentals_data = pd.Series({
-            'market_cap_cr': 15000.0,
-            'roe_3y': 0.15,
-            'sales_cagr_3y': 0.12,
-            'quarter_end': '2024-09-30'
-        })
-        
-        mock_ownership_data = pd.Series({
-            'promoter_holding_pct': 0.68,
-            'promoter_pledge_frac': 0.05,
-            'fii_holding_pct': 0.15
-        })
-        
-        # Determine sector group (simplified mapping)
-        sector_group = _get_sector_group(request.ticker)
-        
-        # Calculate score using the scoring engine
-        from greyoak_score.core.config_manager import ConfigManager
-        from pathlib import Path
-        
-        config_dir = Path(__file__).parent.parent.parent / "configs"
-        config = ConfigManager(config_dir)
-        
-        # Use the scoring engine (with mocked data)
-        score_result = calculate_greyoak_score(
-            ticker=request.ticker,
-            pillar_scores=mock_pillar_scores,
-            prices_data=mock_prices_data,
-            fundamentals_data=mock_fundamentals_data,
-            ownership_data=mock_ownership_data,
-            sector_group=sector_group,
-            mode=request.mode.lower(),
-            config=config,
-            s_z=1.2,  # Mock sector momentum z-score
-            scoring_date=datetime.combine(scoring_date, datetime.min.time().replace(tzinfo=timezone.utc))
-        )
+        logger.info(f"Calculating score for {score_request.ticker} on {score_request.date} ({score_request.mode})")
         
-        # Save to database
+        # Identical concurrent requests share one computation
+        waited = time.perf_counter()
         try:
-            row_id = get_db_instance().save_score(score_result)
-            logger.info(f"Score saved to database with ID {row_id}")
-        except Exception as e:
-            logger.warning(f"Failed to save score to database: {e}")
-            # Continue anyway - don't fail the API call due to database issues
+            (score_result, work_ms, queued), coalesced = await score_flights.do(
+                (score_request.ticker, scoring_date, score_request.mode),
+                lambda: _score_and_persist(score_request, scoring_date)
+            )
+        except WriteQueueFull as e:
+            logger.warning(f"Rejecting score for {score_request.ticker}: {e}")
+            raise HTTPException(
+                status_code=503,
+                detail="Score persistence is backlogged. Please retry shortly."
+            )
+        stage_ms.update(work_ms)
+        if coalesced:
+            stage_ms['coalesced'] = (time.perf_counter() - waited) * 1000
+        elif queued:
+            logger.debug(f"Score for {score_request.ticker} queued for persistence")
         
         # Convert to API response format
-        response = ScoreResponse(
+        result = ScoreResponse(
             ticker=score_result.ticker,
             date=score_result.scoring_date.isoformat(),
             mode=score_result.mode,
@@ -208,20 +491,196 @@ async def calculate_score_endpoint(request_obj: Request, request: ScoreRequest):
             config_hash=score_result.config_hash
         )
         
+        stage_ms['total'] = (time.perf_counter() - started) * 1000
+        response.headers['Server-Timing'] = _format_server_timing(stage_ms)
+        
         logger.info(f"Score calculated successfully: {score_result.score:.2f} ({score_result.band})")
-        return response
+        return result
         
     except HTTPException:
         # Re-raise HTTP exceptions (validation errors)
         raise
     except Exception as e:
-        logger.error(f"Error calculating score for {request.ticker}: {e}", exc_info=True)
+        logger.error(f"Error calculating score for {score_request.ticker}: {e}", exc_info=True)
         raise HTTPException(
             status_code=500,
             detail="Internal server error during score calculation. Please try again later."
         )
 
 
+@router.post(
+    "/calculate/batch",
+    response_model=BatchScoreResponse,
+    responses={
+        400: {"model": ErrorResponse, "description": "Invalid input parameters"},
+        422: {"model": ErrorResponse, "description": "Validation error"},
+        429: {"model": ErrorResponse, "description": "Rate limit exceeded"},
+        500: {"model": ErrorResponse, "description": "Internal server error"}
+    },
+    summary="Calculate Scores for Many Stocks (Rate Limited)",
+    description=f"""
+    Calculate GreyOak Scores for up to 50 tickers on one date and mode.
+    
+    **Rate Limiting:** {rate_limit_per_minute} requests per minute per IP address;
+    a batch counts as one request.
+    
+    **Processing:**
+    - All tickers are scored in one pass with the same configuration and date
+    - Results are persisted with one multi-row write before the response
+    - Tickers that fail are listed in `errors`; the rest of the batch still succeeds
+    
+    **Response:** per-ticker `results`, `errors`, a `summary` of counts
+    (requested, successful, failed, persisted) and score `statistics`.
+    """
+)
+@limiter.limit(rate_limit)
+async def calculate_scores_batch_endpoint(request: Request, response: Response, batch_request: BatchScoreRequest):
+    """
+    Calculate GreyOak Scores for a batch of stocks.
+    
+    Scoring and the database write run on the scoring executor; per-stage
+    durations for the whole batch are reported in the Server-Timing header.
+    """
+    stage_ms = {}
+    started = time.perf_counter()
+    try:
+        try:
+            scoring_date = datetime.strptime(batch_request.date, '%Y-%m-%d').date()
+        except ValueError:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid date format: {batch_request.date}. Expected YYYY-MM-DD"
+            )
+        stage_ms['validate'] = (time.perf_counter() - started) * 1000
+        
+        logger.info(f"Calculating batch of {len(batch_request.tickers)} scores for "
+                    f"{batch_request.date} ({batch_request.mode})")
+        
+        (results, errors), stage_ms['queue'], stage_ms['score'] = await _run_on_scoring_executor(
+            _compute_scores_batch, batch_request, scoring_date
+        )
+        persisted, queue_ms, stage_ms['persist'] = await _run_on_scoring_executor(
+            _persist_scores_batch, results
+        )
+        stage_ms['queue'] += queue_ms
+        
+        scores_values = [r.score for r in results]
+        bands = {band: 0 for band in ('Strong Buy', 'Buy', 'Hold', 'Avoid')}
+        for r in results:
+            bands[r.band] = bands.get(r.band, 0) + 1
+        statistics = {
+            "avg_score": round(sum(scores_values) / len(scores_values), 2) if scores_values else 0,
+            "min_score": round(min(scores_values), 2) if scores_values else 0,
+            "max_score": round(max(scores_values), 2) if scores_values else 0,
+            "bands": bands,
+            "date": batch_request.date,
+            "mode": batch_request.mode
+        }
+        
+        stage_ms['total'] = (time.perf_counter() - started) * 1000
+        response.headers['Server-Timing'] = _format_server_timing(stage_ms)
+        
+        logger.info(f"Batch scored: {len(results)} ok, {len(errors)} failed, {persisted} persisted")
+        return BatchScoreResponse(
+            results=[_score_response(r) for r in results],
+            errors=errors,
+            summary={
+                "requested": len(batch_request.tickers),
+                "successful": len(results),
+                "failed": len(errors),
+                "persisted": persisted
+            },
+            statistics=statistics
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error calculating score batch: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail="Internal server error during batch score calculation. Please try again later."
+        )
+
+
+@router.get(
+    "/scores/latest",
+    response_model=LatestScoresResponse,
+    responses={
+        304: {"description": "Not modified (If-None-Match matched the ETag)"},
+        400: {"model": ErrorResponse, "description": "Invalid parameters"},
+        429: {"model": ErrorResponse, "description": "Rate limit exceeded"},
+        500: {"model": ErrorResponse, "description": "Database error"}
+    },
+    summary="Get Latest Scores (Rate Limited, Cached)",
+    description=f"""
+    Get scores for the most recent scoring date in a mode, best scores first.
+    
+    **Rate Limiting:** {rate_limit_per_minute} requests per minute per IP address.
+    
+    **Caching:** Responses are served from an in-process cache and carry an `ETag`;
+    send it back in `If-None-Match` to get `304 Not Modified` when nothing changed.
+    Pass `next_cursor` from the response as `cursor` to fetch the next page.
+    """
+)
+@limiter.limit(rate_limit)
+async def get_latest_scores(
+    request: Request,
+    response: Response,
+    mode: str = Query(..., description="Scoring mode ('Trader' or 'Investor')"),
+    limit: Optional[int] = Query(100, ge=1, le=1000, description="Maximum number of results"),
+    cursor: Optional[str] = Query(None, description="Pagination cursor from a previous page")
+):
+    """Get the latest scores for a mode (cached, ETag-aware)."""
+    try:
+        if mode not in ['Trader', 'Investor']:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid mode: {mode}. Must be 'Trader' or 'Investor'"
+            )
+        
+        cache_key = ('latest', mode, limit, cursor, _get_score_config().config_hash)
+        entry = response_cache.get(cache_key)
+        if entry is None:
+            try:
+                results, next_cursor = await _query_db(
+                    'get_latest_scores_page',
+                    mode=mode,
+                    limit=limit,
+                    cursor=cursor,
+                    raw=True
+                )
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            except DATABASE_ERRORS as e:
+                logger.error(f"Database error retrieving latest scores: {e}")
+                raise HTTPException(
+                    status_code=500,
+                    detail="Database error. Please try again later."
+                )
+            
+            # Same shape as LatestScoresResponse, serialized once and cached as bytes
+            result = {
+                'date': results[0]['date'] if results else None,
+                'mode': mode,
+                'scores': results,
+                'next_cursor': next_cursor
+            }
+            entry = response_cache.put(cache_key, dumps(result), date=None, mode=mode)
+            logger.info(f"Retrieved {len(results)} latest {mode} scores")
+        
+        return _conditional_response(request, entry)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error retrieving latest scores: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail="Internal server error. Please try again later."
+        )
+
+
 @router.get(
     "/scores/{ticker}",
     response_model=List[ScoreResponse],
@@ -241,19 +700,23 @@ async def calculate_score_endpoint(request_obj: Request, request: ScoreRequest):
     - `start_date`: Filter scores from this date (inclusive, YYYY-MM-DD)
     - `end_date`: Filter scores to this date (inclusive, YYYY-MM-DD) 
     - `mode`: Filter by scoring mode ('Trader' or 'Investor')
-    - `limit`: Limit number of results (default: 100, max: 1000)
+    - `limit`: Page size (default: 100, max: 1000)
+    - `cursor`: Opaque cursor from the previous page's `X-Next-Cursor` header
     
-    **Results:** Ordered by date DESC (most recent first)
+    **Results:** Ordered by date DESC (most recent first). When more rows exist,
+    the `X-Next-Cursor` header (and a `Link: rel="next"` header) point to the next page.
     """
 )
 @limiter.limit(rate_limit)
 async def get_scores_for_ticker(
     request: Request,
+    response: Response,
     ticker: str = Path(..., description="Stock ticker symbol (e.g., 'RELIANCE.NS')"),
     start_date: Optional[str] = Query(None, description="Start date filter (YYYY-MM-DD)"),
     end_date: Optional[str] = Query(None, description="End date filter (YYYY-MM-DD)"),
     mode: Optional[str] = Query(None, description="Mode filter ('Trader' or 'Investor')"),
-    limit: Optional[int] = Query(100, ge=1, le=1000, description="Maximum number of results")
+    limit: Optional[int] = Query(100, ge=1, le=1000, description="Maximum number of results"),
+    cursor: Optional[str] = Query(None, description="Pagination cursor from a previous page")
 ):
     """Get score history for a ticker with optional filters."""
     try:
@@ -302,55 +765,43 @@ async def get_scores_for_ticker(
         
         logger.info(f"Retrieving scores for {ticker} with filters: start={start_date}, end={end_date}, mode={mode}, limit={limit}")
         
-        # Query database
+        # Query database (keyset page); identical concurrent requests share one query
         try:
-            results = get_db_instance().get_scores_by_ticker(
-                ticker=ticker,
-                start_date=start_date_obj,
-                end_date=end_date_obj,
-                mode=mode,
-                limit=limit
+            (results, next_cursor), _ = await history_flights.do(
+                ('ticker_history', ticker, start_date_obj, end_date_obj, mode, limit, cursor),
+                lambda: _query_db(
+                    'get_scores_by_ticker_page',
+                    ticker=ticker,
+                    start_date=start_date_obj,
+                    end_date=end_date_obj,
+                    mode=mode,
+                    limit=limit,
+                    cursor=cursor,
+                    raw=True
+                )
             )
-        except psycopg2.Error as e:
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except DATABASE_ERRORS as e:
             logger.error(f"Database error retrieving scores for {ticker}: {e}")
             raise HTTPException(
                 status_code=500,
                 detail="Database error. Please try again later."
             )
         
-        if not results:
+        if not results and not cursor:
             raise HTTPException(
                 status_code=404,
                 detail=f"No scores found for {ticker} with the specified filters"
             )
         
-        # Convert to API response format
-        response = [
-            ScoreResponse(
-                ticker=r.ticker,
-                date=r.scoring_date.isoformat(),
-                mode=r.mode,
-                score=r.score,
-                band=r.band,
-                pillars={
-                    'F': r.pillars.F,
-                    'T': r.pillars.T,
-                    'R': r.pillars.R,
-                    'O': r.pillars.O,
-                    'Q': r.pillars.Q,
-                    'S': r.pillars.S
-                },
-                risk_penalty=r.risk_penalty,
-                guardrail_flags=r.guardrail_flags,
-                confidence=r.confidence,
-                s_z=r.s_z,
-                as_of=r.as_of.isoformat(),
-                config_hash=r.config_hash
-            ) for r in results
-        ]
-        
-        logger.info(f"Retrieved {len(response)} scores for {ticker}")
-        return response
+        if next_cursor:
+            response.headers['X-Next-Cursor'] = next_cursor
+            next_url = request.url.include_query_params(cursor=next_cursor)
+            response.headers['Link'] = f'<{next_url}>; rel="next"'
+        
+        logger.info(f"Retrieved {len(results)} scores for {ticker}")
+        return _json_response(results, response)
         
     except HTTPException:
         raise
@@ -366,6 +817,7 @@ async def get_scores_for_ticker(
     "/scores/band/{band}",
     response_model=StocksByBandResponse,
     responses={
+        304: {"description": "Not modified (If-None-Match matched the ETag)"},
         400: {"model": ErrorResponse, "description": "Invalid parameters"},
         404: {"model": ErrorResponse, "description": "No stocks found"},
         429: {"model": ErrorResponse, "description": "Rate limit exceeded"},
@@ -382,16 +834,23 @@ async def get_scores_for_ticker(
     - Investment research and recommendations
     - Performance tracking and analysis
     
-    **Results:** Ordered by score DESC (best scores first within the band)
+    **Results:** Ordered by score DESC (best scores first within the band).
+    Pass `next_cursor` from the response as `cursor` to fetch the next page.
+    
+    **Caching:** Responses are cached in-process until scores for the date are
+    saved (or the TTL expires) and carry an `ETag`; send it back in
+    `If-None-Match` to get `304 Not Modified`.
     """
 )
 @limiter.limit(rate_limit)
 async def get_stocks_by_band(
     request: Request,
+    response: Response,
     band: str = Path(..., description="Investment band"),
     date: str = Query(..., description="Score date (YYYY-MM-DD)"),
     mode: str = Query(..., description="Scoring mode ('Trader' or 'Investor')"),
-    limit: Optional[int] = Query(50, ge=1, le=500, description="Maximum number of results")
+    limit: Optional[int] = Query(50, ge=1, le=500, description="Maximum number of results"),
+    cursor: Optional[str] = Query(None, description="Pagination cursor from a previous page")
 ):
     """Get all stocks with a specific investment band on a given date."""
     try:
@@ -419,58 +878,43 @@ async def get_stocks_by_band(
                 detail=f"Invalid date format: {date}. Expected YYYY-MM-DD"
             )
         
+        cache_key = ('band', band, date_obj, mode, limit, cursor, _get_score_config().config_hash)
+        entry = response_cache.get(cache_key)
+        if entry is not None:
+            return _conditional_response(request, entry)
+        
         logger.info(f"Retrieving {band} stocks for {date} ({mode}) with limit {limit}")
         
-        # Query database
+        # Query database (keyset page)
         try:
-            results = get_db_instance().get_scores_by_band(
+            results, next_cursor = await _query_db(
+                'get_scores_by_band_page',
                 band=band,
                 date=date_obj,
                 mode=mode,
-                limit=limit
+                limit=limit,
+                cursor=cursor,
+                raw=True
             )
-        except psycopg2.Error as e:
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except DATABASE_ERRORS as e:
             logger.error(f"Database error retrieving {band} stocks: {e}")
             raise HTTPException(
                 status_code=500,
                 detail="Database error. Please try again later."
             )
         
-        if not results:
+        if not results and not cursor:
             raise HTTPException(
                 status_code=404,
                 detail=f"No {band} stocks found for {date} in {mode} mode"
             )
         
-        # Convert to API response format
-        scores = [
-            ScoreResponse(
-                ticker=r.ticker,
-                date=r.scoring_date.isoformat(),
-                mode=r.mode,
-                score=r.score,
-                band=r.band,
-                pillars={
-                    'F': r.pillars.F,
-                    'T': r.pillars.T,
-                    'R': r.pillars.R,
-                    'O': r.pillars.O,
-                    'Q': r.pillars.Q,
-                    'S': r.pillars.S
-                },
-                risk_penalty=r.risk_penalty,
-                guardrail_flags=r.guardrail_flags,
-                confidence=r.confidence,
-                s_z=r.s_z,
-                as_of=r.as_of.isoformat(),
-                config_hash=r.config_hash
-            ) for r in results
-        ]
-        
         # Calculate statistics
-        scores_values = [s.score for s in scores]
+        scores_values = [s['score'] for s in results]
         statistics = {
-            "count": len(scores),
+            "count": len(results),
             "avg_score": round(sum(scores_values) / len(scores_values), 2) if scores_values else 0,
             "min_score": round(min(scores_values), 2) if scores_values else 0,
             "max_score": round(max(scores_values), 2) if scores_values else 0,
@@ -479,13 +923,17 @@ async def get_stocks_by_band(
             "band": band
         }
         
-        response = StocksByBandResponse(
-            stocks=scores,
-            statistics=statistics
-        )
+        # Same shape as StocksByBandResponse, serialized once and cached as bytes
+        result = {
+            'stocks': results,
+            'statistics': statistics,
+            'next_cursor': next_cursor
+        }
         
-        logger.info(f"Retrieved {len(scores)} {band} stocks for {date} ({mode})")
-        return response
+        entry = response_cache.put(cache_key, dumps(result), date=date_obj, mode=mode)
+        
+        logger.info(f"Retrieved {len(results)} {band} stocks for {date} ({mode})")
+        return _conditional_response(request, entry)
         
     except HTTPException:
         raise
@@ -497,6 +945,504 @@ async def get_stocks_by_band(
         )
 
 
+@router.get(
+    "/sectors/{sector}",
+    response_model=SectorAnalysisResponse,
+    responses={
+        304: {"description": "Not modified (If-None-Match matched the ETag)"},
+        400: {"model": ErrorResponse, "description": "Invalid parameters"},
+        404: {"model": ErrorResponse, "description": "No aggregate for the sector"},
+        429: {"model": ErrorResponse, "description": "Rate limit exceeded"},
+        500: {"model": ErrorResponse, "description": "Database error"}
+    },
+    summary="Get Sector Analysis (Rate Limited, Cached)",
+    description=f"""
+    Aggregate statistics for a sector group on a date: number of stocks, mean and
+    median score, band distribution, mean pillar scores and mean sector momentum (S_z).
+
+    **Rate Limiting:** {rate_limit_per_minute} requests per minute per IP address.
+
+    **Data:** Served from aggregates precomputed when score batches are persisted,
+    so the response costs one primary-key lookup regardless of sector size. Omit
+    `date` for the sector's most recent aggregated date. `stocks` is left empty;
+    use `/scores/band/{{band}}` for member scores.
+
+    **Caching:** Responses are cached in-process and carry an `ETag`; send it back
+    in `If-None-Match` to get `304 Not Modified`.
+    """
+)
+@limiter.limit(rate_limit)
+async def get_sector_analysis(
+    request: Request,
+    response: Response,
+    sector: str = Path(..., description="Sector group (e.g., 'banks', 'it')"),
+    mode: str = Query(..., description="Scoring mode ('Trader' or 'Investor')"),
+    date: Optional[str] = Query(None, description="Score date (YYYY-MM-DD); default: latest")
+):
+    """Get precomputed sector aggregates for a date (cached, ETag-aware)."""
+    try:
+        sector = sector.lower()
+        if not re.match(r'^[a-z0-9_]{1,50}$', sector):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid sector: {sector}"
+            )
+
+        if mode not in ['Trader', 'Investor']:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid mode: {mode}. Must be 'Trader' or 'Investor'"
+            )
+
+        date_obj = None
+        if date:
+            try:
+                date_obj = datetime.strptime(date, '%Y-%m-%d').date()
+            except ValueError:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Invalid date format: {date}. Expected YYYY-MM-DD"
+                )
+
+        cache_key = ('sector', sector, date_obj, mode, _get_score_config().config_hash)
+        entry = response_cache.get(cache_key)
+        if entry is not None:
+            return _conditional_response(request, entry)
+
+        try:
+            aggregate = await _query_db('get_sector_aggregate', sector=sector, mode=mode, date=date_obj)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        except DATABASE_ERRORS as e:
+            logger.error(f"Database error retrieving sector {sector}: {e}")
+            raise HTTPException(
+                status_code=500,
+                detail="Database error. Please try again later."
+            )
+
+        if aggregate is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"No scores aggregated for sector {sector}"
+                       + (f" on {date}" if date else "") + f" in {mode} mode"
+            )
+
+        n_stocks = aggregate['n_stocks']
+        sector_statistics = {
+            'n_stocks': n_stocks,
+            'mean_score': aggregate['mean_score'],
+            'median_score': aggregate['median_score'],
+            **{f'mean_{pillar}': value for pillar, value in aggregate['mean_pillars'].items()}
+        }
+        momentum_analysis = {
+            'mean_s_z': aggregate['mean_s_z'],
+            'sector_bear_count': aggregate['sector_bear_count'],
+            'sector_bear_ratio': round(aggregate['sector_bear_count'] / n_stocks, 4) if n_stocks else 0.0
+        }
+
+        # Same shape as SectorAnalysisResponse, serialized once and cached as bytes
+        result = {
+            'sector': aggregate['sector'],
+            'date': aggregate['date'],
+            'mode': mode,
+            'stocks': [],
+            'sector_statistics': sector_statistics,
+            'band_distribution': aggregate['band_counts'],
+            'momentum_analysis': momentum_analysis
+        }
+        entry = response_cache.put(cache_key, dumps(result), date=date_obj, mode=mode)
+
+        logger.info(f"Retrieved sector aggregate for {sector} on {aggregate['date']} ({mode})")
+        return _conditional_response(request, entry)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error retrieving sector {sector}: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail="Internal server error. Please try again later."
+        )
+
+
+@router.post(
+    "/portfolio/analyze",
+    response_model=PortfolioAnalysisResponse,
+    responses={
+        400: {"model": ErrorResponse, "description": "Invalid input parameters"},
+        404: {"model": ErrorResponse, "description": "No scores for the portfolio"},
+        422: {"model": ErrorResponse, "description": "Validation error"},
+        429: {"model": ErrorResponse, "description": "Rate limit exceeded"},
+        500: {"model": ErrorResponse, "description": "Database error"}
+    },
+    summary="Analyze Portfolio (Rate Limited)",
+    description=f"""
+    Weighted portfolio score, pillar exposures, band mix and risk-penalty
+    contributions for up to 500 tickers.
+    
+    **Rate Limiting:** {rate_limit_per_minute} requests per minute per IP address.
+    
+    **Data:** Scores for all tickers are fetched in one query (each ticker's
+    latest score, or scores on `date`) and cached until scores for that date
+    and mode are saved. Re-submitting the same tickers with different weights
+    is served from the cache without touching the database.
+    
+    **What-if:** `scenarios` maps names to alternative weight vectors for the
+    same tickers; each is aggregated alongside the base weights.
+    
+    **Missing scores:** Tickers without a score are listed in `missing` and
+    the remaining weights are rescaled to sum to 1 (`coverage` reports the
+    weight that had scores).
+    """
+)
+@limiter.limit(rate_limit)
+async def analyze_portfolio(request: Request, response: Response, portfolio_request: PortfolioAnalysisRequest):
+    """Aggregate a weighted portfolio (and what-if scenarios) over one bulk score fetch."""
+    try:
+        tickers = portfolio_request.tickers
+        invalid = [ticker for ticker in tickers if not _validate_ticker(ticker)]
+        if invalid:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid ticker format: {', '.join(invalid[:10])}"
+            )
+        
+        for name, weights in [('weights', portfolio_request.weights), *portfolio_request.scenarios.items()]:
+            if len(weights) != len(tickers):
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"{name} has {len(weights)} entries for {len(tickers)} tickers"
+                )
+            if any(w < 0 for w in weights):
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"{name} has negative weights"
+                )
+        
+        date_obj = None
+        if portfolio_request.date:
+            try:
+                date_obj = datetime.strptime(portfolio_request.date, '%Y-%m-%d').date()
+            except ValueError:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Invalid date format: {portfolio_request.date}. Expected YYYY-MM-DD"
+                )
+        
+        holdings = await _get_portfolio_holdings(tickers, portfolio_request.mode, date_obj)
+        if not holdings.tickers:
+            raise HTTPException(
+                status_code=404,
+                detail=f"No {portfolio_request.mode} scores found for the requested tickers"
+                       + (f" on {portfolio_request.date}" if portfolio_request.date else "")
+            )
+        
+        try:
+            aggregates = aggregate_portfolio(holdings, portfolio_request.weights, portfolio_request.scenarios)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        logger.info(f"Analyzed portfolio of {len(tickers)} tickers ({len(holdings.missing)} missing, "
+                    f"{len(portfolio_request.scenarios)} scenarios)")
+        return _json_response({
+            'date': portfolio_request.date,
+            'mode': portfolio_request.mode,
+            **aggregates
+        }, response)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error analyzing portfolio: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail="Internal server error. Please try again later."
+        )
+
+
+async def _get_portfolio_holdings(tickers: List[str], mode: str, date_obj) -> PortfolioHoldings:
+    """
+    Packed holdings for a portfolio's tickers, from portfolio_cache or one bulk query.
+    
+    Keyed by the ticker set (weights are not part of the key), so re-weighting
+    the same portfolio does not query the database.
+    """
+    cache_key = ('portfolio', tuple(tickers), date_obj, mode)
+    entry = portfolio_cache.get(cache_key)
+    if entry is not None:
+        return entry.value
+    
+    try:
+        rows = await _query_db('get_scores_for_tickers', tickers=tickers, mode=mode, date=date_obj)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except DATABASE_ERRORS as e:
+        logger.error(f"Database error fetching portfolio scores: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail="Database error. Please try again later."
+        )
+    
+    holdings = build_holdings(tickers, rows)
+    portfolio_cache.put(cache_key, holdings, date=date_obj, mode=mode, etag=False)
+    return holdings
+
+
+@router.get(
+    "/export/scores",
+    responses={
+        200: {
+            "description": "Score history in the requested format",
+            "content": {media_type: {} for media_type, _ in EXPORT_FORMATS.values()}
+        },
+        400: {"model": ErrorResponse, "description": "Invalid parameters"},
+        429: {"model": ErrorResponse, "description": "Rate limit exceeded"},
+        500: {"model": ErrorResponse, "description": "Database error"},
+        503: {"model": ErrorResponse, "description": "Too many exports in progress"}
+    },
+    summary="Export Score History (Rate Limited, Streaming)",
+    description=f"""
+    Stream every score for a mode and date range as a columnar file.
+    
+    **Rate Limiting:** {rate_limit_per_minute} requests per minute per IP address.
+    
+    **Formats:**
+    - `arrow`: Arrow IPC stream (`pyarrow.ipc.open_stream`), one record batch per chunk
+    - `parquet`: Parquet file, one zstd-compressed row group per chunk
+    - `ndjson`: one JSON object per line
+    
+    **Streaming:** Rows are read through a server-side cursor in chunks of
+    `EXPORT_CHUNK_SIZE` (default 50,000) and encoded chunk by chunk, so there is
+    no row cap and server memory stays flat. Rows are ordered by (date, ticker);
+    columns are flat (`f_pillar` ... `s_pillar`) rather than nested.
+    
+    **Concurrency:** At most `EXPORT_MAX_CONCURRENT` (default 4) exports run at
+    once, since each holds a database connection until its download finishes;
+    further requests get `503` with `Retry-After`.
+    """
+)
+@limiter.limit(rate_limit)
+async def export_scores(
+    request: Request,
+    mode: str = Query(..., description="Scoring mode ('Trader' or 'Investor')"),
+    start_date: Optional[str] = Query(None, description="Start date filter (YYYY-MM-DD)"),
+    end_date: Optional[str] = Query(None, description="End date filter (YYYY-MM-DD)"),
+    format: str = Query('arrow', description="Output format: 'arrow', 'parquet' or 'ndjson'")
+):
+    """Stream score history for a mode and date range in a columnar format."""
+    try:
+        if mode not in ['Trader', 'Investor']:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid mode: {mode}. Must be 'Trader' or 'Investor'"
+            )
+        
+        if format not in EXPORT_FORMATS:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid format: {format}. Must be one of {sorted(EXPORT_FORMATS)}"
+            )
+        
+        dates = {}
+        for name, value in (('start_date', start_date), ('end_date', end_date)):
+            if value:
+                try:
+                    dates[name] = datetime.strptime(value, '%Y-%m-%d').date()
+                except ValueError:
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"Invalid {name} format: {value}. Expected YYYY-MM-DD"
+                    )
+        
+        if not export_slots.acquire(blocking=False):
+            raise HTTPException(
+                status_code=503,
+                detail=f"{EXPORT_MAX_CONCURRENT} score exports already in progress. Please retry shortly.",
+                headers={'Retry-After': '30'}
+            )
+        
+        try:
+            chunks = get_db_instance().stream_score_chunks(mode=mode, chunk_size=EXPORT_CHUNK_SIZE, **dates)
+            # Run the query and fetch the first chunk before sending headers,
+            # so connection and query errors still get a proper status code
+            first = await asyncio.to_thread(next, chunks, None)
+        except ValueError as e:
+            export_slots.release()
+            raise HTTPException(status_code=400, detail=str(e))
+        except DATABASE_ERRORS as e:
+            export_slots.release()
+            logger.error(f"Database error starting score export: {e}")
+            raise HTTPException(
+                status_code=500,
+                detail="Database error. Please try again later."
+            )
+        except BaseException:
+            export_slots.release()
+            raise
+        
+        media_type, extension = EXPORT_FORMATS[format]
+        filename = f"scores_{mode.lower()}_{start_date or 'start'}_{end_date or 'latest'}.{extension}"
+        logger.info(f"Streaming {mode} score export as {format} ({start_date} to {end_date})")
+        body = _ExportBody(encode_export(itertools.chain([first] if first else [], chunks), format), chunks)
+        # Sync iterator: Starlette pulls the remaining blocks on a worker thread
+        return StreamingResponse(
+            body,
+            media_type=media_type,
+            headers={'Content-Disposition': f'attachment; filename="{filename}"'},
+            background=BackgroundTask(body.close)
+        )
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Error exporting scores: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail="Internal server error. Please try again later."
+        )
+
+
+class _ExportBody:
+    """
+    Export blocks for StreamingResponse that hold one export slot.
+    
+    The slot is released exactly once: when the blocks run out or fail, on
+    close(), or when the body is garbage-collected. The last case covers a
+    client that disconnects before Starlette starts iterating, where a
+    generator's finally block would never run.
+    """
+    
+    def __init__(self, blocks, chunks):
+        self._blocks = blocks
+        self._chunks = chunks
+        self._lock = threading.Lock()
+        self._closed = False
+    
+    def __iter__(self):
+        return self
+    
+    def __next__(self):
+        try:
+            return next(self._blocks)
+        except BaseException:
+            self.close()
+            raise
+    
+    def close(self) -> None:
+        """Close the row stream and free the export slot (idempotent)."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        try:
+            self._blocks.close()
+            self._chunks.close()  # Returns the pooled connection now, not at garbage collection
+        finally:
+            export_slots.release()
+    
+    def __del__(self):
+        self.close()
+
+
+@router.get(
+    "/events/scores",
+    responses={
+        200: {"description": "Server-sent event stream", "content": {"text/event-stream": {}}},
+        400: {"model": ErrorResponse, "description": "Invalid filters"},
+        429: {"model": ErrorResponse, "description": "Rate limit exceeded"},
+        503: {"model": ErrorResponse, "description": "Too many subscribers"}
+    },
+    summary="Stream Score Events (Server-Sent Events)",
+    description=f"""
+    Push newly published scores to the client as server-sent events, instead of
+    polling `/scores/latest`.
+
+    **Rate Limiting:** {rate_limit_per_minute} connections per minute per IP address.
+
+    **Events:**
+    - `score`: one per saved score, `data` is
+      `{{"ticker", "date", "mode", "score", "band", "sector", "id"}}`
+    - `overflow`: the client fell more than `SCORE_EVENTS_BUFFER` (default 5000)
+      events behind and `data.dropped` events were discarded, oldest first
+    - comment lines every `SCORE_EVENTS_KEEPALIVE` seconds (default 15) keep
+      idle connections open through proxies
+
+    **Filters:** comma-separated `tickers`, `bands` and `sectors`; an omitted
+    filter matches everything. Filtering happens on the server, so a client only
+    receives (and buffers) the events it asked for.
+
+    Events are published when a save commits, from this or any other process
+    writing to the same database.
+    """
+)
+@limiter.limit(rate_limit)
+async def stream_score_events(
+    request: Request,
+    tickers: Optional[str] = Query(None, description="Comma-separated tickers (e.g., 'TCS.NS,INFY.NS')"),
+    bands: Optional[str] = Query(None, description="Comma-separated bands (e.g., 'Strong Buy,Buy')"),
+    sectors: Optional[str] = Query(None, description="Comma-separated sector groups (e.g., 'it,banks')")
+):
+    """Subscribe to score events matching the filters and stream them as SSE."""
+    ticker_filter = _split_filter(tickers, str.upper)
+    for ticker in ticker_filter or ():
+        if not _validate_ticker(ticker):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid ticker format: {ticker}"
+            )
+
+    band_filter = _split_filter(bands)
+    valid_bands = ['Strong Buy', 'Buy', 'Hold', 'Avoid']
+    for band in band_filter or ():
+        if band not in valid_bands:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid band: {band}. Must be one of: {valid_bands}"
+            )
+
+    sector_filter = _split_filter(sectors, str.lower)
+    for sector in sector_filter or ():
+        if not re.match(r'^[a-z0-9_]{1,50}$', sector):
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid sector: {sector}"
+            )
+
+    broker = get_score_event_broker()
+    try:
+        subscription = broker.subscribe(ticker_filter, band_filter, sector_filter)
+    except TooManySubscribers as e:
+        raise HTTPException(status_code=503, detail=str(e))
+
+    logger.info(f"Score event subscriber connected (tickers={tickers}, bands={bands}, sectors={sectors})")
+    return StreamingResponse(
+        _score_event_stream(request, broker, subscription),
+        media_type="text/event-stream",
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+
+async def _score_event_stream(request: Request, broker: ScoreEventBroker, subscription: Subscription):
+    """SSE frames for a subscription until the client disconnects."""
+    try:
+        yield f"retry: {SCORE_EVENTS_RETRY_MS}\n\n".encode()
+        reported_drops = 0
+        while not await request.is_disconnected():
+            events = await subscription.next_events(timeout=SCORE_EVENTS_KEEPALIVE)
+            if subscription.dropped > reported_drops:
+                yield b"event: overflow\ndata: " + dumps({'dropped': subscription.dropped - reported_drops}) + b"\n\n"
+                reported_drops = subscription.dropped
+            if not events:
+                yield b": keepalive\n\n"
+                continue
+            yield b''.join(
+                b"id: %d\nevent: score\ndata: %s\n\n" % (event['id'], dumps(event)) for event in events
+            )
+    finally:
+        broker.unsubscribe(subscription)
+        logger.info("Score event subscriber disconnected")
+
+
 @router.get(
     "/health",
     response_model=HealthResponse,
@@ -505,7 +1451,8 @@ async def get_stocks_by_band(
     Comprehensive application health check including database connectivity and connection pool status.
     
     **CP7 Features:**
-    - Database connection pool monitoring
+    - Database connection pool monitoring (in use / idle connections, checkout
+      wait-time histogram, checkout failures, retries, per-query latency)
     - Connection retry validation
     - Enhanced error reporting
     - Performance metrics
@@ -520,26 +1467,31 @@ async def get_stocks_by_band(
     - Database connectivity verification
     - Connection pool status monitoring
     
+    **Snapshot:** Database status and table statistics come from a background
+    monitor that probes every `HEALTH_PROBE_INTERVAL` seconds (default 15), so
+    this endpoint never queries the database itself. Statistics are planner
+    estimates; `checked_at` / `age_seconds` report the snapshot's freshness and
+    a snapshot older than three intervals reports the database as unhealthy.
+    
     **Note:** This is the application health endpoint. For infrastructure-only health checks (faster), use `GET /health`.
     """
 )
 @limiter.exempt  # Health checks should not be rate limited
 async def health_check_detailed():
-    """Detailed health check with database connectivity test."""
+    """Detailed health check served from the background monitor's last snapshot."""
     try:
-        # Test database connection
-        db_status = "unknown"
-        db_error = None
+        monitor = get_health_monitor()
+        snapshot = monitor.get_snapshot()
+        if snapshot is None:
+            # First request before the monitor's first probe completed
+            await asyncio.to_thread(monitor.refresh)
+            snapshot = monitor.get_snapshot()
         
-        try:
-            if get_db_instance().test_connection():
-                db_status = "healthy"
-            else:
-                db_status = "unhealthy"
-                db_error = "Connection test failed"
-        except Exception as e:
+        db_status = snapshot['status']
+        db_error = snapshot['error']
+        if snapshot['stale']:
             db_status = "unhealthy"
-            db_error = str(e)
+            db_error = f"Health snapshot is stale ({snapshot['age_seconds']:.0f}s old)"
         
         # Determine overall status
         if db_status == "healthy":
@@ -549,13 +1501,7 @@ async def health_check_detailed():
         else:
             overall_status = "unknown"
         
-        # Get database stats if connection is healthy
-        db_stats = None
-        if db_status == "healthy":
-            try:
-                db_stats = get_db_instance().get_database_stats()
-            except Exception as e:
-                logger.warning(f"Failed to get database stats: {e}")
+        db_stats = snapshot['stats'] if db_status == "healthy" else None
         
         response = HealthResponse(
             status=overall_status,
@@ -566,7 +1512,10 @@ async def health_check_detailed():
                 "database": {
                     "status": db_status,
                     "error": db_error,
-                    "stats": db_stats
+                    "stats": db_stats,
+                    "pool": _pool_stats(),
+                    "checked_at": snapshot['checked_at'],
+                    "age_seconds": snapshot['age_seconds']
                 },
                 "api": {
                     "status": "healthy"
@@ -595,8 +1544,72 @@ async def health_check_detailed():
         )
 
 
+@router.get(
+    "/metrics",
+    summary="Runtime Metrics",
+    description="""
+    Live runtime metrics for dashboards and alerting.
+    
+    - `database_pool`: connections in use / idle, checkout wait-time histogram
+      (ms buckets), checkout failures, connection retries and per-query latency
+      histograms by query name
+    - `async_database_pool`: the same pool metrics for the asyncpg read pool
+      (only when `DB_DRIVER=asyncpg`)
+    - `response_cache`: hit/miss counters and size
+    - `portfolio_cache`: the same counters for cached portfolio holdings
+    - `request_coalescing`: single-flight leaders, coalesced requests and hit
+      ratio for score calculations and ticker history queries
+    - `write_queue`: write-behind persistence counters
+    - `score_events`: event stream subscribers and published / delivered /
+      dropped event counters (once the stream has started)
+    
+    Cheap to call: nothing here queries the database.
+    """
+)
+@limiter.exempt  # Scraped frequently by monitoring
+async def get_metrics():
+    """Pool, cache, coalescing and write-queue metrics."""
+    metrics = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "database_pool": _pool_stats(),
+        "response_cache": response_cache.get_stats(),
+        "portfolio_cache": portfolio_cache.get_stats(),
+        "request_coalescing": {
+            flights.name: flights.get_stats() for flights in (score_flights, history_flights)
+        },
+        "write_queue": get_write_queue().get_stats()
+    }
+    score_events = get_score_event_stats()
+    if score_events is not None:
+        metrics["score_events"] = score_events
+    if USE_ASYNC_DB:
+        try:
+            metrics["async_database_pool"] = (await get_async_database()).get_pool_stats()
+        except Exception as e:
+            metrics["async_database_pool"] = {"error": str(e)}
+    return metrics
+
+
 # Helper functions
 
+def _pool_stats() -> Dict[str, Any]:
+    """Live pool instrumentation, or an error entry if the pool is unavailable."""
+    try:
+        return get_db_instance().get_pool_stats()
+    except Exception as e:
+        return {"error": str(e)}
+
+
+def _split_filter(value: Optional[str], normalize=None) -> Optional[List[str]]:
+    """Split a comma-separated filter parameter; None when unset or empty."""
+    if not value:
+        return None
+    items = [item.strip() for item in value.split(',') if item.strip()]
+    if normalize:
+        items = [normalize(item) for item in items]
+    return items or None
+
+
 def _validate_ticker(ticker: str) -> bool:
     """
     Validate ticker format.
@@ -200,6 +200,32 @@ class StocksByBandResponse(BaseModel):
             "band": "Buy"
         }
     )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Cursor for the next page (pass as `cursor`); null on the last page"
+    )
+
+
+class LatestScoresResponse(BaseModel):
+    """
+    Response model for GET /scores/latest endpoint.
+    
+    Scores for the most recent scoring date in a mode, best first.
+    """
+    date: Optional[str] = Field(
+        None,
+        description="Latest scoring date (YYYY-MM-DD); null if no scores exist",
+        example="2024-10-08"
+    )
+    mode: str = Field(..., description="Scoring mode", example="Investor")
+    scores: List[ScoreResponse] = Field(
+        ...,
+        description="Scores for the latest date ordered by score DESC"
+    )
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Cursor for the next page (pass as `cursor`); null on the last page"
+    )
 
 
 class HealthResponse(BaseModel):
@@ -268,7 +294,7 @@ class ErrorResponse(BaseModel):
 
 class BatchScoreRequest(BaseModel):
     """
-    Request model for batch score calculation (future enhancement).
+    Request model for POST /calculate/batch endpoint.
     
     Allows scoring multiple stocks in a single API call for efficiency.
     """
@@ -310,7 +336,9 @@ class BatchScoreRequest(BaseModel):
 
 class BatchScoreResponse(BaseModel):
     """
-    Response model for batch score calculation (future enhancement).
+    Response model for POST /calculate/batch endpoint.
+    
+    Per-ticker results and errors plus batch counters and score statistics.
     """
     results: List[ScoreResponse] = Field(
         ...,
@@ -326,7 +354,20 @@ class BatchScoreResponse(BaseModel):
         example={
             "requested": 10,
             "successful": 9,
-            "failed": 1
+            "failed": 1,
+            "persisted": 9
+        }
+    )
+    statistics: Dict[str, Any] = Field(
+        default_factory=dict,
+        description="Score statistics over the successful results",
+        example={
+            "avg_score": 68.4,
+            "min_score": 51.2,
+            "max_score": 79.8,
+            "bands": {"Strong Buy": 2, "Buy": 4, "Hold": 3, "Avoid": 0},
+            "date": "2024-10-08",
+            "mode": "Trader"
         }
     )
 
@@ -342,11 +383,38 @@ class ScoreHistoryRequest(BaseModel):
 
 
 class PortfolioAnalysisRequest(BaseModel):
-    """Request model for portfolio analysis (future enhancement)."""
-    tickers: List[str] = Field(..., max_length=20)
+    """
+    Request model for POST /portfolio/analyze endpoint.
+    
+    Weights are aligned with tickers. Optional what-if scenarios re-weight
+    the same tickers and are evaluated against the same fetched scores.
+    """
+    tickers: List[str] = Field(
+        ...,
+        description="Portfolio tickers",
+        min_length=1,
+        max_length=500
+    )
     weights: List[float] = Field(..., description="Portfolio weights (must sum to 1.0)")
-    date: str
+    date: Optional[str] = Field(
+        None,
+        description="Score date (YYYY-MM-DD); default: each ticker's latest score"
+    )
     mode: Literal["Trader", "Investor"]
+    scenarios: Dict[str, List[float]] = Field(
+        default_factory=dict,
+        description="What-if weight vectors by name (same length and order as tickers)",
+        max_length=20
+    )
+    
+    @field_validator('tickers')
+    @classmethod
+    def validate_tickers(cls, v: List[str]) -> List[str]:
+        """Normalize tickers; duplicates are rejected since weights are positional."""
+        normalized = [ticker.strip().upper() for ticker in v]
+        if len(set(normalized)) != len(normalized):
+            raise ValueError("Portfolio tickers must be unique")
+        return normalized
     
     @field_validator('weights')
     @classmethod
@@ -354,17 +422,66 @@ class PortfolioAnalysisRequest(BaseModel):
         """Validate that weights sum to 1.0 and match ticker count."""
         if abs(sum(v) - 1.0) > 0.01:
             raise ValueError("Portfolio weights must sum to 1.0")
+        if any(w < 0 for w in v):
+            raise ValueError("Portfolio weights must be non-negative")
         
         # Note: We can't access 'tickers' here in Pydantic v2 easily,
         # so this validation would be done at the endpoint level
         return v
 
 
+class PortfolioAnalysisResponse(BaseModel):
+    """
+    Response model for POST /portfolio/analyze endpoint.
+    
+    Weighted aggregates for the portfolio and each what-if scenario, plus
+    per-holding contributions (largest risk-penalty contribution first).
+    """
+    date: Optional[str] = Field(None, description="Requested score date (null: latest scores)")
+    mode: str = Field(..., description="Scoring mode")
+    portfolio: Dict[str, Any] = Field(
+        ...,
+        description="Weighted score, pillar exposures, risk penalty, band mix and weight coverage",
+        example={
+            "score": 68.4,
+            "pillar_exposures": {"F": 71.2, "T": 64.0, "R": 66.5, "O": 74.1, "Q": 80.3, "S": 70.9},
+            "risk_penalty": 2.35,
+            "band_mix": {"Strong Buy": 0.2, "Buy": 0.5, "Hold": 0.3, "Avoid": 0.0},
+            "coverage": 1.0
+        }
+    )
+    holdings: List[Dict[str, Any]] = Field(
+        ...,
+        description="Per-holding weight, score, band and score / risk-penalty contributions"
+    )
+    missing: List[str] = Field(
+        default_factory=list,
+        description="Requested tickers without a score (their weight is redistributed)"
+    )
+    scenarios: Dict[str, Dict[str, Any]] = Field(
+        default_factory=dict,
+        description="Aggregates for each what-if scenario, same shape as `portfolio`"
+    )
+
+
 class SectorAnalysisResponse(BaseModel):
-    """Response model for sector analysis (future enhancement)."""
+    """Response model for sector analysis, built from precomputed sector aggregates."""
     sector: str
     date: str
     mode: str
-    stocks: List[ScoreResponse]
-    sector_statistics: Dict[str, float]
-    momentum_analysis: Dict[str, Any]
\ No newline at end of file
+    stocks: List[ScoreResponse] = Field(
+        default_factory=list,
+        description="Member scores (not included in aggregate responses; use /scores/band/{band})"
+    )
+    sector_statistics: Dict[str, float] = Field(
+        ...,
+        description="n_stocks, mean_score, median_score and mean pillar scores (mean_F ... mean_S)"
+    )
+    band_distribution: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Number of stocks in each band"
+    )
+    momentum_analysis: Dict[str, Any] = Field(
+        ...,
+        description="Mean sector momentum z-score (S_z) and SectorBear guardrail counts"
+    )
\ No newline at end of file
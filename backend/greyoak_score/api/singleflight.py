@@ -0,0 +1,79 @@
+"""
+Single-flight coalescing of identical concurrent API work.
+
+When a dashboard opens, many clients ask for the same (ticker, date, mode)
+at once. SingleFlight lets the first request for a key start the work (the
+leader) and has every identical request that arrives while it is running
+await the same result instead of recomputing or re-querying. Nothing is
+cached: once the work finishes, the next request for the key starts afresh.
+
+The work runs in its own task, so a leader whose client disconnects does
+not cancel the result its followers are waiting for. Exceptions are shared
+the same way results are.
+"""
+
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+
+class SingleFlight:
+    """
+    Per-key in-flight deduplication for coroutine work on one event loop.
+
+    Counts leaders (work started), coalesced callers (shared a leader's
+    work) and failures for the hit-ratio metric.
+    """
+
+    def __init__(self, name: str):
+        """
+        Args:
+            name: Label for logs and metrics
+        """
+        self.name = name
+        self._in_flight: Dict[Hashable, asyncio.Task] = {}
+        self._lock = threading.Lock()  # Guards counters read by get_stats from other threads
+        self._stats = {'leaders': 0, 'coalesced': 0, 'failures': 0}
+
+    async def do(self, key: Hashable, work: Callable[[], Awaitable[Any]]) -> Tuple[Any, bool]:
+        """
+        Run work() for key, or join the identical call already in flight.
+
+        Args:
+            key: Identity of the work (request parameters)
+            work: Coroutine function producing the result
+
+        Returns:
+            Tuple of (result, coalesced); coalesced is True if this caller
+            shared another caller's work
+
+        Raises:
+            Whatever work() raised, for the leader and every follower
+        """
+        task = self._in_flight.get(key)
+        coalesced = task is not None
+        if task is None:
+            task = asyncio.ensure_future(work())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._finished(key, done))
+        with self._lock:
+            self._stats['coalesced' if coalesced else 'leaders'] += 1
+        # shield: a cancelled caller must not cancel the shared work
+        return await asyncio.shield(task), coalesced
+
+    def _finished(self, key: Hashable, task: asyncio.Task) -> None:
+        """Forget the finished task so the next request starts new work."""
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if task.cancelled() or task.exception() is not None:
+            with self._lock:
+                self._stats['failures'] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Leader/coalesced counters, keys in flight and the coalescing hit ratio."""
+        with self._lock:
+            stats = dict(self._stats)
+        stats['in_flight'] = len(self._in_flight)
+        requests = stats['leaders'] + stats['coalesced']
+        stats['hit_ratio'] = round(stats['coalesced'] / requests, 4) if requests else 0.0
+        return stats
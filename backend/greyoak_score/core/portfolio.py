@@ -0,0 +1,167 @@
+"""Portfolio analysis - weighted aggregation of stored GreyOak Scores.
+
+Holdings are packed once into column arrays (a pillar matrix, score and
+risk-penalty vectors and a one-hot band matrix). Every aggregate is then a
+product with the weight vector, and several weight vectors (what-if
+scenarios) are evaluated together as one matrix product over the same arrays.
+"""
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from greyoak_score.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+PILLARS = ('F', 'T', 'R', 'O', 'Q', 'S')
+BANDS = ('Strong Buy', 'Buy', 'Hold', 'Avoid')
+
+
+@dataclass(frozen=True)
+class PortfolioHoldings:
+    """Scores for a portfolio's tickers, packed as arrays in request order."""
+    tickers: Tuple[str, ...]      # tickers with a score
+    positions: np.ndarray         # (n,) index of each ticker in the request
+    dates: Tuple[str, ...]
+    bands: Tuple[str, ...]
+    scores: np.ndarray            # (n,)
+    pillars: np.ndarray           # (n, 6), columns in PILLARS order
+    risk_penalties: np.ndarray    # (n,)
+    band_onehot: np.ndarray       # (n, 4), columns in BANDS order
+    missing: Tuple[str, ...]      # requested tickers without a score
+
+
+def build_holdings(tickers: Sequence[str], rows: Sequence[Mapping[str, Any]]) -> PortfolioHoldings:
+    """
+    Pack score rows into holdings arrays aligned with the requested tickers.
+
+    Args:
+        tickers: Requested tickers, in request (weight) order
+        rows: Score dicts shaped like ScoreResponse, any order, one per ticker
+
+    Returns:
+        PortfolioHoldings for the tickers that have a row; the rest are listed in `missing`
+    """
+    by_ticker = {row['ticker']: row for row in rows}
+    positions = [i for i, ticker in enumerate(tickers) if ticker in by_ticker]
+    ordered = [by_ticker[tickers[i]] for i in positions]
+
+    band_column = {band: i for i, band in enumerate(BANDS)}
+    band_onehot = np.zeros((len(ordered), len(BANDS)))
+    band_onehot[np.arange(len(ordered)), [band_column[row['band']] for row in ordered]] = 1.0
+
+    return PortfolioHoldings(
+        tickers=tuple(row['ticker'] for row in ordered),
+        positions=np.array(positions, dtype=int),
+        dates=tuple(row['date'] for row in ordered),
+        bands=tuple(row['band'] for row in ordered),
+        scores=np.array([row['score'] for row in ordered], dtype=float),
+        pillars=np.array(
+            [[row['pillars'][p] for p in PILLARS] for row in ordered], dtype=float
+        ).reshape(len(ordered), len(PILLARS)),
+        risk_penalties=np.array([row['risk_penalty'] for row in ordered], dtype=float),
+        band_onehot=band_onehot,
+        missing=tuple(ticker for ticker in tickers if ticker not in by_ticker)
+    )
+
+
+def aggregate_portfolio(
+    holdings: PortfolioHoldings,
+    weights: Sequence[float],
+    scenarios: Optional[Mapping[str, Sequence[float]]] = None
+) -> Dict[str, Any]:
+    """
+    Weighted portfolio score, pillar exposures, band mix and risk-penalty contributions.
+
+    Weights are given per requested ticker. Weights of tickers without a score
+    are dropped and the rest rescaled to sum to 1; `coverage` reports the
+    weight that had scores. Scenarios (alternative weight vectors for the same
+    tickers) are stacked with the base weights into one (k, n) matrix so all of
+    them cost a single product with each holdings array.
+
+    Args:
+        holdings: Packed holdings from build_holdings
+        weights: Weight per requested ticker
+        scenarios: Optional name -> weight vector (same length and order as weights)
+
+    Returns:
+        Dict with 'portfolio' (aggregates for the base weights), 'holdings'
+        (per-ticker weight, score and contributions), 'missing' and
+        'scenarios' (aggregates per scenario name)
+
+    Raises:
+        ValueError: If no requested ticker has a score or a weight vector is malformed
+    """
+    if not len(holdings.tickers):
+        raise ValueError("None of the requested tickers have scores")
+
+    scenarios = dict(scenarios or {})
+    names = ['base', *scenarios]
+    requested = np.array([weights, *scenarios.values()], dtype=float)  # (k, n_requested)
+
+    # Keep the scored tickers and rescale each weight vector over them
+    held = requested[:, holdings.positions]
+    coverage = held.sum(axis=1)
+    if np.any(coverage <= 0):
+        bad = [name for name, c in zip(names, coverage) if c <= 0]
+        raise ValueError(f"Weights have no exposure to scored tickers: {', '.join(bad)}")
+    W = held / coverage[:, None]
+
+    scores = W @ holdings.scores                  # (k,)
+    exposures = W @ holdings.pillars              # (k, 6)
+    penalties = W @ holdings.risk_penalties       # (k,)
+    band_mix = W @ holdings.band_onehot           # (k, 4)
+
+    summaries = [
+        _summary(scores[k], exposures[k], penalties[k], band_mix[k], coverage[k])
+        for k in range(len(names))
+    ]
+
+    base = W[0]
+    score_contributions = base * holdings.scores
+    penalty_contributions = base * holdings.risk_penalties
+    holding_rows: List[Dict[str, Any]] = [
+        {
+            'ticker': ticker,
+            'date': holdings.dates[i],
+            'weight': round(float(base[i]), 6),
+            'score': round(float(holdings.scores[i]), 2),
+            'band': holdings.bands[i],
+            'score_contribution': round(float(score_contributions[i]), 4),
+            'risk_penalty': round(float(holdings.risk_penalties[i]), 2),
+            'risk_penalty_contribution': round(float(penalty_contributions[i]), 4)
+        }
+        for i, ticker in enumerate(holdings.tickers)
+    ]
+    # Largest risk-penalty drag first
+    holding_rows.sort(key=lambda row: row['risk_penalty_contribution'], reverse=True)
+
+    logger.debug(
+        f"Aggregated portfolio of {len(holdings.tickers)} holdings "
+        f"({len(holdings.missing)} missing, {len(scenarios)} scenarios)"
+    )
+    return {
+        'portfolio': summaries[0],
+        'holdings': holding_rows,
+        'missing': list(holdings.missing),
+        'scenarios': dict(zip(names[1:], summaries[1:]))
+    }
+
+
+def _summary(
+    score: float,
+    exposures: np.ndarray,
+    penalty: float,
+    band_mix: np.ndarray,
+    coverage: float
+) -> Dict[str, Any]:
+    """JSON-ready aggregates for one weight vector."""
+    return {
+        'score': round(float(score), 2),
+        'pillar_exposures': {p: round(float(v), 2) for p, v in zip(PILLARS, exposures)},
+        'risk_penalty': round(float(penalty), 2),
+        'band_mix': {band: round(float(v), 4) for band, v in zip(BANDS, band_mix)},
+        'coverage': round(float(coverage), 4)
+    }
@@ -0,0 +1,388 @@
+"""
+Async PostgreSQL access path for the API (asyncpg).
+
+ScoreDatabase uses psycopg2's thread-locked pool, so async route handlers
+either block the event loop or tie up a worker thread per query.
+AsyncScoreDatabase offers the same read/save methods, under the same names
+and with the same return types, as coroutines on a native asyncpg pool.
+Query text, validation and row conversion come from ScoreQueries, so both
+drivers return identical results.
+
+Routes use it when DB_DRIVER=asyncpg; the write-behind queue, health
+monitor and maintenance tasks keep using ScoreDatabase.
+
+Key Features:
+- Native async pool (DB_POOL_MIN_CONN / DB_POOL_MAX_CONN)
+- Checkouts wait up to DB_POOL_CHECKOUT_TIMEOUT, then raise PoolTimeout
+- asyncpg's per-connection statement cache replaces explicit PREPAREs
+  (disabled with DB_PREPARED_STATEMENTS=false for transaction poolers)
+- Same pool and per-query latency metrics as ScoreDatabase (get_pool_stats)
+"""
+
+import asyncio
+import json
+import os
+import time
+from contextlib import asynccontextmanager
+from datetime import date
+from decimal import Decimal
+from typing import Any, Dict, List, Optional, Tuple
+
+import psycopg2
+
+try:
+    import asyncpg
+except ImportError:  # Only required when DB_DRIVER=asyncpg
+    asyncpg = None
+
+from greyoak_score.data.models import ScoreOutput
+from greyoak_score.data.persistence import (
+    ScoreQueries, SCORE_COLUMNS, _UPSERT_SCORE, _UPSERT_LATEST_ONE, _PUBLISH_ONE,
+    _notify_saved, _notify_published
+)
+from greyoak_score.data.pool_metrics import timed_query
+from greyoak_score.data.prepared import to_server_placeholders
+from greyoak_score.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_FLOAT_COLUMNS = frozenset(
+    index for index, column in enumerate(SCORE_COLUMNS)
+    if column in ('score', 'f_pillar', 't_pillar', 'r_pillar', 'o_pillar', 'q_pillar',
+                  's_pillar', 'risk_penalty', 'confidence', 's_z')
+)
+_FLAGS_COLUMN = SCORE_COLUMNS.index('guardrail_flags')
+
+
+class PoolTimeout(Exception):
+    """Raised when no pooled connection frees up within the checkout timeout."""
+
+
+# Errors the routes treat as database failures, whichever driver is in use
+DATABASE_ERRORS: Tuple[type, ...] = (psycopg2.Error, PoolTimeout)
+if asyncpg is not None:
+    DATABASE_ERRORS += (asyncpg.PostgresError, asyncpg.InterfaceError)
+
+
+def use_async_driver() -> bool:
+    """True if the API should query through AsyncScoreDatabase (DB_DRIVER=asyncpg)."""
+    return os.getenv('DB_DRIVER', 'psycopg2').lower() == 'asyncpg'
+
+
+class AsyncScoreDatabase(ScoreQueries):
+    """
+    asyncpg implementation of the ScoreDatabase read/save interface.
+
+    Create it, then await open() (get_async_database() does both). Methods
+    mirror ScoreDatabase: same names, arguments and return types, awaited.
+    """
+
+    def __init__(self, database_url: Optional[str] = None):
+        """
+        Configure the pool (connections open on open()).
+
+        Args:
+            database_url: PostgreSQL connection string. If None, uses environment variables.
+        """
+        self._configure(database_url)
+        self._pool = None
+
+    async def open(self) -> None:
+        """
+        Create the connection pool with DB_POOL_MIN_CONN open connections.
+
+        Raises:
+            RuntimeError: If asyncpg is not installed
+        """
+        if asyncpg is None:
+            raise RuntimeError("DB_DRIVER=asyncpg requires the asyncpg package")
+        if self._pool is not None:
+            return
+        self._pool = await asyncpg.create_pool(
+            dsn=self.database_url,
+            min_size=self.min_conn,
+            max_size=self.max_conn,
+            timeout=self.pool_timeout,
+            statement_cache_size=100 if self.use_prepared else 0,
+            init=self._init_connection
+        )
+        logger.info(f"Async database pool initialized: {self._get_safe_connection_info()}, "
+                    f"pool={self.min_conn}-{self.max_conn} connections")
+
+    @staticmethod
+    async def _init_connection(conn) -> None:
+        """Decode JSONB as Python objects, as psycopg2 does."""
+        await conn.set_type_codec(
+            'jsonb', encoder=json.dumps, decoder=json.loads, schema='pg_catalog'
+        )
+
+    async def close_pool(self) -> None:
+        """
+        Close all connections in the pool.
+        Should be called during application shutdown.
+        """
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+            logger.info("Async connection pool closed")
+
+    @asynccontextmanager
+    async def get_connection(self):
+        """
+        Check out a pooled connection, waiting up to checkout_timeout.
+
+        Yields:
+            asyncpg.Connection
+
+        Raises:
+            PoolTimeout: If no connection frees up in time
+        """
+        if self._pool is None:
+            raise PoolTimeout("Async connection pool not initialized")
+        start = time.perf_counter()
+        try:
+            conn = await self._pool.acquire(timeout=self.checkout_timeout)
+        except asyncio.TimeoutError:
+            self.metrics.increment('checkout_failures')
+            raise PoolTimeout(
+                f"connection pool exhausted: no connection free within {self.checkout_timeout}s"
+            )
+        finally:
+            self.metrics.checkout_wait.observe((time.perf_counter() - start) * 1000)
+        self.metrics.increment('checkouts')
+        try:
+            yield conn
+        finally:
+            await self._pool.release(conn)
+            self.metrics.increment('returns')
+
+    @timed_query
+    async def test_connection(self) -> bool:
+        """
+        Test database connectivity.
+
+        Returns:
+            bool: True if connection successful, False otherwise
+        """
+        try:
+            async with self.get_connection() as conn:
+                return await conn.fetchval("SELECT 1") == 1
+        except Exception as e:
+            logger.error(f"Database connection test failed: {e}")
+            return False
+
+    @timed_query
+    async def save_score(self, score: ScoreOutput) -> int:
+        """
+        Save a score (UPSERT on (ticker, date, mode)) and update latest_scores.
+
+        Args:
+            score: ScoreOutput from the scoring engine
+
+        Returns:
+            int: Database ID of the inserted/updated row
+
+        Raises:
+            asyncpg.PostgresError: If database operation fails
+            ValueError: If score data is invalid
+        """
+        self._validate_score(score)
+
+        try:
+            async with self.get_connection() as conn:
+                async with conn.transaction():
+                    row_id = await conn.fetchval(
+                        to_server_placeholders(_UPSERT_SCORE), *self._score_params(score)
+                    )
+                    await conn.execute(
+                        to_server_placeholders(_UPSERT_LATEST_ONE),
+                        score.ticker, score.scoring_date, score.mode
+                    )
+                    events = []
+                    if self.publish_events:
+                        events = [row[1] for row in await conn.fetch(
+                            to_server_placeholders(_PUBLISH_ONE),
+                            score.ticker, score.scoring_date, score.mode
+                        )]
+        except DATABASE_ERRORS as e:
+            logger.error(f"Database error saving score for {score.ticker}: {e}")
+            raise
+
+        _notify_saved({(score.scoring_date, score.mode)})
+        _notify_published(events)
+        logger.info(f"Score saved for {score.ticker} with ID {row_id}")
+        return row_id
+
+    def _score_params(self, score: ScoreOutput) -> tuple:
+        """Column values in INSERT order, typed for asyncpg (Decimal, plain JSON list)."""
+        params = list(super()._score_params(score))
+        for index in _FLOAT_COLUMNS:
+            params[index] = Decimal(str(params[index]))
+        params[_FLAGS_COLUMN] = score.guardrail_flags
+        return tuple(params)
+
+    @timed_query
+    async def get_score(self, ticker: str, date: date, mode: str) -> Optional[ScoreOutput]:
+        """
+        Retrieve a specific score from the database.
+
+        Returns:
+            ScoreOutput if found, None if not found
+        """
+        if not ticker or not ticker.strip():
+            raise ValueError("Ticker cannot be empty")
+
+        if mode not in ['Trader', 'Investor']:
+            raise ValueError(f"Invalid mode: {mode}. Must be 'Trader' or 'Investor'")
+
+        async with self.get_connection() as conn:
+            row = await conn.fetchrow(
+                f"SELECT {self._select_columns(False)} FROM scores "
+                "WHERE ticker = $1 AND date = $2 AND mode = $3",
+                ticker, date, mode
+            )
+        return self._row_to_score_output(row) if row else None
+
+    @timed_query
+    async def get_scores_by_ticker_page(
+        self,
+        ticker: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        mode: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        raw: bool = False
+    ) -> Tuple[List[Any], Optional[str]]:
+        """Keyset-paginated score history for a ticker (see ScoreDatabase)."""
+        query, params = self._ticker_page_query(ticker, start_date, end_date, mode, cursor, raw)
+        rows = await self._fetch_page(query, params, limit)
+        return self._page_result(rows, limit, raw, 'ticker_history', ('date', 'mode'))
+
+    @timed_query
+    async def get_scores_by_band_page(
+        self,
+        band: str,
+        date: date,
+        mode: str,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        raw: bool = False
+    ) -> Tuple[List[Any], Optional[str]]:
+        """Keyset-paginated stocks in a band on a date (see ScoreDatabase)."""
+        query, params = self._band_page_query(band, date, mode, cursor, raw)
+        rows = await self._fetch_page(query, params, limit)
+        return self._page_result(rows, limit, raw, 'band', ('score', 'ticker'))
+
+    @timed_query
+    async def get_latest_scores_page(
+        self,
+        mode: str,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        raw: bool = False
+    ) -> Tuple[List[Any], Optional[str]]:
+        """Keyset-paginated latest scores for a mode (see ScoreDatabase)."""
+        query, params = self._latest_page_query(mode, cursor, raw)
+        rows = await self._fetch_page(query, params, limit)
+        return self._page_result(rows, limit, raw, 'latest', ('date', 'score', 'ticker'))
+
+    @timed_query
+    async def get_scores_for_tickers(
+        self,
+        tickers: List[str],
+        mode: str,
+        date: Optional[date] = None
+    ) -> List[Dict[str, Any]]:
+        """Scores for many tickers in one query, as response dicts (see ScoreDatabase)."""
+        query, params = self._tickers_scores_query(tickers, mode, date)
+        try:
+            async with self.get_connection() as conn:
+                rows = await conn.fetch(to_server_placeholders(query), *params)
+        except DATABASE_ERRORS as e:
+            logger.error(f"Database error fetching scores for {len(tickers)} tickers: {e}")
+            raise
+        return [self._row_to_score_dict(row) for row in rows]
+
+    @timed_query
+    async def get_sector_aggregate(
+        self,
+        sector: str,
+        mode: str,
+        date: Optional[date] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Precomputed aggregate for one sector group (see ScoreDatabase)."""
+        query, params = self._sector_aggregate_query(sector, date, mode)
+        try:
+            async with self.get_connection() as conn:
+                row = await conn.fetchrow(to_server_placeholders(query), *params)
+        except DATABASE_ERRORS as e:
+            logger.error(f"Database error fetching sector aggregate for {sector}: {e}")
+            raise
+        return self._sector_aggregate_dict(row) if row else None
+
+    async def _fetch_page(self, query: str, params: List[Any], limit: int) -> List[Any]:
+        """Run a keyset page query, fetching one extra row to detect a next page."""
+        try:
+            async with self.get_connection() as conn:
+                return await conn.fetch(to_server_placeholders(query), *params, limit + 1)
+        except DATABASE_ERRORS as e:
+            logger.error(f"Database error fetching score page: {e}")
+            raise
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """
+        Connection pool statistics for monitoring (same shape as ScoreDatabase's).
+
+        Not a coroutine: it only reads in-process counters.
+        """
+        if self._pool is None:
+            return {"error": "Connection pool not initialized"}
+
+        size, idle = self._pool.get_size(), self._pool.get_idle_size()
+        return {
+            "pool_configured": True,
+            "driver": "asyncpg",
+            "min_connections": self.min_conn,
+            "max_connections": self.max_conn,
+            "pool_timeout": self.pool_timeout,
+            "checkout_timeout": self.checkout_timeout,
+            "pool_closed": self._pool.is_closing(),
+            "in_use": size - idle,
+            "idle": idle,
+            "open": size,
+            "capacity": self.max_conn,
+            "utilization": round((size - idle) / self.max_conn, 4) if self.max_conn else 0.0,
+            **self.metrics.snapshot()
+        }
+
+
+# Convenience singleton instance for easy access
+_async_db_instance: Optional[AsyncScoreDatabase] = None
+_async_db_lock = asyncio.Lock()
+
+async def get_async_database() -> AsyncScoreDatabase:
+    """
+    Get the singleton async database instance, opening its pool on first use.
+
+    Returns:
+        AsyncScoreDatabase: Shared instance with an open pool
+    """
+    global _async_db_instance
+    if _async_db_instance is None:
+        async with _async_db_lock:
+            if _async_db_instance is None:
+                db = AsyncScoreDatabase()
+                await db.open()
+                _async_db_instance = db
+    return _async_db_instance
+
+async def close_async_database() -> None:
+    """
+    Close the singleton async database and its pool.
+    Should be called during application shutdown.
+    """
+    global _async_db_instance
+    if _async_db_instance is not None:
+        await _async_db_instance.close_pool()
+        _async_db_instance = None
@@ -0,0 +1,172 @@
+"""
+Background database health monitor.
+
+Health endpoints are polled every few seconds by orchestrators and load
+balancers. Instead of probing PostgreSQL on every request, a monitor thread
+refreshes a snapshot on an interval (connectivity test plus planner-estimated
+table statistics) and the endpoint serves the last snapshot with its age.
+
+Key Features:
+- One probe per interval regardless of request rate
+- Cheap statistics (ScoreDatabase.get_database_stats_estimated)
+- Snapshot age and staleness flag for detecting a stuck prober
+"""
+
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional
+
+from greyoak_score.data.persistence import ScoreDatabase, get_database
+from greyoak_score.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class DatabaseHealthMonitor:
+    """
+    Periodically probes the database and keeps the latest health snapshot.
+
+    A snapshot older than stale_after seconds is reported as stale, which
+    the health endpoint treats as a failed probe.
+    """
+
+    def __init__(
+        self,
+        db_factory: Callable[[], ScoreDatabase] = get_database,
+        interval: Optional[float] = None,
+        stale_after: Optional[float] = None
+    ):
+        """
+        Initialize the monitor (the probe thread starts on start()).
+
+        Args:
+            db_factory: Returns the ScoreDatabase to probe
+            interval: Seconds between probes (HEALTH_PROBE_INTERVAL, default 15)
+            stale_after: Snapshot age treated as stale (default 3 x interval)
+        """
+        self.db_factory = db_factory
+        self.interval = (
+            interval if interval is not None
+            else float(os.getenv('HEALTH_PROBE_INTERVAL', '15'))
+        )
+        self.stale_after = stale_after if stale_after is not None else 3 * self.interval
+
+        self._snapshot: Optional[Dict[str, Any]] = None
+        self._refreshed_at: Optional[float] = None  # monotonic
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the probe thread (idempotent)."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._run, name='db-health-monitor', daemon=True
+            )
+            self._thread.start()
+        logger.info(f"Database health monitor started: interval={self.interval:.0f}s")
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Stop the probe thread."""
+        thread = self._thread
+        if thread is None:
+            return
+        self._stop.set()
+        thread.join(timeout)
+        self._thread = None
+        logger.info("Database health monitor stopped")
+
+    def refresh(self) -> Dict[str, Any]:
+        """
+        Probe the database now and store the result.
+
+        Concurrent callers share a single probe.
+
+        Returns:
+            Dict: The new snapshot
+        """
+        with self._refresh_lock:
+            started = time.perf_counter()
+            status, error, stats = "unknown", None, None
+            try:
+                db = self.db_factory()
+                if db.test_connection():
+                    status = "healthy"
+                    stats = db.get_database_stats_estimated()
+                else:
+                    status, error = "unhealthy", "Connection test failed"
+            except Exception as e:
+                status, error = "unhealthy", str(e)
+
+            snapshot = {
+                'status': status,
+                'error': error,
+                'stats': stats,
+                'checked_at': datetime.now(timezone.utc).isoformat(),
+                'probe_ms': round((time.perf_counter() - started) * 1000, 2)
+            }
+            with self._lock:
+                self._snapshot = snapshot
+                self._refreshed_at = time.monotonic()
+        if status != "healthy":
+            logger.warning(f"Database health probe: {status} ({error})")
+        return snapshot
+
+    def get_snapshot(self) -> Optional[Dict[str, Any]]:
+        """
+        Latest snapshot with its age, or None before the first probe.
+
+        Returns:
+            Dict with status, error, stats, checked_at, probe_ms,
+            age_seconds and stale
+        """
+        with self._lock:
+            if self._snapshot is None:
+                return None
+            age = time.monotonic() - self._refreshed_at
+            snapshot = dict(self._snapshot)
+        snapshot['age_seconds'] = round(age, 3)
+        snapshot['stale'] = age > self.stale_after
+        return snapshot
+
+    def _run(self) -> None:
+        """Probe loop: refresh, then sleep until the next interval or stop."""
+        while not self._stop.is_set():
+            try:
+                self.refresh()
+            except Exception as e:  # Never let the prober die
+                logger.error(f"Database health probe failed: {e}", exc_info=True)
+            self._stop.wait(self.interval)
+
+
+# Convenience singleton instance for easy access
+_health_monitor = None
+
+def get_health_monitor() -> DatabaseHealthMonitor:
+    """
+    Get the singleton health monitor, starting its probe thread.
+
+    Returns:
+        DatabaseHealthMonitor: Shared, running monitor
+    """
+    global _health_monitor
+    if _health_monitor is None:
+        _health_monitor = DatabaseHealthMonitor()
+        _health_monitor.start()
+    return _health_monitor
+
+def close_health_monitor() -> None:
+    """
+    Stop the singleton monitor.
+    Should be called during application shutdown, before closing the database.
+    """
+    global _health_monitor
+    if _health_monitor is not None:
+        _health_monitor.stop()
+        _health_monitor = None
@@ -0,0 +1,78 @@
+"""
+Keyset pagination cursors for score queries.
+
+A cursor is an opaque, URL-safe token holding the sort key of the last row
+on a page plus the ordering it belongs to. The next page is fetched with a
+row-value comparison on that key (WHERE (a, b) < (%s, %s)), which walks the
+index directly instead of scanning and discarding OFFSET rows.
+
+Orderings:
+- 'ticker_history': (date, mode) DESC for one ticker's history
+- 'band': (score, ticker) DESC within a band on a date
+- 'latest': (date, score, ticker) for latest scores, pinning the date
+"""
+
+import base64
+import json
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, List
+
+# Key component types per ordering, used to decode cursor values
+CURSOR_KEYS: Dict[str, tuple] = {
+    'ticker_history': ('date', 'str'),
+    'band': ('decimal', 'str'),
+    'latest': ('date', 'decimal', 'str'),
+}
+
+
+def encode_cursor(kind: str, key: List[Any]) -> str:
+    """
+    Encode the sort key of the last row on a page as an opaque cursor.
+
+    Args:
+        kind: Ordering name (a key of CURSOR_KEYS)
+        key: Sort key values (dates, Decimals/floats, strings)
+
+    Returns:
+        str: URL-safe cursor token
+    """
+    if kind not in CURSOR_KEYS:
+        raise ValueError(f"Unknown cursor kind: {kind}")
+    values = [v.isoformat() if isinstance(v, date) else str(v) for v in key]
+    raw = json.dumps({'k': kind, 'v': values}, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(token: str, kind: str) -> List[Any]:
+    """
+    Decode a cursor produced by encode_cursor for the given ordering.
+
+    Args:
+        token: Cursor token from a previous page
+        kind: Expected ordering name
+
+    Returns:
+        List of typed sort key values
+
+    Raises:
+        ValueError: If the token is malformed or belongs to another ordering
+    """
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        values = payload['v']
+        types = CURSOR_KEYS[kind]
+        if payload['k'] != kind or len(values) != len(types):
+            raise ValueError("cursor does not match this query")
+        return [_parse_value(value, kind_of) for value, kind_of in zip(values, types)]
+    except (ValueError, KeyError, TypeError, InvalidOperation) as e:
+        raise ValueError(f"Invalid cursor: {e}")
+
+
+def _parse_value(value: str, type_name: str) -> Any:
+    if type_name == 'date':
+        return date.fromisoformat(value)
+    if type_name == 'decimal':
+        return Decimal(value)
+    return str(value)
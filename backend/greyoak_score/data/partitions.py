@@ -0,0 +1,297 @@
+"""
+Range-partition maintenance for the scores table.
+
+The scores table is declaratively partitioned by RANGE (date), one partition
+per month (default) or quarter, plus a DEFAULT partition as a safety net.
+Partitions are named after their lower bound:
+
+- month:   scores_p2024_10  -> [2024-10-01, 2024-11-01)
+- quarter: scores_p2024q4   -> [2024-10-01, 2025-01-01)
+
+maintain_partitions() is run from the API lifespan and can be scheduled
+(python -m greyoak_score.data.partitions): it pre-creates upcoming
+partitions so rows never land in DEFAULT, and optionally detaches (and
+drops) partitions that fall entirely before a retention cutoff. If rows did
+land in DEFAULT for a range that now gets its own partition, they are moved
+into it (Postgres refuses to create the partition while DEFAULT holds them).
+"""
+
+import argparse
+import re
+from datetime import date
+from typing import Dict, List, Optional, Tuple
+
+from psycopg2 import sql
+
+from greyoak_score.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+PARENT_TABLE = 'scores'
+DEFAULT_PARTITION = 'scores_default'
+INTERVALS = {'month': 1, 'quarter': 3}
+
+_BOUND_RE = re.compile(r"FROM \('(\d{4}-\d{2}-\d{2})'\) TO \('(\d{4}-\d{2}-\d{2})'\)")
+
+
+def add_months(day: date, months: int) -> date:
+    """First day of the month `months` after day's month."""
+    index = day.year * 12 + (day.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_bounds(day: date, interval: str = 'month') -> Tuple[date, date]:
+    """
+    Return the [start, end) range of the partition that holds `day`.
+
+    Raises:
+        ValueError: If interval is not 'month' or 'quarter'
+    """
+    if interval not in INTERVALS:
+        raise ValueError(f"Invalid partition interval: {interval}. Must be one of {list(INTERVALS)}")
+    step = INTERVALS[interval]
+    start_month = ((day.month - 1) // step) * step + 1
+    start = date(day.year, start_month, 1)
+    return start, add_months(start, step)
+
+
+def partition_name(start: date, interval: str = 'month') -> str:
+    """Partition table name for a range starting at `start`."""
+    if interval == 'quarter':
+        return f"{PARENT_TABLE}_p{start.year}q{(start.month - 1) // 3 + 1}"
+    return f"{PARENT_TABLE}_p{start.year}_{start.month:02d}"
+
+
+def planned_partitions(first: date, last: date, interval: str = 'month') -> List[Tuple[str, date, date]]:
+    """(name, start, end) for every partition covering first..last inclusive."""
+    partitions = []
+    start, end = partition_bounds(first, interval)
+    while start <= last:
+        partitions.append((partition_name(start, interval), start, end))
+        start, end = end, add_months(end, INTERVALS[interval])
+    return partitions
+
+
+def is_partitioned(cur) -> bool:
+    """True if the scores table is a partitioned (parent) table."""
+    cur.execute("""
+        SELECT 1 FROM pg_partitioned_table pt
+        JOIN pg_class c ON c.oid = pt.partrelid
+        WHERE c.relname = %s AND pg_table_is_visible(c.oid)
+    """, (PARENT_TABLE,))
+    return cur.fetchone() is not None
+
+
+def list_partitions(cur) -> List[Dict]:
+    """
+    Attached range partitions of scores with their bounds.
+
+    Returns:
+        List of {'name', 'start', 'end'} dicts ordered by start (DEFAULT excluded)
+    """
+    cur.execute("""
+        SELECT c.relname, pg_get_expr(c.relpartbound, c.oid)
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        JOIN pg_class p ON p.oid = i.inhparent
+        WHERE p.relname = %s AND pg_table_is_visible(p.oid)
+    """, (PARENT_TABLE,))
+    partitions = []
+    for name, bound in cur.fetchall():
+        match = _BOUND_RE.search(bound or '')
+        if match:
+            partitions.append({
+                'name': name,
+                'start': date.fromisoformat(match.group(1)),
+                'end': date.fromisoformat(match.group(2)),
+            })
+    return sorted(partitions, key=lambda p: p['start'])
+
+
+def has_default_partition(cur) -> bool:
+    """True if scores_default is attached as the DEFAULT partition of scores."""
+    cur.execute("""
+        SELECT 1 FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        JOIN pg_class p ON p.oid = i.inhparent
+        WHERE p.relname = %s AND c.relname = %s AND pg_table_is_visible(p.oid)
+    """, (PARENT_TABLE, DEFAULT_PARTITION))
+    return cur.fetchone() is not None
+
+
+def default_has_rows(cur, start: date, end: date) -> bool:
+    """True if the DEFAULT partition holds rows dated in [start, end)."""
+    cur.execute(
+        sql.SQL("SELECT EXISTS (SELECT 1 FROM {} WHERE date >= %s AND date < %s)").format(
+            sql.Identifier(DEFAULT_PARTITION)
+        ),
+        (start, end)
+    )
+    return bool(cur.fetchone()[0])
+
+
+def create_partitions(cur, first: date, last: date, interval: str = 'month') -> List[str]:
+    """
+    Create missing partitions covering first..last (inclusive).
+
+    Ranges already covered by an existing partition are skipped, so the
+    routine is idempotent and tolerates partitions of another interval.
+
+    Rows that landed in DEFAULT for a missing range (maintenance did not run
+    in time) would make CREATE ... PARTITION OF fail. For those ranges DEFAULT
+    is detached, the partition created, the rows moved into it and DEFAULT
+    reattached, all in the caller's transaction.
+
+    Returns:
+        Names of partitions created
+    """
+    existing = list_partitions(cur)
+    missing = []
+    for name, start, end in planned_partitions(first, last, interval):
+        if any(p['start'] < end and start < p['end'] for p in existing):
+            continue
+        missing.append((name, start, end))
+        existing.append({'name': name, 'start': start, 'end': end})
+    if not missing:
+        return []
+
+    blocked = []
+    if has_default_partition(cur):
+        blocked = [p for p in missing if default_has_rows(cur, p[1], p[2])]
+    if blocked:
+        logger.warning(
+            f"Rows for {[name for name, _, _ in blocked]} are in {DEFAULT_PARTITION}; "
+            f"moving them into new partitions"
+        )
+        cur.execute(sql.SQL("ALTER TABLE {} DETACH PARTITION {}").format(
+            sql.Identifier(PARENT_TABLE), sql.Identifier(DEFAULT_PARTITION)
+        ))
+
+    for name, start, end in missing:
+        cur.execute(
+            sql.SQL("CREATE TABLE IF NOT EXISTS {} PARTITION OF {} FOR VALUES FROM (%s) TO (%s)").format(
+                sql.Identifier(name), sql.Identifier(PARENT_TABLE)
+            ),
+            (start, end)
+        )
+
+    if blocked:
+        for name, start, end in blocked:
+            cur.execute(
+                sql.SQL("""
+                    WITH moved AS (
+                        DELETE FROM {} WHERE date >= %s AND date < %s RETURNING *
+                    )
+                    INSERT INTO {} SELECT * FROM moved
+                """).format(sql.Identifier(DEFAULT_PARTITION), sql.Identifier(name)),
+                (start, end)
+            )
+            logger.warning(f"Moved {cur.rowcount} rows from {DEFAULT_PARTITION} into {name}")
+        cur.execute(sql.SQL("ALTER TABLE {} ATTACH PARTITION {} DEFAULT").format(
+            sql.Identifier(PARENT_TABLE), sql.Identifier(DEFAULT_PARTITION)
+        ))
+
+    created = [name for name, _, _ in missing]
+    logger.info(f"Created score partitions: {created}")
+    return created
+
+
+def detach_partitions_before(cur, cutoff: date, drop: bool = False) -> List[str]:
+    """
+    Detach partitions whose whole range ends on or before `cutoff`.
+
+    Args:
+        cur: Cursor inside a transaction
+        cutoff: Rows with date < cutoff may be retired
+        drop: Also DROP the detached tables (otherwise they remain as
+              standalone tables for archiving)
+
+    Returns:
+        Names of partitions detached
+    """
+    detached = []
+    for partition in list_partitions(cur):
+        if partition['end'] > cutoff:
+            continue
+        identifier = sql.Identifier(partition['name'])
+        cur.execute(sql.SQL("ALTER TABLE {} DETACH PARTITION {}").format(
+            sql.Identifier(PARENT_TABLE), identifier
+        ))
+        if drop:
+            cur.execute(sql.SQL("DROP TABLE {}").format(identifier))
+        detached.append(partition['name'])
+    if detached:
+        logger.info(f"{'Dropped' if drop else 'Detached'} score partitions: {detached}")
+    return detached
+
+
+def maintain_partitions(
+    conn,
+    months_ahead: int = 3,
+    retain_months: Optional[int] = None,
+    drop: bool = False,
+    interval: str = 'month',
+    today: Optional[date] = None
+) -> Dict[str, List[str]]:
+    """
+    Pre-create upcoming partitions and optionally retire old ones, in one transaction.
+
+    Does nothing if scores is not partitioned (migration not applied yet).
+
+    Args:
+        conn: psycopg2 connection
+        months_ahead: Ensure partitions exist through this many months ahead
+        retain_months: If set, detach partitions entirely older than this many months
+        drop: Drop (not just detach) retired partitions
+        interval: 'month' or 'quarter' for newly created partitions
+        today: Reference date (defaults to date.today())
+
+    Returns:
+        Dict with 'created' and 'detached' partition names
+    """
+    today = today or date.today()
+    result = {'created': [], 'detached': []}
+    with conn.cursor() as cur:
+        if not is_partitioned(cur):
+            logger.debug("scores is not partitioned; skipping partition maintenance")
+            return result
+        result['created'] = create_partitions(
+            cur, today, add_months(today, months_ahead), interval
+        )
+        if retain_months is not None:
+            cutoff = add_months(today, -retain_months)
+            result['detached'] = detach_partitions_before(cur, cutoff, drop=drop)
+    conn.commit()
+    return result
+
+
+def main() -> None:
+    """CLI entry point for scheduled partition maintenance."""
+    from greyoak_score.data.persistence import get_database, close_database
+
+    parser = argparse.ArgumentParser(description="Maintain scores table partitions")
+    parser.add_argument('--months-ahead', type=int, default=3,
+                        help="Pre-create partitions this many months ahead (default: 3)")
+    parser.add_argument('--retain-months', type=int, default=None,
+                        help="Detach partitions entirely older than this many months")
+    parser.add_argument('--drop', action='store_true',
+                        help="Drop retired partitions instead of only detaching them")
+    parser.add_argument('--interval', choices=list(INTERVALS), default='month',
+                        help="Range of newly created partitions (default: month)")
+    args = parser.parse_args()
+
+    try:
+        result = get_database().maintain_partitions(
+            months_ahead=args.months_ahead,
+            retain_months=args.retain_months,
+            drop=args.drop,
+            interval=args.interval
+        )
+        print(f"Created: {result['created'] or 'none'}")
+        print(f"Detached: {result['detached'] or 'none'}")
+    finally:
+        close_database()
+
+
+if __name__ == "__main__":
+    main()
@@ -9,28 +9,622 @@ Key Features:
 - Parameterized queries for SQL injection prevention
 - Connection pooling and transaction management
 - Query methods: by ticker, by band, with date filters
+- Per-sector aggregates (sector_aggregates) refreshed by batch saves
+- Score events published on commit (NOTIFY score_events + in-process listeners)
 - Proper error handling and logging
 """
 
 import os
+import io
+import csv
 import json
 import time
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterable, Iterator, Tuple, Callable, Set
 from datetime import date, datetime
 import psycopg2
-from psycopg2.extras import RealDictCursor, Json
+from psycopg2.extras import RealDictCursor, Json, execute_values
 from psycopg2 import pool
 from contextlib import contextmanager
 import logging
 
 from greyoak_score.data.models import ScoreOutput, PillarScores
+from greyoak_score.data.pagination import encode_cursor, decode_cursor
+from greyoak_score.data import partitions
+from greyoak_score.data.pool_metrics import InstrumentedConnectionPool, PoolMetrics, timed_query
+from greyoak_score.data.prepared import PreparedStatements, PreparingConnection
 from greyoak_score.utils.logger import get_logger
 import greyoak_score
 
 logger = get_logger(__name__)
 
+# scores columns written by the save methods, in INSERT/COPY order
+SCORE_COLUMNS = (
+    'ticker', 'date', 'mode', 'score', 'band',
+    'f_pillar', 't_pillar', 'r_pillar', 'o_pillar', 'q_pillar', 's_pillar',
+    'risk_penalty', 'guardrail_flags', 'confidence', 's_z',
+    'as_of', 'config_hash', 'code_version'
+)
 
-class ScoreDatabase:
+# scores columns the API returns, selected by the raw (response dict) read path
+RESPONSE_COLUMNS = (
+    'ticker', 'date', 'mode', 'score', 'band',
+    'f_pillar', 't_pillar', 'r_pillar', 'o_pillar', 'q_pillar', 's_pillar',
+    'risk_penalty', 'guardrail_flags', 'confidence', 's_z', 'as_of', 'config_hash'
+)
+_RESPONSE_SELECT = ", ".join(RESPONSE_COLUMNS)
+
+# latest_scores holds each (ticker, mode)'s most recent score; an upsert only
+# replaces a row with one for the same or a newer date
+_LATEST_UPSERT = """
+    INSERT INTO latest_scores ({columns}) {{source}}
+    ON CONFLICT (ticker, mode) DO UPDATE SET {updates}
+    WHERE latest_scores.date <= EXCLUDED.date
+""".format(
+    columns=", ".join(SCORE_COLUMNS),
+    updates=", ".join(f"{col} = EXCLUDED.{col}" for col in SCORE_COLUMNS if col not in ('ticker', 'mode'))
+)
+
+# Hot queries, prepared per pooled connection (see greyoak_score.data.prepared).
+# Callers must execute exactly these strings for the prepared path to apply.
+HOT_STATEMENTS = PreparedStatements()
+
+_UPSERT_SCORE = HOT_STATEMENTS.register('score_upsert', """
+    INSERT INTO scores ({columns}) VALUES ({placeholders})
+    ON CONFLICT (ticker, date, mode) DO UPDATE SET {updates}
+    RETURNING id
+""".format(
+    columns=", ".join(SCORE_COLUMNS),
+    placeholders=", ".join(["%s"] * len(SCORE_COLUMNS)),
+    updates=", ".join(f"{col} = EXCLUDED.{col}" for col in SCORE_COLUMNS[3:])
+))
+_UPSERT_LATEST_ONE = HOT_STATEMENTS.register('score_upsert_latest', _LATEST_UPSERT.format(
+    source=f"SELECT {', '.join(SCORE_COLUMNS)} FROM scores WHERE ticker = %s AND date = %s AND mode = %s"
+))
+
+_FULL_SELECT = ", ".join(SCORE_COLUMNS)
+_TICKER_PAGE = "SELECT {columns} FROM scores WHERE {where} ORDER BY date DESC, mode DESC LIMIT %s"
+_BAND_PAGE = "SELECT {columns} FROM scores WHERE {where} ORDER BY score DESC, ticker DESC LIMIT %s"
+_LATEST_PAGE = "SELECT {columns} FROM latest_scores WHERE {where} ORDER BY score DESC, ticker DESC LIMIT %s"
+_LATEST_FIRST = "mode = %s AND date = (SELECT MAX(date) FROM latest_scores WHERE mode = %s)"
+_LATEST_AFTER = "mode = %s AND date = %s AND (score, ticker) < (%s, %s)"
+
+# Bulk lookup of many tickers' scores in one round trip (portfolio analysis):
+# each ticker's latest score, or its score on a given date
+_TICKERS_LATEST = f"SELECT {_RESPONSE_SELECT} FROM latest_scores WHERE mode = %s AND ticker = ANY(%s)"
+_TICKERS_ON_DATE = f"SELECT {_RESPONSE_SELECT} FROM scores WHERE mode = %s AND date = %s AND ticker = ANY(%s)"
+
+# Page queries in their unfiltered shapes (first page and after a cursor),
+# for both the ScoreOutput (full) and response-dict (raw) column lists
+for _suffix, _columns in (('', _FULL_SELECT), ('_raw', _RESPONSE_SELECT)):
+    for _name, _template, _where in (
+        ('ticker_page', _TICKER_PAGE, "ticker = %s"),
+        ('ticker_page_after', _TICKER_PAGE, "ticker = %s AND (date, mode) < (%s, %s)"),
+        ('band_page', _BAND_PAGE, "band = %s AND date = %s AND mode = %s"),
+        ('band_page_after', _BAND_PAGE, "band = %s AND date = %s AND mode = %s AND (score, ticker) < (%s, %s)"),
+        ('latest_page', _LATEST_PAGE, _LATEST_FIRST),
+        ('latest_page_after', _LATEST_PAGE, _LATEST_AFTER),
+    ):
+        HOT_STATEMENTS.register(f"score_{_name}{_suffix}", _template.format(columns=_columns, where=_where))
+
+# Columnar export: API columns with numerics cast to float8 in the query, so
+# rows arrive as plain Python floats ready for Arrow/JSON encoding
+EXPORT_COLUMNS = RESPONSE_COLUMNS
+_EXPORT_SELECT = ", ".join(
+    col if col in ('ticker', 'date', 'mode', 'band', 'guardrail_flags', 'as_of', 'config_hash')
+    else f"{col}::float8 AS {col}"
+    for col in EXPORT_COLUMNS
+)
+
+# Per-(date, mode, sector_group) aggregates, recomputed from scores whenever
+# a batch is persisted; tickers missing from sector_mapping count towards
+# DEFAULT_SECTOR_GROUP
+DEFAULT_SECTOR_GROUP = 'diversified'
+SECTOR_AGGREGATE_COLUMNS = (
+    'date', 'mode', 'sector_group', 'n_stocks', 'mean_score', 'median_score', 'band_counts',
+    'mean_f_pillar', 'mean_t_pillar', 'mean_r_pillar', 'mean_o_pillar', 'mean_q_pillar',
+    'mean_s_pillar', 'mean_s_z', 'sector_bear_count', 'updated_at'
+)
+_SECTOR_AGGREGATES_INSERT = """
+    INSERT INTO sector_aggregates ({columns})
+    SELECT
+        s.date, s.mode, COALESCE(m.sector_group, '{default_group}'),
+        COUNT(*),
+        ROUND(AVG(s.score), 2),
+        ROUND((percentile_cont(0.5) WITHIN GROUP (ORDER BY s.score))::numeric, 2),
+        jsonb_build_object({band_counts}),
+        {pillar_means},
+        ROUND(AVG(s.s_z), 3),
+        COUNT(*) FILTER (WHERE s.guardrail_flags ? 'SectorBear'),
+        NOW()
+    FROM scores s
+    LEFT JOIN sector_mapping m ON m.ticker = s.ticker
+    WHERE {{where}}
+    GROUP BY s.date, s.mode, COALESCE(m.sector_group, '{default_group}')
+""".format(
+    columns=", ".join(SECTOR_AGGREGATE_COLUMNS),
+    default_group=DEFAULT_SECTOR_GROUP,
+    band_counts=", ".join(
+        f"'{band}', COUNT(*) FILTER (WHERE s.band = '{band}')"
+        for band in ('Strong Buy', 'Buy', 'Hold', 'Avoid')
+    ),
+    pillar_means=", ".join(f"ROUND(AVG(s.{p}_pillar), 2)" for p in 'ftroqs')
+)
+_SECTOR_AGGREGATE_LOCK = (
+    "SELECT pg_advisory_xact_lock(hashtext('sector_aggregates'), hashtext(%s::text || '/' || %s))"
+)
+_SECTOR_AGGREGATE = HOT_STATEMENTS.register('sector_aggregate', (
+    f"SELECT {', '.join(SECTOR_AGGREGATE_COLUMNS)} FROM sector_aggregates "
+    "WHERE sector_group = %s AND mode = %s AND date = %s"
+))
+_SECTOR_AGGREGATE_LATEST = HOT_STATEMENTS.register('sector_aggregate_latest', (
+    f"SELECT {', '.join(SECTOR_AGGREGATE_COLUMNS)} FROM sector_aggregates "
+    "WHERE sector_group = %s AND mode = %s ORDER BY date DESC LIMIT 1"
+))
+
+# Score events: one compact JSON payload per saved (ticker, date, mode), sent
+# with pg_notify inside the save transaction (delivered to LISTENers on
+# commit) and returned so in-process listeners get the same payloads
+SCORE_EVENTS_CHANNEL = 'score_events'
+_PUBLISH_EVENTS = """
+    SELECT pg_notify('{channel}', e.payload), e.payload FROM (
+        SELECT json_build_object(
+            'ticker', s.ticker, 'date', s.date, 'mode', s.mode, 'score', s.score,
+            'band', s.band, 'sector', COALESCE(m.sector_group, '{default_group}')
+        )::text AS payload
+        FROM ({{source}}) s
+        LEFT JOIN sector_mapping m ON m.ticker = s.ticker
+    ) e
+""".format(channel=SCORE_EVENTS_CHANNEL, default_group=DEFAULT_SECTOR_GROUP)
+_PUBLISH_ONE = _PUBLISH_EVENTS.format(
+    source="SELECT ticker, date, mode, score, band FROM scores WHERE ticker = %s AND date = %s AND mode = %s"
+)
+
+# Callbacks run after scores are committed, with the set of (date, mode) keys written
+SaveListener = Callable[[Set[Tuple[date, str]]], None]
+_save_listeners: List[SaveListener] = []
+
+
+def register_save_listener(listener: SaveListener) -> None:
+    """
+    Register a callback invoked after any ScoreDatabase save commits.
+    
+    Used by in-process caches to drop entries for the (date, mode) pairs
+    that were just written. Listener errors are logged, never raised.
+    """
+    if listener not in _save_listeners:
+        _save_listeners.append(listener)
+
+
+def unregister_save_listener(listener: SaveListener) -> None:
+    """Remove a callback registered with register_save_listener."""
+    if listener in _save_listeners:
+        _save_listeners.remove(listener)
+
+
+def _notify_saved(keys: Set[Tuple[date, str]]) -> None:
+    for listener in list(_save_listeners):
+        try:
+            listener(keys)
+        except Exception as e:
+            logger.warning(f"Score save listener {listener!r} failed: {e}")
+
+
+# Callbacks run after scores are committed, with the decoded event payloads
+PublishListener = Callable[[List[Dict[str, Any]]], None]
+_publish_listeners: List[PublishListener] = []
+
+
+def register_publish_listener(listener: PublishListener) -> None:
+    """
+    Register a callback invoked with score events after a save commits.
+    
+    Each event is a dict with ticker, date, mode, score, band and sector.
+    Used as the in-process event feed when PostgreSQL LISTEN is not used.
+    Listener errors are logged, never raised.
+    """
+    if listener not in _publish_listeners:
+        _publish_listeners.append(listener)
+
+
+def unregister_publish_listener(listener: PublishListener) -> None:
+    """Remove a callback registered with register_publish_listener."""
+    if listener in _publish_listeners:
+        _publish_listeners.remove(listener)
+
+
+def _notify_published(payloads: List[str]) -> None:
+    if not payloads or not _publish_listeners:
+        return
+    events = [json.loads(payload) for payload in payloads]
+    for listener in list(_publish_listeners):
+        try:
+            listener(events)
+        except Exception as e:
+            logger.warning(f"Score publish listener {listener!r} failed: {e}")
+
+
+class _CSVRowStream(io.TextIOBase):
+    """
+    Read-only text stream that renders rows to CSV lazily for COPY FROM STDIN.
+    
+    psycopg2's copy_expert pulls data with read(size); rows are formatted only
+    as the server consumes them, so a large batch never exists as one string.
+    """
+    
+    def __init__(self, rows: Iterable[tuple]):
+        self._rows = iter(rows)
+        self._buffer = io.StringIO()
+        self._writer = csv.writer(self._buffer, lineterminator='\n')
+        self._pending = ''
+        self.rows_written = 0
+    
+    def readable(self) -> bool:
+        return True
+    
+    def read(self, size: int = -1) -> str:
+        while size < 0 or len(self._pending) < size:
+            row = next(self._rows, None)
+            if row is None:
+                break
+            self._buffer.seek(0)
+            self._buffer.truncate()
+            self._writer.writerow(row)
+            self._pending += self._buffer.getvalue()
+            self.rows_written += 1
+        
+        if size < 0:
+            chunk, self._pending = self._pending, ''
+        else:
+            chunk, self._pending = self._pending[:size], self._pending[size:]
+        return chunk
+
+
+def resolve_database_url(database_url: Optional[str] = None) -> str:
+    """
+    Resolve the PostgreSQL connection string without connecting.
+    
+    Args:
+        database_url: Explicit connection string. If None, uses DATABASE_URL or
+            the PG* environment variables.
+    """
+    if database_url:
+        return database_url
+    
+    # Check for DATABASE_URL first (single source)
+    database_url = os.getenv('DATABASE_URL')
+    if database_url:
+        return database_url
+    
+    # Build connection string from environment variables
+    pguser = os.getenv('PGUSER', 'greyoak')
+    pgpassword = os.getenv('PGPASSWORD', 'greyoak_pw_change_in_production')
+    pghost = os.getenv('PGHOST', 'db')  # Docker service name
+    pgport = os.getenv('PGPORT', '5432')
+    pgdatabase = os.getenv('PGDATABASE', 'greyoak_scores')
+    
+    return f"postgresql://{pguser}:{pgpassword}@{pghost}:{pgport}/{pgdatabase}"
+
+
+class ScoreQueries:
+    """
+    Driver-independent parts of the score persistence layer.
+    
+    Connection settings, score validation and parameters, page query
+    building and row conversion, shared by ScoreDatabase (psycopg2) and
+    AsyncScoreDatabase (asyncpg) so both return identical results.
+    """
+    
+    def _configure(self, database_url: Optional[str]) -> None:
+        """
+        Resolve the connection string and pool settings from arguments/environment.
+        
+        Args:
+            database_url: PostgreSQL connection string. If None, uses environment variables.
+        """
+        self.database_url = resolve_database_url(database_url)
+        
+        # Connection pool configuration
+        self.min_conn = int(os.getenv('DB_POOL_MIN_CONN', '2'))
+        self.max_conn = int(os.getenv('DB_POOL_MAX_CONN', '20'))
+        self.pool_timeout = int(os.getenv('DB_POOL_TIMEOUT', '30'))
+        self.checkout_timeout = float(os.getenv('DB_POOL_CHECKOUT_TIMEOUT', '5'))
+        # Disable behind transaction-pooling proxies (e.g. PgBouncer), which
+        # do not keep prepared statements with a client session
+        self.use_prepared = os.getenv('DB_PREPARED_STATEMENTS', 'true').lower() in ('1', 'true', 'yes')
+        # Publish score events (NOTIFY score_events) from the save transactions
+        self.publish_events = os.getenv('SCORE_EVENTS_PUBLISH', 'true').lower() in ('1', 'true', 'yes')
+        
+        # Pool/query instrumentation (see get_pool_stats)
+        self.metrics = PoolMetrics()
+    
+    def _get_safe_connection_info(self) -> str:
+        """Get connection info without exposing credentials."""
+        try:
+            parts = self.database_url.split('@')[1]  # Everything after @
+            return f"postgresql://***:***@{parts}"
+        except Exception:
+            return "postgresql://***:***@***"
+    
+    def _validate_score(self, score: ScoreOutput) -> None:
+        """Validate a score before writing it."""
+        if not isinstance(score, ScoreOutput):
+            raise ValueError("Input must be a ScoreOutput instance")
+        
+        if not score.ticker or not score.ticker.strip():
+            raise ValueError("Ticker cannot be empty")
+        
+        if not (0 <= score.score <= 100):
+            raise ValueError(f"Score must be between 0-100, got {score.score}")
+    
+    def _score_params(self, score: ScoreOutput) -> tuple:
+        """Column values for a scores row, in INSERT column order."""
+        return (
+            score.ticker,
+            score.scoring_date,
+            score.mode,
+            float(score.score),
+            score.band,
+            float(score.pillars.F),
+            float(score.pillars.T),
+            float(score.pillars.R),
+            float(score.pillars.O),
+            float(score.pillars.Q),
+            float(score.pillars.S),
+            float(score.risk_penalty),
+            Json(score.guardrail_flags),  # JSON serialization
+            float(score.confidence),
+            float(score.s_z),
+            score.as_of,
+            score.config_hash,
+            getattr(score, 'code_version', greyoak_score.__version__)
+        )
+    
+    def _ticker_page_query(
+        self,
+        ticker: str,
+        start_date: Optional[date],
+        end_date: Optional[date],
+        mode: Optional[str],
+        cursor: Optional[str],
+        raw: bool
+    ) -> Tuple[str, List[Any]]:
+        """Ticker history page query and params (without the LIMIT value)."""
+        where, params = self._ticker_filters(ticker, start_date, end_date, mode)
+        if cursor:
+            where += " AND (date, mode) < (%s, %s)"
+            params.extend(decode_cursor(cursor, 'ticker_history'))
+        return _TICKER_PAGE.format(columns=self._select_columns(raw), where=where), params
+    
+    def _band_page_query(
+        self,
+        band: str,
+        date: date,
+        mode: str,
+        cursor: Optional[str],
+        raw: bool
+    ) -> Tuple[str, List[Any]]:
+        """Band page query and params (without the LIMIT value)."""
+        valid_bands = ['Strong Buy', 'Buy', 'Hold', 'Avoid']
+        if band not in valid_bands:
+            raise ValueError(f"Invalid band: {band}. Must be one of {valid_bands}")
+        
+        if mode not in ['Trader', 'Investor']:
+            raise ValueError(f"Invalid mode: {mode}. Must be 'Trader' or 'Investor'")
+        
+        where = "band = %s AND date = %s AND mode = %s"
+        params: List[Any] = [band, date, mode]
+        if cursor:
+            where += " AND (score, ticker) < (%s, %s)"
+            params.extend(decode_cursor(cursor, 'band'))
+        return _BAND_PAGE.format(columns=self._select_columns(raw), where=where), params
+    
+    def _latest_page_query(self, mode: str, cursor: Optional[str], raw: bool) -> Tuple[str, List[Any]]:
+        """Latest-scores page query and params (without the LIMIT value)."""
+        if mode not in ['Trader', 'Investor']:
+            raise ValueError(f"Invalid mode: {mode}. Must be 'Trader' or 'Investor'")
+        
+        columns = self._select_columns(raw)
+        if cursor:
+            latest_date, score, ticker = decode_cursor(cursor, 'latest')
+            return _LATEST_PAGE.format(columns=columns, where=_LATEST_AFTER), [mode, latest_date, score, ticker]
+        return _LATEST_PAGE.format(columns=columns, where=_LATEST_FIRST), [mode, mode]
+
+    def _sector_aggregate_query(
+        self,
+        sector: str,
+        date: Optional[date],
+        mode: str
+    ) -> Tuple[str, List[Any]]:
+        """Sector aggregate lookup (latest aggregated date if date is None) and params."""
+        if not sector or not sector.strip():
+            raise ValueError("Sector cannot be empty")
+        if mode not in ['Trader', 'Investor']:
+            raise ValueError(f"Invalid mode: {mode}. Must be 'Trader' or 'Investor'")
+        if date is None:
+            return _SECTOR_AGGREGATE_LATEST, [sector, mode]
+        return _SECTOR_AGGREGATE, [sector, mode, date]
+
+    def _tickers_scores_query(
+        self,
+        tickers: List[str],
+        mode: str,
+        date: Optional[date]
+    ) -> Tuple[str, List[Any]]:
+        """Bulk ticker lookup (latest_scores if date is None, else scores on date) and params."""
+        if not tickers:
+            raise ValueError("Tickers cannot be empty")
+        if mode not in ['Trader', 'Investor']:
+            raise ValueError(f"Invalid mode: {mode}. Must be 'Trader' or 'Investor'")
+        if date is None:
+            return _TICKERS_LATEST, [mode, list(tickers)]
+        return _TICKERS_ON_DATE, [mode, date, list(tickers)]
+
+    @staticmethod
+    def _sector_aggregate_dict(row: Dict[str, Any]) -> Dict[str, Any]:
+        """Convert a sector_aggregates row to a JSON-ready dict (floats, ISO dates)."""
+        band_counts = row['band_counts']
+        if isinstance(band_counts, str):
+            band_counts = json.loads(band_counts)
+        return {
+            'sector': row['sector_group'],
+            'date': row['date'].isoformat(),
+            'mode': row['mode'],
+            'n_stocks': int(row['n_stocks']),
+            'mean_score': float(row['mean_score']),
+            'median_score': float(row['median_score']),
+            'band_counts': {band: int(count) for band, count in band_counts.items()},
+            'mean_pillars': {
+                pillar.upper(): float(row[f'mean_{pillar}_pillar'])
+                for pillar in 'ftroqs'
+                if row[f'mean_{pillar}_pillar'] is not None
+            },
+            'mean_s_z': float(row['mean_s_z']),
+            'sector_bear_count': int(row['sector_bear_count']),
+            'updated_at': row['updated_at'].isoformat()
+        }
+
+    def _page_result(
+        self,
+        rows: List[Any],
+        limit: int,
+        raw: bool,
+        kind: str,
+        key_columns: Tuple[str, ...]
+    ) -> Tuple[List[Any], Optional[str]]:
+        """
+        Trim the extra look-ahead row and build the next cursor from the last row.
+        
+        Args:
+            rows: Up to limit + 1 rows from a page query
+            limit: Page size
+            raw: Convert to response dicts instead of ScoreOutput
+            kind: Cursor ordering name
+            key_columns: Columns forming the cursor's sort key
+        """
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(kind, [last[column] for column in key_columns])
+        return self._convert_rows(rows, raw), next_cursor
+    
+    def _ticker_filters(
+        self,
+        ticker: str,
+        start_date: Optional[date],
+        end_date: Optional[date],
+        mode: Optional[str]
+    ) -> Tuple[str, List[Any]]:
+        """Validated WHERE clause and params for a ticker history query."""
+        if not ticker or not ticker.strip():
+            raise ValueError("Ticker cannot be empty")
+        
+        if mode and mode not in ['Trader', 'Investor']:
+            raise ValueError(f"Invalid mode: {mode}. Must be 'Trader' or 'Investor'")
+        
+        where = "ticker = %s"
+        params: List[Any] = [ticker]
+        if start_date:
+            where += " AND date >= %s"
+            params.append(start_date)
+        if end_date:
+            where += " AND date <= %s"
+            params.append(end_date)
+        if mode:
+            where += " AND mode = %s"
+            params.append(mode)
+        return where, params
+    
+    @staticmethod
+    def _select_columns(raw: bool) -> str:
+        """SELECT list: only the API columns for raw reads, else every stored score column."""
+        return _RESPONSE_SELECT if raw else _FULL_SELECT
+    
+    def _convert_rows(self, rows: List[Dict[str, Any]], raw: bool) -> List[Any]:
+        """Convert page rows to response dicts (raw) or ScoreOutput models."""
+        convert = self._row_to_score_dict if raw else self._row_to_score_output
+        return [convert(row) for row in rows]
+    
+    @staticmethod
+    def _row_to_score_dict(row: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Convert a database row straight to a JSON-ready dict shaped like ScoreResponse.
+        
+        Fast path for read endpoints: skips ScoreOutput/ScoreResponse validation,
+        which the database CHECK constraints already guarantee for stored rows.
+        
+        Args:
+            row: Row selected with RESPONSE_COLUMNS
+            
+        Returns:
+            Dict with the ScoreResponse fields (dates as ISO strings, numbers as floats)
+        """
+        flags = row['guardrail_flags']
+        return {
+            'ticker': row['ticker'],
+            'date': row['date'].isoformat(),
+            'mode': row['mode'],
+            'score': float(row['score']),
+            'band': row['band'],
+            'pillars': {
+                'F': float(row['f_pillar']),
+                'T': float(row['t_pillar']),
+                'R': float(row['r_pillar']),
+                'O': float(row['o_pillar']),
+                'Q': float(row['q_pillar']),
+                'S': float(row['s_pillar'])
+            },
+            'risk_penalty': float(row['risk_penalty']),
+            'guardrail_flags': flags if isinstance(flags, list) else [],
+            'confidence': float(row['confidence']),
+            's_z': float(row['s_z']),
+            'as_of': row['as_of'].isoformat(),
+            'config_hash': row['config_hash']
+        }
+    
+    def _row_to_score_output(self, row: Dict[str, Any]) -> ScoreOutput:
+        """
+        Convert database row to ScoreOutput model.
+        
+        Args:
+            row: Dictionary-like row from database query
+            
+        Returns:
+            ScoreOutput: Validated Pydantic model instance
+            
+        Raises:
+            ValueError: If row data is invalid
+        """
+        try:
+            return ScoreOutput(
+                ticker=row['ticker'],
+                date=row['date'],
+                mode=row['mode'],
+                score=float(row['score']),
+                band=row['band'],
+                pillars=PillarScores(
+                    F=float(row['f_pillar']),
+                    T=float(row['t_pillar']),
+                    R=float(row['r_pillar']),
+                    O=float(row['o_pillar']),
+                    Q=float(row['q_pillar']),
+                    S=float(row['s_pillar'])
+                ),
+                risk_penalty=float(row['risk_penalty']),
+                guardrail_flags=row['guardrail_flags'] if isinstance(row['guardrail_flags'], list) else [],
+                confidence=float(row['confidence']),
+                s_z=float(row['s_z']),
+                as_of=row['as_of'],
+                config_hash=row['config_hash'],
+                code_version=row.get('code_version', greyoak_score.__version__)
+            )
+        except Exception as e:
+            logger.error(f"Error converting database row to ScoreOutput: {e}")
+            logger.error(f"Row data: {dict(row)}")
+            raise ValueError(f"Invalid database row: {e}")
+
+
+class ScoreDatabase(ScoreQueries):
     """
     PostgreSQL persistence layer for GreyOak Scores with Connection Pooling.
     
@@ -50,6 +644,11 @@ class ScoreDatabase:
     - Max connections: 20 (configurable)
     - Retry logic with exponential backoff
     - Connection health checks
+    - Checkouts wait up to DB_POOL_CHECKOUT_TIMEOUT for a free connection
+    - Hot queries run as server-side prepared statements (DB_PREPARED_STATEMENTS)
+    - warm_pool() opens and prepares connections at startup
+    - Batch saves refresh sector_aggregates for the (date, mode) pairs written
+    - Pool and per-query latency metrics (get_pool_stats)
     - Proper cleanup on shutdown
     """
     
@@ -60,27 +659,7 @@ class ScoreDatabase:
         Args:
             database_url: PostgreSQL connection string. If None, uses environment variables.
         """
-        if database_url:
-            self.database_url = database_url
-        else:
-            # Check for DATABASE_URL first (single source)
-            database_url = os.getenv('DATABASE_URL')
-            if database_url:
-                self.database_url = database_url
-            else:
-                # Build connection string from environment variables
-                pguser = os.getenv('PGUSER', 'greyoak')
-                pgpassword = os.getenv('PGPASSWORD', 'greyoak_pw_change_in_production')
-                pghost = os.getenv('PGHOST', 'db')  # Docker service name
-                pgport = os.getenv('PGPORT', '5432')
-                pgdatabase = os.getenv('PGDATABASE', 'greyoak_scores')
-                
-                self.database_url = f"postgresql://{pguser}:{pgpassword}@{pghost}:{pgport}/{pgdatabase}"
-        
-        # Connection pool configuration
-        self.min_conn = int(os.getenv('DB_POOL_MIN_CONN', '2'))
-        self.max_conn = int(os.getenv('DB_POOL_MAX_CONN', '20'))
-        self.pool_timeout = int(os.getenv('DB_POOL_TIMEOUT', '30'))
+        self._configure(database_url)
         
         # Initialize connection pool
         self._connection_pool = None
@@ -89,14 +668,6 @@ class ScoreDatabase:
         logger.info(f"Database pool initialized: {self._get_safe_connection_info()}, "
                    f"pool={self.min_conn}-{self.max_conn} connections")
     
-    def _get_safe_connection_info(self) -> str:
-        """Get connection info without exposing credentials."""
-        try:
-            parts = self.database_url.split('@')[1]  # Everything after @
-            return f"postgresql://***:***@{parts}"
-        except Exception:
-            return "postgresql://***:***@***"
-    
     def _initialize_pool(self, max_retries: int = 3, retry_delay: float = 1.0) -> None:
         """
         Initialize connection pool with retry logic.
@@ -107,11 +678,17 @@ class ScoreDatabase:
         """
         for attempt in range(max_retries + 1):
             try:
-                self._connection_pool = psycopg2.pool.ThreadedConnectionPool(
-                    minconn=self.min_conn,
+                self._connection_pool = InstrumentedConnectionPool(
+                    psycopg2.pool.ThreadedConnectionPool(
+                        minconn=self.min_conn,
+                        maxconn=self.max_conn,
+                        dsn=self.database_url,
+                        connect_timeout=self.pool_timeout,
+                        connection_factory=PreparingConnection
+                    ),
                     maxconn=self.max_conn,
-                    dsn=self.database_url,
-                    connect_timeout=self.pool_timeout
+                    metrics=self.metrics,
+                    checkout_timeout=self.checkout_timeout
                 )
                 logger.info(f"Connection pool initialized successfully on attempt {attempt + 1}")
                 return
@@ -163,6 +740,9 @@ class ScoreDatabase:
                     self._connection_pool.putconn(conn, close=True)
                     conn = self._connection_pool.getconn()
                 
+                if self.use_prepared:
+                    HOT_STATEMENTS.prepare(conn)  # No-op once this session has them
+                
                 yield conn
                 # If we reach here, operation was successful
                 return
@@ -183,6 +763,7 @@ class ScoreDatabase:
                     raise
                 
                 wait_time = retry_delay * (2 ** attempt)  # Exponential backoff
+                self.metrics.increment('retries')
                 logger.warning(f"Database connection attempt {attempt + 1}/{max_retries + 1} failed: {e}")
                 logger.warning(f"Retrying in {wait_time:.1f} seconds...")
                 time.sleep(wait_time)
@@ -204,6 +785,46 @@ class ScoreDatabase:
                     # Return connection to pool for reuse
                     self._connection_pool.putconn(conn)
     
+    def warm_pool(self, connections: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Open, verify and prepare pooled connections ahead of traffic.
+        
+        Checks out `connections` (default DB_POOL_MIN_CONN) connections at once,
+        so each is a distinct session, prepares the hot statements on each and
+        returns them to the pool. Call during application startup.
+        
+        Args:
+            connections: Number of connections to warm (capped at max_conn)
+            
+        Returns:
+            Dict with 'connections' warmed, 'statements' prepared and 'elapsed_ms'
+        """
+        count = min(connections or self.min_conn, self.max_conn)
+        started = time.perf_counter()
+        checked_out = []
+        prepared = 0
+        try:
+            for _ in range(count):
+                conn = self._connection_pool.getconn()
+                checked_out.append(conn)
+                with conn.cursor() as cur:
+                    cur.execute("SELECT 1")
+                conn.rollback()
+                if self.use_prepared:
+                    prepared += HOT_STATEMENTS.prepare(conn)
+        finally:
+            for conn in checked_out:
+                self._connection_pool.putconn(conn)
+        
+        result = {
+            'connections': len(checked_out),
+            'statements': prepared,
+            'elapsed_ms': round((time.perf_counter() - started) * 1000, 2)
+        }
+        logger.info(f"Connection pool warmed: {result}")
+        return result
+    
+    @timed_query
     def test_connection(self) -> bool:
         """
         Test database connectivity.
@@ -221,12 +842,14 @@ class ScoreDatabase:
             logger.error(f"Database connection test failed: {e}")
             return False
     
+    @timed_query
     def save_score(self, score: ScoreOutput) -> int:
         """
         Save a score to the database using UPSERT for idempotent operations.
         
         Uses ON CONFLICT (ticker, date, mode) DO UPDATE to handle duplicates.
         This ensures the same score calculation can be run multiple times safely.
+        latest_scores is updated in the same transaction.
         
         Args:
             score: ScoreOutput from the scoring engine
@@ -238,15 +861,8 @@ class ScoreDatabase:
             psycopg2.Error: If database operation fails
             ValueError: If score data is invalid
         """
-        if not isinstance(score, ScoreOutput):
-            raise ValueError("Input must be a ScoreOutput instance")
-        
         # Validate critical fields
-        if not score.ticker or not score.ticker.strip():
-            raise ValueError("Ticker cannot be empty")
-        
-        if not (0 <= score.score <= 100):
-            raise ValueError(f"Score must be between 0-100, got {score.score}")
+        self._validate_score(score)
         
         logger.debug(f"Saving score for {score.ticker} on {score.scoring_date} ({score.mode})")
         
@@ -254,18 +870,81 @@ class ScoreDatabase:
             with self.get_connection() as conn:
                 with conn.cursor() as cur:
                     # UPSERT query with parameterized values (SQL injection safe)
-                    cur.execute("""
+                    HOT_STATEMENTS.execute(cur, _UPSERT_SCORE, self._score_params(score))
+                    
+                    row_id = cur.fetchone()[0]
+                    HOT_STATEMENTS.execute(
+                        cur, _UPSERT_LATEST_ONE, (score.ticker, score.scoring_date, score.mode)
+                    )
+                    events = []
+                    if self.publish_events:
+                        cur.execute(_PUBLISH_ONE, (score.ticker, score.scoring_date, score.mode))
+                        events = [row[1] for row in cur.fetchall()]
+                    conn.commit()
+                    _notify_saved({(score.scoring_date, score.mode)})
+                    _notify_published(events)
+                    
+                    logger.info(f"Score saved for {score.ticker} with ID {row_id}")
+                    return row_id
+                    
+        except psycopg2.Error as e:
+            logger.error(f"Database error saving score for {score.ticker}: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error saving score for {score.ticker}: {e}")
+            raise
+    
+    @timed_query
+    def save_scores_batch(
+        self,
+        scores: List[ScoreOutput],
+        page_size: int = 500,
+        refresh_aggregates: bool = True
+    ) -> int:
+        """
+        Save many scores in one transaction using multi-row UPSERTs.
+        
+        Rows are sent as multi-row VALUES lists (execute_values) with the same
+        ON CONFLICT (ticker, date, mode) DO UPDATE semantics as save_score.
+        Duplicate keys within the batch are collapsed to the last occurrence,
+        since one INSERT cannot update the same row twice. latest_scores and
+        the sector aggregates for the (date, mode) pairs written are updated
+        in the same transaction, which also publishes a score event per row.
+        
+        Args:
+            scores: ScoreOutput records from the scoring engine
+            page_size: Rows per INSERT statement
+            refresh_aggregates: Recompute sector aggregates in this transaction;
+                frequent small writers (the write-behind queue) pass False and
+                call refresh_sector_aggregates on their own schedule
+            
+        Returns:
+            int: Number of rows written
+            
+        Raises:
+            psycopg2.Error: If database operation fails (the batch is rolled back)
+            ValueError: If any score is invalid
+        """
+        latest = {}
+        for score in scores:
+            self._validate_score(score)
+            latest[(score.ticker, score.scoring_date, score.mode)] = score
+        
+        if not latest:
+            return 0
+        
+        rows = [self._score_params(score) for score in latest.values()]
+        
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cur:
+                    execute_values(cur, """
                         INSERT INTO scores (
                             ticker, date, mode, score, band,
                             f_pillar, t_pillar, r_pillar, o_pillar, q_pillar, s_pillar,
                             risk_penalty, guardrail_flags, confidence, s_z,
                             as_of, config_hash, code_version
-                        ) VALUES (
-                            %s, %s, %s, %s, %s,
-                            %s, %s, %s, %s, %s, %s,
-                            %s, %s, %s, %s,
-                            %s, %s, %s
-                        )
+                        ) VALUES %s
                         ON CONFLICT (ticker, date, mode) 
                         DO UPDATE SET
                             score = EXCLUDED.score,
@@ -283,41 +962,185 @@ class ScoreDatabase:
                             as_of = EXCLUDED.as_of,
                             config_hash = EXCLUDED.config_hash,
                             code_version = EXCLUDED.code_version
-                        RETURNING id
-                    """, (
-                        score.ticker,
-                        score.scoring_date,
-                        score.mode,
-                        float(score.score),
-                        score.band,
-                        float(score.pillars.F),
-                        float(score.pillars.T),
-                        float(score.pillars.R),
-                        float(score.pillars.O),
-                        float(score.pillars.Q),
-                        float(score.pillars.S),
-                        float(score.risk_penalty),
-                        Json(score.guardrail_flags),  # JSON serialization
-                        float(score.confidence),
-                        float(score.s_z),
-                        score.as_of,
-                        score.config_hash,
-                        getattr(score, 'code_version', greyoak_score.__version__)
-                    ))
+                    """, rows, page_size=page_size)
+                    execute_values(cur, _LATEST_UPSERT.format(source=f"""
+                        SELECT DISTINCT ON (ticker, mode) {', '.join(SCORE_COLUMNS)} FROM scores
+                        WHERE (ticker, date, mode) IN (VALUES %s)
+                        ORDER BY ticker, mode, date DESC
+                    """), list(latest), page_size=page_size)
+                    if refresh_aggregates:
+                        self._refresh_sector_aggregates(cur, {(key[1], key[2]) for key in latest})
+                    events = []
+                    if self.publish_events:
+                        events = [row[1] for row in execute_values(cur, _PUBLISH_EVENTS.format(source="""
+                            SELECT ticker, date, mode, score, band FROM scores
+                            WHERE (ticker, date, mode) IN (VALUES %s)
+                        """), list(latest), page_size=page_size, fetch=True)]
+                    conn.commit()
+                    _notify_saved({(key[1], key[2]) for key in latest})
+                    _notify_published(events)
+                    
+                    logger.info(f"Saved batch of {len(rows)} scores")
+                    return len(rows)
+                    
+        except psycopg2.Error as e:
+            logger.error(f"Database error saving batch of {len(rows)} scores: {e}")
+            raise
+        except Exception as e:
+            logger.error(f"Unexpected error saving batch of {len(rows)} scores: {e}")
+            raise
+    
+    @timed_query
+    def save_scores_bulk(self, records: Iterable[ScoreOutput]) -> Dict[str, int]:
+        """
+        Bulk UPSERT scores via COPY into a staging table (nightly persistence).
+        
+        Rows are streamed with COPY ... FROM STDIN into a temporary table, then
+        merged into scores with one INSERT ... SELECT ... ON CONFLICT
+        (ticker, date, mode) DO UPDATE, all in a single transaction together
+        with the latest_scores and sector_aggregates refresh. Duplicate keys within the input keep
+        the last occurrence.
+        
+        Args:
+            records: ScoreOutput records (any iterable; consumed once)
+            
+        Returns:
+            Dict with 'inserted' and 'updated' row counts
+            
+        Raises:
+            psycopg2.Error: If database operation fails (nothing is written)
+            ValueError: If any score is invalid (nothing is written)
+        """
+        columns = ', '.join(SCORE_COLUMNS)
+        updates = ',\n                            '.join(
+            f"{col} = EXCLUDED.{col}" for col in SCORE_COLUMNS[3:]
+        )
+        saved_keys: Set[Tuple[date, str]] = set()
+        stream = _CSVRowStream(self._copy_rows(records, saved_keys))
+        
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(f"""
+                        CREATE TEMP TABLE scores_stage ON COMMIT DROP AS
+                        SELECT {columns} FROM scores WITH NO DATA
+                    """)
+                    cur.execute("ALTER TABLE scores_stage ADD COLUMN stage_seq BIGSERIAL")
                     
-                    row_id = cur.fetchone()[0]
+                    cur.copy_expert(
+                        f"COPY scores_stage ({columns}) FROM STDIN WITH (FORMAT csv)",
+                        stream
+                    )
+                    
+                    # xmax = 0 only for freshly inserted rows
+                    cur.execute(f"""
+                        WITH merged AS (
+                            INSERT INTO scores ({columns})
+                            SELECT DISTINCT ON (ticker, date, mode) {columns}
+                            FROM scores_stage
+                            ORDER BY ticker, date, mode, stage_seq DESC
+                            ON CONFLICT (ticker, date, mode)
+                            DO UPDATE SET
+                            {updates}
+                            RETURNING (xmax = 0) AS inserted
+                        )
+                        SELECT
+                            COUNT(*) FILTER (WHERE inserted) AS inserted,
+                            COUNT(*) FILTER (WHERE NOT inserted) AS updated
+                        FROM merged
+                    """)
+                    inserted, updated = cur.fetchone()
+                    
+                    cur.execute(_LATEST_UPSERT.format(source=f"""
+                        SELECT DISTINCT ON (ticker, mode) {columns}
+                        FROM scores_stage
+                        ORDER BY ticker, mode, date DESC, stage_seq DESC
+                    """))
+                    self._refresh_sector_aggregates(cur, saved_keys)
+                    events = []
+                    if self.publish_events:
+                        cur.execute(_PUBLISH_EVENTS.format(source="""
+                            SELECT DISTINCT ON (ticker, date, mode) ticker, date, mode, score, band
+                            FROM scores_stage
+                            ORDER BY ticker, date, mode, stage_seq DESC
+                        """))
+                        events = [row[1] for row in cur.fetchall()]
                     conn.commit()
+                    _notify_saved(saved_keys)
+                    _notify_published(events)
                     
-                    logger.info(f"Score saved for {score.ticker} with ID {row_id}")
-                    return row_id
+                    counts = {'inserted': int(inserted or 0), 'updated': int(updated or 0)}
+                    logger.info(f"Bulk saved {stream.rows_written} scores: {counts}")
+                    return counts
                     
         except psycopg2.Error as e:
-            logger.error(f"Database error saving score for {score.ticker}: {e}")
+            logger.error(f"Database error in bulk score save: {e}")
             raise
         except Exception as e:
-            logger.error(f"Unexpected error saving score for {score.ticker}: {e}")
+            logger.error(f"Unexpected error in bulk score save: {e}")
             raise
     
+    def _copy_rows(
+        self,
+        records: Iterable[ScoreOutput],
+        saved_keys: Set[Tuple[date, str]]
+    ) -> Iterator[tuple]:
+        """Validate records and yield COPY-ready CSV rows, collecting (date, mode) keys."""
+        for score in records:
+            self._validate_score(score)
+            saved_keys.add((score.scoring_date, score.mode))
+            row = list(self._score_params(score))
+            row[SCORE_COLUMNS.index('guardrail_flags')] = json.dumps(score.guardrail_flags)
+            row[SCORE_COLUMNS.index('as_of')] = score.as_of.isoformat()
+            yield row
+
+    @timed_query
+    def refresh_sector_aggregates(self, keys: Iterable[Tuple[date, str]]) -> int:
+        """
+        Recompute sector_aggregates for (date, mode) pairs in one transaction.
+        
+        Used by writers that save with refresh_aggregates=False.
+        
+        Returns:
+            int: Number of (date, mode) pairs refreshed
+        """
+        keys = set(keys)
+        if not keys:
+            return 0
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cur:
+                    self._refresh_sector_aggregates(cur, keys)
+                    conn.commit()
+                    _notify_saved(keys)
+                    logger.info(f"Refreshed sector_aggregates for {len(keys)} (date, mode) pairs")
+                    return len(keys)
+        except psycopg2.Error as e:
+            logger.error(f"Database error refreshing sector_aggregates: {e}")
+            raise
+
+    @staticmethod
+    def _refresh_sector_aggregates(cur, keys: Iterable[Tuple[date, str]]) -> None:
+        """
+        Recompute sector_aggregates for (date, mode) pairs on an open cursor (caller commits).
+        
+        A transaction-scoped advisory lock per (date, mode), taken in sorted
+        order, serializes concurrent refreshes of the same pair, so the
+        DELETE of a later refresh sees the rows an earlier one committed
+        instead of both inserting them.
+        """
+        for score_date, mode in sorted(keys):
+            cur.execute(_SECTOR_AGGREGATE_LOCK, (score_date, mode))
+            cur.execute(
+                "DELETE FROM sector_aggregates WHERE date = %s AND mode = %s",
+                (score_date, mode)
+            )
+            cur.execute(
+                _SECTOR_AGGREGATES_INSERT.format(where="s.date = %s AND s.mode = %s"),
+                (score_date, mode)
+            )
+
+    @timed_query
     def get_score(
         self, 
         ticker: str, 
@@ -369,6 +1192,7 @@ class ScoreDatabase:
             logger.error(f"Unexpected error retrieving score for {ticker}: {e}")
             raise
     
+    @timed_query
     def get_scores_by_ticker(
         self,
         ticker: str,
@@ -441,6 +1265,7 @@ class ScoreDatabase:
             logger.error(f"Unexpected error retrieving scores for {ticker}: {e}")
             raise
     
+    @timed_query
     def get_scores_by_band(
         self,
         band: str,
@@ -505,6 +1330,7 @@ class ScoreDatabase:
             logger.error(f"Unexpected error retrieving {band} stocks: {e}")
             raise
     
+    @timed_query
     def get_latest_scores(
         self,
         mode: str,
@@ -513,6 +1339,8 @@ class ScoreDatabase:
         """
         Get the most recent scores for all tickers in a given mode.
         
+        Served from latest_scores rather than scanning scores for MAX(date).
+        
         Args:
             mode: 'Trader' or 'Investor'
             limit: Optional limit on number of results
@@ -523,14 +1351,11 @@ class ScoreDatabase:
         if mode not in ['Trader', 'Investor']:
             raise ValueError(f"Invalid mode: {mode}. Must be 'Trader' or 'Investor'")
         
+        # latest_scores (mode, date, score DESC) index: one range scan
         query = """
-            WITH latest_date AS (
-                SELECT MAX(date) as max_date FROM scores WHERE mode = %s
-            )
-            SELECT s.* FROM scores s
-            INNER JOIN latest_date ld ON s.date = ld.max_date
-            WHERE s.mode = %s
-            ORDER BY s.score DESC
+            SELECT * FROM latest_scores
+            WHERE mode = %s AND date = (SELECT MAX(date) FROM latest_scores WHERE mode = %s)
+            ORDER BY score DESC, ticker DESC
         """
         params = [mode, mode]
         
@@ -556,71 +1381,312 @@ class ScoreDatabase:
             logger.error(f"Unexpected error retrieving latest scores: {e}")
             raise
     
-    def _row_to_score_output(self, row: Dict[str, Any]) -> ScoreOutput:
+    @timed_query
+    def get_scores_by_ticker_page(
+        self,
+        ticker: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        mode: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        raw: bool = False
+    ) -> Tuple[List[Any], Optional[str]]:
         """
-        Convert database row to ScoreOutput model.
+        Keyset-paginated score history for a ticker.
+        
+        Ordered by (date, mode) DESC; each page continues strictly after the
+        cursor's key, so deep pages cost the same as the first one.
         
         Args:
-            row: Dictionary-like row from database query
+            ticker: Stock ticker
+            start_date: Optional start date filter (inclusive)
+            end_date: Optional end date filter (inclusive)
+            mode: Optional mode filter ('Trader' or 'Investor')
+            limit: Page size
+            cursor: next_cursor from the previous page (None for the first page)
+            raw: Return response dicts (see _row_to_score_dict) instead of ScoreOutput
             
         Returns:
-            ScoreOutput: Validated Pydantic model instance
+            Tuple of (scores, next_cursor); next_cursor is None on the last page
             
         Raises:
-            ValueError: If row data is invalid
+            ValueError: If filters or cursor are invalid
+            psycopg2.Error: If database query fails
+        """
+        query, params = self._ticker_page_query(ticker, start_date, end_date, mode, cursor, raw)
+        rows = self._fetch_page(query, params, limit)
+        
+        logger.debug(f"Retrieved page of {min(len(rows), limit)} scores for {ticker}")
+        return self._page_result(rows, limit, raw, 'ticker_history', ('date', 'mode'))
+    
+    @timed_query
+    def get_scores_by_band_page(
+        self,
+        band: str,
+        date: date,
+        mode: str,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+        raw: bool = False
+    ) -> Tuple[List[Any], Optional[str]]:
+        """
+        Keyset-paginated stocks in a band on a date, ordered by (score, ticker) DESC.
+        
+        Args:
+            band: 'Strong Buy', 'Buy', 'Hold', or 'Avoid'
+            date: Score date
+            mode: 'Trader' or 'Investor'
+            limit: Page size
+            cursor: next_cursor from the previous page
+            raw: Return response dicts instead of ScoreOutput
+            
+        Returns:
+            Tuple of (scores, next_cursor); next_cursor is None on the last page
+        """
+        query, params = self._band_page_query(band, date, mode, cursor, raw)
+        rows = self._fetch_page(query, params, limit)
+        return self._page_result(rows, limit, raw, 'band', ('score', 'ticker'))
+    
+    @timed_query
+    def get_latest_scores_page(
+        self,
+        mode: str,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        raw: bool = False
+    ) -> Tuple[List[Any], Optional[str]]:
+        """
+        Keyset-paginated latest scores for a mode, ordered by (score, ticker) DESC.
+        
+        Reads latest_scores. The cursor pins the latest date seen on the first
+        page; if a newer date is written meanwhile, later pages come back short
+        (those tickers have moved on) rather than mixing dates.
+        
+        Args:
+            mode: 'Trader' or 'Investor'
+            limit: Page size
+            cursor: next_cursor from the previous page
+            raw: Return response dicts instead of ScoreOutput
+            
+        Returns:
+            Tuple of (scores, next_cursor); next_cursor is None on the last page
+        """
+        query, params = self._latest_page_query(mode, cursor, raw)
+        rows = self._fetch_page(query, params, limit)
+        return self._page_result(rows, limit, raw, 'latest', ('date', 'score', 'ticker'))
+
+    @timed_query
+    def get_scores_for_tickers(
+        self,
+        tickers: List[str],
+        mode: str,
+        date: Optional[date] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Scores for many tickers in one query, as response dicts (see _row_to_score_dict).
+
+        With no date, each ticker's most recent score comes from latest_scores
+        (tickers may then have different dates); otherwise scores on that date.
+
+        Args:
+            tickers: Tickers to fetch
+            mode: 'Trader' or 'Investor'
+            date: Score date; None for each ticker's latest score
+
+        Returns:
+            One dict per ticker that has a score, in no particular order
+
+        Raises:
+            ValueError: If tickers or mode are invalid
         """
+        query, params = self._tickers_scores_query(tickers, mode, date)
         try:
-            return ScoreOutput(
-                ticker=row['ticker'],
-                date=row['date'],
-                mode=row['mode'],
-                score=float(row['score']),
-                band=row['band'],
-                pillars=PillarScores(
-                    F=float(row['f_pillar']),
-                    T=float(row['t_pillar']),
-                    R=float(row['r_pillar']),
-                    O=float(row['o_pillar']),
-                    Q=float(row['q_pillar']),
-                    S=float(row['s_pillar'])
-                ),
-                risk_penalty=float(row['risk_penalty']),
-                guardrail_flags=row['guardrail_flags'] if isinstance(row['guardrail_flags'], list) else [],
-                confidence=float(row['confidence']),
-                s_z=float(row['s_z']),
-                as_of=row['as_of'],
-                config_hash=row['config_hash'],
-                code_version=row.get('code_version', greyoak_score.__version__)
-            )
-        except Exception as e:
-            logger.error(f"Error converting database row to ScoreOutput: {e}")
-            logger.error(f"Row data: {dict(row)}")
-            raise ValueError(f"Invalid database row: {e}")
+            with self.get_connection() as conn:
+                with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                    cur.execute(query, params)
+                    rows = cur.fetchall()
+        except psycopg2.Error as e:
+            logger.error(f"Database error fetching scores for {len(tickers)} tickers: {e}")
+            raise
+        return [self._row_to_score_dict(row) for row in rows]
+
+    @timed_query
+    def get_sector_aggregate(
+        self,
+        sector: str,
+        mode: str,
+        date: Optional[date] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Precomputed aggregate for one sector group (a primary-key lookup).
+
+        Args:
+            sector: Sector group (e.g. 'banks')
+            mode: 'Trader' or 'Investor'
+            date: Score date; None for the sector's latest aggregated date
+
+        Returns:
+            Dict with count, mean/median score, band counts, mean pillars,
+            mean S_z and SectorBear count, or None if not aggregated
+
+        Raises:
+            ValueError: If sector or mode is invalid
+        """
+        query, params = self._sector_aggregate_query(sector, date, mode)
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                    HOT_STATEMENTS.execute(cur, query, params)
+                    row = cur.fetchone()
+        except psycopg2.Error as e:
+            logger.error(f"Database error fetching sector aggregate for {sector}: {e}")
+            raise
+        return self._sector_aggregate_dict(row) if row else None
+
+    def stream_scores(
+        self,
+        ticker: Optional[str] = None,
+        band: Optional[str] = None,
+        mode: Optional[str] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        batch_size: int = 2000
+    ) -> Iterator[ScoreOutput]:
+        """
+        Stream scores through a server-side (named) cursor.
+        
+        Rows arrive from PostgreSQL in batch_size round trips and are converted
+        one at a time, so memory stays flat regardless of result size. The
+        pooled connection is held until the iterator is exhausted or closed.
+        
+        Args:
+            ticker: Optional ticker filter
+            band: Optional band filter
+            mode: Optional mode filter
+            start_date: Optional start date filter (inclusive)
+            end_date: Optional end date filter (inclusive)
+            batch_size: Rows fetched per round trip (cursor.itersize)
+            
+        Yields:
+            ScoreOutput ordered by (date, ticker, mode)
+        """
+        if mode and mode not in ['Trader', 'Investor']:
+            raise ValueError(f"Invalid mode: {mode}. Must be 'Trader' or 'Investor'")
+        
+        clauses, params = [], []
+        for column, value in (('ticker', ticker), ('band', band), ('mode', mode)):
+            if value:
+                clauses.append(f"{column} = %s")
+                params.append(value)
+        if start_date:
+            clauses.append("date >= %s")
+            params.append(start_date)
+        if end_date:
+            clauses.append("date <= %s")
+            params.append(end_date)
+        
+        where = " AND ".join(clauses) if clauses else "TRUE"
+        query = f"SELECT * FROM scores WHERE {where} ORDER BY date, ticker, mode"
+        
+        with self.get_connection() as conn:
+            with conn.cursor(name=f"scores_stream_{id(conn):x}", cursor_factory=RealDictCursor) as cur:
+                cur.itersize = batch_size
+                cur.execute(query, params)
+                for row in cur:
+                    yield self._row_to_score_output(row)
+            conn.rollback()  # End the read-only transaction that held the cursor
+    
+    def stream_score_chunks(
+        self,
+        mode: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        chunk_size: int = 50000
+    ) -> Iterator[List[tuple]]:
+        """
+        Stream score history for a mode as chunks of row tuples (bulk export).
+        
+        Rows come from a server-side (named) cursor chunk_size at a time and are
+        never converted to dicts or models, so memory is bounded by one chunk
+        regardless of the date range. The pooled connection is held until the
+        iterator is exhausted or closed.
+        
+        Args:
+            mode: 'Trader' or 'Investor'
+            start_date: Optional start date filter (inclusive)
+            end_date: Optional end date filter (inclusive)
+            chunk_size: Rows per chunk (and per fetch round trip)
+            
+        Yields:
+            Lists of tuples in EXPORT_COLUMNS order, ordered by (date, ticker)
+            
+        Raises:
+            ValueError: If mode or the date range is invalid
+        """
+        if mode not in ['Trader', 'Investor']:
+            raise ValueError(f"Invalid mode: {mode}. Must be 'Trader' or 'Investor'")
+        if start_date and end_date and start_date > end_date:
+            raise ValueError(f"start_date {start_date} is after end_date {end_date}")
+        
+        where, params = "mode = %s", [mode]
+        if start_date:
+            where += " AND date >= %s"
+            params.append(start_date)
+        if end_date:
+            where += " AND date <= %s"
+            params.append(end_date)
+        query = f"SELECT {_EXPORT_SELECT} FROM scores WHERE {where} ORDER BY date, ticker"
+        
+        with self.get_connection() as conn:
+            with conn.cursor(name=f"scores_export_{id(conn):x}") as cur:
+                cur.itersize = chunk_size
+                cur.execute(query, params)
+                while True:
+                    rows = cur.fetchmany(chunk_size)
+                    if not rows:
+                        break
+                    yield rows
+            conn.rollback()  # End the read-only transaction that held the cursor
+    
+    def _fetch_page(self, query: str, params: List[Any], limit: int) -> List[Dict[str, Any]]:
+        """Run a keyset page query, fetching one extra row to detect a next page."""
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                    HOT_STATEMENTS.execute(cur, query, params + [limit + 1])
+                    return cur.fetchall()
+        except psycopg2.Error as e:
+            logger.error(f"Database error fetching score page: {e}")
+            raise
     
     def get_pool_stats(self) -> Dict[str, Any]:
         """
         Get connection pool statistics for monitoring.
         
         Returns:
-            Dict with pool statistics
+            Dict with pool configuration, live connection counts (in_use, idle,
+            peak_in_use), checkout counters and wait-time histogram, connection
+            retries and per-query latency histograms
         """
         if not self._connection_pool:
             return {"error": "Connection pool not initialized"}
         
         try:
-            # Note: psycopg2 pool doesn't expose detailed stats
-            # but we can provide basic configuration info
             return {
                 "pool_configured": True,
                 "min_connections": self.min_conn,
                 "max_connections": self.max_conn,
                 "pool_timeout": self.pool_timeout,
-                "pool_closed": self._connection_pool.closed if hasattr(self._connection_pool, 'closed') else False
+                "checkout_timeout": self.checkout_timeout,
+                "pool_closed": self._connection_pool.closed,
+                **self._connection_pool.get_stats()
             }
         except Exception as e:
             logger.error(f"Error retrieving pool stats: {e}")
             return {"error": str(e)}
     
+    @timed_query
     def get_database_stats(self) -> Dict[str, Any]:
         """
         Get database statistics for monitoring and debugging.
@@ -664,7 +1730,182 @@ class ScoreDatabase:
         except Exception as e:
             logger.error(f"Error retrieving database stats: {e}")
             return {"error": str(e), "connection_pool": self.get_pool_stats()}
+    
+    @timed_query
+    def get_database_stats_estimated(self) -> Dict[str, Any]:
+        """
+        Cheap variant of get_database_stats for frequent health probes.
+        
+        Row and distinct counts come from planner statistics (pg_class.reltuples
+        summed over partitions, pg_stats.n_distinct and most-common-value
+        frequencies) instead of full-table aggregates; earliest/latest date
+        are read from the date index. Estimates are as fresh as the last
+        (auto)ANALYZE, and None where the table has never been analyzed.
+        
+        Returns:
+            Dict with the same keys as get_database_stats plus estimated=True
+        """
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor(cursor_factory=RealDictCursor) as cur:
+                    cur.execute("""
+                        SELECT COALESCE(SUM(GREATEST(c.reltuples, 0)), 0)::bigint AS total_scores
+                        FROM pg_class c
+                        WHERE c.oid = 'scores'::regclass
+                           OR c.oid IN (SELECT inhrelid FROM pg_inherits WHERE inhparent = 'scores'::regclass)
+                    """)
+                    total = cur.fetchone()['total_scores']
+                    
+                    cur.execute("SELECT MIN(date) AS earliest_date, MAX(date) AS latest_date FROM scores")
+                    stats: Dict[str, Any] = dict(cur.fetchone())
+                    
+                    # Parent-level statistics; inherited rows cover partitioned tables
+                    cur.execute("""
+                        SELECT DISTINCT ON (attname)
+                            attname, n_distinct,
+                            most_common_vals::text::text[] AS common_values,
+                            most_common_freqs AS common_freqs
+                        FROM pg_stats
+                        WHERE schemaname = current_schema() AND tablename = 'scores'
+                          AND attname IN ('ticker', 'date', 'mode', 'band')
+                        ORDER BY attname, inherited DESC
+                    """)
+                    column_stats = {row['attname']: row for row in cur.fetchall()}
+            
+            def distinct(column: str) -> Optional[int]:
+                row = column_stats.get(column)
+                if row is None or row['n_distinct'] is None:
+                    return None
+                n_distinct = row['n_distinct']
+                # Negative n_distinct is a fraction of the row count
+                return int(round(-n_distinct * total if n_distinct < 0 else n_distinct))
+            
+            def frequencies(column: str) -> Dict[str, int]:
+                row = column_stats.get(column)
+                if row is None or not row['common_values']:
+                    return {}
+                return {
+                    value: int(round(freq * total))
+                    for value, freq in zip(row['common_values'], row['common_freqs'])
+                }
+            
+            modes = frequencies('mode')
+            stats.update({
+                'total_scores': total,
+                'unique_tickers': distinct('ticker'),
+                'unique_dates': distinct('date'),
+                'trader_scores': modes.get('Trader') if modes else None,
+                'investor_scores': modes.get('Investor') if modes else None,
+                'band_distribution': frequencies('band'),
+                'estimated': True,
+                'connection_pool': self.get_pool_stats()
+            })
+            return stats
+            
+        except Exception as e:
+            logger.error(f"Error retrieving estimated database stats: {e}")
+            return {"error": str(e), "estimated": True, "connection_pool": self.get_pool_stats()}
+
+    
+    @timed_query
+    def rebuild_latest_scores(self) -> int:
+        """
+        Backfill latest_scores from scores (one row per ticker and mode).
+        
+        Normally latest_scores is maintained by the save methods; run this
+        after loading scores by other means or to repair drift. Runs in one
+        transaction with DELETE (not TRUNCATE) so readers are never blocked.
+        
+        Returns:
+            int: Number of rows in the rebuilt table
+        """
+        columns = ', '.join(SCORE_COLUMNS)
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute("DELETE FROM latest_scores")
+                    cur.execute(f"""
+                        INSERT INTO latest_scores ({columns})
+                        SELECT DISTINCT ON (ticker, mode) {columns}
+                        FROM scores
+                        ORDER BY ticker, mode, date DESC
+                    """)
+                    count = cur.rowcount
+                    conn.commit()
+                    # No single date changed; (None, mode) drops latest-score caches
+                    _notify_saved({(None, mode) for mode in ('Trader', 'Investor')})
+                    logger.info(f"Rebuilt latest_scores with {count} rows")
+                    return count
+        except psycopg2.Error as e:
+            logger.error(f"Database error rebuilding latest_scores: {e}")
+            raise
+
+    @timed_query
+    def rebuild_sector_aggregates(self) -> int:
+        """
+        Recompute sector_aggregates for every (date, mode) in scores.
+
+        Batch saves keep the aggregates current (the write-behind queue via
+        refresh_sector_aggregates); run this after loading scores by other
+        means, saving single scores with save_score, or changing sector_mapping. Runs in one transaction, so readers see
+        either the old or the new aggregates.
+
+        Returns:
+            int: Number of aggregate rows written
+        """
+        try:
+            with self.get_connection() as conn:
+                with conn.cursor() as cur:
+                    # Blocks batch refreshes (not readers) until the rebuild commits
+                    cur.execute("LOCK TABLE sector_aggregates IN SHARE ROW EXCLUSIVE MODE")
+                    cur.execute("DELETE FROM sector_aggregates")
+                    cur.execute(_SECTOR_AGGREGATES_INSERT.format(where="TRUE"))
+                    count = cur.rowcount
+                    cur.execute("SELECT DISTINCT date, mode FROM sector_aggregates")
+                    keys = {(row[0], row[1]) for row in cur.fetchall()}
+                    conn.commit()
+                    _notify_saved(keys)
+                    logger.info(f"Rebuilt sector_aggregates with {count} rows")
+                    return count
+        except psycopg2.Error as e:
+            logger.error(f"Database error rebuilding sector_aggregates: {e}")
+            raise
 
+    @timed_query
+    def maintain_partitions(
+        self,
+        months_ahead: int = 3,
+        retain_months: Optional[int] = None,
+        drop: bool = False,
+        interval: str = 'month'
+    ) -> Dict[str, List[str]]:
+        """
+        Pre-create upcoming scores partitions and optionally retire old ones.
+        
+        No-op if the scores table is not partitioned. See
+        greyoak_score.data.partitions for details.
+        
+        Args:
+            months_ahead: Ensure partitions exist this many months ahead
+            retain_months: If set, detach partitions entirely older than this
+            drop: Drop retired partitions instead of only detaching them
+            interval: 'month' or 'quarter' for new partitions
+            
+        Returns:
+            Dict with 'created' and 'detached' partition names
+        """
+        try:
+            with self.get_connection() as conn:
+                return partitions.maintain_partitions(
+                    conn,
+                    months_ahead=months_ahead,
+                    retain_months=retain_months,
+                    drop=drop,
+                    interval=interval
+                )
+        except psycopg2.Error as e:
+            logger.error(f"Database error maintaining partitions: {e}")
+            raise
 
 # Convenience singleton instance for easy access
 _db_instance = None
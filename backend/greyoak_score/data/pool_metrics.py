@@ -0,0 +1,250 @@
+"""
+Connection-pool and query instrumentation for ScoreDatabase.
+
+psycopg2's ThreadedConnectionPool exposes no statistics and fails immediately
+with PoolError when every connection is checked out. InstrumentedConnectionPool
+wraps it so checkouts wait (up to a timeout) for a free connection, and
+records what is needed to tell pool starvation from slow queries:
+
+- connections in use / idle, and the peak in use
+- checkout wait-time histogram and checkout failures
+- connection retries from ScoreDatabase.get_connection
+- per-query latency histograms and error counts, by query name
+"""
+
+import bisect
+import functools
+import inspect
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from psycopg2 import pool
+
+# Histogram bucket upper bounds in milliseconds (last bucket is +Inf)
+LATENCY_BUCKETS_MS: Tuple[float, ...] = (
+    1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000
+)
+
+
+class LatencyHistogram:
+    """Thread-safe fixed-bucket latency histogram (milliseconds)."""
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS_MS):
+        self.buckets = buckets
+        self._counts = [0] * (len(buckets) + 1)
+        self._count = 0
+        self._sum = 0.0
+        self._max = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value_ms: float) -> None:
+        """Record one observation."""
+        index = bisect.bisect_left(self.buckets, value_ms)
+        with self._lock:
+            self._counts[index] += 1
+            self._count += 1
+            self._sum += value_ms
+            self._max = max(self._max, value_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Counts per bucket plus summary values.
+
+        Returns:
+            Dict with count, sum_ms, avg_ms, max_ms, bucket-estimated p50/p95/p99
+            and 'buckets' mapping each upper bound ('le') to its count
+        """
+        with self._lock:
+            counts = list(self._counts)
+            count, total, peak = self._count, self._sum, self._max
+        labels = [str(b) for b in self.buckets] + ['+Inf']
+        return {
+            'count': count,
+            'sum_ms': round(total, 3),
+            'avg_ms': round(total / count, 3) if count else 0.0,
+            'max_ms': round(peak, 3),
+            'p50_ms': self._quantile(counts, count, 0.50, peak),
+            'p95_ms': self._quantile(counts, count, 0.95, peak),
+            'p99_ms': self._quantile(counts, count, 0.99, peak),
+            'buckets': dict(zip(labels, counts)),
+        }
+
+    def _quantile(self, counts, count: int, q: float, peak: float) -> float:
+        """Upper bound of the bucket holding the q-quantile (capped at the max seen)."""
+        if not count:
+            return 0.0
+        rank, seen = q * count, 0
+        for index, bucket_count in enumerate(counts):
+            seen += bucket_count
+            if seen >= rank:
+                bound = self.buckets[index] if index < len(self.buckets) else peak
+                return round(min(bound, peak), 3)
+        return round(peak, 3)
+
+
+class PoolMetrics:
+    """Counters and histograms shared by the pool wrapper and ScoreDatabase."""
+
+    def __init__(self):
+        self.checkout_wait = LatencyHistogram()
+        self._queries: Dict[str, LatencyHistogram] = {}
+        self._query_errors: Dict[str, int] = {}
+        self._counters = {
+            'checkouts': 0, 'checkout_failures': 0, 'returns': 0,
+            'discarded': 0, 'retries': 0,
+        }
+        self._lock = threading.Lock()
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        """Bump a counter ('checkouts', 'checkout_failures', 'returns', 'discarded', 'retries')."""
+        with self._lock:
+            self._counters[name] += amount
+
+    def observe_query(self, name: str, elapsed_ms: float, failed: bool = False) -> None:
+        """Record one execution of a named query."""
+        with self._lock:
+            histogram = self._queries.get(name)
+            if histogram is None:
+                histogram = self._queries[name] = LatencyHistogram()
+            if failed:
+                self._query_errors[name] = self._query_errors.get(name, 0) + 1
+        histogram.observe(elapsed_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Counters, checkout wait histogram and per-query latencies."""
+        with self._lock:
+            counters = dict(self._counters)
+            queries = dict(self._queries)
+            errors = dict(self._query_errors)
+        return {
+            **counters,
+            'checkout_wait_ms': self.checkout_wait.snapshot(),
+            'queries': {
+                name: {**histogram.snapshot(), 'errors': errors.get(name, 0)}
+                for name, histogram in sorted(queries.items())
+            },
+        }
+
+
+class InstrumentedConnectionPool:
+    """
+    Wrapper around a psycopg2 ThreadedConnectionPool that records metrics.
+
+    A semaphore sized to maxconn makes getconn() wait up to checkout_timeout
+    seconds for a free connection instead of failing immediately.
+    """
+
+    def __init__(self, inner: pool.AbstractConnectionPool, maxconn: int,
+                 metrics: PoolMetrics, checkout_timeout: float = 5.0):
+        """
+        Args:
+            inner: Pool to delegate to
+            maxconn: Pool capacity (checkouts beyond this wait)
+            metrics: Where to record counters and wait times
+            checkout_timeout: Seconds to wait for a free connection
+        """
+        self._inner = inner
+        self.maxconn = maxconn
+        self.metrics = metrics
+        self.checkout_timeout = checkout_timeout
+        self._slots = threading.BoundedSemaphore(maxconn)
+        self._lock = threading.Lock()
+        self._in_use = 0
+        self._peak_in_use = 0
+
+    @property
+    def closed(self) -> bool:
+        return bool(getattr(self._inner, 'closed', False))
+
+    def getconn(self):
+        """Check out a connection, waiting for a free slot if the pool is full."""
+        start = time.perf_counter()
+        if not self._slots.acquire(timeout=self.checkout_timeout):
+            self.metrics.checkout_wait.observe((time.perf_counter() - start) * 1000)
+            self.metrics.increment('checkout_failures')
+            raise pool.PoolError(
+                f"connection pool exhausted: no connection free within {self.checkout_timeout}s"
+            )
+        try:
+            conn = self._inner.getconn()
+        except Exception:
+            self._slots.release()
+            self.metrics.increment('checkout_failures')
+            raise
+        finally:
+            self.metrics.checkout_wait.observe((time.perf_counter() - start) * 1000)
+
+        with self._lock:
+            self._in_use += 1
+            self._peak_in_use = max(self._peak_in_use, self._in_use)
+        self.metrics.increment('checkouts')
+        return conn
+
+    def putconn(self, conn, close: bool = False) -> None:
+        """Return a connection (close=True discards it)."""
+        try:
+            self._inner.putconn(conn, close=close)
+        finally:
+            with self._lock:
+                self._in_use -= 1
+            self._slots.release()
+            self.metrics.increment('discarded' if close else 'returns')
+
+    def closeall(self) -> None:
+        self._inner.closeall()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Live connection counts plus the recorded metrics."""
+        with self._lock:
+            in_use, peak = self._in_use, self._peak_in_use
+        idle = len(getattr(self._inner, '_pool', ()))  # psycopg2 keeps idle connections here
+        return {
+            'in_use': in_use,
+            'idle': idle,
+            'open': in_use + idle,
+            'peak_in_use': peak,
+            'capacity': self.maxconn,
+            'utilization': round(in_use / self.maxconn, 4) if self.maxconn else 0.0,
+            **self.metrics.snapshot(),
+        }
+
+
+def timed_query(func: Callable) -> Callable:
+    """
+    Record a ScoreDatabase method's latency under its name in self.metrics.
+
+    Works for coroutine methods too (AsyncScoreDatabase). Exceptions are
+    counted as errors and re-raised.
+    """
+    def record(self, start: float, failed: bool) -> None:
+        metrics: Optional[PoolMetrics] = getattr(self, 'metrics', None)
+        if metrics is not None:
+            metrics.observe_query(func.__name__, (time.perf_counter() - start) * 1000, failed)
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(self, *args, **kwargs):
+            start = time.perf_counter()
+            failed = False
+            try:
+                return await func(self, *args, **kwargs)
+            except Exception:
+                failed = True
+                raise
+            finally:
+                record(self, start, failed)
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        start = time.perf_counter()
+        failed = False
+        try:
+            return func(self, *args, **kwargs)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            record(self, start, failed)
+    return wrapper
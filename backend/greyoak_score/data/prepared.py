@@ -0,0 +1,105 @@
+"""
+Server-side prepared statements for hot ScoreDatabase queries.
+
+psycopg2 interpolates parameters client-side and sends fresh SQL text for
+every query, so PostgreSQL parses and plans each one from scratch. Hot
+queries are registered here by their exact SQL text; on checkout each
+pooled connection PREPAREs them once per session, and execute() then sends
+a short EXECUTE instead whenever the query text matches a registered
+statement. Unregistered queries, or connections without the statements
+(e.g. mocks, or DB_PREPARED_STATEMENTS=false behind a transaction-pooling
+proxy), fall back to plain execution.
+"""
+
+import re
+from typing import Dict, List, Sequence, Set
+
+import psycopg2
+import psycopg2.extensions
+
+from greyoak_score.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_PLACEHOLDER = re.compile(r'%s')
+
+
+class PreparingConnection(psycopg2.extensions.connection):
+    """psycopg2 connection that tracks the statements prepared on its session."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.prepared: Set[str] = set()
+        self.prepare_failed = False  # Don't retry (and re-log) on every checkout
+
+
+def to_server_placeholders(sql: str) -> str:
+    """Rewrite psycopg2 %s placeholders as PostgreSQL $1, $2, ... parameters."""
+    counter = iter(range(1, sql.count('%s') + 1))
+    return _PLACEHOLDER.sub(lambda _: f"${next(counter)}", sql)
+
+
+class PreparedStatements:
+    """Registry of named statements, keyed by the SQL text callers execute."""
+
+    def __init__(self):
+        self._statements: Dict[str, str] = {}  # name -> SQL (with %s placeholders)
+        self._by_sql: Dict[str, str] = {}
+
+    def register(self, name: str, sql: str) -> str:
+        """
+        Register a statement; returns the SQL so it can be used as a constant.
+
+        Raises:
+            ValueError: If the name is already registered for different SQL
+        """
+        if self._statements.get(name, sql) != sql:
+            raise ValueError(f"Prepared statement {name} already registered with different SQL")
+        self._statements[name] = sql
+        self._by_sql[sql] = name
+        return sql
+
+    @property
+    def names(self) -> List[str]:
+        return sorted(self._statements)
+
+    def prepare(self, conn) -> int:
+        """
+        PREPARE every registered statement missing from this connection's session.
+
+        Commits the preparing transaction. Connections that cannot track
+        statements (no `prepared` set) are skipped.
+
+        Returns:
+            int: Number of statements prepared now
+        """
+        prepared = getattr(conn, 'prepared', None)
+        if not isinstance(prepared, set) or conn.prepare_failed:
+            return 0
+        missing = [name for name in self._statements if name not in prepared]
+        if not missing:
+            return 0
+        try:
+            with conn.cursor() as cur:
+                for name in missing:
+                    cur.execute(f"PREPARE {name} AS {to_server_placeholders(self._statements[name])}")
+            conn.commit()
+        except psycopg2.Error as e:
+            conn.rollback()
+            conn.prepare_failed = True
+            logger.warning(f"Could not prepare statements; using plain queries on this connection: {e}")
+            return 0
+        prepared.update(missing)
+        return len(missing)
+
+    def execute(self, cur, sql: str, params: Sequence = ()) -> None:
+        """Run sql, via EXECUTE if it is registered and prepared on cur's connection."""
+        name = self._by_sql.get(sql)
+        prepared = getattr(cur.connection, 'prepared', None)
+        if name is not None and isinstance(prepared, set) and name in prepared:
+            if params:
+                cur.execute(f"EXECUTE {name} ({', '.join(['%s'] * len(params))})", params)
+            else:
+                cur.execute(f"EXECUTE {name}")
+        else:
+            cur.execute(sql, params)
@@ -0,0 +1,308 @@
+"""
+Score event fan-out for push subscribers (server-sent events).
+
+The save methods of ScoreDatabase publish one compact event per saved score
+(ticker, date, mode, score, band, sector) when their transaction commits.
+ScoreEventBroker fans those events out to subscribers, each with its own
+ticker/band/sector filters and a bounded buffer.
+
+Event sources (SCORE_EVENTS_BACKEND):
+- 'postgres' (default): a listener thread holds one dedicated connection
+  with LISTEN score_events, so saves from any process (nightly batch jobs,
+  other API workers) reach every subscriber
+- 'local': in-process only, fed by register_publish_listener; for a local
+  stand-in database or a single process that does all the writing
+
+Key Features:
+- Filtering happens on publish, so subscribers only buffer what they want
+- Per-subscriber buffers drop their oldest events when full and count the
+  drops, so one slow client never holds back the others or grows memory
+- The listener reconnects with exponential backoff
+"""
+
+import itertools
+import json
+import os
+import select
+import threading
+from collections import deque
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Set
+
+import asyncio
+import psycopg2
+import psycopg2.extensions
+
+from greyoak_score.data.persistence import (
+    SCORE_EVENTS_CHANNEL, register_publish_listener, resolve_database_url, unregister_publish_listener
+)
+from greyoak_score.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class TooManySubscribers(Exception):
+    """Raised when SCORE_EVENTS_MAX_SUBSCRIBERS subscriptions are already open."""
+
+
+class Subscription:
+    """
+    One subscriber's filters and bounded event buffer.
+
+    Events are appended on the subscriber's event loop; next_events() waits
+    for and drains them.
+    """
+
+    def __init__(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        tickers: Optional[Iterable[str]],
+        bands: Optional[Iterable[str]],
+        sectors: Optional[Iterable[str]],
+        buffer_size: int
+    ):
+        self.loop = loop
+        self.tickers: Optional[FrozenSet[str]] = frozenset(tickers) if tickers else None
+        self.bands: Optional[FrozenSet[str]] = frozenset(bands) if bands else None
+        self.sectors: Optional[FrozenSet[str]] = frozenset(sectors) if sectors else None
+        self.dropped = 0
+        self._buffer: deque = deque(maxlen=buffer_size)
+        self._ready = asyncio.Event()
+
+    def matches(self, event: Dict[str, Any]) -> bool:
+        """Whether an event passes this subscriber's filters (unset filters match all)."""
+        return (
+            (self.tickers is None or event['ticker'] in self.tickers)
+            and (self.bands is None or event['band'] in self.bands)
+            and (self.sectors is None or event['sector'] in self.sectors)
+        )
+
+    def _deliver(self, events: List[Dict[str, Any]]) -> None:
+        """Buffer events (runs on the subscriber's loop); a full buffer drops its oldest."""
+        overflow = len(self._buffer) + len(events) - self._buffer.maxlen
+        if overflow > 0:
+            self.dropped += overflow
+        self._buffer.extend(events)
+        self._ready.set()
+
+    async def next_events(self, timeout: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Wait for buffered events and return all of them.
+
+        Returns:
+            List of events (empty if timeout elapsed first)
+        """
+        if not self._buffer:
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout)
+            except asyncio.TimeoutError:
+                return []
+        self._ready.clear()
+        events = list(self._buffer)
+        self._buffer.clear()
+        return events
+
+
+class ScoreEventBroker:
+    """
+    Thread-safe in-process pub/sub for score events.
+
+    publish() may be called from any thread; each subscription receives its
+    matching events on its own event loop.
+    """
+
+    def __init__(self, buffer_size: Optional[int] = None, max_subscribers: Optional[int] = None):
+        """
+        Args:
+            buffer_size: Events buffered per subscriber (SCORE_EVENTS_BUFFER, default 5000)
+            max_subscribers: Open subscriptions allowed (SCORE_EVENTS_MAX_SUBSCRIBERS, default 500)
+        """
+        self.buffer_size = buffer_size or int(os.getenv('SCORE_EVENTS_BUFFER', '5000'))
+        self.max_subscribers = max_subscribers or int(os.getenv('SCORE_EVENTS_MAX_SUBSCRIBERS', '500'))
+        self._subscriptions: Set[Subscription] = set()
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._stats = {'published': 0, 'delivered': 0}
+
+    def subscribe(
+        self,
+        tickers: Optional[Iterable[str]] = None,
+        bands: Optional[Iterable[str]] = None,
+        sectors: Optional[Iterable[str]] = None
+    ) -> Subscription:
+        """
+        Open a subscription on the running event loop.
+
+        Raises:
+            TooManySubscribers: If max_subscribers are already open
+        """
+        subscription = Subscription(
+            asyncio.get_running_loop(), tickers, bands, sectors, self.buffer_size
+        )
+        with self._lock:
+            if len(self._subscriptions) >= self.max_subscribers:
+                raise TooManySubscribers(f"{self.max_subscribers} score event subscribers already connected")
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Close a subscription (idempotent)."""
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def publish(self, events: List[Dict[str, Any]]) -> None:
+        """
+        Number events and hand each subscriber the ones matching its filters.
+
+        Args:
+            events: Event dicts with ticker, date, mode, score, band and sector
+        """
+        if not events:
+            return
+        with self._lock:
+            for event in events:
+                event['id'] = next(self._ids)
+            subscriptions = list(self._subscriptions)
+            self._stats['published'] += len(events)
+
+        for subscription in subscriptions:
+            matched = [event for event in events if subscription.matches(event)]
+            if not matched:
+                continue
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._deliver, matched)
+            except RuntimeError:  # Subscriber's loop already closed
+                self.unsubscribe(subscription)
+                continue
+            with self._lock:
+                self._stats['delivered'] += len(matched)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Subscriber and event counters for monitoring."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['subscribers'] = len(self._subscriptions)
+            stats['dropped'] = sum(s.dropped for s in self._subscriptions)
+        return stats
+
+
+class PostgresScoreListener:
+    """
+    Forwards NOTIFY score_events payloads to a broker from a background thread.
+
+    Uses its own autocommit connection (not a pooled one), since a LISTEN
+    session must stay open for as long as events are wanted. It never needs
+    the score pool, so starting it while the database is down is fine: the
+    thread keeps retrying until the database comes back.
+    """
+
+    def __init__(
+        self,
+        broker: ScoreEventBroker,
+        database_url: str,
+        poll_interval: float = 5.0,
+        max_backoff: float = 30.0
+    ):
+        self.broker = broker
+        self.database_url = database_url
+        self.poll_interval = poll_interval
+        self.max_backoff = max_backoff
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the listener thread (idempotent)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='score-event-listener', daemon=True)
+        self._thread.start()
+        logger.info(f"Score event listener started on channel {SCORE_EVENTS_CHANNEL}")
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        """Stop the listener thread (within one poll interval)."""
+        thread = self._thread
+        if thread is None:
+            return
+        self._stop.set()
+        thread.join(timeout)
+        self._thread = None
+        logger.info("Score event listener stopped")
+
+    def _run(self) -> None:
+        """Listen, reconnecting with exponential backoff until stopped."""
+        backoff = 1.0
+        while not self._stop.is_set():
+            try:
+                self._listen()
+                backoff = 1.0
+            except Exception as e:  # Never let the listener die
+                logger.warning(f"Score event listener disconnected: {e}; retrying in {backoff:.0f}s")
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, self.max_backoff)
+
+    def _listen(self) -> None:
+        conn = psycopg2.connect(self.database_url)
+        try:
+            conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+            with conn.cursor() as cur:
+                cur.execute(f"LISTEN {SCORE_EVENTS_CHANNEL}")
+            while not self._stop.is_set():
+                if select.select([conn], [], [], self.poll_interval) == ([], [], []):
+                    continue
+                conn.poll()
+                payloads, conn.notifies[:] = [n.payload for n in conn.notifies], []
+                events = []
+                for payload in payloads:
+                    try:
+                        events.append(json.loads(payload))
+                    except ValueError:
+                        logger.warning(f"Ignoring malformed score event: {payload[:200]}")
+                self.broker.publish(events)
+        finally:
+            conn.close()
+
+
+# Convenience singleton instance for easy access
+_broker: Optional[ScoreEventBroker] = None
+_listener: Optional[PostgresScoreListener] = None
+_singleton_lock = threading.Lock()
+
+def get_score_event_broker() -> ScoreEventBroker:
+    """
+    Get the singleton broker, connecting its event source on first use.
+
+    Returns:
+        ScoreEventBroker: Shared broker fed by SCORE_EVENTS_BACKEND
+    """
+    global _broker, _listener
+    with _singleton_lock:
+        if _broker is None:
+            broker = ScoreEventBroker()
+            backend = os.getenv('SCORE_EVENTS_BACKEND', 'postgres').lower()
+            if backend == 'local':
+                register_publish_listener(broker.publish)
+            else:
+                _listener = PostgresScoreListener(broker, resolve_database_url())
+                _listener.start()
+            logger.info(f"Score event broker started with {backend} backend")
+            _broker = broker
+    return _broker
+
+def get_score_event_stats() -> Optional[Dict[str, Any]]:
+    """Stats of the singleton broker, or None if it has not been started."""
+    broker = _broker
+    return broker.get_stats() if broker is not None else None
+
+def close_score_event_broker() -> None:
+    """
+    Stop the event source and drop the singleton broker.
+    Should be called during application shutdown.
+    """
+    global _broker, _listener
+    with _singleton_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+        if _broker is not None:
+            unregister_publish_listener(_broker.publish)
+            _broker = None
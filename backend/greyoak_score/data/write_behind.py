@@ -0,0 +1,312 @@
+"""
+Write-behind persistence queue for computed scores.
+
+API requests hand their ScoreOutput to an in-process queue and return
+immediately; a single writer thread drains the queue and persists records
+in batches with multi-row UPSERTs (ScoreDatabase.save_scores_batch).
+
+Key Features:
+- Flush every N records or M milliseconds, whichever comes first
+- Bounded queue with backpressure (producers wait, then get WriteQueueFull)
+- Drain and final flush on shutdown
+- Sector aggregates refreshed at most every SECTOR_AGGREGATE_REFRESH_SECONDS
+  for the (date, mode) pairs written, not on every flush
+- Counters for monitoring (pending, written, failed, batches)
+"""
+
+import os
+import queue
+import threading
+import time
+from datetime import date
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from greyoak_score.data.models import ScoreOutput
+from greyoak_score.data.persistence import ScoreDatabase, get_database
+from greyoak_score.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Sentinel that tells the writer thread to flush and exit
+_STOP = object()
+
+
+class WriteQueueFull(Exception):
+    """Raised when the write-behind queue stays full past the enqueue timeout."""
+
+
+class ScoreWriteBehindQueue:
+    """
+    Batched, write-behind persistence for ScoreOutput records.
+
+    Producers call submit(); the writer thread collects records until it has
+    batch_size of them or flush_interval_ms has passed since the first record
+    of the batch arrived, then writes them in one transaction. If a batch
+    fails it is retried with exponential backoff before being dropped.
+    """
+
+    def __init__(
+        self,
+        db_factory: Callable[[], ScoreDatabase] = get_database,
+        batch_size: Optional[int] = None,
+        flush_interval_ms: Optional[float] = None,
+        max_pending: Optional[int] = None,
+        enqueue_timeout: Optional[float] = None,
+        max_retries: int = 3,
+        retry_delay: float = 0.5,
+        aggregate_refresh_seconds: Optional[float] = None
+    ):
+        """
+        Initialize the queue (the writer thread starts on start()).
+
+        Args:
+            db_factory: Returns the ScoreDatabase to write to
+            batch_size: Flush after this many records (SCORE_WRITE_BATCH_SIZE)
+            flush_interval_ms: Flush after this many ms (SCORE_WRITE_FLUSH_MS)
+            max_pending: Queue capacity before backpressure (SCORE_WRITE_QUEUE_MAX)
+            enqueue_timeout: Seconds submit() waits on a full queue (SCORE_WRITE_ENQUEUE_TIMEOUT)
+            max_retries: Retries for a failed batch before it is dropped
+            retry_delay: Initial delay between retries (exponential backoff)
+            aggregate_refresh_seconds: Longest delay before written (date, mode)
+                pairs get their sector aggregates recomputed
+                (SECTOR_AGGREGATE_REFRESH_SECONDS, default 300)
+        """
+        self.db_factory = db_factory
+        self.batch_size = batch_size or int(os.getenv('SCORE_WRITE_BATCH_SIZE', '100'))
+        self.flush_interval = (
+            flush_interval_ms if flush_interval_ms is not None
+            else float(os.getenv('SCORE_WRITE_FLUSH_MS', '250'))
+        ) / 1000.0
+        self.max_pending = max_pending or int(os.getenv('SCORE_WRITE_QUEUE_MAX', '5000'))
+        self.enqueue_timeout = (
+            enqueue_timeout if enqueue_timeout is not None
+            else float(os.getenv('SCORE_WRITE_ENQUEUE_TIMEOUT', '2.0'))
+        )
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.aggregate_refresh_seconds = (
+            aggregate_refresh_seconds if aggregate_refresh_seconds is not None
+            else float(os.getenv('SECTOR_AGGREGATE_REFRESH_SECONDS', '300'))
+        )
+
+        self._queue: queue.Queue = queue.Queue(maxsize=self.max_pending)
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._stats = {'submitted': 0, 'written': 0, 'failed': 0, 'batches': 0, 'rejected': 0,
+                       'aggregate_refreshes': 0}
+        # (date, mode) pairs written since the last aggregate refresh (writer thread only)
+        self._stale_aggregates: Set[Tuple[date, str]] = set()
+        self._aggregates_due: Optional[float] = None
+
+    def start(self) -> None:
+        """Start the writer thread (idempotent)."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(
+                target=self._run, name='score-write-behind', daemon=True
+            )
+            self._thread.start()
+        logger.info(
+            f"Write-behind queue started: batch_size={self.batch_size}, "
+            f"flush_interval={self.flush_interval * 1000:.0f}ms, max_pending={self.max_pending}"
+        )
+
+    def submit(self, score: ScoreOutput) -> None:
+        """
+        Queue a score for persistence.
+
+        Blocks for up to enqueue_timeout seconds while the queue is full.
+
+        Raises:
+            WriteQueueFull: If the queue is still full after the timeout
+            RuntimeError: If the writer thread is not running
+        """
+        if self._thread is None or not self._thread.is_alive():
+            raise RuntimeError("Write-behind queue is not running")
+
+        try:
+            self._queue.put(score, timeout=self.enqueue_timeout)
+        except queue.Full:
+            self._bump('rejected')
+            raise WriteQueueFull(
+                f"Write-behind queue full ({self.max_pending} pending records)"
+            )
+        self._bump('submitted')
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every record submitted so far has been written or dropped.
+
+        Returns:
+            bool: True if the queue drained within the timeout
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._queue.unfinished_tasks:
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(0.005)
+        return True
+
+    def stop(self, timeout: Optional[float] = 30.0) -> None:
+        """Flush outstanding records and stop the writer thread."""
+        thread = self._thread
+        if thread is None:
+            return
+
+        self._queue.put(_STOP)
+        thread.join(timeout)
+        if thread.is_alive():
+            logger.error(f"Write-behind queue did not drain within {timeout}s "
+                         f"({self._queue.qsize()} records left)")
+        else:
+            logger.info(f"Write-behind queue stopped: {self.get_stats()}")
+        self._thread = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue counters for monitoring."""
+        with self._lock:
+            stats = dict(self._stats)
+        stats['pending'] = self._queue.qsize()
+        stats['running'] = self._thread is not None and self._thread.is_alive()
+        return stats
+
+    def _bump(self, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[key] += amount
+
+    def _run(self) -> None:
+        """Writer loop: collect a batch, write it, repeat until stopped."""
+        stopping = False
+        while not stopping:
+            batch, stopping = self._collect_batch()
+            if batch:
+                self._write_batch(batch)
+                for _ in batch:
+                    self._queue.task_done()
+            self._refresh_aggregates(force=stopping)
+            if stopping:
+                self._queue.task_done()  # The stop sentinel
+
+    def _collect_batch(self) -> tuple:
+        """
+        Block for the first record (or until an aggregate refresh is due), then
+        gather more until the batch is full or the flush interval (measured
+        from the first record) expires.
+
+        Returns:
+            Tuple of (records, stop_requested)
+        """
+        wait = None
+        if self._aggregates_due is not None:
+            wait = max(0.0, self._aggregates_due - time.monotonic())
+        try:
+            first = self._queue.get(timeout=wait)
+        except queue.Empty:
+            return [], False
+        if first is _STOP:
+            return [], True
+
+        batch: List[ScoreOutput] = [first]
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            try:
+                item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is _STOP:
+                # Drain whatever is left so shutdown writes everything
+                return batch + self._drain(), True
+            batch.append(item)
+        return batch, False
+
+    def _drain(self) -> List[ScoreOutput]:
+        items = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return items
+            if item is _STOP:
+                self._queue.task_done()
+            else:
+                items.append(item)
+
+    def _write_batch(self, batch: List[ScoreOutput]) -> None:
+        """Persist a batch (in batch_size chunks), retrying with backoff."""
+        for start in range(0, len(batch), self.batch_size):
+            chunk = batch[start:start + self.batch_size]
+            for attempt in range(self.max_retries + 1):
+                try:
+                    self.db_factory().save_scores_batch(chunk, refresh_aggregates=False)
+                    self._mark_aggregates_stale(chunk)
+                    self._bump('written', len(chunk))
+                    self._bump('batches')
+                    break
+                except ValueError as e:
+                    # Invalid data will not succeed on retry
+                    logger.error(f"Dropping batch of {len(chunk)} scores with invalid data: {e}")
+                    self._bump('failed', len(chunk))
+                    break
+                except Exception as e:
+                    if attempt == self.max_retries:
+                        logger.error(f"Dropping batch of {len(chunk)} scores after "
+                                     f"{self.max_retries + 1} attempts: {e}")
+                        self._bump('failed', len(chunk))
+                        break
+                    wait_time = self.retry_delay * (2 ** attempt)
+                    logger.warning(f"Batch write attempt {attempt + 1}/{self.max_retries + 1} "
+                                   f"failed: {e}; retrying in {wait_time:.1f}s")
+                    time.sleep(wait_time)
+
+    def _mark_aggregates_stale(self, chunk: List[ScoreOutput]) -> None:
+        if not self._stale_aggregates:
+            self._aggregates_due = time.monotonic() + self.aggregate_refresh_seconds
+        self._stale_aggregates.update((score.scoring_date, score.mode) for score in chunk)
+
+    def _refresh_aggregates(self, force: bool = False) -> None:
+        """Recompute sector aggregates for written pairs once the refresh is due."""
+        if not self._stale_aggregates:
+            return
+        if not force and time.monotonic() < self._aggregates_due:
+            return
+        keys = set(self._stale_aggregates)
+        try:
+            self.db_factory().refresh_sector_aggregates(keys)
+        except Exception as e:
+            # Keep the pairs; the next attempt is one interval later
+            logger.warning(f"Sector aggregate refresh for {len(keys)} (date, mode) pairs failed: {e}")
+            self._aggregates_due = time.monotonic() + self.aggregate_refresh_seconds
+            return
+        self._stale_aggregates.clear()
+        self._aggregates_due = None
+        self._bump('aggregate_refreshes')
+
+
+# Convenience singleton instance for easy access
+_write_queue = None
+
+def get_write_queue() -> ScoreWriteBehindQueue:
+    """
+    Get the singleton write-behind queue, starting its writer thread.
+
+    Returns:
+        ScoreWriteBehindQueue: Shared, running queue
+    """
+    global _write_queue
+    if _write_queue is None:
+        _write_queue = ScoreWriteBehindQueue()
+        _write_queue.start()
+    return _write_queue
+
+def close_write_queue(timeout: Optional[float] = 30.0) -> None:
+    """
+    Flush pending scores and stop the singleton queue.
+    Should be called during application shutdown, before closing the database.
+    """
+    global _write_queue
+    if _write_queue is not None:
+        _write_queue.stop(timeout)
+        _write_queue = None
+        logger.info("Write-behind queue closed")
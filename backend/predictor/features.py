@@ -111,6 +111,28 @@ def build_feature_frame(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def _ewm_zscore(
+    df: pd.DataFrame,
+    feature_cols: list,
+    ts_alpha: float = 0.06
+) -> pd.DataFrame:
+    """
+    Per-symbol EWMA z-score for every feature column in one grouped pass
+    
+    Args:
+        df: DataFrame with 'symbol' column (rows in date order within symbol)
+        feature_cols: List of feature column names
+        ts_alpha: EWMA alpha
+    
+    Returns:
+        DataFrame of time-series z-scores aligned to df.index
+    """
+    ewm = df.groupby('symbol', sort=False)[feature_cols].ewm(alpha=ts_alpha, adjust=False)
+    ewm_mean = ewm.mean().droplevel(0).reindex(df.index)
+    ewm_std = ewm.std().droplevel(0).reindex(df.index)
+    return (df[feature_cols] - ewm_mean) / (ewm_std + 1e-9)
+
+
 def standardize_features(
     df: pd.DataFrame,
     feature_cols: list,
@@ -121,6 +143,10 @@ def standardize_features(
     """
     Standardize features (z-score normalization)
     
+    Both modes run on grouped transforms: per-date mean/std for the
+    cross-sectional z-score, and a per-symbol EWMA z-score computed once
+    on the raw features and reused for every fallback row.
+    
     Args:
         df: DataFrame with features (multi-stock, with 'date' and 'symbol' columns)
         feature_cols: List of feature column names to standardize
@@ -132,41 +158,39 @@ def standardize_features(
         DataFrame with standardized features (original columns overwritten)
     """
     df = df.copy()
+    values = df[feature_cols].astype(float)
+    
+    # Symbols need > 20 rows of history for a time-series z-score
+    has_history = (df.groupby('symbol', sort=False)['symbol'].transform('size') > 20).values
     
     if method == 'cross_sectional':
         # Cross-sectional standardization (within each date)
-        for date in df['date'].unique():
-            date_mask = df['date'] == date
-            date_data = df.loc[date_mask, feature_cols]
-            
-            # Check if enough stocks and variation
-            if len(date_data) >= min_stocks and date_data.std().sum() > 1e-6:
-                # Cross-sectional z-score
-                z_scores = (date_data - date_data.mean()) / (date_data.std() + 1e-9)
-                df.loc[date_mask, feature_cols] = z_scores
-            else:
-                # Fallback to time-series z-score
-                for symbol in df.loc[date_mask, 'symbol'].unique():
-                    symbol_mask = (df['symbol'] == symbol)
-                    for col in feature_cols:
-                        ts_data = df.loc[symbol_mask, col]
-                        if len(ts_data) > 20:  # Need history
-                            ewm_mean = ts_data.ewm(alpha=ts_alpha, adjust=False).mean()
-                            ewm_std = ts_data.ewm(alpha=ts_alpha, adjust=False).std()
-                            ts_z = (ts_data - ewm_mean) / (ewm_std + 1e-9)
-                            df.loc[symbol_mask, col] = ts_z
+        by_date = values.groupby(df['date'], sort=False)
+        xs_mean = by_date.transform('mean')
+        xs_std = by_date.transform('std')
+        n_stocks = df.groupby('date', sort=False)['date'].transform('size')
+        
+        # Date needs enough stocks and variation, else fall back to time-series
+        xs_ok = ((n_stocks >= min_stocks) & (xs_std.sum(axis=1) > 1e-6)).values
+        
+        standardized = values.values.copy()
+        xs_z = ((values - xs_mean) / (xs_std + 1e-9)).values
+        standardized[xs_ok] = xs_z[xs_ok]
+        
+        fallback = ~xs_ok & has_history
+        if fallback.any():
+            ts_z = _ewm_zscore(df, feature_cols, ts_alpha).values
+            standardized[fallback] = ts_z[fallback]
+        
+        df[feature_cols] = standardized
     
     elif method == 'time_series':
         # Time-series standardization (per stock)
-        for symbol in df['symbol'].unique():
-            symbol_mask = df['symbol'] == symbol
-            for col in feature_cols:
-                ts_data = df.loc[symbol_mask, col]
-                if len(ts_data) > 20:
-                    ewm_mean = ts_data.ewm(alpha=ts_alpha, adjust=False).mean()
-                    ewm_std = ts_data.ewm(alpha=ts_alpha, adjust=False).std()
-                    ts_z = (ts_data - ewm_mean) / (ewm_std + 1e-9)
-                    df.loc[symbol_mask, col] = ts_z
+        if has_history.any():
+            standardized = values.values.copy()
+            ts_z = _ewm_zscore(df, feature_cols, ts_alpha).values
+            standardized[has_history] = ts_z[has_history]
+            df[feature_cols] = standardized
     
     return df
 
@@ -7,8 +7,25 @@ import numpy as np
 import pandas as pd
 import pickle
 from pathlib import Path
-from typing import Dict, Tuple
+from typing import Dict, Iterator, List, Tuple
 import yaml
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+
+# Flag bits carried through inference as an integer bitmask
+FLAG_XSCTN_FALLBACK = 1 << 0
+FLAG_GATE_FAIL = 1 << 1
+
+FLAG_NAMES = [
+    (FLAG_XSCTN_FALLBACK, 'XSctnFallback'),
+    (FLAG_GATE_FAIL, 'GateFail'),
+]
+
+# Columns carried from the feature frame into the predictions output
+OUTPUT_ID_COLS = ['date', 'symbol', 'close', 'U', 'L']
 
 
 def load_config():
@@ -19,9 +36,61 @@ def load_config():
 
 
 def load_model(model_path: Path) -> Dict:
-    """Load trained model artifacts"""
+    """Load trained model artifacts (calibrators compiled to lookup tables)"""
     with open(model_path, 'rb') as f:
-        return pickle.load(f)
+        artifacts = pickle.load(f)
+    get_calibration_tables(artifacts)
+    return artifacts
+
+
+def compile_calibrator(calibrator) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Compile a fitted isotonic calibrator into sorted breakpoint arrays
+    
+    IsotonicRegression(out_of_bounds='clip') predicts by linear interpolation
+    between its thresholds, so np.interp over the same breakpoints is exact.
+    
+    Args:
+        calibrator: Fitted sklearn IsotonicRegression
+    
+    Returns:
+        Tuple of (x_breakpoints, y_breakpoints)
+    """
+    x = np.asarray(calibrator.X_thresholds_, dtype=np.float64)
+    y = np.asarray(calibrator.y_thresholds_, dtype=np.float64)
+    return x, y
+
+
+def get_calibration_tables(model_artifacts: Dict) -> Dict:
+    """Return {'pos', 'neg'} lookup tables, compiling them once if missing"""
+    tables = model_artifacts.get('calibration_tables')
+    if tables is None:
+        tables = {
+            'pos': compile_calibrator(model_artifacts['calibrator_pos']),
+            'neg': compile_calibrator(model_artifacts['calibrator_neg']),
+        }
+        model_artifacts['calibration_tables'] = tables
+    return tables
+
+
+def decode_flags(flag_bits: np.ndarray) -> np.ndarray:
+    """
+    Decode integer flag bitmasks into comma-joined flag strings
+    
+    Each distinct mask is decoded once and broadcast back to all rows.
+    
+    Args:
+        flag_bits: Integer bitmask per row
+    
+    Returns:
+        Object array of strings (e.g. 'XSctnFallback,GateFail' or '')
+    """
+    uniques, inverse = np.unique(np.asarray(flag_bits, dtype=np.int64), return_inverse=True)
+    labels = np.array(
+        [','.join(name for bit, name in FLAG_NAMES if mask & bit) for mask in uniques],
+        dtype=object
+    )
+    return labels[inverse.reshape(-1)]
 
 
 def predict_probabilities(
@@ -39,8 +108,7 @@ def predict_probabilities(
         Tuple of (p_pos, p_neg, p_neu)
     """
     model = model_artifacts['model']
-    cal_pos = model_artifacts['calibrator_pos']
-    cal_neg = model_artifacts['calibrator_neg']
+    tables = get_calibration_tables(model_artifacts)
     
     # Predict raw probabilities
     y_pred_proba = model.predict(X)
@@ -49,8 +117,8 @@ def predict_probabilities(
     p_pos_raw = y_pred_proba[:, 2]  # Class 2 = +1
     p_neg_raw = y_pred_proba[:, 0]  # Class 0 = -1
     
-    p_pos = cal_pos.predict(p_pos_raw)
-    p_neg = cal_neg.predict(p_neg_raw)
+    p_pos = np.interp(p_pos_raw, *tables['pos'])
+    p_neg = np.interp(p_neg_raw, *tables['neg'])
     
     # Ensure probabilities sum <= 1
     p_pos = np.clip(p_pos, 0, 1)
@@ -115,7 +183,7 @@ def compute_predictor_score(
         ts_alpha: EWMA alpha for time-series fallback
     
     Returns:
-        Tuple of (scores, flags)
+        Tuple of (scores, flag_bits)
     """
     n = len(p_pos)
     
@@ -124,12 +192,12 @@ def compute_predictor_score(
         # Cross-sectional z-score
         z_p = (p_pos - np.mean(p_pos)) / (np.std(p_pos) + 1e-9)
         z_ra = (RA - np.mean(RA)) / (np.std(RA) + 1e-9)
-        flags = [[] for _ in range(n)]
+        flags = np.zeros(n, dtype=np.int64)
     else:
         # Time-series fallback (EWMA z-score)
         z_p = ts_ewma_z(pd.Series(p_pos), alpha=ts_alpha).values
         z_ra = ts_ewma_z(pd.Series(RA), alpha=ts_alpha).values
-        flags = [['XSctnFallback'] for _ in range(n)]
+        flags = np.full(n, FLAG_XSCTN_FALLBACK, dtype=np.int64)
     
     # Map to points
     P_p = np.clip(50 + 15 * z_p, 0, 100)
@@ -154,8 +222,8 @@ def apply_gates(
     RA: np.ndarray,
     E_min: float,
     RA_min: float,
-    flags: list
-) -> Tuple[np.ndarray, list]:
+    flags: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
     """
     Apply amplitude gates
     
@@ -165,10 +233,10 @@ def apply_gates(
         RA: Risk-adjusted edge
         E_min: Minimum E threshold
         RA_min: Minimum RA threshold
-        flags: Existing flags list
+        flags: Existing flag bitmask per row
     
     Returns:
-        Tuple of (gated_scores, updated_flags)
+        Tuple of (gated_scores, updated_flag_bits)
     """
     # Check gates
     gate_pass = (E >= E_min) & (RA >= RA_min)
@@ -177,9 +245,7 @@ def apply_gates(
     gated_score = np.where(gate_pass, base_score, np.minimum(base_score, 49)).astype(int)
     
     # Update flags
-    for i in range(len(flags)):
-        if not gate_pass[i]:
-            flags[i].append('GateFail')
+    flags = np.asarray(flags, dtype=np.int64) | np.where(gate_pass, 0, FLAG_GATE_FAIL)
     
     return gated_score, flags
 
@@ -306,7 +372,7 @@ def run_inference(
     sb_cut, buy_cut = adjust_cuts_for_coverage(timing_bands, thresholds, config)
     
     # Build output DataFrame
-    output = df[['date', 'symbol', 'close', 'U', 'L']].copy()
+    output = df[OUTPUT_ID_COLS].copy()
     output['p_pos'] = p_pos
     output['p_neg'] = p_neg
     output['p_neu'] = p_neu
@@ -314,15 +380,132 @@ def run_inference(
     output['RA'] = RA
     output['predictor_score'] = gated_score
     output['timing_band'] = timing_bands
-    output['flags'] = [','.join(f) if f else '' for f in flags]
+    output['flags'] = decode_flags(flags)
     output['model_id'] = model_artifacts['model_id']
     
     return output
 
 
+def iter_feature_chunks(
+    features_path: Path,
+    columns: List[str]
+) -> Iterator[pd.DataFrame]:
+    """
+    Stream a feature Parquet file or partitioned dataset one date at a time
+    
+    Each chunk is one complete cross-section, so compute_predictor_score
+    (which normalizes across the rows it is given) scores every date the same
+    way however the file is laid out in row groups.
+    
+    The data is scanned once, so rows must be in ascending date order: a
+    file sorted by date (e.g. df.sort_values(['date', 'symbol']) before
+    to_parquet) or a hive dataset partitioned by date=YYYY-MM-DD/. A panel
+    sorted by symbol, as build_feature_frame returns it, is rejected.
+    
+    Args:
+        features_path: Parquet file or (hive-partitioned) dataset directory
+        columns: Columns to read (projection pushed down to Parquet)
+    
+    Yields:
+        DataFrame chunks, one per date in ascending order
+    
+    Raises:
+        ValueError: If rows are not in ascending date order
+    """
+    dataset = ds.dataset(str(features_path), format='parquet', partitioning='hive')
+    
+    pending = []  # Record batch slices of the current date
+    current = None
+    for batch in dataset.to_batches(columns=columns):
+        if not batch.num_rows:
+            continue
+        dates = batch.column(batch.schema.get_field_index('date'))
+        out_of_order = pc.any(pc.less(dates[1:], dates[:-1])).as_py()
+        if out_of_order or (current is not None and pc.less(dates[0], current).as_py()):
+            raise ValueError(
+                f"Feature rows in {features_path} are not in ascending date order; "
+                f"sort by date before writing or partition the dataset by date="
+            )
+        
+        changes = pc.not_equal(dates[1:], dates[:-1]).to_numpy(zero_copy_only=False)
+        starts = [0] + (np.flatnonzero(changes) + 1).tolist()
+        for start, end in zip(starts, starts[1:] + [batch.num_rows]):
+            if current is not None and dates[start] != current:
+                yield pa.Table.from_batches(pending).to_pandas()
+                pending = []
+            current = dates[start]
+            pending.append(batch.slice(start, end - start))
+    
+    if pending:
+        yield pa.Table.from_batches(pending).to_pandas()
+
+
+def run_inference_streaming(
+    features_path: Path,
+    model_artifacts: Dict,
+    output_dir: Path,
+    config: Dict = None
+) -> Dict:
+    """
+    Run inference chunk by chunk and append to a date-partitioned dataset
+    
+    Peak memory is bounded by the largest date rather than the full panel:
+    the features are read once, with column projection, and each date is
+    scored with run_inference and written out before the next date is read.
+    Features must be in date order (see iter_feature_chunks). Writing a
+    date replaces that date's partition, so reruns (over a shifted window or
+    with another model) never leave duplicate predictions behind.
+    
+    Args:
+        features_path: Feature Parquet file sorted by date, or dataset
+            directory partitioned by date=YYYY-MM-DD/
+        model_artifacts: Trained model artifacts
+        output_dir: Root of the partitioned predictions dataset (date=YYYY-MM-DD/)
+        config: Configuration (optional, will load if not provided)
+    
+    Returns:
+        Summary dict with chunk and row counts
+    """
+    if config is None:
+        config = load_config()
+    
+    get_calibration_tables(model_artifacts)
+    columns = list(dict.fromkeys(OUTPUT_ID_COLS + list(model_artifacts['feature_cols'])))
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    
+    n_chunks = 0
+    n_rows = 0
+    
+    for chunk in iter_feature_chunks(features_path, columns):
+        output = run_inference(chunk, model_artifacts, config)
+        output['date'] = pd.to_datetime(output['date']).dt.date
+        
+        pq.write_to_dataset(
+            pa.Table.from_pandas(output, preserve_index=False),
+            root_path=str(output_dir),
+            partition_cols=['date'],
+            basename_template="part-{i}.parquet",
+            existing_data_behavior='delete_matching'
+        )
+        
+        n_chunks += 1
+        n_rows += len(output)
+        del chunk, output
+    
+    return {
+        'chunks': n_chunks,
+        'rows': n_rows,
+        'output_dir': str(output_dir),
+        'model_id': model_artifacts['model_id']
+    }
+
+
 if __name__ == "__main__":
     print("Inference module loaded successfully")
     print("\nTo run inference:")
     print("  from predictor.infer import run_inference, load_model")
     print("  artifacts = load_model('path/to/model.pkl')")
     print("  results = run_inference(df, artifacts)")
+    print("\nTo stream a multi-year feature panel:")
+    print("  run_inference_streaming('features.parquet', artifacts, 'predictions/')")
@@ -9,11 +9,18 @@ import lightgbm as lgb
 from sklearn.model_selection import TimeSeriesSplit
 from sklearn.calibration import CalibratedClassifierCV
 from sklearn.isotonic import IsotonicRegression
+import hashlib
+import json
+import os
 import pickle
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from datetime import datetime
 import yaml
 
+from predictor.infer import compile_calibrator
+
 
 def load_config():
     """Load predictor configuration"""
@@ -31,14 +38,13 @@ def purged_walk_forward_cv(
     Purged walk-forward cross-validation
     
     Args:
-        df: DataFrame with date column
+        df: DataFrame with date column (sorted by date)
         n_splits: Number of CV folds
         embargo: Number of bars to skip after each training set
     
     Returns:
-        List of (train_idx, test_idx) tuples
+        List of (train_idx, test_idx) tuples of contiguous NumPy index ranges
     """
-    df = df.sort_values('date').reset_index(drop=True)
     n = len(df)
     
     fold_size = n // (n_splits + 1)
@@ -52,57 +58,171 @@ def purged_walk_forward_cv(
         if test_end <= test_start:
             break
         
-        train_idx = df.index[:train_end].tolist()
-        test_idx = df.index[test_start:test_end].tolist()
+        train_idx = np.arange(0, train_end)
+        test_idx = np.arange(test_start, test_end)
         
         folds.append((train_idx, test_idx))
     
     return folds
 
 
+def map_labels(y: np.ndarray) -> np.ndarray:
+    """Map labels (-1, 0, +1) to LightGBM classes (0, 1, 2)"""
+    return np.asarray(y, dtype=int) + 1
+
+
+def class_sample_weights(y: np.ndarray, config: dict) -> np.ndarray:
+    """Per-sample weights from config class weights"""
+    weights = config['model']['class_weights']
+    return np.array([weights['neg'], weights['neu'], weights['pos']])[map_labels(y)]
+
+
+def dataset_cache_key(X: pd.DataFrame, y: np.ndarray, config: dict) -> str:
+    """
+    SHA-256 key for a binned dataset
+    
+    Covers the float32 feature values, feature names, labels and the
+    LightGBM params (thread count excluded, it does not affect binning).
+    """
+    params = {
+        k: v for k, v in config['model']['lgbm_params'].items()
+        if k not in ('num_threads', 'n_jobs')
+    }
+    h = hashlib.sha256()
+    h.update(json.dumps(list(X.columns)).encode())
+    h.update(json.dumps(params, sort_keys=True, default=str).encode())
+    h.update(np.ascontiguousarray(X.to_numpy(dtype=np.float32)).tobytes())
+    h.update(np.ascontiguousarray(np.asarray(y, dtype=np.int8)).tobytes())
+    return h.hexdigest()
+
+
+def load_or_build_dataset(
+    X: pd.DataFrame,
+    y: np.ndarray,
+    config: dict,
+    cache_dir: Path
+) -> tuple:
+    """
+    Bin the full feature matrix once and cache it as a LightGBM binary file
+    
+    The cache file is keyed by dataset_cache_key, so retraining on unchanged
+    features loads the binned dataset directly and skips feature binning.
+    
+    Args:
+        X: Full feature matrix
+        y: Labels (-1, 0, +1)
+        config: Model configuration
+        cache_dir: Directory holding cached .bin datasets
+    
+    Returns:
+        Tuple of (constructed lgb.Dataset, cache file path)
+    """
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    cache_path = cache_dir / f"lgbm_{dataset_cache_key(X, y, config)}.bin"
+    params = config['model']['lgbm_params'].copy()
+    
+    if cache_path.exists():
+        print(f"  Dataset cache hit: {cache_path.name}")
+        dataset = lgb.Dataset(str(cache_path), params=params).construct()
+        return dataset, cache_path
+    
+    print(f"  Dataset cache miss, binning {X.shape[0]} x {X.shape[1]} features")
+    dataset = lgb.Dataset(
+        X,
+        label=map_labels(y),
+        params=params,
+        free_raw_data=True
+    ).construct()
+    
+    # Write to a temp name first so readers never see a partial file
+    tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+    dataset.save_binary(str(tmp_path))
+    os.replace(tmp_path, cache_path)
+    
+    return dataset, cache_path
+
+
+def train_lgbm_fold(
+    full_data: lgb.Dataset,
+    y: np.ndarray,
+    train_idx: np.ndarray,
+    test_idx: np.ndarray,
+    config: dict
+) -> lgb.Booster:
+    """
+    Train LightGBM multiclass model on subsets of a pre-binned dataset
+    
+    Args:
+        full_data: Constructed dataset covering all rows
+        y: Labels (-1, 0, +1) for all rows
+        train_idx: Training row indices
+        test_idx: Validation row indices
+        config: Model configuration
+    
+    Returns:
+        Trained LightGBM model
+    """
+    train_data = full_data.subset(np.asarray(train_idx, dtype=np.int32)).construct()
+    train_data.set_weight(class_sample_weights(y[train_idx], config))
+    
+    val_data = full_data.subset(np.asarray(test_idx, dtype=np.int32))
+    
+    params = config['model']['lgbm_params'].copy()
+    
+    model = lgb.train(
+        params,
+        train_data,
+        num_boost_round=300,
+        valid_sets=[val_data],
+        callbacks=[lgb.early_stopping(stopping_rounds=20, verbose=False)]
+    )
+    
+    return model
+
+
 def train_lgbm_model(
     X_train: pd.DataFrame,
     y_train: np.ndarray,
     X_val: pd.DataFrame,
     y_val: np.ndarray,
-    config: dict
+    config: dict,
+    feature_name='auto'
 ) -> lgb.Booster:
     """
     Train LightGBM multiclass model
     
     Args:
-        X_train: Training features
+        X_train: Training features (DataFrame or 2-D array)
         y_train: Training labels (-1, 0, +1)
         X_val: Validation features
         y_val: Validation labels
         config: Model configuration
+        feature_name: Feature names when X is a plain array
     
     Returns:
         Trained LightGBM model
     """
     # Map labels to 0, 1, 2 for LightGBM
-    label_map = {-1: 0, 0: 1, 1: 2}
-    y_train_mapped = np.array([label_map[y] for y in y_train])
-    y_val_mapped = np.array([label_map[y] for y in y_val])
+    y_train_mapped = map_labels(y_train)
+    y_val_mapped = map_labels(y_val)
     
     # Class weights
-    weights = config['model']['class_weights']
-    sample_weights = np.array([
-        weights['neg'] if y == -1 else weights['neu'] if y == 0 else weights['pos']
-        for y in y_train
-    ])
+    sample_weights = class_sample_weights(y_train, config)
     
     # Create datasets
     train_data = lgb.Dataset(
         X_train,
         label=y_train_mapped,
-        weight=sample_weights
+        weight=sample_weights,
+        feature_name=feature_name
     )
     
     val_data = lgb.Dataset(
         X_val,
         label=y_val_mapped,
-        reference=train_data
+        reference=train_data,
+        feature_name=feature_name
     )
     
     # Train model
@@ -119,6 +239,120 @@ def train_lgbm_model(
     return model
 
 
+def _fold_bounds(idx: np.ndarray) -> tuple:
+    """Return (start, stop) of a contiguous index range"""
+    return int(idx[0]), int(idx[-1]) + 1
+
+
+def _train_fold_worker(task: dict) -> tuple:
+    """
+    Train one CV fold in a worker process
+    
+    The feature matrix and labels are opened as read-only memory maps, so
+    contiguous fold slices are views into the shared file rather than copies.
+    When a cached binary dataset is given, folds subset it instead of re-binning.
+    
+    Args:
+        task: Fold description (memmap paths, fold bounds, config, feature names)
+    
+    Returns:
+        Tuple of (fold_idx, model, test_probabilities)
+    """
+    X = np.load(task['X_path'], mmap_mode='r')
+    y = np.load(task['y_path'], mmap_mode='r')
+    
+    train_start, train_stop = task['train_bounds']
+    test_start, test_stop = task['test_bounds']
+    
+    X_train, y_train = X[train_start:train_stop], np.asarray(y[train_start:train_stop])
+    X_test, y_test = X[test_start:test_stop], np.asarray(y[test_start:test_stop])
+    
+    if task.get('dataset_path'):
+        params = task['config']['model']['lgbm_params'].copy()
+        full_data = lgb.Dataset(task['dataset_path'], params=params).construct()
+        model = train_lgbm_fold(
+            full_data, np.asarray(y),
+            np.arange(train_start, train_stop),
+            np.arange(test_start, test_stop),
+            task['config']
+        )
+    else:
+        model = train_lgbm_model(
+            X_train, y_train, X_test, y_test,
+            task['config'],
+            feature_name=task['feature_cols']
+        )
+    y_pred_proba = model.predict(X_test)
+    
+    return task['fold_idx'], model, y_pred_proba
+
+
+def train_folds_parallel(
+    X: pd.DataFrame,
+    y: np.ndarray,
+    folds: list,
+    config: dict,
+    n_jobs: int,
+    dataset_path: Path = None
+) -> list:
+    """
+    Train CV folds concurrently in worker processes
+    
+    X is written once as a float32 memory-mapped .npy file that every worker
+    maps read-only. LightGBM threads are split so that workers x threads
+    matches the available cores.
+    
+    Args:
+        X: Feature matrix
+        y: Labels (-1, 0, +1)
+        folds: List of (train_idx, test_idx) contiguous index ranges
+        config: Model configuration
+        n_jobs: Number of worker processes
+        dataset_path: Optional cached LightGBM binary dataset for all rows
+    
+    Returns:
+        List of (model, test_probabilities) in fold order
+    """
+    n_workers = max(1, min(n_jobs, len(folds)))
+    n_threads = max(1, (os.cpu_count() or 1) // n_workers)
+    
+    fold_config = dict(config)
+    fold_config['model'] = dict(config['model'])
+    fold_config['model']['lgbm_params'] = dict(config['model']['lgbm_params'], num_threads=n_threads)
+    
+    with tempfile.TemporaryDirectory(prefix='greyoak_cv_') as tmp_dir:
+        X_path = os.path.join(tmp_dir, 'X.npy')
+        y_path = os.path.join(tmp_dir, 'y.npy')
+        
+        X_mm = np.lib.format.open_memmap(X_path, mode='w+', dtype=np.float32, shape=X.shape)
+        X_mm[:] = X.to_numpy(dtype=np.float32)
+        X_mm.flush()
+        del X_mm
+        np.save(y_path, np.asarray(y))
+        
+        tasks = [
+            {
+                'fold_idx': fold_idx,
+                'X_path': X_path,
+                'y_path': y_path,
+                'train_bounds': _fold_bounds(train_idx),
+                'test_bounds': _fold_bounds(test_idx),
+                'config': fold_config,
+                'feature_cols': list(X.columns),
+                'dataset_path': str(dataset_path) if dataset_path else None,
+            }
+            for fold_idx, (train_idx, test_idx) in enumerate(folds)
+        ]
+        
+        print(f"  Workers: {n_workers} x {n_threads} LightGBM threads")
+        results = [None] * len(folds)
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            for fold_idx, model, y_pred_proba in executor.map(_train_fold_worker, tasks):
+                results[fold_idx] = (model, y_pred_proba)
+    
+    return results
+
+
 def isotonic_calibration(
     y_true: np.ndarray,
     y_pred_proba: np.ndarray
@@ -150,16 +384,21 @@ def train_predictor_model(
     df: pd.DataFrame,
     feature_cols: list,
     save_dir: Path,
-    model_id: str = None
+    model_id: str = None,
+    n_jobs: int = None,
+    cache_dir: Path = None
 ) -> dict:
     """
     Full training pipeline with CV and calibration
     
     Args:
-        df: DataFrame with features and labels
+        df: DataFrame with features and labels (sorted by date)
         feature_cols: List of feature column names
         save_dir: Directory to save model artifacts
         model_id: Optional model identifier
+        n_jobs: Folds trained concurrently (default: model.cv.n_jobs, 1 = sequential)
+        cache_dir: Binned dataset cache directory (default: model.dataset_cache_dir,
+            None disables the cache)
     
     Returns:
         Dictionary with model, calibrators, and metadata
@@ -189,6 +428,22 @@ def train_predictor_model(
     oof_probs = np.zeros((len(df), 3))
     oof_probs[:] = np.nan
     
+    if n_jobs is None:
+        n_jobs = config['model']['cv'].get('n_jobs', 1)
+    
+    if cache_dir is None:
+        cache_dir = config['model'].get('dataset_cache_dir')
+    
+    # Bin the full matrix once; folds are built as subsets of it
+    full_data, dataset_path = None, None
+    if cache_dir:
+        full_data, dataset_path = load_or_build_dataset(X, y, config, cache_dir)
+    
+    if n_jobs > 1 and len(folds) > 1:
+        fold_results = train_folds_parallel(X, y, folds, config, n_jobs, dataset_path=dataset_path)
+    else:
+        fold_results = None
+    
     models = []
     
     for fold_idx, (train_idx, test_idx) in enumerate(folds):
@@ -196,15 +451,24 @@ def train_predictor_model(
         print(f"  Train: {len(train_idx)} samples")
         print(f"  Test:  {len(test_idx)} samples")
         
-        X_train, y_train = X.iloc[train_idx], y[train_idx]
-        X_test, y_test = X.iloc[test_idx], y[test_idx]
+        y_test = y[test_idx]
+        
+        if fold_results is not None:
+            model, y_pred_proba = fold_results[fold_idx]
+        else:
+            X_test = X.iloc[test_idx]
+            
+            # Train model
+            if full_data is not None:
+                model = train_lgbm_fold(full_data, y, train_idx, test_idx, config)
+            else:
+                X_train, y_train = X.iloc[train_idx], y[train_idx]
+                model = train_lgbm_model(X_train, y_train, X_test, y_test, config)
+            y_pred_proba = model.predict(X_test)
         
-        # Train model
-        model = train_lgbm_model(X_train, y_train, X_test, y_test, config)
         models.append(model)
         
         # OOF predictions
-        y_pred_proba = model.predict(X_test)
         oof_probs[test_idx] = y_pred_proba
         
         # Metrics
@@ -236,6 +500,10 @@ def train_predictor_model(
         'model': final_model,
         'calibrator_pos': cal_pos,
         'calibrator_neg': cal_neg,
+        'calibration_tables': {
+            'pos': compile_calibrator(cal_pos),
+            'neg': compile_calibrator(cal_neg),
+        },
         'feature_cols': feature_cols,
         'model_id': model_id,
         'config': config,
@@ -0,0 +1,73 @@
+"""API tests for routing score reads through the async (asyncpg) driver."""
+
+import pytest
+from fastapi.testclient import TestClient
+
+import greyoak_score.api.routes as routes
+from greyoak_score.api.main import app
+from greyoak_score.data.async_persistence import PoolTimeout
+
+
+class FakeAsyncDatabase:
+    """Coroutine versions of the page methods, like AsyncScoreDatabase."""
+
+    def __init__(self, make_score_output):
+        self.make = make_score_output
+        self.calls = []
+        self.fail = False
+
+    async def get_scores_by_ticker_page(self, ticker, start_date, end_date, mode, limit, cursor, raw=False):
+        self.calls.append(('ticker', ticker))
+        if self.fail:
+            raise PoolTimeout("connection pool exhausted")
+        return [routes._score_response(self.make(ticker=ticker)).model_dump()], None
+
+    async def get_scores_by_band_page(self, band, date, mode, limit, cursor, raw=False):
+        self.calls.append(('band', band))
+        return [routes._score_response(self.make(ticker="TCS.NS", band=band)).model_dump()], None
+
+    async def get_latest_scores_page(self, mode, limit, cursor, raw=False):
+        self.calls.append(('latest', mode))
+        return [routes._score_response(self.make(ticker="TCS.NS", mode=mode)).model_dump()], None
+
+
+@pytest.fixture
+def async_client(monkeypatch, make_score_output):
+    db = FakeAsyncDatabase(make_score_output)
+
+    async def get_async_database():
+        return db
+
+    def no_sync_database():
+        raise AssertionError("sync driver used while DB_DRIVER=asyncpg")
+
+    monkeypatch.setattr(routes, 'USE_ASYNC_DB', True)
+    monkeypatch.setattr(routes, 'get_async_database', get_async_database)
+    monkeypatch.setattr(routes, 'get_db_instance', no_sync_database)
+    routes.response_cache.clear()
+    yield TestClient(app), db
+    routes.response_cache.clear()
+
+
+def test_reads_use_async_database(async_client):
+    client, db = async_client
+
+    history = client.get("/api/v1/scores/TCS.NS")
+    band = client.get("/api/v1/scores/band/Buy", params={"date": "2024-10-08", "mode": "Trader"})
+    latest = client.get("/api/v1/scores/latest", params={"mode": "Investor"})
+
+    assert history.status_code == band.status_code == latest.status_code == 200
+    assert history.json()[0]["ticker"] == "TCS.NS"
+    assert band.json()["statistics"]["count"] == 1
+    assert latest.json()["mode"] == "Investor"
+    assert db.calls == [('ticker', "TCS.NS"), ('band', "Buy"), ('latest', "Investor")]
+
+
+def test_async_pool_timeout_is_database_error(async_client):
+    client, db = async_client
+    db.fail = True
+
+    response = client.get("/api/v1/scores/TCS.NS")
+
+    assert response.status_code == 500
+    assert "Database error" in response.json()["message"]
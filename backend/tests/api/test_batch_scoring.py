@@ -0,0 +1,97 @@
+"""API tests for POST /calculate/batch."""
+
+import pytest
+
+import greyoak_score.api.routes as routes
+
+
+class FakeBatchDatabase:
+    """Records multi-row writes."""
+
+    def __init__(self, fail=False):
+        self.batches = []
+        self.fail = fail
+
+    def save_scores_batch(self, scores, page_size=500):
+        if self.fail:
+            raise RuntimeError("database unavailable")
+        self.batches.append(list(scores))
+        return len(scores)
+
+
+@pytest.fixture
+def batch_client(api_client, monkeypatch):
+    monkeypatch.setattr(routes, '_persist_score', lambda score_result: True)
+    yield api_client(FakeBatchDatabase())
+    routes.shutdown_scoring_executor()
+
+
+def test_batch_scores_all_tickers_with_one_write(batch_client):
+    client, db = batch_client
+    payload = {"tickers": ["RELIANCE.NS", "TCS.NS", "INFY.NS", "tcs.ns"], "date": "2024-10-08", "mode": "Trader"}
+
+    response = client.post("/api/v1/calculate/batch", json=payload)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert [r["ticker"] for r in body["results"]] == ["RELIANCE.NS", "TCS.NS", "INFY.NS"]
+    assert body["summary"] == {"requested": 3, "successful": 3, "failed": 0, "persisted": 3}
+    assert len(db.batches) == 1 and len(db.batches[0]) == 3
+    stats = body["statistics"]
+    assert stats["min_score"] <= stats["avg_score"] <= stats["max_score"]
+    assert sum(stats["bands"].values()) == 3
+    assert {"score", "persist", "total"} <= {
+        part.split(';')[0].strip() for part in response.headers["server-timing"].split(',')
+    }
+
+
+def test_batch_matches_single_calculation(batch_client):
+    client, _ = batch_client
+    single = client.post("/api/v1/calculate", json={"ticker": "TCS.NS", "date": "2024-10-08", "mode": "Investor"})
+    batch = client.post("/api/v1/calculate/batch", json={"tickers": ["TCS.NS"], "date": "2024-10-08", "mode": "Investor"})
+
+    assert batch.json()["results"][0] == single.json()
+
+
+def test_batch_reports_per_ticker_failures(batch_client, monkeypatch):
+    client, db = batch_client
+    compute = routes._compute_score
+
+    def flaky_compute(score_request, scoring_date):
+        if score_request.ticker == "INFY.NS":
+            raise ValueError("No price data")
+        return compute(score_request, scoring_date)
+
+    monkeypatch.setattr(routes, '_compute_score', flaky_compute)
+    payload = {"tickers": ["TCS.NS", "INFY.NS", "BAD!"], "date": "2024-10-08", "mode": "Trader"}
+
+    body = client.post("/api/v1/calculate/batch", json=payload).json()
+
+    assert [r["ticker"] for r in body["results"]] == ["TCS.NS"]
+    assert body["errors"] == [
+        {"ticker": "INFY.NS", "error": "No price data"},
+        {"ticker": "BAD!", "error": "Invalid ticker format"},
+    ]
+    assert body["summary"]["failed"] == 2
+    assert [s.ticker for s in db.batches[0]] == ["TCS.NS"]
+
+
+def test_batch_survives_persistence_failure(batch_client):
+    client, db = batch_client
+    db.fail = True
+
+    body = client.post("/api/v1/calculate/batch",
+                       json={"tickers": ["TCS.NS"], "date": "2024-10-08", "mode": "Trader"}).json()
+
+    assert body["summary"]["successful"] == 1
+    assert body["summary"]["persisted"] == 0
+
+
+def test_batch_rejects_bad_date(batch_client):
+    client, db = batch_client
+
+    response = client.post("/api/v1/calculate/batch",
+                           json={"tickers": ["TCS.NS"], "date": "08-10-2024", "mode": "Trader"})
+
+    assert response.status_code == 400
+    assert db.batches == []
@@ -0,0 +1,63 @@
+"""API tests for the health snapshot and metrics endpoints."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+import greyoak_score.api.routes as routes
+from greyoak_score.api.main import app
+from greyoak_score.data.health_monitor import DatabaseHealthMonitor
+
+
+def test_metrics_endpoint_reports_pool_and_cache(monkeypatch, pooled_db):
+    db, _ = pooled_db
+    monkeypatch.setattr(routes, 'get_db_instance', lambda: db)
+
+    body = TestClient(app).get("/api/v1/metrics").json()
+
+    pool = body["database_pool"]
+    assert pool["capacity"] == db.max_conn
+    assert {"in_use", "idle", "checkout_wait_ms", "checkout_failures", "retries", "queries"} <= set(pool)
+    assert "hit_ratio" in body["response_cache"]
+    assert set(body["request_coalescing"]) == {"score", "ticker_history"}
+    assert "hit_ratio" in body["request_coalescing"]["score"]
+    assert "pending" in body["write_queue"]
+
+
+def test_health_includes_live_pool_stats(monkeypatch, pooled_db):
+    db, _ = pooled_db
+    monkeypatch.setattr(routes, 'get_db_instance', lambda: db)
+    monitor = DatabaseHealthMonitor(db_factory=lambda: db, interval=60)
+    monkeypatch.setattr(routes, 'get_health_monitor', lambda: monitor)
+
+    body = TestClient(app).get("/api/v1/health").json()
+
+    assert body["components"]["database"]["pool"]["checkouts"] >= 1
+
+
+class TestHealthEndpoint:
+    """GET /api/v1/health serves the monitor snapshot."""
+
+    @pytest.fixture
+    def client(self, monkeypatch):
+        db = MagicMock()
+        db.test_connection.return_value = True
+        db.get_database_stats_estimated.return_value = {'total_scores': 1000, 'estimated': True}
+        db.get_pool_stats.return_value = {'in_use': 0}
+        monitor = DatabaseHealthMonitor(db_factory=lambda: db, interval=60)
+        monkeypatch.setattr(routes, 'get_health_monitor', lambda: monitor)
+        monkeypatch.setattr(routes, 'get_db_instance', lambda: db)
+        return TestClient(app), db
+
+    def test_repeated_probes_do_not_query_database(self, client):
+        test_client, db = client
+
+        bodies = [test_client.get("/api/v1/health").json() for _ in range(5)]
+
+        assert db.test_connection.call_count == 1
+        assert db.get_database_stats_estimated.call_count == 1
+        database = bodies[-1]["components"]["database"]
+        assert database["status"] == "healthy"
+        assert database["stats"]["estimated"] is True
+        assert database["age_seconds"] >= 0 and database["checked_at"]
@@ -0,0 +1,126 @@
+"""Tests for POST /api/v1/portfolio/analyze (weighted portfolio aggregation)."""
+
+from datetime import date
+
+import pytest
+
+import greyoak_score.api.routes as routes
+from greyoak_score.data.persistence import _notify_saved
+
+
+def score_row(ticker, score, band, risk_penalty):
+    """Score dict as ScoreDatabase.get_scores_for_tickers returns it."""
+    return {
+        'ticker': ticker, 'date': "2024-10-08", 'mode': "Investor",
+        'score': score, 'band': band,
+        'pillars': {'F': score, 'T': score, 'R': score, 'O': score, 'Q': score, 'S': score},
+        'risk_penalty': risk_penalty, 'guardrail_flags': [],
+        'confidence': 0.9, 's_z': 0.4,
+        'as_of': "2024-10-08T10:30:00+00:00", 'config_hash': "abc123",
+    }
+
+
+class PortfolioDatabase:
+    """Serves stored scores by ticker and records bulk lookups."""
+
+    def __init__(self):
+        self.calls = []
+        self.rows = {
+            "TCS.NS": score_row("TCS.NS", 80.0, "Strong Buy", 1.0),
+            "INFY.NS": score_row("INFY.NS", 60.0, "Hold", 4.0),
+        }
+
+    def get_scores_for_tickers(self, tickers, mode, date=None):
+        self.calls.append((tuple(tickers), mode, date))
+        return [self.rows[t] for t in tickers if t in self.rows]
+
+
+@pytest.fixture
+def client(api_client):
+    return api_client(PortfolioDatabase())
+
+
+def test_analyzes_portfolio_from_one_bulk_fetch(client):
+    test_client, db = client
+    payload = {"tickers": ["tcs.ns", "INFY.NS"], "weights": [0.75, 0.25], "mode": "Investor"}
+
+    response = test_client.post("/api/v1/portfolio/analyze", json=payload)
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body['portfolio']['score'] == 75.0
+    assert body['portfolio']['pillar_exposures']['F'] == 75.0
+    assert body['portfolio']['risk_penalty'] == 1.75
+    assert body['portfolio']['band_mix'] == {"Strong Buy": 0.75, "Buy": 0.0, "Hold": 0.25, "Avoid": 0.0}
+    assert [h['ticker'] for h in body['holdings']] == ["INFY.NS", "TCS.NS"]
+    assert db.calls == [(("TCS.NS", "INFY.NS"), "Investor", None)]
+
+
+def test_reweighting_and_scenarios_reuse_the_fetched_scores(client):
+    test_client, db = client
+    payload = {"tickers": ["TCS.NS", "INFY.NS"], "weights": [0.5, 0.5], "mode": "Investor",
+               "scenarios": {"tilt": [0.9, 0.1]}}
+
+    first = test_client.post("/api/v1/portfolio/analyze", json=payload).json()
+    second = test_client.post("/api/v1/portfolio/analyze",
+                              json={**payload, "weights": [0.9, 0.1], "scenarios": {}}).json()
+
+    assert first['scenarios']['tilt'] == second['portfolio']
+    assert len(db.calls) == 1
+
+
+def test_holdings_are_cached_outside_the_response_cache(client):
+    test_client, _ = client
+    payload = {"tickers": ["TCS.NS"], "weights": [1.0], "mode": "Investor"}
+
+    test_client.post("/api/v1/portfolio/analyze", json=payload)
+
+    entry = routes.portfolio_cache.get(('portfolio', ("TCS.NS",), None, "Investor"))
+    assert entry is not None and entry.etag is None
+    assert routes.response_cache.get_stats()['size'] == 0
+
+
+def test_saved_scores_invalidate_cached_holdings(client):
+    test_client, db = client
+    payload = {"tickers": ["TCS.NS"], "weights": [1.0], "mode": "Investor", "date": "2024-10-08"}
+    test_client.post("/api/v1/portfolio/analyze", json=payload)
+
+    db.rows["TCS.NS"] = score_row("TCS.NS", 50.0, "Hold", 2.0)
+    _notify_saved({(date(2024, 10, 8), "Investor")})
+
+    response = test_client.post("/api/v1/portfolio/analyze", json=payload)
+    assert response.json()['portfolio']['score'] == 50.0
+    assert [call[2] for call in db.calls] == [date(2024, 10, 8)] * 2
+
+
+def test_missing_tickers_are_reported(client):
+    test_client, _ = client
+    payload = {"tickers": ["TCS.NS", "WIPRO.NS"], "weights": [0.5, 0.5], "mode": "Investor"}
+
+    body = test_client.post("/api/v1/portfolio/analyze", json=payload).json()
+
+    assert body['missing'] == ["WIPRO.NS"]
+    assert body['portfolio']['coverage'] == 0.5
+    assert body['portfolio']['score'] == 80.0
+
+
+def test_portfolio_without_scores_returns_404(client):
+    test_client, _ = client
+    payload = {"tickers": ["WIPRO.NS"], "weights": [1.0], "mode": "Investor"}
+
+    assert test_client.post("/api/v1/portfolio/analyze", json=payload).status_code == 404
+
+
+@pytest.mark.parametrize("payload, status", [
+    ({"tickers": ["TCS.NS", "INFY.NS"], "weights": [1.0], "mode": "Investor"}, 400),
+    ({"tickers": ["TCS.NS"], "weights": [1.0], "mode": "Investor", "scenarios": {"bad": [0.5, 0.5]}}, 400),
+    ({"tickers": ["TCS.NS"], "weights": [1.0], "mode": "Investor", "date": "08-10-2024"}, 400),
+    ({"tickers": ["BAD TICKER"], "weights": [1.0], "mode": "Investor"}, 400),
+    ({"tickers": ["TCS.NS", "INFY.NS"], "weights": [0.7, 0.7], "mode": "Investor"}, 422),
+    ({"tickers": ["TCS.NS", "tcs.ns"], "weights": [0.5, 0.5], "mode": "Investor"}, 422),
+])
+def test_invalid_requests_are_rejected(client, payload, status):
+    test_client, db = client
+
+    assert test_client.post("/api/v1/portfolio/analyze", json=payload).status_code == status
+    assert db.calls == []
@@ -0,0 +1,113 @@
+"""Tests for the indexed, hot-reloading predictor predictions store."""
+
+import os
+import threading
+import time
+
+import pandas as pd
+import pytest
+
+from api.predictions_store import PredictionsStore
+
+
+def _write_predictions(path, rows):
+    df = pd.DataFrame(rows, columns=['date', 'symbol', 'p_pos', 'E', 'RA',
+                                     'predictor_score', 'timing_band', 'flags', 'model_id'])
+    df['date'] = pd.to_datetime(df['date'])
+    df.to_parquet(path, index=False)
+
+
+def _bump_mtime(path, seconds=10):
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + seconds * 1_000_000_000))
+
+
+@pytest.fixture
+def predictions_file(tmp_path):
+    path = tmp_path / "predictor_predictions.parquet"
+    _write_predictions(path, [
+        ('2022-12-05', 'TCS', 0.40, 0.01, 0.3, 55, 'TimingHold', '', 'm1'),
+        ('2022-12-01', 'TCS', 0.30, 0.00, 0.1, 45, 'TimingHold', 'GateFail', 'm1'),
+        ('2022-12-05', 'INFY', 0.70, 0.02, 0.5, 72, 'TimingBuy', '', 'm1'),
+        ('2022-12-05', 'LTTS', 0.20, -0.01, -0.2, 30, 'TimingAvoid', 'GateFail', 'm1'),
+    ])
+    return path
+
+
+class TestPredictionsSnapshot:
+    """Indexed lookups over the loaded snapshot."""
+
+    def test_latest_is_most_recent_date(self, predictions_file):
+        store = PredictionsStore(predictions_file)
+        row = store.snapshot().latest('TCS')
+        assert row['date'] == pd.Timestamp('2022-12-05')
+        assert row['predictor_score'] == 55
+
+    def test_lookup_is_case_insensitive(self, predictions_file):
+        store = PredictionsStore(predictions_file)
+        assert store.snapshot().latest('infy')['symbol'] == 'INFY'
+
+    def test_missing_ticker_returns_none(self, predictions_file):
+        store = PredictionsStore(predictions_file)
+        snapshot = store.snapshot()
+        assert snapshot.latest('NOPE') is None
+        assert snapshot.history('NOPE').empty
+
+    def test_history_is_contiguous_and_date_ordered(self, predictions_file):
+        store = PredictionsStore(predictions_file)
+        history = store.snapshot().history('TCS')
+        assert list(history['date']) == [pd.Timestamp('2022-12-01'), pd.Timestamp('2022-12-05')]
+
+    def test_column_projection(self, predictions_file):
+        store = PredictionsStore(predictions_file)
+        assert 'model_id' not in store.frame().columns
+
+    def test_missing_file_returns_none(self, tmp_path):
+        store = PredictionsStore(tmp_path / "missing.parquet")
+        assert store.snapshot() is None
+
+
+class TestHotReload:
+    """Reloads on mtime change without blocking readers."""
+
+    def _wait_for(self, predicate, timeout=5.0):
+        deadline = time.time() + timeout
+        while time.time() < deadline:
+            if predicate():
+                return True
+            time.sleep(0.01)
+        return False
+
+    def test_reload_on_mtime_change(self, predictions_file):
+        store = PredictionsStore(predictions_file, check_interval=0)
+        assert store.snapshot().latest('NEWCO') is None
+
+        _write_predictions(predictions_file, [
+            ('2022-12-06', 'NEWCO', 0.9, 0.03, 0.6, 88, 'TimingSB', '', 'm2'),
+        ])
+        _bump_mtime(predictions_file)
+
+        assert self._wait_for(lambda: store.snapshot().latest('NEWCO') is not None)
+
+    def test_readers_get_old_snapshot_while_reloading(self, predictions_file, monkeypatch):
+        store = PredictionsStore(predictions_file, check_interval=0)
+        original = store.snapshot()
+
+        release = threading.Event()
+        build = store._build_snapshot
+
+        def slow_build(mtime_ns):
+            release.wait(timeout=5)
+            return build(mtime_ns)
+
+        monkeypatch.setattr(store, '_build_snapshot', slow_build)
+        _bump_mtime(predictions_file)
+
+        # Reload is in flight; readers keep getting the old snapshot immediately
+        start = time.perf_counter()
+        for _ in range(10):
+            assert store.snapshot() is original
+        assert time.perf_counter() - start < 1.0
+
+        release.set()
+        assert self._wait_for(lambda: store.snapshot() is not original)
@@ -0,0 +1,78 @@
+"""Thundering-herd tests: identical concurrent requests do the backend work once."""
+
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+import greyoak_score.api.routes as routes
+from greyoak_score.api.main import app
+from greyoak_score.api.singleflight import SingleFlight
+
+HERD_SIZE = 50
+
+
+@pytest.fixture
+def herd(monkeypatch):
+    """Fresh coalescing counters, no rate limit and no database writes."""
+    monkeypatch.setattr(routes, 'score_flights', SingleFlight('score'))
+    monkeypatch.setattr(routes, 'history_flights', SingleFlight('ticker_history'))
+    monkeypatch.setattr(routes.limiter, 'enabled', False)
+    monkeypatch.setattr(routes, '_persist_score', lambda score_result: True)
+    yield
+    routes.shutdown_scoring_executor()
+
+
+async def _stampede(method: str, url: str, **kwargs):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await asyncio.gather(
+            *(client.request(method, url, **kwargs) for _ in range(HERD_SIZE))
+        )
+
+
+def test_score_herd_computes_once(herd, monkeypatch):
+    compute = routes._compute_score
+    calls = []
+    lock = threading.Lock()
+
+    def counted_compute(score_request, scoring_date):
+        with lock:
+            calls.append(score_request.ticker)
+        time.sleep(0.1)
+        return compute(score_request, scoring_date)
+
+    monkeypatch.setattr(routes, '_compute_score', counted_compute)
+    payload = {"ticker": "RELIANCE.NS", "date": "2024-10-08", "mode": "Trader"}
+
+    responses = asyncio.run(_stampede("POST", "/api/v1/calculate", json=payload))
+
+    assert all(r.status_code == 200 for r in responses)
+    assert len({r.json()["score"] for r in responses}) == 1
+    assert calls == ["RELIANCE.NS"]
+    stats = routes.score_flights.get_stats()
+    assert stats['leaders'] == 1
+    assert stats['coalesced'] == HERD_SIZE - 1
+    assert sum('coalesced;dur=' in r.headers['server-timing'] for r in responses) == HERD_SIZE - 1
+
+
+def test_history_herd_queries_once(herd, monkeypatch, make_score_output):
+    calls = []
+
+    class SlowDatabase:
+        def get_scores_by_ticker_page(self, ticker, start_date, end_date, mode, limit, cursor, raw=False):
+            calls.append(ticker)
+            time.sleep(0.1)
+            return [routes._score_response(make_score_output(ticker=ticker)).model_dump()], None
+
+    db = SlowDatabase()
+    monkeypatch.setattr(routes, 'get_db_instance', lambda: db)
+
+    responses = asyncio.run(_stampede("GET", "/api/v1/scores/TCS.NS", params={"mode": "Trader"}))
+
+    assert all(r.status_code == 200 for r in responses)
+    assert calls == ["TCS.NS"]
+    assert routes.history_flights.get_stats()['hit_ratio'] == round((HERD_SIZE - 1) / HERD_SIZE, 4)
+
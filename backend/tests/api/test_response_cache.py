@@ -0,0 +1,131 @@
+"""Tests for the read-through response cache and ETag revalidation."""
+
+import time
+from datetime import date
+
+import pytest
+
+import greyoak_score.api.routes as routes
+from greyoak_score.api.cache import ResponseCache, etag_matches
+from greyoak_score.data.persistence import _notify_saved
+
+
+class TestResponseCache:
+    """TTL, LRU and invalidation behaviour."""
+
+    def test_entries_expire_after_ttl(self):
+        cache = ResponseCache(max_entries=10, ttl_seconds=0.05)
+        cache.put('k', {'v': 1}, date=date(2024, 10, 8), mode='Trader')
+        assert cache.get('k') is not None
+        time.sleep(0.06)
+        assert cache.get('k') is None
+
+    def test_least_recently_used_is_evicted(self):
+        cache = ResponseCache(max_entries=2, ttl_seconds=60)
+        for key in ('a', 'b'):
+            cache.put(key, key, date=date(2024, 10, 8), mode='Trader')
+        cache.get('a')
+        cache.put('c', 'c', date=date(2024, 10, 8), mode='Trader')
+
+        assert cache.get('b') is None
+        assert cache.get('a') is not None and cache.get('c') is not None
+        assert cache.get_stats()['evictions'] == 1
+
+    def test_internal_values_skip_the_etag(self):
+        cache = ResponseCache(max_entries=10, ttl_seconds=60)
+
+        entry = cache.put('holdings', object(), date=date(2024, 10, 8), mode='Trader', etag=False)
+
+        assert entry.etag is None
+        assert cache.get('holdings') is entry
+
+    def test_invalidate_matches_date_mode_and_latest(self):
+        cache = ResponseCache(max_entries=10, ttl_seconds=60)
+        cache.put('day8', 1, date=date(2024, 10, 8), mode='Trader')
+        cache.put('day7', 2, date=date(2024, 10, 7), mode='Trader')
+        cache.put('investor', 3, date=date(2024, 10, 8), mode='Investor')
+        cache.put('latest', 4, date=None, mode='Trader')
+
+        removed = cache.invalidate({(date(2024, 10, 8), 'Trader')})
+
+        assert removed == 2
+        assert cache.get('day8') is None and cache.get('latest') is None
+        assert cache.get('day7') is not None and cache.get('investor') is not None
+
+    @pytest.mark.parametrize("header, expected", [
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"zzz", "abc"', True),
+        ('*', True),
+        ('"zzz"', False),
+        (None, False),
+    ])
+    def test_etag_matching(self, header, expected):
+        assert etag_matches(header, '"abc"') is expected
+
+
+class CountingDatabase:
+    """Band/latest pages that count database calls."""
+
+    def __init__(self, make_score_output):
+        self.make = make_score_output
+        self.calls = 0
+        self.score = 72.0
+
+    def _rows(self, scores, raw):
+        return [routes._score_response(s).model_dump() for s in scores] if raw else scores
+
+    def get_scores_by_band_page(self, band, date, mode, limit, cursor, raw=False):
+        self.calls += 1
+        return self._rows([self.make(ticker="TCS.NS", mode=mode, score=self.score, band=band)], raw), None
+
+    def get_latest_scores_page(self, mode, limit, cursor, raw=False):
+        self.calls += 1
+        return self._rows([self.make(ticker="TCS.NS", mode=mode, score=self.score)], raw), None
+
+
+@pytest.fixture
+def client(api_client, make_score_output):
+    return api_client(CountingDatabase(make_score_output))
+
+
+BAND_URL = "/api/v1/scores/band/Buy"
+BAND_PARAMS = {"date": "2024-10-08", "mode": "Trader"}
+
+
+def test_band_queries_are_served_from_cache(client):
+    test_client, db = client
+
+    first = test_client.get(BAND_URL, params=BAND_PARAMS)
+    second = test_client.get(BAND_URL, params=BAND_PARAMS)
+
+    assert first.status_code == second.status_code == 200
+    assert first.json() == second.json()
+    assert first.headers["etag"] == second.headers["etag"]
+    assert db.calls == 1
+
+
+def test_if_none_match_returns_304(client):
+    test_client, _ = client
+    etag = test_client.get(BAND_URL, params=BAND_PARAMS).headers["etag"]
+
+    response = test_client.get(BAND_URL, params=BAND_PARAMS, headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+
+def test_save_invalidates_matching_entries(client):
+    test_client, db = client
+    etag = test_client.get(BAND_URL, params=BAND_PARAMS).headers["etag"]
+    test_client.get("/api/v1/scores/latest", params={"mode": "Trader"})
+
+    db.score = 74.0
+    _notify_saved({(date(2024, 10, 8), "Trader")})
+
+    response = test_client.get(BAND_URL, params=BAND_PARAMS, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    test_client.get("/api/v1/scores/latest", params={"mode": "Trader"})
+    assert db.calls == 4
@@ -0,0 +1,91 @@
+"""Tests for concurrent fan-out in the rule-based /batch endpoint."""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import api.routes_rule_based as routes
+from api.routes_rule_based import BatchSignalRequest, get_batch_signals
+
+
+class FakePredictor:
+    """Blocking predictor with per-ticker delays and failures."""
+
+    def __init__(self, delays=None, failures=()):
+        self.delays = delays or {}
+        self.failures = set(failures)
+
+    def get_signal(self, ticker, mode='trader'):
+        time.sleep(self.delays.get(ticker, 0.0))
+        if ticker in self.failures:
+            raise ValueError(f"No data for {ticker}")
+        return {'ticker': ticker, 'signal': 'Buy', 'mode': mode}
+
+
+@pytest.fixture
+def fake_predictor(monkeypatch):
+    def install(predictor, timeout=5.0, workers=8):
+        monkeypatch.setattr(routes, 'predictor_instance', predictor)
+        monkeypatch.setattr(routes, 'BATCH_TICKER_TIMEOUT', timeout)
+        monkeypatch.setattr(routes, 'BATCH_MAX_WORKERS', workers)
+        monkeypatch.setattr(routes, 'batch_executor', ThreadPoolExecutor(max_workers=workers))
+        monkeypatch.setattr(routes, 'batch_slots', None)
+        return predictor
+    return install
+
+
+def _run(tickers, mode='trader'):
+    return asyncio.run(get_batch_signals(BatchSignalRequest(tickers=tickers, mode=mode)))
+
+
+def test_batch_latency_tracks_slowest_ticker(fake_predictor):
+    tickers = [f'T{i}' for i in range(6)]
+    fake_predictor(FakePredictor(delays={t: 0.2 for t in tickers}))
+
+    start = time.perf_counter()
+    response = _run(tickers)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.2 * len(tickers) / 2
+    assert response.summary['successful'] == len(tickers)
+
+
+def test_batch_results_keep_request_order(fake_predictor):
+    tickers = ['SLOW', 'FAST', 'MID']
+    fake_predictor(FakePredictor(delays={'SLOW': 0.2, 'FAST': 0.0, 'MID': 0.1}))
+
+    response = _run(tickers)
+
+    assert [r['ticker'] for r in response.results] == tickers
+
+
+def test_batch_reports_partial_failures_and_timeouts(fake_predictor):
+    fake_predictor(
+        FakePredictor(delays={'HANG': 1.0}, failures={'BAD'}),
+        timeout=0.2
+    )
+
+    response = _run(['OK', 'BAD', 'HANG'])
+    summary = response.summary
+
+    assert [r['signal'] for r in response.results] == ['Buy', 'Error', 'Error']
+    assert summary['successful'] == 1
+    assert summary['failed'] == 2
+    assert summary['timed_out'] == 1
+    assert {f['ticker'] for f in summary['failures']} == {'BAD', 'HANG'}
+
+
+def test_timeout_starts_when_a_worker_is_free(fake_predictor):
+    fake_predictor(
+        FakePredictor(delays={'SLOW1': 1.0, 'SLOW2': 1.0, 'FAST1': 0.05, 'FAST2': 0.05}),
+        timeout=0.2,
+        workers=2
+    )
+
+    response = _run(['SLOW1', 'SLOW2', 'FAST1', 'FAST2'])
+
+    assert [r['signal'] for r in response.results] == ['Error', 'Error', 'Buy', 'Buy']
+    assert response.results[0]['error'] == "Timed out after 0.2s"
+    assert response.summary['timed_out'] == 2
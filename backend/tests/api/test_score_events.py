@@ -0,0 +1,89 @@
+"""Tests for GET /api/v1/events/scores (server-sent events)."""
+
+import asyncio
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+import greyoak_score.api.routes as routes
+from greyoak_score.api.main import app
+from greyoak_score.data.score_events import ScoreEventBroker
+
+
+class FakeRequest:
+    """Reports a disconnect after a fixed number of checks."""
+
+    def __init__(self, checks):
+        self.checks = checks
+
+    async def is_disconnected(self):
+        self.checks -= 1
+        return self.checks < 0
+
+
+def event(ticker="TCS.NS", band="Buy"):
+    return {'ticker': ticker, 'date': "2024-10-08", 'mode': "Trader",
+            'score': 72.5, 'band': band, 'sector': "it"}
+
+
+@pytest.fixture
+def broker(monkeypatch):
+    broker = ScoreEventBroker(buffer_size=2, max_subscribers=1)
+    monkeypatch.setattr(routes, 'get_score_event_broker', lambda: broker)
+    monkeypatch.setattr(routes.limiter, 'enabled', False)
+    return broker
+
+
+def collect(broker, publish, checks, **filters):
+    """Run one subscription's SSE generator and return its frames."""
+
+    async def scenario():
+        subscription = broker.subscribe(**filters)
+        publish()
+        await asyncio.sleep(0)
+        return [frame async for frame in routes._score_event_stream(FakeRequest(checks), broker, subscription)]
+
+    return asyncio.run(scenario())
+
+
+def test_stream_emits_score_events(broker):
+    frames = collect(broker, lambda: broker.publish([event(), event("INFY.NS")]), checks=1)
+
+    assert frames[0] == b"retry: 3000\n\n"
+    blocks = frames[1].decode().strip().split("\n\n")
+    assert blocks[0].splitlines()[:2] == ["id: 1", "event: score"]
+    data = json.loads(blocks[1].splitlines()[2][len("data: "):])
+    assert data == {**event("INFY.NS"), 'id': 2}
+    assert broker.get_stats()['subscribers'] == 0  # Unsubscribed on disconnect
+
+
+def test_stream_reports_overflow_then_keepalive(broker, monkeypatch):
+    monkeypatch.setattr(routes, 'SCORE_EVENTS_KEEPALIVE', 0.01)
+
+    frames = collect(broker, lambda: broker.publish([event() for _ in range(5)]), checks=2)
+
+    assert frames[1] == b'event: overflow\ndata: {"dropped":3}\n\n'
+    assert frames[2].count(b"event: score") == 2
+    assert frames[3] == b": keepalive\n\n"
+
+
+@pytest.mark.parametrize("params", [
+    {"tickers": "TCS.NS,not a ticker"},
+    {"bands": "Buy,Maybe"},
+    {"sectors": "it,Bad-Sector"},
+])
+def test_invalid_filters_return_400(broker, params):
+    response = TestClient(app).get("/api/v1/events/scores", params=params)
+
+    assert response.status_code == 400
+    assert broker.get_stats()['subscribers'] == 0
+
+
+def test_subscriber_limit_returns_503(broker):
+    async def fill():
+        broker.subscribe()
+
+    asyncio.run(fill())
+
+    assert TestClient(app).get("/api/v1/events/scores").status_code == 503
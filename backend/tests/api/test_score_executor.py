@@ -0,0 +1,69 @@
+"""Tests that POST /calculate keeps scoring work off the event loop."""
+
+import asyncio
+import time
+
+import httpx
+import pytest
+
+import greyoak_score.api.routes as routes
+from greyoak_score.api.main import app
+
+
+SCORE_WORK_SECONDS = 0.3
+
+
+@pytest.fixture
+def slow_scoring(monkeypatch):
+    """Make scoring CPU-heavy (blocking) and skip the database write."""
+    compute = routes._compute_score
+
+    def slow_compute(score_request, scoring_date):
+        time.sleep(SCORE_WORK_SECONDS)
+        return compute(score_request, scoring_date)
+
+    monkeypatch.setattr(routes, '_compute_score', slow_compute)
+    monkeypatch.setattr(routes, '_persist_score', lambda score_result: None)
+    yield
+    routes.shutdown_scoring_executor()
+
+
+async def _measure(n_scores: int):
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        # Distinct dates, so identical-request coalescing doesn't merge the work
+        scores = [
+            asyncio.create_task(client.post("/api/v1/calculate", json={
+                "ticker": "RELIANCE.NS", "date": f"2024-10-{day + 1:02d}", "mode": "Trader"
+            }))
+            for day in range(n_scores)
+        ]
+        await asyncio.sleep(0.05)
+
+        health_ms = []
+        while not all(task.done() for task in scores):
+            start = time.perf_counter()
+            response = await client.get("/health")
+            health_ms.append((time.perf_counter() - start) * 1000)
+            assert response.status_code == 200
+            await asyncio.sleep(0.01)
+
+        return await asyncio.gather(*scores), health_ms
+
+
+def test_health_stays_responsive_while_scoring(slow_scoring):
+    score_responses, health_ms = asyncio.run(_measure(n_scores=8))
+
+    assert all(r.status_code == 200 for r in score_responses)
+    assert len(health_ms) >= 10
+    p95 = sorted(health_ms)[int(0.95 * len(health_ms))]
+    assert p95 < SCORE_WORK_SECONDS * 1000 / 3
+
+
+def test_calculate_reports_stage_timings(slow_scoring):
+    score_responses, _ = asyncio.run(_measure(n_scores=1))
+    header = score_responses[0].headers['server-timing']
+
+    stages = dict(part.strip().split(';dur=') for part in header.split(','))
+    assert set(stages) == {'validate', 'queue', 'score', 'persist', 'total'}
+    assert float(stages['score']) >= SCORE_WORK_SECONDS * 1000
@@ -0,0 +1,175 @@
+"""Tests for GET /api/v1/export/scores (streamed Arrow IPC / Parquet / NDJSON)."""
+
+import asyncio
+import gc
+import io
+import json
+import threading
+from datetime import date, datetime, timezone
+
+import psycopg2
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from starlette.requests import Request
+
+import greyoak_score.api.routes as routes
+from greyoak_score.api.export import EXPORT_SCHEMA
+from greyoak_score.data.persistence import EXPORT_COLUMNS
+
+
+def export_row(ticker, day, score=72.5):
+    """Row tuple as ScoreDatabase.stream_score_chunks yields it."""
+    return (
+        ticker, date(2024, 10, day), "Trader", score, "Buy",
+        70.0, 80.0, 75.0, 65.0, 85.0, 78.0, 5.5, ["LowDataHold"], 0.85, 1.2,
+        datetime(2024, 10, day, 10, 30, tzinfo=timezone.utc), "abc123"
+    )
+
+
+class ExportDatabase:
+    """Yields fixed row chunks and records the stream arguments."""
+
+    def __init__(self, chunks, fail=False):
+        self.chunks = chunks
+        self.fail = fail
+        self.calls = []
+
+    def stream_score_chunks(self, mode, start_date=None, end_date=None, chunk_size=50000):
+        self.calls.append((mode, start_date, end_date, chunk_size))
+        if self.fail:
+            raise psycopg2.OperationalError("connection refused")
+        yield from self.chunks
+
+
+CHUNKS = [[export_row("INFY.NS", 8), export_row("TCS.NS", 8)], [export_row("TCS.NS", 9, 80.0)]]
+
+
+@pytest.fixture
+def export_client(api_client):
+    def make(chunks=CHUNKS, fail=False):
+        return api_client(ExportDatabase(chunks, fail))
+    return make
+
+
+def test_schema_matches_export_columns():
+    assert tuple(EXPORT_SCHEMA.names) == EXPORT_COLUMNS
+
+
+def test_arrow_stream_has_one_batch_per_chunk(export_client):
+    client, db = export_client()
+
+    response = client.get("/api/v1/export/scores",
+                          params={"mode": "Trader", "start_date": "2024-10-01", "end_date": "2024-10-31"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/vnd.apache.arrow.stream"
+    assert 'filename="scores_trader_2024-10-01_2024-10-31.arrows"' in response.headers["content-disposition"]
+    reader = pa.ipc.open_stream(response.content)
+    batches = list(reader)
+    assert [b.num_rows for b in batches] == [2, 1]
+    table = pa.Table.from_batches(batches)
+    assert table.schema == EXPORT_SCHEMA
+    assert table.column('ticker').to_pylist() == ["INFY.NS", "TCS.NS", "TCS.NS"]
+    assert table.column('guardrail_flags').to_pylist()[0] == ["LowDataHold"]
+    assert db.calls == [("Trader", date(2024, 10, 1), date(2024, 10, 31), routes.EXPORT_CHUNK_SIZE)]
+
+
+def test_parquet_has_one_row_group_per_chunk(export_client):
+    client, _ = export_client()
+
+    response = client.get("/api/v1/export/scores", params={"mode": "Trader", "format": "parquet"})
+
+    assert response.status_code == 200
+    parquet = pq.ParquetFile(io.BytesIO(response.content))
+    assert parquet.num_row_groups == 2
+    table = parquet.read()
+    assert table.num_rows == 3
+    assert table.column('score').to_pylist() == [72.5, 72.5, 80.0]
+    assert table.column('date').to_pylist()[-1] == date(2024, 10, 9)
+
+
+def test_ndjson_has_one_object_per_line(export_client):
+    client, _ = export_client()
+
+    response = client.get("/api/v1/export/scores", params={"mode": "Trader", "format": "ndjson"})
+
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert len(lines) == 3
+    assert lines[2]['ticker'] == "TCS.NS" and lines[2]['date'] == "2024-10-09"
+    assert lines[0]['as_of'] == "2024-10-08T10:30:00+00:00"
+
+
+def test_empty_range_is_a_valid_empty_file(export_client):
+    client, _ = export_client(chunks=[])
+
+    arrow = client.get("/api/v1/export/scores", params={"mode": "Investor"})
+    parquet = client.get("/api/v1/export/scores", params={"mode": "Investor", "format": "parquet"})
+
+    assert pa.ipc.open_stream(arrow.content).read_all().num_rows == 0
+    assert pq.read_table(io.BytesIO(parquet.content)).schema == EXPORT_SCHEMA
+
+
+def test_database_errors_return_500_before_streaming(export_client):
+    client, _ = export_client(fail=True)
+
+    response = client.get("/api/v1/export/scores", params={"mode": "Trader"})
+
+    assert response.status_code == 500
+
+
+@pytest.mark.parametrize("params", [
+    {"mode": "Swing"},
+    {"mode": "Trader", "format": "csv"},
+    {"mode": "Trader", "start_date": "01-10-2024"},
+])
+def test_invalid_parameters_return_400(export_client, params):
+    client, db = export_client()
+
+    assert client.get("/api/v1/export/scores", params=params).status_code == 400
+    assert db.calls == []
+
+
+def test_export_returns_503_when_all_slots_are_busy(export_client, monkeypatch):
+    client, db = export_client()
+    slots = threading.BoundedSemaphore(1)
+    monkeypatch.setattr(routes, 'export_slots', slots)
+    slots.acquire()
+
+    response = client.get("/api/v1/export/scores", params={"mode": "Trader"})
+
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "30"
+    assert db.calls == []
+
+
+@pytest.mark.parametrize("fail", [False, True])
+def test_export_slot_is_released_after_the_request(export_client, monkeypatch, fail):
+    client, _ = export_client(fail=fail)
+    slots = threading.BoundedSemaphore(1)
+    monkeypatch.setattr(routes, 'export_slots', slots)
+
+    client.get("/api/v1/export/scores", params={"mode": "Trader", "format": "ndjson"})
+    response = client.get("/api/v1/export/scores", params={"mode": "Trader", "format": "ndjson"})
+
+    assert response.status_code == (500 if fail else 200)
+    assert slots.acquire(blocking=False)
+
+
+def test_export_slot_is_released_when_body_is_never_iterated(export_client, monkeypatch):
+    """Client gone before the first block: dropping the response frees the slot."""
+    _, db = export_client()
+    slots = threading.BoundedSemaphore(1)
+    monkeypatch.setattr(routes, 'export_slots', slots)
+    request = Request({'type': 'http', 'method': 'GET', 'path': "/api/v1/export/scores",
+                       'headers': [], 'query_string': b"", 'client': ("test", 1)})
+
+    response = asyncio.run(routes.export_scores(request, mode="Trader", start_date=None,
+                                                end_date=None, format="ndjson"))
+    assert not slots.acquire(blocking=False)
+    del response
+    gc.collect()
+
+    assert slots.acquire(blocking=False)
+    assert len(db.calls) == 1
@@ -0,0 +1,70 @@
+"""API tests for cursor pagination on score history and band endpoints."""
+
+from datetime import date
+
+import pytest
+
+import greyoak_score.api.routes as routes
+from greyoak_score.data.pagination import decode_cursor, encode_cursor
+
+
+class FakePagedDatabase:
+    """Serves pre-built pages and records the cursors it was asked for."""
+
+    def __init__(self, make_score_output):
+        self.make = make_score_output
+        self.cursors = []
+
+    def _rows(self, scores, raw):
+        return [routes._score_response(s).model_dump() for s in scores] if raw else scores
+
+    def get_scores_by_ticker_page(self, ticker, start_date, end_date, mode, limit, cursor, raw=False):
+        self.cursors.append(cursor)
+        if cursor is not None:
+            decode_cursor(cursor, 'ticker_history')  # ValueError on bad cursors, like ScoreDatabase
+        else:
+            page = [self.make(ticker=ticker, day=d) for d in (9, 8)]
+            return self._rows(page, raw), encode_cursor('ticker_history', [date(2024, 10, 8), "Trader"])
+        return self._rows([self.make(ticker=ticker, day=7)], raw), None
+
+    def get_scores_by_band_page(self, band, date, mode, limit, cursor, raw=False):
+        self.cursors.append(cursor)
+        return self._rows([self.make(ticker="TCS.NS", band=band)], raw), None if cursor else "next-token"
+
+
+@pytest.fixture
+def client(api_client, make_score_output):
+    return api_client(FakePagedDatabase(make_score_output))
+
+
+def test_ticker_history_exposes_next_cursor_header(client):
+    test_client, db = client
+
+    first = test_client.get("/api/v1/scores/TCS.NS", params={"limit": 2})
+    assert first.status_code == 200
+    assert len(first.json()) == 2
+    next_cursor = first.headers["x-next-cursor"]
+    assert f"cursor={next_cursor}" in first.headers["link"]
+
+    second = test_client.get("/api/v1/scores/TCS.NS", params={"limit": 2, "cursor": next_cursor})
+    assert second.status_code == 200
+    assert [s["date"] for s in second.json()] == ["2024-10-07"]
+    assert "x-next-cursor" not in second.headers
+    assert db.cursors == [None, next_cursor]
+
+
+def test_invalid_cursor_is_bad_request(client):
+    test_client, _ = client
+    response = test_client.get("/api/v1/scores/TCS.NS", params={"cursor": "garbage"})
+    assert response.status_code == 400
+
+
+def test_band_response_includes_next_cursor(client):
+    test_client, _ = client
+    params = {"date": "2024-10-08", "mode": "Trader"}
+
+    body = test_client.get("/api/v1/scores/band/Buy", params=params).json()
+    assert body["next_cursor"] == "next-token"
+
+    body = test_client.get("/api/v1/scores/band/Buy", params={**params, "cursor": "next-token"}).json()
+    assert body["next_cursor"] is None
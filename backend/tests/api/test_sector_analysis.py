@@ -0,0 +1,102 @@
+"""Tests for GET /api/v1/sectors/{sector} (precomputed sector aggregates)."""
+
+from datetime import date
+
+import pytest
+
+from greyoak_score.data.persistence import _notify_saved
+
+
+def aggregate(sector="banks", day="2024-10-08", mode="Trader", mean_score=68.42):
+    """Aggregate dict as ScoreDatabase.get_sector_aggregate returns it."""
+    return {
+        'sector': sector, 'date': day, 'mode': mode,
+        'n_stocks': 12, 'mean_score': mean_score, 'median_score': 70.0,
+        'band_counts': {"Strong Buy": 2, "Buy": 5, "Hold": 4, "Avoid": 1},
+        'mean_pillars': {'F': 71.0, 'T': 66.5, 'R': 60.25, 'O': 75.0, 'Q': 80.1, 'S': 72.0},
+        'mean_s_z': -0.412, 'sector_bear_count': 3,
+        'updated_at': "2024-10-08T18:00:00+00:00",
+    }
+
+
+class AggregateDatabase:
+    """Serves one stored aggregate per (sector, mode) and records lookups."""
+
+    def __init__(self):
+        self.calls = []
+        self.stored = {("banks", "Trader"): aggregate()}
+
+    def get_sector_aggregate(self, sector, mode, date=None):
+        self.calls.append((sector, mode, date))
+        return self.stored.get((sector, mode))
+
+
+@pytest.fixture
+def client(api_client):
+    return api_client(AggregateDatabase())
+
+
+def test_returns_sector_analysis_from_aggregate(client):
+    test_client, db = client
+
+    response = test_client.get("/api/v1/sectors/banks", params={"date": "2024-10-08", "mode": "Trader"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body['sector'] == "banks" and body['date'] == "2024-10-08" and body['mode'] == "Trader"
+    assert body['stocks'] == []
+    assert body['sector_statistics'] == {
+        'n_stocks': 12, 'mean_score': 68.42, 'median_score': 70.0,
+        'mean_F': 71.0, 'mean_T': 66.5, 'mean_R': 60.25, 'mean_O': 75.0, 'mean_Q': 80.1, 'mean_S': 72.0,
+    }
+    assert body['band_distribution'] == {"Strong Buy": 2, "Buy": 5, "Hold": 4, "Avoid": 1}
+    assert body['momentum_analysis'] == {'mean_s_z': -0.412, 'sector_bear_count': 3, 'sector_bear_ratio': 0.25}
+    assert db.calls == [("banks", "Trader", date(2024, 10, 8))]
+
+
+def test_date_defaults_to_latest_aggregate(client):
+    test_client, db = client
+
+    response = test_client.get("/api/v1/sectors/BANKS", params={"mode": "Trader"})
+
+    assert response.status_code == 200
+    assert db.calls == [("banks", "Trader", None)]
+
+
+def test_responses_are_cached_until_scores_are_saved(client):
+    test_client, db = client
+    params = {"date": "2024-10-08", "mode": "Trader"}
+    etag = test_client.get("/api/v1/sectors/banks", params=params).headers["etag"]
+
+    assert test_client.get("/api/v1/sectors/banks", params=params,
+                           headers={"If-None-Match": etag}).status_code == 304
+    assert len(db.calls) == 1
+
+    db.stored[("banks", "Trader")] = aggregate(mean_score=70.1)
+    _notify_saved({(date(2024, 10, 8), "Trader")})
+
+    response = test_client.get("/api/v1/sectors/banks", params=params, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()['sector_statistics']['mean_score'] == 70.1
+    assert len(db.calls) == 2
+
+
+def test_unknown_sector_returns_404(client):
+    test_client, _ = client
+
+    response = test_client.get("/api/v1/sectors/banks", params={"mode": "Investor"})
+
+    assert response.status_code == 404
+    assert "banks" in response.json()['message']
+
+
+@pytest.mark.parametrize("path, params", [
+    ("/api/v1/sectors/banks", {"mode": "Swing"}),
+    ("/api/v1/sectors/banks", {"mode": "Trader", "date": "08-10-2024"}),
+    ("/api/v1/sectors/bad-sector!", {"mode": "Trader"}),
+])
+def test_invalid_parameters_return_400(client, path, params):
+    test_client, db = client
+
+    assert test_client.get(path, params=params).status_code == 400
+    assert db.calls == []
@@ -0,0 +1,133 @@
+"""
+Driver concurrency benchmark: psycopg2 on worker threads vs the asyncpg pool.
+
+Drives GET /api/v1/scores/{ticker} through the ASGI app with 50 and 200
+concurrent clients, once per driver (routes.USE_ASYNC_DB), and reports
+throughput and latency percentiles.
+
+Runs against a real PostgreSQL with the scores schema (db_init/01_schema.sql)
+and needs asyncpg installed. Set BENCH_DATABASE_URL, e.g.
+    BENCH_DATABASE_URL=postgresql://greyoak:pw@localhost:5432/greyoak_scores \\
+        pytest -m performance tests/performance/test_async_database.py -s
+Benchmark rows use the BENCH*.NS ticker prefix and are deleted afterwards.
+"""
+
+import asyncio
+import os
+import statistics
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict
+
+import httpx
+import pytest
+
+import greyoak_score.api.main as main
+import greyoak_score.api.routes as routes
+from greyoak_score.data.async_persistence import close_async_database
+from greyoak_score.data.models import ScoreOutput, PillarScores
+from greyoak_score.data.persistence import ScoreDatabase
+
+pytest.importorskip("asyncpg")
+
+BENCH_DATABASE_URL = os.getenv('BENCH_DATABASE_URL')
+BENCH_TICKERS = 200
+BENCH_DAYS = 30
+REQUESTS_PER_CLIENT = 10
+CONCURRENCY = (50, 200)
+POOL_SIZE = '20'  # Same DB_POOL_MAX_CONN for both drivers
+
+
+def _bench_scores():
+    as_of = datetime(2024, 10, 8, tzinfo=timezone.utc)
+    for day in range(BENCH_DAYS):
+        for i in range(BENCH_TICKERS):
+            yield ScoreOutput(
+                ticker=f"BENCH{i:04d}.NS",
+                date=date(2024, 1, 1) + timedelta(days=day),
+                mode="Trader",
+                score=70.0,
+                band="Buy",
+                pillars=PillarScores(F=70.0, T=80.0, R=75.0, O=65.0, Q=85.0, S=78.0),
+                risk_penalty=5.0,
+                guardrail_flags=[],
+                confidence=0.9,
+                s_z=0.5,
+                as_of=as_of,
+                config_hash="bench",
+                code_version="bench"
+            )
+
+
+async def _run_clients(clients: int) -> Dict[str, float]:
+    """Each client issues REQUESTS_PER_CLIENT history reads back to back."""
+    latencies = []
+    transport = httpx.ASGITransport(app=main.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        async def run_client(n: int):
+            for r in range(REQUESTS_PER_CLIENT):
+                ticker = f"BENCH{(n * REQUESTS_PER_CLIENT + r) % BENCH_TICKERS:04d}.NS"
+                start = time.perf_counter()
+                response = await client.get(f"/api/v1/scores/{ticker}", params={"limit": 20})
+                latencies.append((time.perf_counter() - start) * 1000)
+                assert response.status_code == 200, response.text
+
+        started = time.perf_counter()
+        await asyncio.gather(*(run_client(n) for n in range(clients)))
+        elapsed = time.perf_counter() - started
+    await close_async_database()  # Pool is bound to this event loop
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        'rps': len(latencies) / elapsed,
+        'p50': quantiles[49],
+        'p99': quantiles[98],
+    }
+
+
+@pytest.fixture
+def bench_env(monkeypatch):
+    if not BENCH_DATABASE_URL:
+        pytest.skip("BENCH_DATABASE_URL not set")
+    monkeypatch.setenv('DATABASE_URL', BENCH_DATABASE_URL)
+    monkeypatch.setenv('DB_POOL_MAX_CONN', POOL_SIZE)
+    monkeypatch.setattr(routes.limiter, 'enabled', False)
+    monkeypatch.setattr(main.limiter, 'enabled', False)
+
+    db = ScoreDatabase(BENCH_DATABASE_URL)
+    monkeypatch.setattr(routes, 'get_db_instance', lambda: db)
+
+    def cleanup():
+        with db.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("DELETE FROM scores WHERE ticker LIKE 'BENCH%.NS'")
+                cur.execute("DELETE FROM latest_scores WHERE ticker LIKE 'BENCH%.NS'")
+            conn.commit()
+
+    cleanup()
+    db.save_scores_bulk(_bench_scores())
+    yield monkeypatch
+    cleanup()
+    db.close_pool()
+    routes.shutdown_scoring_executor()
+
+
+@pytest.mark.performance
+class TestAsyncDriverPerformance:
+    """Throughput of the history endpoint per driver and client count."""
+
+    def test_throughput_by_driver(self, bench_env):
+        results = {}
+        for clients in CONCURRENCY:
+            for driver, use_async in (('psycopg2', False), ('asyncpg', True)):
+                bench_env.setattr(routes, 'USE_ASYNC_DB', use_async)
+                results[(driver, clients)] = asyncio.run(_run_clients(clients))
+
+        print(f"\n🔀 Driver concurrency benchmark ({REQUESTS_PER_CLIENT} requests per client, "
+              f"pool={POOL_SIZE})")
+        for (driver, clients), stats in results.items():
+            print(f"  • {driver:8s} {clients:3d} clients: {stats['rps']:8.0f} req/s, "
+                  f"p50 {stats['p50']:.1f}ms, p99 {stats['p99']:.1f}ms")
+        for clients in CONCURRENCY:
+            speedup = results[('asyncpg', clients)]['rps'] / results[('psycopg2', clients)]['rps']
+            print(f"  • {clients} clients: asyncpg {speedup:.2f}x psycopg2 throughput")
@@ -0,0 +1,96 @@
+"""
+Bulk persistence benchmark: save_scores_bulk (COPY + merge) vs looped save_score.
+
+Runs against a real PostgreSQL with the scores schema (db_init/01_schema.sql).
+Set BENCH_DATABASE_URL, e.g.
+    BENCH_DATABASE_URL=postgresql://greyoak:pw@localhost:5432/greyoak_scores \\
+        pytest -m performance tests/performance/test_bulk_persistence.py -s
+Benchmark rows use the BENCH*.NS ticker prefix and are deleted afterwards.
+"""
+
+import os
+import time
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from greyoak_score.data.models import ScoreOutput, PillarScores
+from greyoak_score.data.persistence import ScoreDatabase
+
+BENCH_DATABASE_URL = os.getenv('BENCH_DATABASE_URL')
+BENCH_TICKERS = 500
+BENCH_DAYS = 20  # 10,000 rows
+
+
+def _bench_scores(n_tickers: int, n_days: int, score: float = 70.0):
+    as_of = datetime(2024, 10, 8, tzinfo=timezone.utc)
+    for day in range(n_days):
+        for i in range(n_tickers):
+            yield ScoreOutput(
+                ticker=f"BENCH{i:04d}.NS",
+                date=date(2024, 1, 1) + timedelta(days=day),
+                mode="Trader",
+                score=score,
+                band="Buy",
+                pillars=PillarScores(F=70.0, T=80.0, R=75.0, O=65.0, Q=85.0, S=78.0),
+                risk_penalty=5.0,
+                guardrail_flags=[],
+                confidence=0.9,
+                s_z=0.5,
+                as_of=as_of,
+                config_hash="bench",
+                code_version="bench"
+            )
+
+
+@pytest.fixture
+def bench_db():
+    if not BENCH_DATABASE_URL:
+        pytest.skip("BENCH_DATABASE_URL not set")
+    db = ScoreDatabase(BENCH_DATABASE_URL)
+
+    def cleanup():
+        with db.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("DELETE FROM scores WHERE ticker LIKE 'BENCH%.NS'")
+            conn.commit()
+
+    cleanup()
+    yield db
+    cleanup()
+    db.close_pool()
+
+
+@pytest.mark.performance
+class TestBulkPersistencePerformance:
+    """Compare COPY-based bulk upsert with one save_score per row."""
+
+    def test_bulk_vs_looped_save(self, bench_db):
+        n_rows = BENCH_TICKERS * BENCH_DAYS
+        print(f"\n💾 Bulk persistence benchmark ({n_rows} rows)")
+
+        start = time.perf_counter()
+        counts = bench_db.save_scores_bulk(_bench_scores(BENCH_TICKERS, BENCH_DAYS))
+        bulk_insert_s = time.perf_counter() - start
+        assert counts == {'inserted': n_rows, 'updated': 0}
+
+        start = time.perf_counter()
+        counts = bench_db.save_scores_bulk(_bench_scores(BENCH_TICKERS, BENCH_DAYS, score=71.0))
+        bulk_update_s = time.perf_counter() - start
+        assert counts == {'inserted': 0, 'updated': n_rows}
+
+        # Looped baseline on a sample, extrapolated (a full loop takes minutes)
+        sample = list(_bench_scores(BENCH_TICKERS, 2, score=72.0))
+        start = time.perf_counter()
+        for score in sample:
+            bench_db.save_score(score)
+        looped_per_row = (time.perf_counter() - start) / len(sample)
+        looped_estimate_s = looped_per_row * n_rows
+
+        print(f"  • Bulk insert: {bulk_insert_s:.2f}s ({n_rows / bulk_insert_s:,.0f} rows/s)")
+        print(f"  • Bulk update: {bulk_update_s:.2f}s ({n_rows / bulk_update_s:,.0f} rows/s)")
+        print(f"  • Looped save_score: {looped_per_row * 1000:.2f}ms/row "
+              f"(~{looped_estimate_s:.1f}s for {n_rows} rows)")
+        print(f"  • Speedup: {looped_estimate_s / bulk_update_s:.1f}x")
+
+        assert bulk_update_s < looped_estimate_s, "Bulk upsert slower than looped save_score"
@@ -392,6 +392,47 @@ class TestConcurrencyPerformance:
         assert total_requests/overall_duration > 10, f"Throughput too low: {total_requests/overall_duration:.1f} req/s"
 
 
+@pytest.mark.performance
+class TestEventLoopIsolation:
+    """Test that saturating /calculate does not stall the event loop."""
+    
+    def test_health_p95_flat_while_scoring_saturated(self):
+        """Compare /health P95 at idle with /health P95 while /calculate is saturated."""
+        print(f"\n⚖️ Testing /health Latency Under /calculate Saturation")
+        
+        idle_stats = run_concurrent_requests(f"{BASE_URL}/health", PERFORMANCE_SAMPLES).get_statistics()
+        idle_p95 = idle_stats['response_times']['p95_ms']
+        
+        request_data = {"ticker": "RELIANCE.NS", "date": "2024-10-08", "mode": "Trader"}
+        stop = threading.Event()
+        score_metrics = PerformanceMetrics()
+        
+        def saturate_scoring():
+            while not stop.is_set():
+                rt, sc, err = make_request(f"{BASE_URL}/api/v1/calculate", "POST", request_data)
+                score_metrics.add_response(rt, sc, err)
+        
+        with ThreadPoolExecutor(max_workers=CONCURRENT_USERS) as executor:
+            for _ in range(CONCURRENT_USERS):
+                executor.submit(saturate_scoring)
+            time.sleep(1.0)  # Let the scoring executor fill up
+            loaded_stats = run_concurrent_requests(f"{BASE_URL}/health", PERFORMANCE_SAMPLES).get_statistics()
+            stop.set()
+        
+        loaded_p95 = loaded_stats['response_times']['p95_ms']
+        
+        print(f"Results:")
+        print(f"  • Idle /health P95: {idle_p95:.1f}ms")
+        print(f"  • Loaded /health P95: {loaded_p95:.1f}ms")
+        print(f"  • /calculate requests during run: {len(score_metrics.response_times)}")
+        
+        # Assertions
+        assert loaded_stats['status_codes']['2xx'] == loaded_stats['total_requests'], \
+            "Health checks failed while scoring was saturated"
+        assert loaded_p95 < max(idle_p95 * 3, PERFORMANCE_THRESHOLDS['health_p95']), \
+            f"/health P95 rose from {idle_p95:.1f}ms to {loaded_p95:.1f}ms under scoring load"
+
+
 @pytest.mark.performance
 class TestResourceUtilization:
     """Test system resource utilization during performance tests."""
@@ -0,0 +1,112 @@
+"""
+Prepared-statement benchmark: hot ScoreDatabase queries with and without PREPARE.
+
+Runs against a real PostgreSQL with the scores schema (db_init/01_schema.sql).
+Set BENCH_DATABASE_URL, e.g.
+    BENCH_DATABASE_URL=postgresql://greyoak:pw@localhost:5432/greyoak_scores \\
+        pytest -m performance tests/performance/test_prepared_statements.py -s
+Benchmark rows use the BENCH*.NS ticker prefix and are deleted afterwards.
+"""
+
+import os
+import statistics
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable, Dict, List
+
+import pytest
+
+from greyoak_score.data.models import ScoreOutput, PillarScores
+from greyoak_score.data.persistence import ScoreDatabase
+
+BENCH_DATABASE_URL = os.getenv('BENCH_DATABASE_URL')
+BENCH_TICKERS = 500
+BENCH_DAYS = 20
+BENCH_DATE = date(2024, 1, 1) + timedelta(days=BENCH_DAYS - 1)
+ITERATIONS = 500
+
+
+def _bench_score(i: int, day: int, score: float = 70.0) -> ScoreOutput:
+    return ScoreOutput(
+        ticker=f"BENCH{i:04d}.NS",
+        date=date(2024, 1, 1) + timedelta(days=day),
+        mode="Trader",
+        score=score + (i % 30),
+        band="Buy",
+        pillars=PillarScores(F=70.0, T=80.0, R=75.0, O=65.0, Q=85.0, S=78.0),
+        risk_penalty=5.0,
+        guardrail_flags=[],
+        confidence=0.9,
+        s_z=0.5,
+        as_of=datetime(2024, 10, 8, tzinfo=timezone.utc),
+        config_hash="bench",
+        code_version="bench"
+    )
+
+
+def _percentiles(func: Callable[[int], object], iterations: int = ITERATIONS) -> Dict[str, float]:
+    timings: List[float] = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        func(i)
+        timings.append((time.perf_counter() - start) * 1000)
+    quantiles = statistics.quantiles(timings, n=100)
+    return {'p50': quantiles[49], 'p99': quantiles[98]}
+
+
+@pytest.fixture
+def bench_dbs():
+    if not BENCH_DATABASE_URL:
+        pytest.skip("BENCH_DATABASE_URL not set")
+    plain = ScoreDatabase(BENCH_DATABASE_URL)
+    plain.use_prepared = False
+    prepared = ScoreDatabase(BENCH_DATABASE_URL)
+    prepared.use_prepared = True
+
+    def cleanup():
+        with plain.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("DELETE FROM scores WHERE ticker LIKE 'BENCH%.NS'")
+                cur.execute("DELETE FROM latest_scores WHERE ticker LIKE 'BENCH%.NS'")
+            conn.commit()
+
+    cleanup()
+    plain.save_scores_bulk(
+        _bench_score(i, day) for day in range(BENCH_DAYS) for i in range(BENCH_TICKERS)
+    )
+    prepared.warm_pool()
+    yield plain, prepared
+    cleanup()
+    plain.close_pool()
+    prepared.close_pool()
+
+
+@pytest.mark.performance
+class TestPreparedStatementPerformance:
+    """Per-query p50/p99 latency before (plain SQL) and after (EXECUTE)."""
+
+    def test_prepared_vs_plain(self, bench_dbs):
+        plain, prepared = bench_dbs
+        workloads = {
+            'save_score': lambda db: lambda i: db.save_score(
+                _bench_score(i % BENCH_TICKERS, BENCH_DAYS - 1, score=60.0)),
+            'ticker_history': lambda db: lambda i: db.get_scores_by_ticker_page(
+                f"BENCH{i % BENCH_TICKERS:04d}.NS", limit=20, raw=True),
+            'band_page': lambda db: lambda i: db.get_scores_by_band_page(
+                "Buy", BENCH_DATE, "Trader", limit=100, raw=True),
+            'latest_page': lambda db: lambda i: db.get_latest_scores_page(
+                "Trader", limit=100, raw=True),
+        }
+
+        # Same results either way
+        assert plain.get_scores_by_band_page("Buy", BENCH_DATE, "Trader", limit=100, raw=True) == \
+            prepared.get_scores_by_band_page("Buy", BENCH_DATE, "Trader", limit=100, raw=True)
+        assert plain.get_scores_by_ticker_page("BENCH0001.NS", limit=20, raw=True) == \
+            prepared.get_scores_by_ticker_page("BENCH0001.NS", limit=20, raw=True)
+
+        print(f"\n⚡ Prepared statement benchmark ({ITERATIONS} calls per query)")
+        for name, workload in workloads.items():
+            before = _percentiles(workload(plain))
+            after = _percentiles(workload(prepared))
+            print(f"  • {name}: p50 {before['p50']:.2f}ms -> {after['p50']:.2f}ms, "
+                  f"p99 {before['p99']:.2f}ms -> {after['p99']:.2f}ms")
@@ -0,0 +1,128 @@
+"""
+Sector analysis benchmark: aggregating scores per request vs the precomputed row.
+
+Compares p50/p99 latency of computing one sector's statistics from scores
+(join with sector_mapping, GROUP BY, percentile_cont) with reading its row
+from sector_aggregates, and reports what the refresh adds to a bulk save.
+
+Runs against a real PostgreSQL with the scores schema (db_init/01_schema.sql).
+Set BENCH_DATABASE_URL, e.g.
+    BENCH_DATABASE_URL=postgresql://greyoak:pw@localhost:5432/greyoak_scores \\
+        pytest -m performance tests/performance/test_sector_aggregates.py -s
+Benchmark rows use the BENCH*.NS ticker prefix and are deleted afterwards.
+"""
+
+import os
+import statistics
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Callable, Dict, List
+
+import pytest
+
+from greyoak_score.data.models import ScoreOutput, PillarScores
+from greyoak_score.data.persistence import ScoreDatabase, _SECTOR_AGGREGATES_INSERT
+
+BENCH_DATABASE_URL = os.getenv('BENCH_DATABASE_URL')
+BENCH_TICKERS = 2000
+BENCH_SECTORS = 20
+BENCH_DAYS = 5
+BENCH_DATE = date(2024, 1, 1) + timedelta(days=BENCH_DAYS - 1)
+ITERATIONS = 300
+
+# The aggregate query alone, for one sector, as an uncached endpoint would run it
+_ON_THE_FLY = ("SELECT" + _SECTOR_AGGREGATES_INSERT.split("SELECT", 1)[1]).format(
+    where="s.date = %s AND s.mode = %s AND m.sector_group = %s"
+)
+
+
+def _bench_scores():
+    for day in range(BENCH_DAYS):
+        for i in range(BENCH_TICKERS):
+            yield ScoreOutput(
+                ticker=f"BENCH{i:04d}.NS",
+                date=date(2024, 1, 1) + timedelta(days=day),
+                mode="Trader",
+                score=40.0 + (i % 50),
+                band="Buy" if i % 2 else "Hold",
+                pillars=PillarScores(F=70.0, T=80.0, R=75.0, O=65.0, Q=85.0, S=78.0),
+                risk_penalty=5.0,
+                guardrail_flags=["SectorBear"] if i % 7 == 0 else [],
+                confidence=0.9,
+                s_z=0.5,
+                as_of=datetime(2024, 10, 8, tzinfo=timezone.utc),
+                config_hash="bench",
+                code_version="bench"
+            )
+
+
+def _percentiles(func: Callable[[int], object], iterations: int = ITERATIONS) -> Dict[str, float]:
+    timings: List[float] = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        func(i)
+        timings.append((time.perf_counter() - start) * 1000)
+    quantiles = statistics.quantiles(timings, n=100)
+    return {'p50': quantiles[49], 'p99': quantiles[98]}
+
+
+@pytest.fixture
+def bench_db():
+    if not BENCH_DATABASE_URL:
+        pytest.skip("BENCH_DATABASE_URL not set")
+    db = ScoreDatabase(BENCH_DATABASE_URL)
+
+    def cleanup():
+        with db.get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute("DELETE FROM scores WHERE ticker LIKE 'BENCH%.NS'")
+                cur.execute("DELETE FROM latest_scores WHERE ticker LIKE 'BENCH%.NS'")
+                cur.execute("DELETE FROM sector_mapping WHERE ticker LIKE 'BENCH%.NS'")
+                cur.execute("DELETE FROM sector_aggregates WHERE sector_group LIKE 'bench%'")
+                db._refresh_sector_aggregates(
+                    cur, {(date(2024, 1, 1) + timedelta(days=day), "Trader") for day in range(BENCH_DAYS)}
+                )
+            conn.commit()
+
+    cleanup()
+    with db.get_connection() as conn:
+        with conn.cursor() as cur:
+            cur.executemany(
+                "INSERT INTO sector_mapping (ticker, sector_id, sector_group) VALUES (%s, %s, %s)",
+                [(f"BENCH{i:04d}.NS", "bench", f"bench{i % BENCH_SECTORS}") for i in range(BENCH_TICKERS)]
+            )
+        conn.commit()
+    yield db
+    cleanup()
+    db.close_pool()
+
+
+@pytest.mark.performance
+class TestSectorAggregatePerformance:
+    """Per-request aggregation vs primary-key lookup of the precomputed row."""
+
+    def test_precomputed_vs_on_the_fly(self, bench_db):
+        started = time.perf_counter()
+        bench_db.save_scores_bulk(_bench_scores())
+        bulk_ms = (time.perf_counter() - started) * 1000
+
+        def on_the_fly(i: int):
+            with bench_db.get_connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(_ON_THE_FLY, (BENCH_DATE, "Trader", f"bench{i % BENCH_SECTORS}"))
+                    return cur.fetchone()
+
+        def precomputed(i: int):
+            return bench_db.get_sector_aggregate(f"bench{i % BENCH_SECTORS}", "Trader", BENCH_DATE)
+
+        aggregate = precomputed(0)
+        assert aggregate is not None
+        assert aggregate['n_stocks'] == BENCH_TICKERS // BENCH_SECTORS
+
+        before = _percentiles(on_the_fly)
+        after = _percentiles(precomputed)
+        print(f"\n📊 Sector aggregate benchmark ({BENCH_TICKERS} tickers, {BENCH_SECTORS} sectors, "
+              f"{ITERATIONS} lookups)")
+        print(f"  • on the fly:  p50 {before['p50']:.2f}ms, p99 {before['p99']:.2f}ms")
+        print(f"  • precomputed: p50 {after['p50']:.2f}ms, p99 {after['p99']:.2f}ms")
+        print(f"  • bulk save of {BENCH_TICKERS * BENCH_DAYS} scores incl. refresh: {bulk_ms:.0f}ms")
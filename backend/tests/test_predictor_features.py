@@ -0,0 +1,88 @@
+"""
+GreyOak Predictor - Feature Standardization Tests
+Grouped cross-sectional / time-series z-scores
+"""
+
+import numpy as np
+import pandas as pd
+import sys
+sys.path.insert(0, '/app/backend')
+
+from predictor.features import standardize_features
+
+
+def _make_panel(n_symbols: int, n_dates: int, seed: int = 7) -> pd.DataFrame:
+    """Build a (date, symbol) sorted panel with two random features"""
+    rng = np.random.default_rng(seed)
+    dates = pd.date_range('2021-01-01', periods=n_dates, freq='B')
+    symbols = [f'SYM{i}' for i in range(n_symbols)]
+    idx = pd.MultiIndex.from_product([dates, symbols], names=['date', 'symbol'])
+    df = idx.to_frame(index=False)
+    df['f1'] = rng.normal(0, 1, len(df))
+    df['f2'] = rng.normal(5, 2, len(df))
+    return df
+
+
+def _reference_ts_z(series: pd.Series, alpha: float) -> pd.Series:
+    ewm_mean = series.ewm(alpha=alpha, adjust=False).mean()
+    ewm_std = series.ewm(alpha=alpha, adjust=False).std()
+    return (series - ewm_mean) / (ewm_std + 1e-9)
+
+
+def test_cross_sectional_matches_per_date_zscore():
+    """Cross-sectional z-score equals per-date (x - mean) / std"""
+    df = _make_panel(n_symbols=8, n_dates=30)
+    cols = ['f1', 'f2']
+
+    out = standardize_features(df, cols, method='cross_sectional', min_stocks=6)
+
+    for date, grp in df.groupby('date'):
+        expected = (grp[cols] - grp[cols].mean()) / (grp[cols].std() + 1e-9)
+        np.testing.assert_allclose(out.loc[grp.index, cols].values, expected.values)
+
+
+def test_cross_sectional_fallback_uses_time_series_zscore():
+    """Dates with too few stocks fall back to per-symbol EWMA z-score of raw values"""
+    df = _make_panel(n_symbols=8, n_dates=40)
+    # Thin out the last 5 dates to 3 stocks each
+    last_dates = df['date'].unique()[-5:]
+    thin = df['date'].isin(last_dates) & ~df['symbol'].isin(['SYM0', 'SYM1', 'SYM2'])
+    df = df[~thin].reset_index(drop=True)
+    cols = ['f1', 'f2']
+
+    out = standardize_features(df, cols, method='cross_sectional', min_stocks=6, ts_alpha=0.06)
+
+    fallback_rows = df['date'].isin(last_dates)
+    for symbol in ['SYM0', 'SYM1', 'SYM2']:
+        sym_rows = df['symbol'] == symbol
+        for col in cols:
+            expected = _reference_ts_z(df.loc[sym_rows, col], alpha=0.06)
+            mask = sym_rows & fallback_rows
+            np.testing.assert_allclose(out.loc[mask, col].values, expected[mask[sym_rows].values].values)
+
+    # Non-fallback rows keep their cross-sectional z-score
+    first_date = df['date'].iloc[0]
+    grp = df[df['date'] == first_date]
+    expected = (grp[cols] - grp[cols].mean()) / (grp[cols].std() + 1e-9)
+    np.testing.assert_allclose(out.loc[grp.index, cols].values, expected.values)
+
+
+def test_time_series_skips_short_histories():
+    """Time-series mode standardizes symbols with > 20 rows and leaves the rest raw"""
+    long_df = _make_panel(n_symbols=2, n_dates=30)
+    short_df = _make_panel(n_symbols=1, n_dates=10, seed=3)
+    short_df['symbol'] = 'SHORT'
+    df = pd.concat([long_df, short_df], ignore_index=True).sort_values(['date', 'symbol'])
+    df = df.reset_index(drop=True)
+    cols = ['f1', 'f2']
+
+    out = standardize_features(df, cols, method='time_series', ts_alpha=0.1)
+
+    for symbol in ['SYM0', 'SYM1']:
+        rows = df['symbol'] == symbol
+        for col in cols:
+            expected = _reference_ts_z(df.loc[rows, col], alpha=0.1)
+            np.testing.assert_allclose(out.loc[rows, col].values, expected.values)
+
+    short_rows = df['symbol'] == 'SHORT'
+    np.testing.assert_allclose(out.loc[short_rows, cols].values, df.loc[short_rows, cols].values)
@@ -0,0 +1,146 @@
+"""
+GreyOak Predictor - Inference Tests
+Chunked streaming inference over Parquet feature files
+"""
+
+import numpy as np
+import pandas as pd
+import lightgbm as lgb
+import pytest
+import yaml
+from pathlib import Path
+from sklearn.isotonic import IsotonicRegression
+import sys
+sys.path.insert(0, '/app/backend')
+
+from predictor.infer import run_inference, run_inference_streaming, iter_feature_chunks
+
+FEATURES = ['f1', 'f2', 'f3']
+
+
+@pytest.fixture(scope="module")
+def config() -> dict:
+    config_path = Path(__file__).parent.parent / "config" / "predictor.yaml"
+    with open(config_path) as f:
+        return yaml.safe_load(f)
+
+
+@pytest.fixture(scope="module")
+def artifacts() -> dict:
+    """Small trained multiclass model with isotonic calibrators"""
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(400, len(FEATURES)))
+    y = np.digitize(X[:, 0] + rng.normal(scale=0.5, size=400), [-0.5, 0.5])
+    model = lgb.train(
+        {'objective': 'multiclass', 'num_class': 3, 'verbose': -1, 'min_data_in_leaf': 5},
+        lgb.Dataset(pd.DataFrame(X, columns=FEATURES), label=y),
+        num_boost_round=10
+    )
+    proba = model.predict(X)
+    return {
+        'model': model,
+        'calibrator_pos': IsotonicRegression(out_of_bounds='clip').fit(proba[:, 2], y == 2),
+        'calibrator_neg': IsotonicRegression(out_of_bounds='clip').fit(proba[:, 0], y == 0),
+        'feature_cols': FEATURES,
+        'model_id': 'test_model',
+    }
+
+
+def _make_features(n_dates: int = 4, n_symbols: int = 12) -> pd.DataFrame:
+    rng = np.random.default_rng(1)
+    dates = pd.date_range('2022-01-03', periods=n_dates, freq='B')
+    df = pd.MultiIndex.from_product(
+        [dates, [f'S{i:02d}' for i in range(n_symbols)]], names=['date', 'symbol']
+    ).to_frame(index=False)
+    for col in FEATURES:
+        df[col] = rng.normal(size=len(df))
+    df['close'] = 100.0 + rng.normal(size=len(df))
+    df['U'] = 0.05
+    df['L'] = 0.05
+    df['unused'] = 'x'
+    return df
+
+
+def test_date_chunks_match_per_date_inference(tmp_path, artifacts, config):
+    """Streaming by date reproduces run_inference applied to each date"""
+    features = _make_features()
+    features_path = tmp_path / 'features.parquet'
+    features.to_parquet(features_path, index=False, row_group_size=10)
+    output_dir = tmp_path / 'predictions'
+
+    summary = run_inference_streaming(features_path, artifacts, output_dir, config)
+
+    assert summary['chunks'] == features['date'].nunique()
+    assert summary['rows'] == len(features)
+
+    streamed = pd.read_parquet(output_dir)
+    streamed['date'] = pd.to_datetime(streamed['date'].astype(str))
+    streamed = streamed.sort_values(['date', 'symbol']).reset_index(drop=True)
+
+    expected = pd.concat(
+        [run_inference(grp.reset_index(drop=True), artifacts, config)
+         for _, grp in features.groupby('date')],
+        ignore_index=True
+    ).sort_values(['date', 'symbol']).reset_index(drop=True)
+
+    np.testing.assert_allclose(streamed['p_pos'], expected['p_pos'])
+    assert (streamed['predictor_score'].values == expected['predictor_score'].values).all()
+    assert (streamed['flags'].values == expected['flags'].values).all()
+
+
+def test_chunks_are_single_dates_with_projected_columns(tmp_path, artifacts, config):
+    """Chunks follow dates, not the file's row-group layout"""
+    features = _make_features()
+    features_path = tmp_path / 'features.parquet'
+    features.to_parquet(features_path, index=False, row_group_size=10)
+
+    chunks = list(iter_feature_chunks(features_path, ['date', 'symbol'] + FEATURES))
+
+    assert [len(c) for c in chunks] == [12] * 4
+    assert all(c['date'].nunique() == 1 for c in chunks)
+    assert all('unused' not in c.columns for c in chunks)
+
+
+def test_date_partitioned_dataset_streams_by_date(tmp_path):
+    """A hive dataset partitioned by date= is read in date order"""
+    features = _make_features()
+    features['date'] = features['date'].dt.date.astype(str)
+    features.to_parquet(tmp_path / 'features', partition_cols=['date'], index=False)
+
+    chunks = list(iter_feature_chunks(tmp_path / 'features', ['date', 'symbol'] + FEATURES))
+
+    assert [c['date'].iloc[0] for c in chunks] == sorted(features['date'].unique())
+    assert [len(c) for c in chunks] == [12] * 4
+
+
+def test_symbol_sorted_panel_is_rejected(tmp_path):
+    """The single scan needs date order; a symbol-sorted panel fails instead of mixing dates"""
+    features = _make_features().sort_values(['symbol', 'date'])
+    features_path = tmp_path / 'features.parquet'
+    features.to_parquet(features_path, index=False)
+
+    with pytest.raises(ValueError, match="not in ascending date order"):
+        list(iter_feature_chunks(features_path, ['date', 'symbol'] + FEATURES))
+
+
+def test_rerun_replaces_written_dates(tmp_path, artifacts, config):
+    """A rerun over a shifted window with another model leaves one prediction per row"""
+    features = _make_features(n_dates=6)
+    dates = sorted(features['date'].unique())
+    output_dir = tmp_path / 'predictions'
+
+    first_path = tmp_path / 'first.parquet'
+    features[features['date'].isin(dates[:4])].to_parquet(first_path, index=False)
+    run_inference_streaming(first_path, artifacts, output_dir, config)
+
+    second_path = tmp_path / 'second.parquet'
+    features[features['date'].isin(dates[2:])].to_parquet(second_path, index=False)
+    run_inference_streaming(second_path, {**artifacts, 'model_id': 'retrained'}, output_dir, config)
+
+    streamed = pd.read_parquet(output_dir)
+    assert len(streamed) == len(features)
+    assert not streamed.duplicated(['date', 'symbol']).any()
+    streamed['date'] = pd.to_datetime(streamed['date'].astype(str))
+    by_date = streamed.groupby('date')['model_id'].unique()
+    assert list(by_date.loc[dates[:2]].map(tuple)) == [('test_model',)] * 2
+    assert list(by_date.loc[dates[2:]].map(tuple)) == [('retrained',)] * 4
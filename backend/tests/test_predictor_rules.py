@@ -9,7 +9,10 @@ import sys
 sys.path.insert(0, '/app/backend')
 
 from predictor.labels import triple_barrier
-from predictor.infer import apply_gates, compute_predictor_score, adjust_cuts_for_coverage
+from predictor.infer import (
+    apply_gates, compute_predictor_score, adjust_cuts_for_coverage,
+    decode_flags, FLAG_GATE_FAIL, FLAG_XSCTN_FALLBACK
+)
 
 
 def test_same_bar_double_touch_is_neutral():
@@ -41,17 +44,17 @@ def test_gate_fail_caps_score():
     RA = np.array([0.30, 0.50, 0.48])
     E_min = 0.015
     RA_min = 0.45
-    flags = [[], [], []]
+    flags = np.zeros(3, dtype=np.int64)
     
     gated_score, updated_flags = apply_gates(base_score, E, RA, E_min, RA_min, flags)
     
     # First should fail (E too low, RA too low)
     assert gated_score[0] <= 49, f"Score should be capped, got {gated_score[0]}"
-    assert 'GateFail' in updated_flags[0], "Should have GateFail flag"
+    assert updated_flags[0] & FLAG_GATE_FAIL, "Should have GateFail flag"
     
     # Second should pass
     assert gated_score[1] >= 60, f"Score should not be capped, got {gated_score[1]}"
-    assert 'GateFail' not in updated_flags[1], "Should not have GateFail flag"
+    assert not updated_flags[1] & FLAG_GATE_FAIL, "Should not have GateFail flag"
     
     print("  ✅ PASS\n")
 
@@ -68,7 +71,7 @@ def test_xsctn_fallback_when_small_n():
         p_pos_small, RA_small, method='cross_sectional'
     )
     
-    assert any('XSctnFallback' in f for f in flags_small), "Should use fallback for small N"
+    assert np.all(flags_small & FLAG_XSCTN_FALLBACK), "Should use fallback for small N"
     
     # Large sample
     p_pos_large = np.random.rand(20) * 0.5 + 0.25
@@ -78,7 +81,7 @@ def test_xsctn_fallback_when_small_n():
         p_pos_large, RA_large, method='cross_sectional'
     )
     
-    assert not any('XSctnFallback' in f for f in flags_large), "Should not use fallback for large N"
+    assert not np.any(flags_large & FLAG_XSCTN_FALLBACK), "Should not use fallback for large N"
     
     print("  ✅ PASS\n")
 
@@ -141,6 +144,41 @@ def test_timing_band_logic():
     print("  ✅ PASS\n")
 
 
+def test_flag_bitmask_decoding():
+    """Test flag bitmasks decode to comma-joined names at output"""
+    print("Test: Flag bitmask decoding")
+    
+    flag_bits = np.array([0, FLAG_XSCTN_FALLBACK, FLAG_GATE_FAIL,
+                          FLAG_XSCTN_FALLBACK | FLAG_GATE_FAIL, 0])
+    
+    decoded = decode_flags(flag_bits)
+    
+    assert list(decoded) == ['', 'XSctnFallback', 'GateFail', 'XSctnFallback,GateFail', '']
+    
+    print("  ✅ PASS\n")
+
+
+def test_calibration_table_matches_isotonic():
+    """Test compiled lookup table reproduces IsotonicRegression.predict"""
+    print("Test: Calibration lookup table == isotonic predict")
+    
+    from sklearn.isotonic import IsotonicRegression
+    from predictor.infer import compile_calibrator
+    
+    rng = np.random.default_rng(5)
+    raw = rng.random(500)
+    target = (rng.random(500) < raw).astype(int)
+    cal = IsotonicRegression(out_of_bounds='clip').fit(raw, target)
+    
+    # Include out-of-range points to exercise clipping
+    x = np.concatenate([rng.random(1000), [-0.5, 1.5]])
+    table = compile_calibrator(cal)
+    
+    np.testing.assert_allclose(np.interp(x, *table), cal.predict(x))
+    
+    print("  ✅ PASS\n")
+
+
 def run_all_tests():
     """Run all test cases"""
     print("="*70)
@@ -153,6 +191,8 @@ def run_all_tests():
         test_xsctn_fallback_when_small_n()
         test_coverage_guard_raises_cuts()
         test_timing_band_logic()
+        test_flag_bitmask_decoding()
+        test_calibration_table_matches_isotonic()
         
         print("="*70)
         print("✅ ALL TESTS PASSED")
@@ -0,0 +1,108 @@
+"""
+GreyOak Predictor - Training Tests
+Purged walk-forward folds, parallel fold training and dataset caching
+"""
+
+import numpy as np
+import pandas as pd
+import sys
+sys.path.insert(0, '/app/backend')
+
+from predictor.train import (
+    purged_walk_forward_cv, train_folds_parallel, load_or_build_dataset, train_lgbm_fold
+)
+
+
+def _make_config() -> dict:
+    return {
+        'model': {
+            'lgbm_params': {
+                'objective': 'multiclass',
+                'num_class': 3,
+                'metric': 'multi_logloss',
+                'learning_rate': 0.1,
+                'num_leaves': 7,
+                'min_data_in_leaf': 5,
+                'verbose': -1,
+                'deterministic': True,
+            },
+            'class_weights': {'pos': 1.0, 'neu': 0.6, 'neg': 1.0},
+            'cv': {'n_splits': 3, 'embargo': 5},
+        }
+    }
+
+
+def _make_dataset(n: int = 600, seed: int = 11) -> tuple:
+    rng = np.random.default_rng(seed)
+    X = pd.DataFrame(rng.normal(size=(n, 4)), columns=['a', 'b', 'c', 'd'])
+    score = X['a'] - X['b'] + rng.normal(scale=0.5, size=n)
+    y = np.where(score > 0.5, 1, np.where(score < -0.5, -1, 0))
+    df = X.copy()
+    df['date'] = pd.date_range('2020-01-01', periods=n, freq='D')
+    return df, X, y
+
+
+def test_purged_cv_returns_contiguous_numpy_ranges():
+    """Folds are NumPy ranges with an embargo gap between train and test"""
+    df, _, _ = _make_dataset(n=120)
+    folds = purged_walk_forward_cv(df, n_splits=3, embargo=5)
+
+    assert len(folds) == 3
+    for train_idx, test_idx in folds:
+        assert isinstance(train_idx, np.ndarray) and isinstance(test_idx, np.ndarray)
+        assert train_idx[0] == 0
+        assert np.all(np.diff(train_idx) == 1) and np.all(np.diff(test_idx) == 1)
+        assert test_idx[0] - train_idx[-1] - 1 == 5
+
+
+def test_parallel_folds_return_predictions_in_fold_order():
+    """Parallel training yields one (model, probabilities) pair per fold, in order"""
+    df, X, y = _make_dataset()
+    config = _make_config()
+    folds = purged_walk_forward_cv(df, n_splits=3, embargo=5)
+
+    results = train_folds_parallel(X, y, folds, config, n_jobs=2)
+
+    assert len(results) == len(folds)
+    for (model, proba), (_, test_idx) in zip(results, folds):
+        assert proba.shape == (len(test_idx), 3)
+        np.testing.assert_allclose(proba.sum(axis=1), 1.0, atol=1e-6)
+        assert model.feature_name() == list(X.columns)
+
+
+def test_dataset_cache_reuses_binary_file(tmp_path):
+    """Unchanged features load the cached binary; changed features re-bin"""
+    df, X, y = _make_dataset()
+    config = _make_config()
+
+    full_data, cache_path = load_or_build_dataset(X, y, config, tmp_path)
+    assert cache_path.exists()
+    mtime = cache_path.stat().st_mtime_ns
+
+    cached_data, cached_path = load_or_build_dataset(X, y, config, tmp_path)
+    assert cached_path == cache_path
+    assert cache_path.stat().st_mtime_ns == mtime
+    assert cached_data.num_data() == len(X)
+    assert cached_data.get_feature_name() == list(X.columns)
+
+    X_changed = X.copy()
+    X_changed.iloc[0, 0] += 1.0
+    _, changed_path = load_or_build_dataset(X_changed, y, config, tmp_path)
+    assert changed_path != cache_path
+
+    train_idx, test_idx = purged_walk_forward_cv(df, n_splits=3, embargo=5)[-1]
+    model = train_lgbm_fold(cached_data, y, train_idx, test_idx, config)
+    proba = model.predict(X.iloc[test_idx])
+    assert proba.shape == (len(test_idx), 3)
+
+
+def test_parallel_folds_with_dataset_cache(tmp_path):
+    """Workers subset the cached binary dataset instead of re-binning"""
+    df, X, y = _make_dataset()
+    config = _make_config()
+    folds = purged_walk_forward_cv(df, n_splits=3, embargo=5)
+    _, cache_path = load_or_build_dataset(X, y, config, tmp_path)
+
+    results = train_folds_parallel(X, y, folds, config, n_jobs=2, dataset_path=cache_path)
+
+    assert [proba.shape[0] for _, proba in results] == [len(t) for _, t in folds]
@@ -0,0 +1,105 @@
+"""Unit tests for the background database health monitor and estimated stats."""
+
+import time
+from datetime import date
+from unittest.mock import MagicMock
+
+from greyoak_score.data.health_monitor import DatabaseHealthMonitor
+
+
+def fake_db(connected=True):
+    db = MagicMock()
+    db.test_connection.return_value = connected
+    db.get_database_stats_estimated.return_value = {'total_scores': 1000, 'estimated': True}
+    db.get_pool_stats.return_value = {'in_use': 0}
+    return db
+
+
+class TestDatabaseHealthMonitor:
+    """Snapshot refresh, age and staleness."""
+
+    def test_refresh_records_healthy_snapshot(self):
+        db = fake_db()
+        monitor = DatabaseHealthMonitor(db_factory=lambda: db, interval=60)
+
+        assert monitor.get_snapshot() is None
+        monitor.refresh()
+        snapshot = monitor.get_snapshot()
+
+        assert snapshot['status'] == "healthy"
+        assert snapshot['stats']['total_scores'] == 1000
+        assert snapshot['age_seconds'] < 1 and snapshot['stale'] is False
+
+    def test_failed_probe_is_unhealthy(self):
+        db = fake_db()
+        db.test_connection.side_effect = RuntimeError("pool not initialized")
+        monitor = DatabaseHealthMonitor(db_factory=lambda: db, interval=60)
+
+        snapshot = monitor.refresh()
+
+        assert snapshot['status'] == "unhealthy"
+        assert "pool not initialized" in snapshot['error']
+        assert snapshot['stats'] is None
+
+    def test_snapshot_goes_stale(self):
+        monitor = DatabaseHealthMonitor(db_factory=fake_db, interval=60, stale_after=0.01)
+        monitor.refresh()
+        time.sleep(0.02)
+
+        assert monitor.get_snapshot()['stale'] is True
+
+    def test_background_thread_probes_on_interval(self):
+        db = fake_db()
+        monitor = DatabaseHealthMonitor(db_factory=lambda: db, interval=0.02)
+        monitor.start()
+        try:
+            time.sleep(0.15)
+        finally:
+            monitor.stop()
+
+        probes = db.test_connection.call_count
+        assert 3 <= probes <= 10
+        time.sleep(0.05)
+        assert db.test_connection.call_count == probes  # Stopped
+
+
+class TestEstimatedStats:
+    """Planner-estimate statistics (mocked catalog queries)."""
+
+    def test_estimates_from_reltuples_and_pg_stats(self, pooled_db):
+        db, conn = pooled_db
+        cur = conn.cursor.return_value.__enter__.return_value
+        cur.fetchone.side_effect = [
+            {'total_scores': 10000},
+            {'earliest_date': date(2024, 1, 1), 'latest_date': date(2024, 10, 8)},
+        ]
+        cur.fetchall.return_value = [
+            {'attname': 'ticker', 'n_distinct': 500.0, 'common_values': None, 'common_freqs': None},
+            {'attname': 'date', 'n_distinct': -0.02, 'common_values': None, 'common_freqs': None},
+            {'attname': 'mode', 'n_distinct': 2.0,
+             'common_values': ['Trader', 'Investor'], 'common_freqs': [0.6, 0.4]},
+            {'attname': 'band', 'n_distinct': 4.0,
+             'common_values': ['Hold', 'Buy'], 'common_freqs': [0.5, 0.25]},
+        ]
+
+        stats = db.get_database_stats_estimated()
+
+        assert stats['total_scores'] == 10000
+        assert stats['unique_tickers'] == 500
+        assert stats['unique_dates'] == 200
+        assert (stats['trader_scores'], stats['investor_scores']) == (6000, 4000)
+        assert stats['band_distribution'] == {'Hold': 5000, 'Buy': 2500}
+        assert stats['latest_date'] == date(2024, 10, 8)
+        executed = " ".join(c.args[0] for c in cur.execute.call_args_list)
+        assert "COUNT(" not in executed
+
+    def test_unanalyzed_table_reports_unknown_counts(self, pooled_db):
+        db, conn = pooled_db
+        cur = conn.cursor.return_value.__enter__.return_value
+        cur.fetchone.side_effect = [{'total_scores': 0}, {'earliest_date': None, 'latest_date': None}]
+        cur.fetchall.return_value = []
+
+        stats = db.get_database_stats_estimated()
+
+        assert stats['unique_tickers'] is None and stats['trader_scores'] is None
+        assert stats['band_distribution'] == {}
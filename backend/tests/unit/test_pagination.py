@@ -0,0 +1,146 @@
+"""Unit tests for keyset pagination cursors and paged queries."""
+
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+from greyoak_score.data.pagination import encode_cursor, decode_cursor
+
+
+def score_row(ticker: str, day: int, score: str = "70.00", mode: str = "Trader") -> dict:
+    """A scores table row as RealDictCursor returns it."""
+    return {
+        'ticker': ticker, 'date': date(2024, 10, day), 'mode': mode,
+        'score': Decimal(score), 'band': 'Buy',
+        'f_pillar': 70, 't_pillar': 80, 'r_pillar': 75, 'o_pillar': 65, 'q_pillar': 85, 's_pillar': 78,
+        'risk_penalty': 5, 'guardrail_flags': [], 'confidence': Decimal("0.9"), 's_z': Decimal("1.2"),
+        'as_of': datetime(2024, 10, 8, tzinfo=timezone.utc), 'config_hash': 'abc', 'code_version': '1.0.0',
+    }
+
+
+class TestCursorCodec:
+    """Opaque cursor encoding."""
+
+    def test_round_trip_preserves_types(self):
+        token = encode_cursor('latest', [date(2024, 10, 8), Decimal("72.50"), "TCS.NS"])
+        assert decode_cursor(token, 'latest') == [date(2024, 10, 8), Decimal("72.50"), "TCS.NS"]
+
+    def test_cursor_is_url_safe(self):
+        token = encode_cursor('band', [Decimal("99.99"), "M&M.NS"])
+        assert all(c.isalnum() or c in '-_' for c in token)
+
+    def test_cursor_from_other_ordering_rejected(self):
+        token = encode_cursor('band', [Decimal("70"), "TCS.NS"])
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor(token, 'ticker_history')
+
+    @pytest.mark.parametrize("token", ["", "not-a-cursor", "e30"])
+    def test_malformed_cursor_rejected(self, token):
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            decode_cursor(token, 'band')
+
+
+class TestKeysetPages:
+    """Paged ScoreDatabase queries (mocked connection)."""
+
+    def _cursor(self, conn, rows):
+        cur = conn.cursor.return_value.__enter__.return_value
+        cur.fetchall.return_value = rows
+        return cur
+
+    def test_ticker_page_sets_next_cursor_when_more_rows(self, pooled_db):
+        db, conn = pooled_db
+        cur = self._cursor(conn, [score_row("TCS.NS", d) for d in (9, 8, 7)])
+
+        scores, next_cursor = db.get_scores_by_ticker_page("TCS.NS", limit=2)
+
+        assert [s.scoring_date.day for s in scores] == [9, 8]
+        assert decode_cursor(next_cursor, 'ticker_history') == [date(2024, 10, 8), "Trader"]
+        sql, params = cur.execute.call_args[0]
+        assert "ORDER BY date DESC, mode DESC LIMIT %s" in sql
+        assert params[-1] == 3  # limit + 1 probe row
+
+    def test_ticker_page_continues_after_cursor(self, pooled_db):
+        db, conn = pooled_db
+        cur = self._cursor(conn, [score_row("TCS.NS", 7)])
+        token = encode_cursor('ticker_history', [date(2024, 10, 8), "Trader"])
+
+        scores, next_cursor = db.get_scores_by_ticker_page("TCS.NS", limit=2, cursor=token)
+
+        assert next_cursor is None
+        sql, params = cur.execute.call_args[0]
+        assert "(date, mode) < (%s, %s)" in sql
+        assert params == ["TCS.NS", date(2024, 10, 8), "Trader", 3]
+
+    def test_band_page_keyed_on_score_and_ticker(self, pooled_db):
+        db, conn = pooled_db
+        rows = [score_row("B.NS", 8, "72.00"), score_row("A.NS", 8, "71.00")]
+        cur = self._cursor(conn, rows)
+
+        scores, next_cursor = db.get_scores_by_band_page("Buy", date(2024, 10, 8), "Trader", limit=1)
+
+        assert [s.ticker for s in scores] == ["B.NS"]
+        assert decode_cursor(next_cursor, 'band') == [Decimal("72.00"), "B.NS"]
+        assert "ORDER BY score DESC, ticker DESC" in cur.execute.call_args[0][0]
+
+    def test_latest_page_pins_date_from_cursor(self, pooled_db):
+        db, conn = pooled_db
+        cur = self._cursor(conn, [])
+        token = encode_cursor('latest', [date(2024, 10, 8), Decimal("70"), "X.NS"])
+
+        scores, next_cursor = db.get_latest_scores_page("Trader", limit=10, cursor=token)
+
+        assert scores == [] and next_cursor is None
+        assert cur.execute.call_args[0][1] == ["Trader", date(2024, 10, 8), Decimal("70"), "X.NS", 11]
+
+    def test_stream_uses_named_cursor(self, pooled_db):
+        db, conn = pooled_db
+        named = conn.cursor.return_value.__enter__.return_value
+        named.__iter__.return_value = iter([score_row("TCS.NS", 8), score_row("TCS.NS", 9)])
+
+        scores = list(db.stream_scores(ticker="TCS.NS", batch_size=500))
+
+        assert [s.scoring_date.day for s in scores] == [8, 9]
+        assert conn.cursor.call_args.kwargs['name'].startswith("scores_stream_")
+        assert named.itersize == 500
+
+    def test_export_chunks_come_from_named_cursor(self, pooled_db):
+        db, conn = pooled_db
+        named = conn.cursor.return_value.__enter__.return_value
+        named.fetchmany.side_effect = [[("A",), ("B",)], [("C",)], []]
+
+        chunks = list(db.stream_score_chunks("Investor", start_date=date(2024, 1, 1), chunk_size=2))
+
+        assert chunks == [[("A",), ("B",)], [("C",)]]
+        assert conn.cursor.call_args.kwargs['name'].startswith("scores_export_")
+        sql, params = named.execute.call_args[0]
+        assert "score::float8 AS score" in sql and "ORDER BY date, ticker" in sql
+        assert params == ["Investor", date(2024, 1, 1)]
+        named.fetchmany.assert_called_with(2)
+        conn.rollback.assert_called_once()
+
+    def test_export_rejects_inverted_date_range(self, pooled_db):
+        db, _ = pooled_db
+        with pytest.raises(ValueError, match="after end_date"):
+            next(db.stream_score_chunks("Trader", date(2024, 2, 1), date(2024, 1, 1)))
+
+    def test_raw_page_selects_api_columns_and_returns_dicts(self, pooled_db):
+        db, conn = pooled_db
+        cur = self._cursor(conn, [score_row("TCS.NS", 8, "72.50")])
+
+        scores, _ = db.get_scores_by_band_page("Buy", date(2024, 10, 8), "Trader", raw=True)
+
+        sql = cur.execute.call_args[0][0]
+        assert "SELECT *" not in sql and "config_hash" in sql and "code_version" not in sql
+        assert scores[0]['score'] == 72.5 and scores[0]['date'] == "2024-10-08"
+
+
+def test_raw_row_matches_validated_response(pooled_db):
+    """The fast path emits exactly what ScoreOutput -> ScoreResponse would."""
+    from greyoak_score.api.routes import _score_response
+
+    db, _ = pooled_db
+    row = score_row("TCS.NS", 8, "72.50")
+
+    assert db._row_to_score_dict(row) == _score_response(db._row_to_score_output(row)).model_dump()
@@ -0,0 +1,152 @@
+"""Unit tests for scores table partition maintenance."""
+
+from datetime import date
+from unittest.mock import MagicMock
+
+import pytest
+from psycopg2 import sql
+
+from greyoak_score.data.partitions import (
+    add_months, partition_bounds, partition_name, planned_partitions,
+    create_partitions, detach_partitions_before, maintain_partitions
+)
+
+
+def catalog_cursor(partitioned=True, bounds=(), default_dates=()):
+    """Mocked cursor answering the catalog queries and default_has_rows()."""
+    cur = MagicMock()
+
+    def fetchone():
+        query, params = cur.execute.call_args.args
+        if isinstance(query, sql.Composed):  # Rows in DEFAULT for [start, end)
+            return (any(params[0] <= day < params[1] for day in default_dates),)
+        return (1,) if partitioned else None
+
+    cur.fetchone.side_effect = fetchone
+    cur.fetchall.return_value = [
+        (name, f"FOR VALUES FROM ('{start}') TO ('{end}')") for name, start, end in bounds
+    ] + [('scores_default', 'DEFAULT')]
+    return cur
+
+
+def ddl_statements(cur):
+    """Composed statements other than SELECTs executed on the cursor, as (sql, params)."""
+    return [
+        c.args for c in cur.execute.call_args_list
+        if isinstance(c.args[0], sql.Composed) and not c.args[0].seq[0].string.lstrip().startswith('SELECT')
+    ]
+
+
+def statement_text(query):
+    """Composed statement as text, with identifiers unquoted."""
+    return ''.join(part.string if isinstance(part, sql.SQL) else '.'.join(part.strings) for part in query.seq)
+
+
+class TestPartitionRanges:
+    """Pure date arithmetic for partition bounds and names."""
+
+    def test_add_months_crosses_year(self):
+        assert add_months(date(2024, 11, 15), 3) == date(2025, 2, 1)
+        assert add_months(date(2024, 1, 31), -1) == date(2023, 12, 1)
+
+    @pytest.mark.parametrize("day,interval,expected", [
+        (date(2024, 10, 8), 'month', (date(2024, 10, 1), date(2024, 11, 1))),
+        (date(2024, 12, 31), 'month', (date(2024, 12, 1), date(2025, 1, 1))),
+        (date(2024, 11, 8), 'quarter', (date(2024, 10, 1), date(2025, 1, 1))),
+        (date(2024, 3, 31), 'quarter', (date(2024, 1, 1), date(2024, 4, 1))),
+    ])
+    def test_partition_bounds(self, day, interval, expected):
+        assert partition_bounds(day, interval) == expected
+
+    def test_invalid_interval_rejected(self):
+        with pytest.raises(ValueError, match="Invalid partition interval"):
+            partition_bounds(date(2024, 10, 8), 'week')
+
+    def test_partition_names(self):
+        assert partition_name(date(2024, 10, 1)) == "scores_p2024_10"
+        assert partition_name(date(2024, 10, 1), 'quarter') == "scores_p2024q4"
+
+    def test_planned_partitions_cover_range_inclusive(self):
+        planned = planned_partitions(date(2024, 11, 20), date(2025, 1, 1))
+        assert [name for name, _, _ in planned] == ["scores_p2024_11", "scores_p2024_12", "scores_p2025_01"]
+        assert planned[-1][1:] == (date(2025, 1, 1), date(2025, 2, 1))
+
+
+class TestPartitionDDL:
+    """Partition creation and retirement against a mocked catalog."""
+
+    def test_create_skips_existing_and_overlapping_ranges(self):
+        cur = catalog_cursor(bounds=[
+            ("scores_p2024_10", "2024-10-01", "2024-11-01"),
+            ("scores_p2025q1", "2025-01-01", "2025-04-01"),
+        ])
+
+        created = create_partitions(cur, date(2024, 10, 8), date(2025, 2, 1))
+
+        assert created == ["scores_p2024_11", "scores_p2024_12"]
+        assert [params for _, params in ddl_statements(cur)] == [
+            (date(2024, 11, 1), date(2024, 12, 1)),
+            (date(2024, 12, 1), date(2025, 1, 1)),
+        ]
+
+    def test_rows_in_default_are_moved_into_the_new_partition(self):
+        cur = catalog_cursor(
+            bounds=[("scores_p2024_10", "2024-10-01", "2024-11-01")],
+            default_dates=[date(2024, 12, 3), date(2024, 12, 4)]
+        )
+
+        created = create_partitions(cur, date(2024, 10, 8), date(2024, 12, 8))
+
+        assert created == ["scores_p2024_11", "scores_p2024_12"]
+        statements = [' '.join(statement_text(query).split()) for query, *_ in ddl_statements(cur)]
+        assert statements[0] == "ALTER TABLE scores DETACH PARTITION scores_default"
+        assert statements[1].startswith("CREATE TABLE IF NOT EXISTS scores_p2024_11 PARTITION OF")
+        assert statements[2].startswith("CREATE TABLE IF NOT EXISTS scores_p2024_12 PARTITION OF")
+        assert "DELETE FROM scores_default" in statements[3]
+        assert "INSERT INTO scores_p2024_12" in statements[3]
+        assert ddl_statements(cur)[3][1] == (date(2024, 12, 1), date(2025, 1, 1))
+        assert statements[4] == "ALTER TABLE scores ATTACH PARTITION scores_default DEFAULT"
+        assert len(statements) == 5
+
+    def test_detach_only_fully_expired_partitions(self):
+        cur = catalog_cursor(bounds=[
+            ("scores_p2024_08", "2024-08-01", "2024-09-01"),
+            ("scores_p2024_09", "2024-09-01", "2024-10-01"),
+            ("scores_p2024_10", "2024-10-01", "2024-11-01"),
+        ])
+
+        detached = detach_partitions_before(cur, date(2024, 10, 1), drop=True)
+
+        assert detached == ["scores_p2024_08", "scores_p2024_09"]
+        assert len(ddl_statements(cur)) == 4  # DETACH + DROP for each
+
+    def test_maintain_is_noop_when_not_partitioned(self):
+        conn = MagicMock()
+        cur = conn.cursor.return_value.__enter__.return_value
+        cur.fetchone.return_value = None
+
+        result = maintain_partitions(conn, today=date(2024, 10, 8))
+
+        assert result == {'created': [], 'detached': []}
+        conn.commit.assert_not_called()
+
+    def test_maintain_creates_ahead_and_retires_in_one_transaction(self):
+        conn = MagicMock()
+        conn.cursor.return_value.__enter__.return_value = catalog_cursor(bounds=[
+            ("scores_p2023_01", "2023-01-01", "2023-02-01"),
+            ("scores_p2024_10", "2024-10-01", "2024-11-01"),
+        ])
+
+        result = maintain_partitions(conn, months_ahead=2, retain_months=12, today=date(2024, 10, 8))
+
+        assert result == {
+            'created': ["scores_p2024_11", "scores_p2024_12"],
+            'detached': ["scores_p2023_01"],
+        }
+        conn.commit.assert_called_once()
+
+    def test_database_wrapper_uses_pooled_connection(self, pooled_db):
+        db, conn = pooled_db
+        conn.cursor.return_value.__enter__.return_value = catalog_cursor(partitioned=False)
+
+        assert db.maintain_partitions() == {'created': [], 'detached': []}
@@ -0,0 +1,262 @@
+"""Unit tests for multi-row and COPY-based score writes in ScoreDatabase (data/persistence.py)."""
+
+import csv
+import io
+import json
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from unittest.mock import patch
+
+import pytest
+
+
+class TestSaveScoresBatch:
+    """save_scores_batch: one transaction of multi-row UPSERTs."""
+
+    def test_batch_upsert_single_commit(self, pooled_db, make_score_output):
+        db, conn = pooled_db
+        scores = [make_score_output(day=day) for day in range(1, 4)]
+
+        with patch('greyoak_score.data.persistence.execute_values') as mock_values:
+            written = db.save_scores_batch(scores)
+
+        assert written == 3
+        upsert, latest, events = mock_values.call_args_list
+        sql, rows = upsert[0][1], upsert[0][2]
+        assert "ON CONFLICT (ticker, date, mode)" in sql
+        assert [row[:3] for row in rows] == [
+            (s.ticker, s.scoring_date, s.mode) for s in scores
+        ]
+        assert "INSERT INTO latest_scores" in latest[0][1]
+        assert "WHERE latest_scores.date <= EXCLUDED.date" in latest[0][1]
+        assert latest[0][2] == [(s.ticker, s.scoring_date, s.mode) for s in scores]
+        assert "pg_notify('score_events'" in events[0][1] and events[1]['fetch'] is True
+        conn.commit.assert_called_once()
+
+    def test_duplicate_keys_keep_last(self, pooled_db, make_score_output):
+        db, _ = pooled_db
+        first, second = make_score_output(), make_score_output()
+        second.score = 50.0
+
+        with patch('greyoak_score.data.persistence.execute_values') as mock_values:
+            written = db.save_scores_batch([first, second])
+
+        assert written == 1
+        assert mock_values.call_args_list[0][0][2][0][3] == 50.0
+
+    def test_invalid_score_rejects_batch(self, pooled_db, make_score_output):
+        db, conn = pooled_db
+        bad = make_score_output()
+        bad.ticker = ""
+
+        with pytest.raises(ValueError, match="Ticker cannot be empty"):
+            db.save_scores_batch([make_score_output(), bad])
+        conn.commit.assert_not_called()
+
+
+class TestSaveScoresBulk:
+    """save_scores_bulk: COPY into a staging table, then one merge."""
+
+    def _capture_copy(self, conn):
+        cursor = conn.cursor.return_value.__enter__.return_value
+        copied = {}
+
+        def copy_expert(sql, stream):
+            copied['sql'] = sql
+            copied['data'] = ''.join(iter(lambda: stream.read(64), ''))
+
+        cursor.copy_expert.side_effect = copy_expert
+        cursor.fetchone.return_value = (2, 1)
+        return cursor, copied
+
+    def test_streams_csv_and_returns_counts(self, pooled_db, make_score_output):
+        db, conn = pooled_db
+        cursor, copied = self._capture_copy(conn)
+        scores = [make_score_output(day=day) for day in range(1, 4)]
+        scores[0].guardrail_flags = ["LowDataHold", "SectorBear"]
+
+        counts = db.save_scores_bulk(iter(scores))
+
+        assert counts == {'inserted': 2, 'updated': 1}
+        assert copied['sql'].startswith("COPY scores_stage (ticker, date, mode")
+        rows = list(csv.reader(io.StringIO(copied['data'])))
+        assert [row[:3] for row in rows] == [
+            [s.ticker, s.scoring_date.isoformat(), s.mode] for s in scores
+        ]
+        assert json.loads(rows[0][12]) == ["LowDataHold", "SectorBear"]
+
+        statements = [c[0][0] for c in cursor.execute.call_args_list]
+        merge_sql = next(sql for sql in statements if "INSERT INTO scores" in sql)
+        latest_sql = next(sql for sql in statements if "INSERT INTO latest_scores" in sql)
+        assert "ON CONFLICT (ticker, date, mode)" in merge_sql
+        assert "DISTINCT ON (ticker, date, mode)" in merge_sql
+        assert "INSERT INTO latest_scores" in latest_sql
+        assert "DISTINCT ON (ticker, mode)" in latest_sql and "FROM scores_stage" in latest_sql
+        conn.commit.assert_called_once()
+
+    def test_invalid_record_rolls_back(self, pooled_db, make_score_output):
+        db, conn = pooled_db
+        self._capture_copy(conn)
+        bad = make_score_output(day=2)
+        bad.score = 150.0
+
+        with pytest.raises(ValueError, match="Score must be between 0-100"):
+            db.save_scores_bulk([make_score_output(day=1), bad])
+
+        conn.commit.assert_not_called()
+        conn.rollback.assert_called()
+
+
+class TestLatestScores:
+    """latest_scores maintenance and reads."""
+
+    def test_save_score_refreshes_latest_in_same_transaction(self, pooled_db, make_score_output):
+        db, conn = pooled_db
+        cursor = conn.cursor.return_value.__enter__.return_value
+        cursor.fetchone.return_value = (42,)
+        score = make_score_output()
+
+        assert db.save_score(score) == 42
+
+        latest_sql, params = cursor.execute.call_args_list[-2][0]
+        events_sql, event_params = cursor.execute.call_args_list[-1][0]
+        assert "pg_notify('score_events'" in events_sql and event_params == params
+        assert "INSERT INTO latest_scores" in latest_sql
+        assert "ON CONFLICT (ticker, mode)" in latest_sql
+        assert params == (score.ticker, score.scoring_date, score.mode)
+        conn.commit.assert_called_once()
+
+    def test_latest_reads_use_latest_scores_table(self, pooled_db):
+        db, conn = pooled_db
+        cursor = conn.cursor.return_value.__enter__.return_value
+        cursor.fetchall.return_value = []
+
+        db.get_latest_scores("Trader", limit=10)
+        db.get_latest_scores_page("Trader", limit=10)
+
+        for call in cursor.execute.call_args_list:
+            assert "FROM latest_scores" in call[0][0]
+            assert "FROM scores" not in call[0][0]
+
+    def test_rebuild_backfills_one_row_per_ticker_mode(self, pooled_db):
+        db, conn = pooled_db
+        cursor = conn.cursor.return_value.__enter__.return_value
+        cursor.rowcount = 1000
+
+        assert db.rebuild_latest_scores() == 1000
+
+        delete_sql, insert_sql = [c[0][0] for c in cursor.execute.call_args_list]
+        assert delete_sql == "DELETE FROM latest_scores"
+        assert "DISTINCT ON (ticker, mode)" in insert_sql and "ORDER BY ticker, mode, date DESC" in insert_sql
+        conn.commit.assert_called_once()
+
+
+class TestSectorAggregates:
+    """sector_aggregates maintenance (batch saves) and primary-key reads."""
+
+    @staticmethod
+    def _aggregate_statements(cursor):
+        return [
+            (c[0][0], c[0][1] if len(c[0]) > 1 else None)
+            for c in cursor.execute.call_args_list
+            if "sector_aggregates" in c[0][0]
+        ]
+
+    def test_batch_save_refreshes_written_dates_before_commit(self, pooled_db, make_score_output):
+        db, conn = pooled_db
+        cursor = conn.cursor.return_value.__enter__.return_value
+        commits = []
+        conn.commit.side_effect = lambda: commits.append(len(cursor.execute.call_args_list))
+        scores = [make_score_output(day=8), make_score_output(ticker="TCS.NS", day=8),
+                  make_score_output(day=9, mode="Investor")]
+
+        with patch('greyoak_score.data.persistence.execute_values'):
+            db.save_scores_batch(scores)
+
+        statements = self._aggregate_statements(cursor)
+        assert [params for _, params in statements] == \
+            [(date(2024, 10, 8), "Trader")] * 3 + [(date(2024, 10, 9), "Investor")] * 3
+        lock_sql, delete_sql, insert_sql = (sql for sql, _ in statements[:3])
+        assert "pg_advisory_xact_lock(hashtext('sector_aggregates')" in lock_sql
+        assert delete_sql.startswith("DELETE FROM sector_aggregates")
+        assert "LEFT JOIN sector_mapping" in insert_sql
+        assert "COALESCE(m.sector_group, 'diversified')" in insert_sql
+        assert "percentile_cont(0.5)" in insert_sql
+        assert "WHERE s.date = %s AND s.mode = %s" in insert_sql
+        assert commits == [len(cursor.execute.call_args_list)]
+
+    def test_bulk_save_refreshes_written_dates(self, pooled_db, make_score_output):
+        db, conn = pooled_db
+        cursor = conn.cursor.return_value.__enter__.return_value
+        cursor.copy_expert.side_effect = lambda sql, stream: ''.join(iter(lambda: stream.read(64), ''))
+        cursor.fetchone.return_value = (2, 0)
+
+        db.save_scores_bulk([make_score_output(day=8), make_score_output(ticker="TCS.NS", day=8)])
+
+        statements = self._aggregate_statements(cursor)
+        assert [params for _, params in statements] == [(date(2024, 10, 8), "Trader")] * 3
+        conn.commit.assert_called_once()
+
+    def test_batch_save_can_defer_refresh(self, pooled_db, make_score_output):
+        db, conn = pooled_db
+        cursor = conn.cursor.return_value.__enter__.return_value
+
+        with patch('greyoak_score.data.persistence.execute_values'):
+            db.save_scores_batch([make_score_output(day=8)], refresh_aggregates=False)
+        assert self._aggregate_statements(cursor) == []
+
+        assert db.refresh_sector_aggregates({(date(2024, 10, 8), "Trader")}) == 1
+        assert [params for _, params in self._aggregate_statements(cursor)] == [(date(2024, 10, 8), "Trader")] * 3
+        assert conn.commit.call_count == 2
+
+    def test_get_sector_aggregate_reads_one_row(self, pooled_db):
+        db, conn = pooled_db
+        cursor = conn.cursor.return_value.__enter__.return_value
+        cursor.fetchone.return_value = {
+            'date': date(2024, 10, 8), 'mode': "Trader", 'sector_group': "banks",
+            'n_stocks': 12, 'mean_score': Decimal("68.42"), 'median_score': Decimal("70.00"),
+            'band_counts': {"Strong Buy": 2, "Buy": 5, "Hold": 4, "Avoid": 1},
+            'mean_f_pillar': Decimal("71.00"), 'mean_t_pillar': Decimal("66.50"),
+            'mean_r_pillar': Decimal("60.25"), 'mean_o_pillar': Decimal("75.00"),
+            'mean_q_pillar': Decimal("80.10"), 'mean_s_pillar': Decimal("72.00"),
+            'mean_s_z': Decimal("-0.412"), 'sector_bear_count': 3,
+            'updated_at': datetime(2024, 10, 8, 18, 0, tzinfo=timezone.utc),
+        }
+
+        aggregate = db.get_sector_aggregate("banks", "Trader", date(2024, 10, 8))
+
+        sql, params = cursor.execute.call_args[0]
+        assert "FROM sector_aggregates" in sql and "FROM scores" not in sql
+        assert params == ["banks", "Trader", date(2024, 10, 8)]
+        assert aggregate['sector'] == "banks" and aggregate['date'] == "2024-10-08"
+        assert aggregate['median_score'] == 70.0
+        assert aggregate['mean_pillars'] == {'F': 71.0, 'T': 66.5, 'R': 60.25, 'O': 75.0, 'Q': 80.1, 'S': 72.0}
+        assert aggregate['band_counts']["Buy"] == 5
+        assert aggregate['mean_s_z'] == -0.412 and aggregate['sector_bear_count'] == 3
+
+    def test_get_sector_aggregate_latest_and_missing(self, pooled_db):
+        db, conn = pooled_db
+        cursor = conn.cursor.return_value.__enter__.return_value
+        cursor.fetchone.return_value = None
+
+        assert db.get_sector_aggregate("banks", "Investor") is None
+
+        sql, params = cursor.execute.call_args[0]
+        assert "ORDER BY date DESC LIMIT 1" in sql
+        assert params == ["banks", "Investor"]
+        with pytest.raises(ValueError, match="Invalid mode"):
+            db.get_sector_aggregate("banks", "Swing")
+
+    def test_rebuild_recomputes_every_date(self, pooled_db):
+        db, conn = pooled_db
+        cursor = conn.cursor.return_value.__enter__.return_value
+        cursor.rowcount = 30
+        cursor.fetchall.return_value = [(date(2024, 10, 8), "Trader")]
+
+        assert db.rebuild_sector_aggregates() == 30
+
+        lock_sql, delete_sql, insert_sql, _ = [c[0][0] for c in cursor.execute.call_args_list]
+        assert lock_sql == "LOCK TABLE sector_aggregates IN SHARE ROW EXCLUSIVE MODE"
+        assert delete_sql == "DELETE FROM sector_aggregates"
+        assert "WHERE TRUE" in insert_sql
+        conn.commit.assert_called_once()
@@ -0,0 +1,127 @@
+"""Unit tests for connection-pool and query instrumentation."""
+
+import threading
+from unittest.mock import MagicMock
+
+import psycopg2
+import pytest
+from psycopg2 import pool
+
+from greyoak_score.data.pool_metrics import (
+    InstrumentedConnectionPool, LatencyHistogram, PoolMetrics, timed_query
+)
+
+
+class TestLatencyHistogram:
+    """Bucketed latency summaries."""
+
+    def test_buckets_and_quantiles(self):
+        histogram = LatencyHistogram(buckets=(1, 10, 100))
+        for value in [0.5] * 90 + [50] * 9 + [400]:
+            histogram.observe(value)
+
+        snapshot = histogram.snapshot()
+
+        assert snapshot['count'] == 100
+        assert snapshot['buckets'] == {'1': 90, '10': 0, '100': 9, '+Inf': 1}
+        assert snapshot['p50_ms'] == 1
+        assert snapshot['p95_ms'] == 100
+        assert snapshot['p99_ms'] == 100
+        assert snapshot['max_ms'] == 400
+
+    def test_empty_histogram(self):
+        assert LatencyHistogram().snapshot()['p99_ms'] == 0.0
+
+
+def make_pool(maxconn=2, timeout=0.05):
+    inner = MagicMock()
+    inner._pool = []
+    inner.getconn.side_effect = lambda: MagicMock()
+    return InstrumentedConnectionPool(inner, maxconn=maxconn, metrics=PoolMetrics(),
+                                      checkout_timeout=timeout)
+
+
+class TestInstrumentedConnectionPool:
+    """Checkout tracking and waiting."""
+
+    def test_tracks_in_use_and_returns(self):
+        wrapped = make_pool()
+        first, second = wrapped.getconn(), wrapped.getconn()
+        wrapped.putconn(first)
+
+        stats = wrapped.get_stats()
+        assert stats['in_use'] == 1 and stats['peak_in_use'] == 2
+        assert stats['checkouts'] == 2 and stats['returns'] == 1
+        assert stats['checkout_wait_ms']['count'] == 2
+
+        wrapped.putconn(second, close=True)
+        assert wrapped.get_stats()['discarded'] == 1
+
+    def test_exhausted_pool_fails_after_timeout(self):
+        wrapped = make_pool(maxconn=1)
+        wrapped.getconn()
+
+        with pytest.raises(pool.PoolError, match="exhausted"):
+            wrapped.getconn()
+        assert wrapped.get_stats()['checkout_failures'] == 1
+
+    def test_checkout_waits_for_returned_connection(self):
+        wrapped = make_pool(maxconn=1, timeout=2.0)
+        held = wrapped.getconn()
+        threading.Timer(0.05, wrapped.putconn, args=(held,)).start()
+
+        wrapped.getconn()
+
+        assert wrapped.get_stats()['checkout_wait_ms']['max_ms'] >= 40
+
+    def test_inner_failure_releases_slot(self):
+        wrapped = make_pool(maxconn=1)
+        wrapped._inner.getconn.side_effect = psycopg2.OperationalError("down")
+
+        with pytest.raises(psycopg2.OperationalError):
+            wrapped.getconn()
+        wrapped._inner.getconn.side_effect = None
+        wrapped.getconn()  # Slot was released
+        assert wrapped.get_stats()['checkout_failures'] == 1
+
+
+class TestQueryMetrics:
+    """Per-query latency recorded on ScoreDatabase."""
+
+    def test_timed_query_records_latency_and_errors(self):
+        class Repo:
+            metrics = PoolMetrics()
+
+            @timed_query
+            def fetch(self, fail=False):
+                if fail:
+                    raise ValueError("bad")
+                return 1
+
+        repo = Repo()
+        repo.fetch()
+        with pytest.raises(ValueError):
+            repo.fetch(fail=True)
+
+        stats = repo.metrics.snapshot()['queries']['fetch']
+        assert stats['count'] == 2 and stats['errors'] == 1
+
+    def test_database_exposes_pool_and_query_stats(self, pooled_db):
+        db, conn = pooled_db
+        conn.cursor.return_value.__enter__.return_value.fetchall.return_value = []
+
+        db.get_scores_by_ticker_page("TCS.NS")
+        stats = db.get_pool_stats()
+
+        assert stats['in_use'] == 0 and stats['checkouts'] == 1
+        assert stats['queries']['get_scores_by_ticker_page']['count'] == 1
+
+    def test_connection_retries_are_counted(self, pooled_db):
+        db, _ = pooled_db
+        inner = db._connection_pool._inner
+        inner.getconn.side_effect = [psycopg2.OperationalError("reset"), MagicMock(closed=False)]
+
+        with db.get_connection(retry_delay=0):
+            pass
+
+        assert db.get_pool_stats()['retries'] == 1
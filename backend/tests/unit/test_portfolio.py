@@ -0,0 +1,106 @@
+"""Unit tests for weighted portfolio aggregation (core/portfolio.py)."""
+
+import numpy as np
+import pytest
+
+from greyoak_score.core.portfolio import BANDS, PILLARS, aggregate_portfolio, build_holdings
+
+
+def score_row(ticker, score, band, pillar=60.0, risk_penalty=0.0):
+    """Score dict shaped like ScoreResponse."""
+    return {
+        'ticker': ticker, 'date': "2024-10-08", 'mode': "Investor",
+        'score': score, 'band': band,
+        'pillars': {p: pillar for p in PILLARS},
+        'risk_penalty': risk_penalty, 'guardrail_flags': [],
+        'confidence': 0.9, 's_z': 0.0,
+        'as_of': "2024-10-08T10:30:00+00:00", 'config_hash': "abc123",
+    }
+
+
+ROWS = [
+    score_row("TCS.NS", 80.0, "Strong Buy", pillar=80.0, risk_penalty=1.0),
+    score_row("INFY.NS", 60.0, "Hold", pillar=60.0, risk_penalty=4.0),
+    score_row("ITC.NS", 40.0, "Avoid", pillar=40.0, risk_penalty=10.0),
+]
+
+
+def test_build_holdings_follows_request_order_and_lists_missing():
+    holdings = build_holdings(["ITC.NS", "WIPRO.NS", "TCS.NS"], ROWS)
+
+    assert holdings.tickers == ("ITC.NS", "TCS.NS")
+    assert holdings.positions.tolist() == [0, 2]
+    assert holdings.missing == ("WIPRO.NS",)
+    assert holdings.pillars.shape == (2, len(PILLARS))
+    assert holdings.band_onehot.tolist() == [[0, 0, 0, 1], [1, 0, 0, 0]]
+
+
+def test_aggregates_are_weighted_sums():
+    holdings = build_holdings(["TCS.NS", "INFY.NS", "ITC.NS"], ROWS)
+
+    result = aggregate_portfolio(holdings, [0.5, 0.3, 0.2])
+
+    portfolio = result['portfolio']
+    assert portfolio['score'] == pytest.approx(0.5 * 80 + 0.3 * 60 + 0.2 * 40)
+    assert portfolio['pillar_exposures'] == {p: pytest.approx(66.0) for p in PILLARS}
+    assert portfolio['risk_penalty'] == pytest.approx(0.5 * 1 + 0.3 * 4 + 0.2 * 10)
+    assert portfolio['band_mix'] == {"Strong Buy": 0.5, "Buy": 0.0, "Hold": 0.3, "Avoid": 0.2}
+    assert portfolio['coverage'] == 1.0
+    assert result['missing'] == [] and result['scenarios'] == {}
+
+
+def test_holdings_are_ordered_by_risk_penalty_contribution():
+    holdings = build_holdings(["TCS.NS", "INFY.NS", "ITC.NS"], ROWS)
+
+    rows = aggregate_portfolio(holdings, [0.5, 0.3, 0.2])['holdings']
+
+    assert [row['ticker'] for row in rows] == ["ITC.NS", "INFY.NS", "TCS.NS"]
+    assert rows[0]['risk_penalty_contribution'] == pytest.approx(2.0)
+    assert sum(row['score_contribution'] for row in rows) == pytest.approx(66.0)
+
+
+def test_missing_tickers_have_their_weight_redistributed():
+    holdings = build_holdings(["TCS.NS", "WIPRO.NS", "ITC.NS"], ROWS)
+
+    result = aggregate_portfolio(holdings, [0.25, 0.5, 0.25])
+
+    assert result['missing'] == ["WIPRO.NS"]
+    assert result['portfolio']['coverage'] == 0.5
+    assert result['portfolio']['score'] == pytest.approx(60.0)
+    assert sum(row['weight'] for row in result['holdings']) == pytest.approx(1.0)
+
+
+def test_scenarios_match_separate_aggregations():
+    tickers = ["TCS.NS", "INFY.NS", "ITC.NS"]
+    holdings = build_holdings(tickers, ROWS)
+    scenarios = {'defensive': [0.8, 0.2, 0.0], 'equal': [1 / 3] * 3}
+
+    result = aggregate_portfolio(holdings, [0.5, 0.3, 0.2], scenarios)
+
+    assert set(result['scenarios']) == {'defensive', 'equal'}
+    for name, weights in scenarios.items():
+        assert result['scenarios'][name] == aggregate_portfolio(holdings, weights)['portfolio']
+
+
+def test_band_mix_sums_to_one():
+    holdings = build_holdings(["TCS.NS", "INFY.NS", "ITC.NS"], ROWS)
+    weights = np.random.default_rng(0).dirichlet(np.ones(3))
+
+    band_mix = aggregate_portfolio(holdings, weights)['portfolio']['band_mix']
+
+    assert list(band_mix) == list(BANDS)
+    assert sum(band_mix.values()) == pytest.approx(1.0, abs=1e-3)
+
+
+def test_weights_without_scored_exposure_raise():
+    holdings = build_holdings(["TCS.NS", "WIPRO.NS"], ROWS)
+
+    with pytest.raises(ValueError, match="defensive"):
+        aggregate_portfolio(holdings, [0.5, 0.5], {'defensive': [0.0, 1.0]})
+
+
+def test_no_scored_tickers_raise():
+    holdings = build_holdings(["WIPRO.NS"], ROWS)
+
+    with pytest.raises(ValueError):
+        aggregate_portfolio(holdings, [1.0])
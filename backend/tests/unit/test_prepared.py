@@ -0,0 +1,145 @@
+"""Unit tests for server-side prepared statements on hot queries."""
+
+from datetime import date
+from unittest.mock import MagicMock
+
+import psycopg2
+import pytest
+
+from greyoak_score.data.persistence import HOT_STATEMENTS
+from greyoak_score.data.prepared import PreparedStatements, to_server_placeholders
+
+
+def preparing(conn):
+    """Give a mocked connection the attributes of PreparingConnection."""
+    conn.prepared = set()
+    conn.prepare_failed = False
+    return conn
+
+
+def executed(cur):
+    return [c.args[0] for c in cur.execute.call_args_list]
+
+
+class TestPreparedStatements:
+    """Registry, PREPARE on checkout and EXECUTE dispatch."""
+
+    def test_placeholders_become_numbered_parameters(self):
+        assert to_server_placeholders("a = %s AND (b, c) < (%s, %s) LIMIT %s") == \
+            "a = $1 AND (b, c) < ($2, $3) LIMIT $4"
+
+    def test_prepare_once_per_connection(self):
+        registry = PreparedStatements()
+        registry.register('q', "SELECT * FROM t WHERE id = %s")
+        conn = preparing(MagicMock())
+        cur = conn.cursor.return_value.__enter__.return_value
+
+        assert registry.prepare(conn) == 1
+        assert registry.prepare(conn) == 0
+        assert executed(cur) == ["PREPARE q AS SELECT * FROM t WHERE id = $1"]
+        conn.commit.assert_called_once()
+
+    def test_registered_sql_runs_as_execute(self):
+        registry = PreparedStatements()
+        sql = registry.register('q', "SELECT * FROM t WHERE id = %s AND k = %s")
+        cur = MagicMock()
+        cur.connection = preparing(MagicMock())
+        cur.connection.prepared.add('q')
+
+        registry.execute(cur, sql, (1, 'x'))
+        registry.execute(cur, "SELECT 1", ())
+
+        assert cur.execute.call_args_list[0].args == ("EXECUTE q (%s, %s)", (1, 'x'))
+        assert cur.execute.call_args_list[1].args == ("SELECT 1", ())
+
+    def test_unprepared_connection_falls_back_to_plain_sql(self):
+        registry = PreparedStatements()
+        sql = registry.register('q', "SELECT * FROM t WHERE id = %s")
+        cur = MagicMock()  # Connection without a `prepared` set
+
+        registry.execute(cur, sql, (1,))
+
+        assert cur.execute.call_args.args == (sql, (1,))
+
+    def test_failed_prepare_is_not_retried(self):
+        registry = PreparedStatements()
+        registry.register('q', "SELECT * FROM missing_table")
+        conn = preparing(MagicMock())
+        conn.cursor.return_value.__enter__.return_value.execute.side_effect = psycopg2.ProgrammingError("no table")
+
+        assert registry.prepare(conn) == 0
+        assert registry.prepare(conn) == 0
+        conn.rollback.assert_called_once()
+        assert conn.prepared == set()
+
+    def test_conflicting_registration_rejected(self):
+        registry = PreparedStatements()
+        registry.register('q', "SELECT 1")
+        with pytest.raises(ValueError, match="already registered"):
+            registry.register('q', "SELECT 2")
+
+
+class TestHotQueries:
+    """ScoreDatabase hot paths use the prepared statements."""
+
+    @pytest.fixture
+    def prepared_db(self, pooled_db):
+        db, conn = pooled_db
+        preparing(conn)
+        cur = conn.cursor.return_value.__enter__.return_value
+        cur.fetchall.return_value = []
+        cur.connection = conn
+        return db, conn, cur
+
+    def test_hot_statements_cover_save_and_page_shapes(self):
+        for name in ('score_upsert', 'score_upsert_latest', 'score_ticker_page_raw',
+                     'score_ticker_page_after_raw', 'score_band_page_raw', 'score_latest_page_raw'):
+            assert name in HOT_STATEMENTS.names
+
+    def test_checkout_prepares_and_pages_execute(self, prepared_db):
+        db, conn, cur = prepared_db
+
+        db.get_scores_by_band_page("Buy", date(2024, 10, 8), "Trader", limit=10, raw=True)
+        db.get_scores_by_ticker_page("TCS.NS", limit=10, raw=True)
+
+        statements = executed(cur)
+        assert sum(sql.startswith("PREPARE ") for sql in statements) == len(HOT_STATEMENTS.names)
+        assert statements[-2:] == ["EXECUTE score_band_page_raw (%s, %s, %s, %s)",
+                                   "EXECUTE score_ticker_page_raw (%s, %s)"]
+
+    def test_filtered_history_uses_plain_sql(self, prepared_db):
+        db, _, cur = prepared_db
+
+        db.get_scores_by_ticker_page("TCS.NS", mode="Trader", raw=True)
+
+        assert executed(cur)[-1].startswith("SELECT ")
+
+    def test_save_score_executes_prepared_upserts(self, prepared_db, make_score_output):
+        db, conn, cur = prepared_db
+        cur.fetchone.return_value = (7,)
+
+        assert db.save_score(make_score_output()) == 7
+
+        assert [sql.split(" (")[0] for sql in executed(cur)[-3:-1]] == \
+            ["EXECUTE score_upsert", "EXECUTE score_upsert_latest"]
+        assert "pg_notify('score_events'" in executed(cur)[-1]
+
+    def test_disabled_by_flag(self, prepared_db):
+        db, conn, cur = prepared_db
+        db.use_prepared = False
+
+        db.get_scores_by_band_page("Buy", date(2024, 10, 8), "Trader", raw=True)
+
+        assert not any(sql.startswith(("PREPARE", "EXECUTE")) for sql in executed(cur))
+
+    def test_warm_pool_prepares_min_connections(self, pooled_db):
+        db, _ = pooled_db
+        conns = [preparing(MagicMock(closed=False)) for _ in range(db.min_conn)]
+        db._connection_pool._inner.getconn.side_effect = conns
+
+        result = db.warm_pool()
+
+        assert result['connections'] == db.min_conn
+        assert result['statements'] == db.min_conn * len(HOT_STATEMENTS.names)
+        assert all(conn.prepared == set(HOT_STATEMENTS.names) for conn in conns)
+        assert db.get_pool_stats()['in_use'] == 0
@@ -0,0 +1,121 @@
+"""Unit tests for ScoreEventBroker fan-out and the publish hook on save."""
+
+import asyncio
+import json
+import threading
+
+import pytest
+
+import greyoak_score.data.persistence as persistence
+import greyoak_score.data.score_events as score_events
+from greyoak_score.data.persistence import _notify_published
+from greyoak_score.data.score_events import ScoreEventBroker, TooManySubscribers
+
+
+def event(ticker="TCS.NS", band="Buy", sector="it", score=72.5):
+    return {'ticker': ticker, 'date': "2024-10-08", 'mode': "Trader",
+            'score': score, 'band': band, 'sector': sector}
+
+
+class TestScoreEventBroker:
+    """Filtering, bounded buffers and cross-thread delivery."""
+
+    def test_subscribers_receive_only_matching_events(self):
+        broker = ScoreEventBroker(buffer_size=10)
+
+        async def scenario():
+            everything = broker.subscribe()
+            tcs = broker.subscribe(tickers=["TCS.NS"])
+            strong_banks = broker.subscribe(bands=["Strong Buy"], sectors=["banks"])
+            broker.publish([
+                event(), event("HDFCBANK.NS", "Strong Buy", "banks"), event("SBIN.NS", "Hold", "banks")
+            ])
+            await asyncio.sleep(0)
+            return [await s.next_events(timeout=0.1) for s in (everything, tcs, strong_banks)]
+
+        everything, tcs, strong_banks = asyncio.run(scenario())
+
+        assert [e['ticker'] for e in everything] == ["TCS.NS", "HDFCBANK.NS", "SBIN.NS"]
+        assert [e['id'] for e in everything] == [1, 2, 3]
+        assert [e['ticker'] for e in tcs] == ["TCS.NS"]
+        assert [e['ticker'] for e in strong_banks] == ["HDFCBANK.NS"]
+        assert broker.get_stats()['delivered'] == 5
+
+    def test_full_buffer_drops_oldest_and_counts(self):
+        broker = ScoreEventBroker(buffer_size=3)
+
+        async def scenario():
+            slow = broker.subscribe()
+            broker.publish([event(score=float(i)) for i in range(5)])
+            await asyncio.sleep(0)
+            return slow, await slow.next_events(timeout=0.1)
+
+        slow, events = asyncio.run(scenario())
+
+        assert [e['score'] for e in events] == [2.0, 3.0, 4.0]
+        assert slow.dropped == 2
+
+    def test_publish_from_another_thread_wakes_subscriber(self):
+        broker = ScoreEventBroker()
+
+        async def scenario():
+            subscription = broker.subscribe()
+            threading.Timer(0.05, broker.publish, [[event()]]).start()
+            return await subscription.next_events(timeout=2)
+
+        assert [e['ticker'] for e in asyncio.run(scenario())] == ["TCS.NS"]
+
+    def test_next_events_times_out_empty(self):
+        broker = ScoreEventBroker()
+
+        async def scenario():
+            return await broker.subscribe().next_events(timeout=0.01)
+
+        assert asyncio.run(scenario()) == []
+
+    def test_subscriber_limit(self):
+        broker = ScoreEventBroker(max_subscribers=1)
+
+        async def scenario():
+            first = broker.subscribe()
+            with pytest.raises(TooManySubscribers):
+                broker.subscribe()
+            broker.unsubscribe(first)
+            broker.subscribe()
+
+        asyncio.run(scenario())
+        assert broker.get_stats()['subscribers'] == 1
+
+
+def test_local_backend_receives_committed_saves(monkeypatch):
+    monkeypatch.setenv('SCORE_EVENTS_BACKEND', 'local')
+    score_events.close_score_event_broker()
+    broker = score_events.get_score_event_broker()
+    try:
+        async def scenario():
+            subscription = broker.subscribe(tickers=["TCS.NS"])
+            _notify_published([json.dumps(event()), json.dumps(event("INFY.NS"))])
+            return await subscription.next_events(timeout=1)
+
+        assert [e['ticker'] for e in asyncio.run(scenario())] == ["TCS.NS"]
+        assert score_events.get_score_event_stats()['published'] == 2
+    finally:
+        score_events.close_score_event_broker()
+    assert score_events.get_score_event_stats() is None
+
+
+def test_postgres_backend_starts_while_database_is_down(monkeypatch):
+    """The listener resolves its DSN without building the score pool, then retries."""
+    monkeypatch.setenv('SCORE_EVENTS_BACKEND', 'postgres')
+    monkeypatch.setenv('DATABASE_URL', "postgresql://u:p@127.0.0.1:1/x")
+    monkeypatch.setattr(persistence, '_db_instance', None)
+    score_events.close_score_event_broker()
+    try:
+        broker = score_events.get_score_event_broker()
+        assert score_events._listener.database_url == "postgresql://u:p@127.0.0.1:1/x"
+        assert score_events._listener._thread.is_alive()
+        assert persistence._db_instance is None
+        assert broker.get_stats()['subscribers'] == 0
+    finally:
+        score_events.close_score_event_broker()
+    assert score_events._listener is None
@@ -0,0 +1,95 @@
+"""Unit tests for single-flight request coalescing."""
+
+import asyncio
+
+import pytest
+
+from greyoak_score.api.singleflight import SingleFlight
+
+
+def run_herd(flights: SingleFlight, keys, work):
+    async def herd():
+        return await asyncio.gather(
+            *(flights.do(key, work) for key in keys), return_exceptions=True
+        )
+    return asyncio.run(herd())
+
+
+class TestSingleFlight:
+    """Concurrent identical calls share one execution."""
+
+    def test_identical_concurrent_calls_share_one_execution(self):
+        flights = SingleFlight('test')
+        calls = []
+
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"score": 72.5}
+
+        results = run_herd(flights, ["A"] * 20, work)
+
+        assert len(calls) == 1
+        assert [r for r, _ in results] == [{"score": 72.5}] * 20
+        assert sum(coalesced for _, coalesced in results) == 19
+        stats = flights.get_stats()
+        assert stats['leaders'] == 1 and stats['coalesced'] == 19
+        assert stats['hit_ratio'] == 0.95
+        assert stats['in_flight'] == 0
+
+    def test_distinct_keys_run_separately(self):
+        flights = SingleFlight('test')
+        calls = []
+
+        async def work():
+            calls.append(1)
+            await asyncio.sleep(0)
+            return len(calls)
+
+        run_herd(flights, ["A", "B", "A", "B"], work)
+
+        assert len(calls) == 2
+        assert flights.get_stats()['coalesced'] == 2
+
+    def test_sequential_calls_do_not_reuse_results(self):
+        flights = SingleFlight('test')
+        counter = iter(range(10))
+
+        async def work():
+            return next(counter)
+
+        async def twice():
+            return [await flights.do("A", work), await flights.do("A", work)]
+
+        assert asyncio.run(twice()) == [(0, False), (1, False)]
+
+    def test_errors_are_shared_and_counted(self):
+        flights = SingleFlight('test')
+
+        async def work():
+            await asyncio.sleep(0.01)
+            raise RuntimeError("database down")
+
+        results = run_herd(flights, ["A"] * 5, work)
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert flights.get_stats()['failures'] == 1
+
+    def test_cancelled_leader_does_not_cancel_followers(self):
+        flights = SingleFlight('test')
+
+        async def work():
+            await asyncio.sleep(0.02)
+            return "done"
+
+        async def scenario():
+            leader = asyncio.ensure_future(flights.do("A", work))
+            await asyncio.sleep(0)
+            follower = asyncio.ensure_future(flights.do("A", work))
+            await asyncio.sleep(0)
+            leader.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await leader
+            return await follower
+
+        assert asyncio.run(scenario()) == ("done", True)
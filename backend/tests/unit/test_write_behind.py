@@ -0,0 +1,138 @@
+"""Unit tests for the write-behind score persistence queue (data/write_behind.py)."""
+
+import threading
+import time
+from datetime import date
+
+import pytest
+
+from greyoak_score.data.write_behind import ScoreWriteBehindQueue, WriteQueueFull
+
+
+class FakeDatabase:
+    """Records batches; optionally blocks or fails."""
+
+    def __init__(self, fail_times: int = 0):
+        self.batches = []
+        self.refreshes = []
+        self.fail_times = fail_times
+        self.release = threading.Event()
+        self.release.set()
+
+    def save_scores_batch(self, scores, refresh_aggregates=True):
+        assert not refresh_aggregates
+        self.release.wait(timeout=5)
+        if self.fail_times:
+            self.fail_times -= 1
+            raise RuntimeError("database unavailable")
+        self.batches.append(list(scores))
+        return len(scores)
+
+    def refresh_sector_aggregates(self, keys):
+        self.refreshes.append(set(keys))
+        return len(keys)
+
+
+def make_queue(db, **kwargs):
+    params = dict(batch_size=100, flush_interval_ms=10_000, max_pending=1000,
+                  enqueue_timeout=0.05, retry_delay=0.01)
+    params.update(kwargs)
+    write_queue = ScoreWriteBehindQueue(db_factory=lambda: db, **params)
+    write_queue.start()
+    return write_queue
+
+
+class TestBatching:
+    """Flush triggers: record count, interval, shutdown."""
+
+    def test_flushes_when_batch_size_reached(self, make_score_output):
+        db = FakeDatabase()
+        write_queue = make_queue(db, batch_size=3)
+        for day in range(1, 7):
+            write_queue.submit(make_score_output(day=day))
+
+        assert write_queue.flush(timeout=2)
+        assert [len(b) for b in db.batches] == [3, 3]
+        write_queue.stop()
+
+    def test_flushes_after_interval(self, make_score_output):
+        db = FakeDatabase()
+        write_queue = make_queue(db, flush_interval_ms=50)
+        write_queue.submit(make_score_output(day=1))
+        write_queue.submit(make_score_output(day=2))
+
+        assert write_queue.flush(timeout=2)
+        assert [len(b) for b in db.batches] == [2]
+        write_queue.stop()
+
+    def test_stop_flushes_pending_records(self, make_score_output):
+        db = FakeDatabase()
+        write_queue = make_queue(db)
+        for day in range(1, 6):
+            write_queue.submit(make_score_output(day=day))
+
+        write_queue.stop()
+
+        assert sum(len(b) for b in db.batches) == 5
+        assert write_queue.get_stats()['written'] == 5
+
+
+class TestBackpressureAndFailures:
+    """Bounded queue and retry behaviour."""
+
+    def test_full_queue_rejects_after_timeout(self, make_score_output):
+        db = FakeDatabase()
+        db.release.clear()  # Writer stalls on the first batch
+        write_queue = make_queue(db, batch_size=1, max_pending=2)
+
+        with pytest.raises(WriteQueueFull):
+            for day in range(1, 10):
+                write_queue.submit(make_score_output(day=day))
+
+        assert write_queue.get_stats()['rejected'] == 1
+        db.release.set()
+        write_queue.stop()
+
+    def test_failed_batch_is_retried(self, make_score_output):
+        db = FakeDatabase(fail_times=2)
+        write_queue = make_queue(db, flush_interval_ms=10)
+        write_queue.submit(make_score_output())
+
+        assert write_queue.flush(timeout=2)
+        stats = write_queue.get_stats()
+        assert stats['written'] == 1 and stats['failed'] == 0
+        write_queue.stop()
+
+    def test_submit_requires_running_queue(self, make_score_output):
+        write_queue = ScoreWriteBehindQueue(db_factory=FakeDatabase)
+        with pytest.raises(RuntimeError):
+            write_queue.submit(make_score_output())
+
+
+class TestSectorAggregateRefresh:
+    """Aggregates are refreshed per interval, not per flush."""
+
+    def test_refresh_is_deferred_and_batched(self, make_score_output):
+        db = FakeDatabase()
+        write_queue = make_queue(db, batch_size=1, aggregate_refresh_seconds=0.3)
+        for day in (1, 1, 2):
+            write_queue.submit(make_score_output(day=day))
+
+        assert write_queue.flush(timeout=2)
+        assert len(db.batches) == 3 and db.refreshes == []
+
+        deadline = time.monotonic() + 2
+        while not db.refreshes and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert db.refreshes == [{(date(2024, 10, 1), "Trader"), (date(2024, 10, 2), "Trader")}]
+        assert write_queue.get_stats()['aggregate_refreshes'] == 1
+        write_queue.stop()
+
+    def test_stop_refreshes_pending_pairs(self, make_score_output):
+        db = FakeDatabase()
+        write_queue = make_queue(db, aggregate_refresh_seconds=3600)
+        write_queue.submit(make_score_output(day=3))
+
+        write_queue.stop()
+
+        assert db.refreshes == [{(date(2024, 10, 3), "Trader")}]